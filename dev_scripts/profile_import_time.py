@@ -0,0 +1,77 @@
+"""Print a per-module import time profile, e.g. to find what makes `import pymatgen.core` slow.
+
+Uses the `-X importtime` option of the Python interpreter, which reports the self
+and cumulative import time of every module imported by a fresh interpreter.
+
+Usage:
+    python dev_scripts/profile_import_time.py "from pymatgen.core import Structure"
+    python dev_scripts/profile_import_time.py "import pymatgen.io.vasp" --top 20 --prefix pymatgen
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+from tabulate import tabulate
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-17"
+
+
+def get_import_profile(import_cmd: str) -> dict[str, tuple[float, float, int]]:
+    """Measure the import time of every module imported by a statement.
+
+    Args:
+        import_cmd (str): Python statement to profile, e.g. "import pymatgen.core".
+
+    Returns:
+        dict[str, tuple[float, float, int]]: Module name to (self, cumulative) import
+            time in milliseconds and nesting depth (0 for top-level imports), in import order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", import_cmd], capture_output=True, text=True, check=True
+    )
+
+    profile: dict[str, tuple[float, float, int]] = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumul_us, module = line.removeprefix("import time:").split("|")
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        profile[module.strip()] = (int(self_us) / 1000, int(cumul_us) / 1000, depth)
+
+    return profile
+
+
+def main() -> None:
+    """Print the slowest modules imported by a statement."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("import_cmd", help="Python statement to profile.")
+    parser.add_argument("--top", type=int, default=30, help="Number of modules to show (default: 30).")
+    parser.add_argument("--prefix", default="", help="Only show modules starting with this prefix.")
+    parser.add_argument("--sort", choices=("self", "cumulative"), default="cumulative", help="Sort column.")
+    args = parser.parse_args()
+
+    profile = get_import_profile(args.import_cmd)
+    total = sum(cumul for _self, cumul, depth in profile.values() if depth == 0)
+
+    col = 0 if args.sort == "self" else 1
+    rows = sorted(
+        (
+            (module, self_ms, cumul)
+            for module, (self_ms, cumul, _depth) in profile.items()
+            if module.startswith(args.prefix)
+        ),
+        key=lambda row: row[col + 1],
+        reverse=True,
+    )[: args.top]
+
+    print(tabulate(rows, headers=("Module", "Self (ms)", "Cumulative (ms)"), floatfmt=".1f"))
+    print(f"\n{len(profile)} modules imported in {total:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import itertools
-from collections import defaultdict
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from pymatgen.core import Structure
 
@@ -23,13 +24,18 @@ def get_warren_cowley_parameters(structure: Structure, r: float, dr: float) -> d
         Warren-Crowley parameters in the form of a dict, e.g. {(Element Mo, Element W): -1.0, ...}
     """
     comp = structure.composition
-
-    n_ij: defaultdict = defaultdict(int)
-    n_neighbors: defaultdict = defaultdict(int)
-    for site in structure:
-        for nn in structure.get_neighbors_in_shell(site.coords, r, dr):
-            n_ij[site.specie, nn.specie] += 1
-            n_neighbors[site.specie] += 1
+    species = list(comp)
+    sp_index = {sp: idx for idx, sp in enumerate(species)}
+    sp_indices = np.array([sp_index[sp] for sp in structure.species])
+
+    # Count neighbors in the shell of all sites at once from the neighbor list
+    centers, points, _images, distances = structure.get_neighbor_list(r + dr, exclude_self=False)
+    in_shell = distances > r - dr
+    counts = np.zeros((len(species), len(species)), dtype=int)
+    np.add.at(counts, (sp_indices[centers[in_shell]], sp_indices[points[in_shell]]), 1)
+
+    n_ij = {(sp1, sp2): int(counts[idx1, idx2]) for idx1, sp1 in enumerate(species) for idx2, sp2 in enumerate(species)}
+    n_neighbors = {sp: int(counts[idx].sum()) for idx, sp in enumerate(species)}
 
     alpha_ij = {}
     for sp1, sp2 in itertools.product(comp, comp):
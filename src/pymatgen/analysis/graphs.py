@@ -1729,10 +1729,8 @@ class MoleculeGraph(MSONable):
         else:
             structure = None
 
-        for idx in range(len(molecule)):
-            neighbors = (
-                strategy.get_nn_info(molecule, idx) if structure is None else strategy.get_nn_info(structure, idx)
-            )
+        all_neighbors = strategy.get_all_nn_info(molecule if structure is None else structure)
+        for idx, neighbors in enumerate(all_neighbors[: len(molecule)]):
             for neighbor in neighbors:
                 # all bonds in molecules should not cross
                 # (artificial) periodic boundaries
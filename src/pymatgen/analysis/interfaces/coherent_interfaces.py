@@ -6,6 +6,7 @@ from itertools import product
 from typing import TYPE_CHECKING
 
 import numpy as np
+from joblib import Parallel, delayed
 from scipy.linalg import polar
 
 from pymatgen.analysis.elasticity.strain import Deformation
@@ -58,6 +59,7 @@ class CoherentInterfaceBuilder:
         self.termination_ftol = termination_ftol
         self.label_index = label_index
         self.filter_out_sym_slabs = filter_out_sym_slabs
+        self._slab_generators: dict[tuple[float, float, bool], tuple[SlabGenerator, SlabGenerator]] = {}
         self._find_matches()
         self._find_terminations()
 
@@ -161,6 +163,41 @@ class CoherentInterfaceBuilder:
         }
         self.terminations = list(self._terminations)
 
+    def _get_slab_generators(
+        self,
+        film_thickness: float,
+        substrate_thickness: float,
+        in_layers: bool,
+    ) -> tuple[SlabGenerator, SlabGenerator]:
+        """Get the film and substrate SlabGenerators for the given thicknesses,
+        which are shared by all terminations.
+        """
+        key = (film_thickness, substrate_thickness, in_layers)
+        if key not in self._slab_generators:
+            film_sg = SlabGenerator(
+                self.film_structure,
+                self.film_miller,
+                min_slab_size=film_thickness,
+                min_vacuum_size=3,
+                in_unit_planes=in_layers,
+                center_slab=True,
+                primitive=True,
+                reorient_lattice=False,  # This is necessary to not screw up the lattice
+            )
+
+            sub_sg = SlabGenerator(
+                self.substrate_structure,
+                self.substrate_miller,
+                min_slab_size=substrate_thickness,
+                min_vacuum_size=3,
+                in_unit_planes=in_layers,
+                center_slab=True,
+                primitive=True,
+                reorient_lattice=False,  # This is necessary to not screw up the lattice
+            )
+            self._slab_generators[key] = (film_sg, sub_sg)
+        return self._slab_generators[key]
+
     def get_interfaces(
         self,
         termination: tuple[str, str],
@@ -184,27 +221,7 @@ class CoherentInterfaceBuilder:
         Yields:
             Iterator[Interface]: interfaces from slabs
         """
-        film_sg = SlabGenerator(
-            self.film_structure,
-            self.film_miller,
-            min_slab_size=film_thickness,
-            min_vacuum_size=3,
-            in_unit_planes=in_layers,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
-
-        sub_sg = SlabGenerator(
-            self.substrate_structure,
-            self.substrate_miller,
-            min_slab_size=substrate_thickness,
-            min_vacuum_size=3,
-            in_unit_planes=in_layers,
-            center_slab=True,
-            primitive=True,
-            reorient_lattice=False,  # This is necessary to not screw up the lattice
-        )
+        film_sg, sub_sg = self._get_slab_generators(film_thickness, substrate_thickness, in_layers)
 
         film_shift, sub_shift = self._terminations[termination]
 
@@ -257,6 +274,39 @@ class CoherentInterfaceBuilder:
                 interface_properties=interface_properties,
             )
 
+    def get_all_interfaces(
+        self,
+        terminations: Sequence[tuple[str, str]] | None = None,
+        n_jobs: int = 1,
+        **kwargs,
+    ) -> dict[tuple[str, str], list[Interface]]:
+        """Generate the interface structures for several terminations in parallel.
+
+        Args:
+            terminations (Sequence[tuple[str, str]] | None): terminations from
+                self.terminations. Defaults to all terminations.
+            n_jobs (int): Number of joblib workers, each building the interfaces of
+                one termination. Defaults to 1, -1 uses all CPUs.
+            **kwargs: Passed to get_interfaces, e.g. gap or film_thickness.
+
+        Returns:
+            dict[tuple[str, str], list[Interface]]: interfaces for each termination
+        """
+        terminations = self.terminations if terminations is None else list(terminations)
+        interfaces = Parallel(n_jobs=n_jobs)(
+            delayed(_get_termination_interfaces)(self, termination, kwargs) for termination in terminations
+        )
+        return dict(zip(terminations, interfaces, strict=True))
+
+
+def _get_termination_interfaces(
+    builder: CoherentInterfaceBuilder,
+    termination: tuple[str, str],
+    kwargs: dict,
+) -> list[Interface]:
+    """Build all interfaces of one termination, used by CoherentInterfaceBuilder.get_all_interfaces."""
+    return list(builder.get_interfaces(termination, **kwargs))
+
 
 def get_rot_3d_for_2d(film_matrix, sub_matrix) -> np.ndarray:
     """Find transformation matrix that will rotate and strain the film to the substrate while preserving the c-axis."""
@@ -129,6 +129,16 @@ class SubstrateAnalyzer(ZSLGenerator):
         """
         vector_sets = []
 
+        # The substrate surfaces are the same for every film surface
+        all_substrate_vectors = []
+        for s_miller in substrate_millers:
+            substrate_slab = SlabGenerator(substrate, s_miller, 20, 15, primitive=False).get_slab()
+            substrate_vectors = reduce_vectors(
+                substrate_slab.oriented_unit_cell.lattice.matrix[0],
+                substrate_slab.oriented_unit_cell.lattice.matrix[1],
+            )
+            all_substrate_vectors.append((substrate_vectors, s_miller))
+
         for f_miller in film_millers:
             film_slab = SlabGenerator(film, f_miller, 20, 15, primitive=False).get_slab()
             film_vectors = reduce_vectors(
@@ -136,13 +146,7 @@ class SubstrateAnalyzer(ZSLGenerator):
                 film_slab.oriented_unit_cell.lattice.matrix[1],
             )
 
-            for s_miller in substrate_millers:
-                substrate_slab = SlabGenerator(substrate, s_miller, 20, 15, primitive=False).get_slab()
-                substrate_vectors = reduce_vectors(
-                    substrate_slab.oriented_unit_cell.lattice.matrix[0],
-                    substrate_slab.oriented_unit_cell.lattice.matrix[1],
-                )
-
+            for substrate_vectors, s_miller in all_substrate_vectors:
                 vector_sets.append((film_vectors, substrate_vectors, f_miller, s_miller))
 
         return vector_sets
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import product
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -125,23 +124,26 @@ class ZSLGenerator(MSONable):
                 2.) the transformation matrices for the substrate to create
                 a super lattice of area j*film area.
         """
-        transformation_indices = [
-            (ii, jj)
-            for ii in range(1, int(np.ceil(self.max_area / film_area)))
-            for jj in range(1, int(np.ceil(self.max_area / substrate_area)))
-            if np.absolute(film_area / substrate_area - float(jj) / ii) < self.max_area_ratio_tol
-        ] + [
-            (ii, jj)
-            for ii in range(1, int(np.ceil(self.max_area / film_area)))
-            for jj in range(1, int(np.ceil(self.max_area / substrate_area)))
-            if np.absolute(substrate_area / film_area - float(ii) / jj) < self.max_area_ratio_tol
-        ]
-        transformation_indices = list(set(transformation_indices))
+        film_multiples = np.arange(1, int(np.ceil(self.max_area / film_area)))[:, None]
+        substrate_multiples = np.arange(1, int(np.ceil(self.max_area / substrate_area)))[None, :]
+        ii, jj = np.broadcast_arrays(film_multiples, substrate_multiples)
+        film_matches = np.absolute(film_area / substrate_area - jj / ii) < self.max_area_ratio_tol
+        substrate_matches = np.absolute(substrate_area / film_area - ii / jj) < self.max_area_ratio_tol
+        transformation_indices = list(
+            {
+                *zip(ii[film_matches].tolist(), jj[film_matches].tolist(), strict=True),
+                *zip(ii[substrate_matches].tolist(), jj[substrate_matches].tolist(), strict=True),
+            }
+        )
 
         # Sort sets by the square of the matching area and yield in order
         # from smallest to largest
+        transform_matrices: dict[int, list] = {}
         for ii, jj in sorted(transformation_indices, key=lambda x: x[0] * x[1]):
-            yield (gen_sl_transform_matrices(ii), gen_sl_transform_matrices(jj))
+            for multiple in (ii, jj):
+                if multiple not in transform_matrices:
+                    transform_matrices[multiple] = gen_sl_transform_matrices(multiple)
+            yield (transform_matrices[ii], transform_matrices[jj])
 
     def get_equiv_transformations(self, transformation_sets, film_vectors, substrate_vectors):
         """
@@ -160,32 +162,45 @@ class ZSLGenerator(MSONable):
             substrate_vectors(array): substrate vectors to generate super
                 lattices
         """
-        for film_transformations, substrate_transformations in transformation_sets:
-            # Apply transformations and reduce using Zur reduce methodology
-            films = np.array(
-                [reduce_vectors(*v) for v in np.dot(film_transformations, film_vectors)],
-                dtype=float,
-            )
+        # Reduced super lattices and their lengths and angles, shared by all
+        # transformation sets with the same film or substrate area multiple
+        reduced: dict[tuple, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+        def get_reduced(transformations, vectors) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            transformations = np.asarray(transformations, dtype=float)
+            vectors = np.asarray(vectors, dtype=float)
+            key = (transformations.shape, transformations.tobytes(), vectors.tobytes())
+            if key not in reduced:
+                # Apply transformations and reduce using Zur reduce methodology
+                sl_vectors = _reduce_vector_sets(np.dot(transformations, vectors))
+                reduced[key] = (sl_vectors, *_get_lengths_and_angles(sl_vectors))
+            return reduced[key]
 
-            substrates = np.array(
-                [reduce_vectors(*v) for v in np.dot(substrate_transformations, substrate_vectors)],
-                dtype=float,
+        for film_transformations, substrate_transformations in transformation_sets:
+            films, film_lengths, film_angles = get_reduced(film_transformations, film_vectors)
+            substrates, substrate_lengths, substrate_angles = get_reduced(substrate_transformations, substrate_vectors)
+
+            # Check all film/substrate super lattice pairs at once if they are equivalent
+            same = _is_same_vector_sets(
+                film_lengths,
+                film_angles,
+                substrate_lengths,
+                substrate_angles,
+                max_length_tol=self.max_length_tol,
+                max_angle_tol=self.max_angle_tol,
             )
-
-            # Check if equivalent super lattices
-            for (f_trans, s_trans), (f, s) in zip(
-                product(film_transformations, substrate_transformations),
-                product(films, substrates),
-                strict=True,
-            ):
-                if is_same_vectors(
-                    f,
-                    s,
-                    bidirectional=self.bidirectional,
+            if self.bidirectional:
+                same |= _is_same_vector_sets(
+                    substrate_lengths,
+                    substrate_angles,
+                    film_lengths,
+                    film_angles,
                     max_length_tol=self.max_length_tol,
                     max_angle_tol=self.max_angle_tol,
-                ):
-                    yield [f, s, f_trans, s_trans]
+                ).T
+
+            for f_idx, s_idx in zip(*np.nonzero(same), strict=True):
+                yield [films[f_idx], substrates[s_idx], film_transformations[f_idx], substrate_transformations[s_idx]]
 
     def __call__(self, film_vectors, substrate_vectors, lowest=False) -> Iterator[ZSLMatch]:
         """Runs the ZSL algorithm to generate all possible matching."""
@@ -310,6 +325,73 @@ def reduce_vectors(a, b):
     return (a, b)
 
 
+def _stack_dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Dot products of the last axis of two stacks of vectors, with the same
+    rounding as np.dot on the individual vectors.
+    """
+    return np.matmul(a[..., None, :], b[..., :, None])[..., 0, 0]
+
+
+def _reduce_vector_sets(vector_sets: np.ndarray) -> np.ndarray:
+    """Vectorized reduce_vectors for a stack of vector pairs with shape (n, 2, 3)."""
+    vector_sets = np.array(vector_sets, dtype=np.float64)
+    active = np.arange(len(vector_sets))
+    a = vector_sets[:, 0].copy()
+    b = vector_sets[:, 1].copy()
+    while len(active) > 0:
+        norm_b = np.sqrt(_stack_dot(b, b))
+
+        # Apply the first of the reduce_vectors steps that is valid for each pair
+        flip = _stack_dot(a, b) < 0
+        swap = ~flip & (np.sqrt(_stack_dot(a, a)) > norm_b)
+        add = ~flip & ~swap & (norm_b > np.sqrt(_stack_dot(b + a, b + a)))
+        subtract = ~flip & ~swap & ~add & (norm_b > np.sqrt(_stack_dot(b - a, b - a)))
+
+        new_a = a.copy()
+        new_a[swap] = b[swap]
+        b[flip] = -b[flip]
+        b[swap] = a[swap]
+        b[add] += a[add]
+        b[subtract] -= a[subtract]
+
+        # Pairs without any valid step are reduced
+        done = ~(flip | swap | add | subtract)
+        vector_sets[active[done], 0] = new_a[done]
+        vector_sets[active[done], 1] = b[done]
+        active = active[~done]
+        a = new_a[~done]
+        b = b[~done]
+    return vector_sets
+
+
+def _get_lengths_and_angles(vector_sets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vector lengths with shape (n, 2) and angles between the two vectors with
+    shape (n,) for a stack of vector pairs.
+    """
+    cross = np.cross(vector_sets[:, 0], vector_sets[:, 1])
+    angles = np.arctan2(np.sqrt(_stack_dot(cross, cross)), _stack_dot(vector_sets[:, 0], vector_sets[:, 1]))
+    return np.sqrt(_stack_dot(vector_sets, vector_sets)), angles
+
+
+def _is_same_vector_sets(
+    lengths1: np.ndarray,
+    angles1: np.ndarray,
+    lengths2: np.ndarray,
+    angles2: np.ndarray,
+    *,
+    max_length_tol: float,
+    max_angle_tol: float,
+) -> np.ndarray:
+    """Unidirectional is_same_vectors for all pairs of two stacks of vector sets
+    given by their lengths and angles, as a boolean array of shape (n1, n2).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strain = lengths2[None, :, :] / lengths1[:, None, :] - 1
+        angle_strain = angles2[None, :] / angles1[:, None] - 1
+    same_lengths = ~np.any(np.absolute(strain) > max_length_tol, axis=2)
+    return same_lengths & (np.absolute(angle_strain) <= max_angle_tol)
+
+
 @njit
 def get_factors(n):
     """Generate all factors of n."""
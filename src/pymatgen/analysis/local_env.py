@@ -27,6 +27,7 @@ from pymatgen.analysis.bond_valence import BV_PARAMS, BVAnalyzer
 from pymatgen.analysis.graphs import StructureGraph
 from pymatgen.analysis.molecule_structure_comparator import CovalentRadius
 from pymatgen.core import Element, IStructure, PeriodicNeighbor, PeriodicSite, Site, Species, Structure
+from pymatgen.core.bonds import CovalentBond
 
 try:
     from openbabel import openbabel
@@ -34,6 +35,7 @@ except Exception:
     openbabel = None
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from typing import Any, TypeAlias
 
     from typing_extensions import Self
@@ -1597,7 +1599,7 @@ class CovalentBondNN(NearNeighbors):
         self.tol = tol
         self.order = order
 
-        self.bonds = None
+        self.bonds: list[CovalentBond] | None = None
 
     @property
     def structures_allowed(self) -> bool:
@@ -1636,37 +1638,45 @@ class CovalentBondNN(NearNeighbors):
             [dict] representing a neighboring site and the type of
             bond present between site n and the neighboring site.
         """
-        # This is unfortunately inefficient, but is the best way to fit the
-        # current NearNeighbors scheme
-        self.bonds = bonds = structure.get_covalent_bonds(tol=self.tol)
+        return self._get_all_nn_info(structure, sites=[n])[0]
 
-        siw = []
+    def get_all_nn_info(self, structure: Structure) -> list[list[dict[str, Any]]]:
+        """Get a listing of all neighbors for all sites in a molecule.
 
-        for bond in bonds:
-            if bond.site1 == structure[n]:
-                site = bond.site2
-                capture_bond = True
-            elif bond.site2 == structure[n]:
-                site = bond.site1
-                capture_bond = True
-            else:
-                site = None
-                capture_bond = False
+        Args:
+            structure (Molecule): Input molecule.
 
-            if capture_bond:
-                index = structure.index(site)
-                weight = bond.get_bond_order() if self.order else bond.length
+        Returns:
+            List of NN site information for each site in the molecule. Each
+                entry has the same format as `get_nn_info`
+        """
+        return self._get_all_nn_info(structure, sites=range(len(structure)))
 
-                siw.append(
-                    {
-                        "site": site,
-                        "image": (0, 0, 0),
-                        "weight": weight,
-                        "site_index": index,
-                    }
-                )
+    def _get_all_nn_info(self, structure: Structure, sites: Sequence[int]) -> list[list[dict[str, Any]]]:
+        """Near-neighbor info of the given sites from a single covalent bond search."""
+        bond_indices = structure.get_covalent_bond_indices(tol=self.tol)
+        self.bonds = bonds = [CovalentBond(structure[idx1], structure[idx2]) for idx1, idx2 in bond_indices]
 
-        return siw
+        # Bonds are sorted by (i, j), so the neighbors of each site come out sorted by index
+        neighbors: dict[int, list[tuple[int, CovalentBond]]] = {idx: [] for idx in sites}
+        for (idx1, idx2), bond in zip(bond_indices.tolist(), bonds, strict=True):
+            if idx1 in neighbors:
+                neighbors[idx1].append((idx2, bond))
+            if idx2 in neighbors:
+                neighbors[idx2].append((idx1, bond))
+
+        return [
+            [
+                {
+                    "site": structure[index],
+                    "image": (0, 0, 0),
+                    "weight": bond.get_bond_order() if self.order else bond.length,
+                    "site_index": index,
+                }
+                for index, bond in neighbors[idx]
+            ]
+            for idx in sites
+        ]
 
     def get_bonded_structure(self, structure: Structure, decorate: bool = False) -> MoleculeGraph:
         """
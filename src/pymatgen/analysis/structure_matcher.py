@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, cast
 import numpy as np
 from monty.json import MSONable
 
-from pymatgen.core import SETTINGS, Composition, IStructure, Lattice, Structure, get_el_sp
+from pymatgen.core import SETTINGS, Composition, IStructure, Lattice, Site, Structure, get_el_sp
 from pymatgen.optimization.linear_assignment import LinearAssignment
 from pymatgen.util.coord import lattice_points_in_supercell
 from pymatgen.util.coord_cython import is_coord_subset_pbc, pbc_shortest_vectors
@@ -47,10 +47,20 @@ class SiteOrderedIStructure(IStructure):
 
     def __eq__(self, other: object) -> bool:
         """Check for IStructure equality and same site order."""
-        if not super().__eq__(other):
-            return False
+        if not all(hasattr(other, attr) for attr in ("lattice", "sites", "properties")):
+            return NotImplemented
         other = cast("SiteOrderedIStructure", other)  # make mypy happy
 
+        if other is self:
+            return True
+        if len(self) != len(other) or self.lattice != other.lattice or self.properties != other.properties:
+            return False
+
+        # Equal sites in the same order imply the unordered site check of IStructure.__eq__.
+        # Compare all coordinates at once first, as this cache lookup is mostly done
+        # between structures of equal composition that differ in their positions.
+        if not np.allclose(self.cart_coords, other.cart_coords, atol=Site.position_atol):
+            return False
         return list(self.sites) == list(other.sites)
 
     def __hash__(self) -> int:
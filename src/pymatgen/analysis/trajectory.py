@@ -0,0 +1,307 @@
+"""Vectorized analysis of molecular dynamics trajectories: mean squared displacement,
+diffusivity, velocity autocorrelation and radial distribution function.
+
+All functions work on arrays of a Trajectory (including a memory-mapped DiskTrajectory)
+instead of building a Structure per frame. Time correlations (MSD, VACF) are computed
+with FFTs over all time origins, and the RDF is accumulated with a neighbor list in
+chunks of frames. Independent chunks of sites (MSD, VACF) or frames (RDF) can be
+processed in parallel processes with n_jobs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from pymatgen.optimization.neighbors import find_points_in_spheres
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pymatgen.core.trajectory import Trajectory
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-17"
+
+# 1 A^2/fs = 1e-16 cm^2 / 1e-15 s
+A2_PER_FS_TO_CM2_PER_S = 0.1
+
+
+def get_unwrapped_coords(
+    trajectory: Trajectory, species: str | Sequence[str] | None = None, chunk_size: int = 1000
+) -> np.ndarray:
+    """Get Cartesian coordinates of the sites in all frames, unwrapped across periodic boundaries.
+
+    Displacements between consecutive frames are wrapped to the nearest image, so sites
+    leaving the cell keep moving continuously instead of jumping back into it.
+
+    Args:
+        trajectory (Trajectory): Structure- or Molecule-based trajectory.
+        species (str | Sequence[str]): Only include sites of these species, e.g. "Li".
+            Defaults to None (all sites).
+        chunk_size (int): Number of frames read at once. Defaults to 1000.
+
+    Returns:
+        np.ndarray: shape (M, N, 3) for M frames and N selected sites, in Angstrom.
+    """
+    indices = get_site_indices(trajectory, species)
+    n_frames = len(trajectory)
+    unwrapped = np.empty((n_frames, len(indices), 3))
+    offset = None  # unwrapped position at the end of the previous chunk
+    last_coords = None
+    for start in range(0, n_frames, chunk_size):
+        stop = min(start + chunk_size, n_frames)
+        coords = np.asarray(trajectory.coords[start:stop], dtype=np.float64)[:, indices]
+        if trajectory.coords_are_displacement:
+            steps = coords
+            base = np.asarray(trajectory.base_positions)[indices] if offset is None else offset
+        else:
+            steps = np.diff(coords, axis=0, prepend=coords[:1] if last_coords is None else last_coords[None])
+            if trajectory.lattice is not None:
+                steps -= np.round(steps)
+            base = coords[0] if offset is None else offset
+            last_coords = coords[-1]
+        positions = base + np.cumsum(steps, axis=0)
+        offset = positions[-1]
+
+        if trajectory.lattice is None:
+            unwrapped[start:stop] = positions
+        elif _is_constant_lattice(trajectory):
+            unwrapped[start:stop] = positions @ np.asarray(trajectory.lattice).reshape(3, 3)
+        else:
+            lattices = np.asarray(trajectory.lattice[start:stop], dtype=np.float64)
+            unwrapped[start:stop] = np.einsum("mnj,mjk->mnk", positions, lattices)
+    return unwrapped
+
+
+def get_msd(
+    trajectory: Trajectory,
+    species: str | Sequence[str] | None = None,
+    per_site: bool = False,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Mean squared displacement as a function of lag time, averaged over all time origins.
+
+    Uses the FFT algorithm of Calandrini et al. (Collection SFN 12, 201 (2011)), which
+    scales as O(M log M) in the number of frames M instead of O(M^2).
+
+    Args:
+        trajectory (Trajectory): Structure- or Molecule-based trajectory.
+        species (str | Sequence[str]): Only include sites of these species, e.g. "Li".
+            Defaults to None (all sites).
+        per_site (bool): Whether to return the MSD of each site instead of the average.
+            Defaults to False.
+        n_jobs (int): Number of processes working on chunks of sites. Defaults to 1.
+
+    Returns:
+        np.ndarray: shape (M,) or (M, N) if per_site, MSD in Angstrom^2 at lag times
+            0, time_step, ..., (M - 1) * time_step.
+    """
+    coords = get_unwrapped_coords(trajectory, species)
+    msd = np.concatenate(_map_site_chunks(_msd_fft, coords, n_jobs), axis=1)
+    return msd if per_site else msd.mean(axis=1)
+
+
+def get_diffusivity(
+    trajectory: Trajectory,
+    species: str | Sequence[str] | None = None,
+    fit_range: tuple[float, float] = (0.1, 0.5),
+    n_jobs: int = 1,
+) -> float:
+    """Tracer diffusivity from a linear fit of the MSD, D = slope / 6.
+
+    Args:
+        trajectory (Trajectory): Trajectory with time_step set.
+        species (str | Sequence[str]): Only include sites of these species, e.g. "Li".
+            Defaults to None (all sites).
+        fit_range (tuple[float, float]): Range of lag times to fit, as fractions of the
+            trajectory length. Short lag times are ballistic and long ones have few
+            time origins, so both are excluded by default. Defaults to (0.1, 0.5).
+        n_jobs (int): Number of processes working on chunks of sites. Defaults to 1.
+
+    Returns:
+        float: Diffusivity in cm^2/s.
+    """
+    if trajectory.time_step is None:
+        raise ValueError("time_step of the trajectory is needed to compute the diffusivity")
+    msd = get_msd(trajectory, species, n_jobs=n_jobs)
+    start, stop = (round(frac * (len(msd) - 1)) for frac in fit_range)
+    if stop - start < 2:
+        raise ValueError(f"{fit_range=} contains fewer than 2 lag times of the {len(msd)} frames")
+
+    times = np.arange(start, stop + 1) * trajectory.time_step
+    slope = np.polyfit(times, msd[start : stop + 1], 1)[0]
+    return slope / 6 * A2_PER_FS_TO_CM2_PER_S
+
+
+def get_vacf(
+    trajectory: Trajectory,
+    species: str | Sequence[str] | None = None,
+    velocities: np.ndarray | None = None,
+    normalize: bool = True,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Velocity autocorrelation function <v(0) . v(t)>, averaged over sites and time origins.
+
+    Args:
+        trajectory (Trajectory): Trajectory with time_step set if velocities are not given.
+        species (str | Sequence[str]): Only include sites of these species, e.g. "Li".
+            Defaults to None (all sites).
+        velocities (np.ndarray): shape (M, N, 3). Velocities of the selected sites. Defaults
+            to None, in which case they are finite differences of the unwrapped coords (in
+            Angstrom/fs), giving M - 1 frames.
+        normalize (bool): Whether to divide by the VACF at lag time 0. Defaults to True.
+        n_jobs (int): Number of processes working on chunks of sites. Defaults to 1.
+
+    Returns:
+        np.ndarray: shape (M,) VACF at lag times 0, time_step, ...
+    """
+    if velocities is None:
+        if trajectory.time_step is None:
+            raise ValueError("time_step of the trajectory is needed to compute velocities")
+        velocities = np.diff(get_unwrapped_coords(trajectory, species), axis=0) / trajectory.time_step
+
+    vacf = np.concatenate(_map_site_chunks(_autocorrelation_fft, np.asarray(velocities), n_jobs), axis=1)
+    vacf = vacf.mean(axis=1)
+    return vacf / vacf[0] if normalize else vacf
+
+
+def get_rdf(
+    trajectory: Trajectory,
+    r_max: float = 10,
+    n_bins: int = 200,
+    species1: str | Sequence[str] | None = None,
+    species2: str | Sequence[str] | None = None,
+    frames: slice | None = None,
+    chunk_size: int = 100,
+    n_jobs: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Time-averaged radial distribution function g(r) of a Structure-based trajectory.
+
+    Args:
+        trajectory (Trajectory): Structure-based trajectory.
+        r_max (float): Maximum distance in Angstrom. Defaults to 10.
+        n_bins (int): Number of distance bins. Defaults to 200.
+        species1 (str | Sequence[str]): Species of the central sites. Defaults to None (all sites).
+        species2 (str | Sequence[str]): Species of the neighbors. Defaults to None (all sites).
+        frames (slice): Frames to average over, e.g. slice(1000, None, 10). Defaults to all frames.
+        chunk_size (int): Number of frames read and processed at once. Defaults to 100.
+        n_jobs (int): Number of processes working on chunks of frames. Defaults to 1.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Bin centers in Angstrom and g(r), both shape (n_bins,).
+    """
+    if trajectory.lattice is None:
+        raise ValueError("RDF is only implemented for Structure-based trajectories")
+    if trajectory.coords_are_displacement:
+        trajectory.to_positions()
+
+    indices1 = get_site_indices(trajectory, species1)
+    indices2 = get_site_indices(trajectory, species2)
+    selected = range(len(trajectory))[frames or slice(None)]
+    chunks = [selected[start : start + chunk_size] for start in range(0, len(selected), chunk_size)]
+    constant_lattice = _is_constant_lattice(trajectory)
+
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_rdf_histogram)(
+            np.asarray(trajectory.coords[list(chunk)], dtype=np.float64),
+            np.asarray(trajectory.lattice if constant_lattice else trajectory.lattice[list(chunk)], dtype=np.float64),
+            indices1,
+            indices2,
+            r_max,
+            n_bins,
+        )
+        for chunk in chunks
+    )
+    hist = np.sum([res[0] for res in results], axis=0)
+    pair_density = np.sum([res[1] for res in results])
+
+    edges = np.linspace(0, r_max, n_bins + 1)
+    shell_volumes = 4 / 3 * np.pi * np.diff(edges**3)
+    return (edges[1:] + edges[:-1]) / 2, hist / (pair_density * shell_volumes)
+
+
+def get_site_indices(trajectory: Trajectory, species: str | Sequence[str] | None = None) -> np.ndarray:
+    """Indices of the sites of a trajectory with given species.
+
+    Args:
+        trajectory (Trajectory): Trajectory.
+        species (str | Sequence[str]): Species, e.g. "Li" or ["Li", "Na"]. Defaults to None (all sites).
+
+    Returns:
+        np.ndarray: Site indices.
+    """
+    if species is None:
+        return np.arange(len(trajectory.species))
+    if isinstance(species, str):
+        species = [species]
+    indices = np.flatnonzero([str(sp) in species for sp in trajectory.species])
+    if len(indices) == 0:
+        raise ValueError(f"No sites of {species=} in the trajectory")
+    return indices
+
+
+def _is_constant_lattice(trajectory: Trajectory) -> bool:
+    return trajectory.lattice is not None and np.ndim(trajectory.lattice) == 2
+
+
+def _map_site_chunks(func, coords: np.ndarray, n_jobs: int) -> list[np.ndarray]:
+    """Apply func to chunks of sites (axis 1) of coords, in n_jobs processes."""
+    if n_jobs == 1:
+        return [func(coords)]
+    n_chunks = len(coords[0]) if n_jobs < 0 else min(n_jobs, len(coords[0]))
+    return Parallel(n_jobs=n_jobs)(delayed(func)(chunk) for chunk in np.array_split(coords, n_chunks, axis=1))
+
+
+def _autocorrelation_fft(values: np.ndarray) -> np.ndarray:
+    """Autocorrelation <x(t0) . x(t0 + t)> over time origins t0 of an (M, N, 3) array, per site."""
+    n_frames = len(values)
+    fft = np.fft.rfft(values, n=2 * n_frames, axis=0)
+    corr = np.fft.irfft(fft * fft.conj(), axis=0)[:n_frames].sum(axis=-1)
+    return corr / (n_frames - np.arange(n_frames))[:, None]
+
+
+def _msd_fft(coords: np.ndarray) -> np.ndarray:
+    """MSD per site of an (M, N, 3) array of unwrapped coords."""
+    n_frames = len(coords)
+    sq_norms = (coords**2).sum(axis=-1)
+    # sum_{t0} |x(t0)|^2 + |x(t0 + t)|^2 over the M - t time origins of lag time t
+    zero = np.zeros((1, sq_norms.shape[1]))
+    head = np.concatenate([zero, np.cumsum(sq_norms, axis=0)[:-1]])
+    tail = np.concatenate([zero, np.cumsum(sq_norms[::-1], axis=0)[:-1]])
+    total = sq_norms.sum(axis=0)
+    sum_sq = (2 * total - head - tail) / (n_frames - np.arange(n_frames))[:, None]
+    return sum_sq - 2 * _autocorrelation_fft(coords)
+
+
+def _rdf_histogram(
+    frac_coords: np.ndarray,
+    lattices: np.ndarray,
+    indices1: np.ndarray,
+    indices2: np.ndarray,
+    r_max: float,
+    n_bins: int,
+) -> tuple[np.ndarray, float]:
+    """Histogram of pair distances in a chunk of frames and the sum of
+    number of pairs / volume over the frames, to normalize the histogram.
+    """
+    n_pairs = len(indices1) * len(indices2) - len(np.intersect1d(indices1, indices2))
+    pbc = np.ones(3, dtype=np.int64)
+    hist = np.zeros(n_bins)
+    pair_density = 0.0
+    for idx, frame in enumerate(frac_coords):
+        lattice = lattices if lattices.ndim == 2 else lattices[idx]
+        cart_coords = frame @ lattice
+        centers, neighbors, images, distances = find_points_in_spheres(
+            np.ascontiguousarray(cart_coords[indices2]),
+            np.ascontiguousarray(cart_coords[indices1]),
+            r=r_max,
+            pbc=pbc,
+            lattice=np.ascontiguousarray(lattice),
+        )
+        is_self = (indices1[centers] == indices2[neighbors]) & ~images.any(axis=1)
+        hist += np.histogram(distances[~is_self], bins=n_bins, range=(0, r_max))[0]
+        pair_density += n_pairs / abs(np.linalg.det(lattice))
+    return hist, pair_density
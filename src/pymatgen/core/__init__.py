@@ -2,36 +2,27 @@
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import warnings
-from importlib.metadata import PackageNotFoundError, version
 from typing import TYPE_CHECKING
 
-from ruamel.yaml import YAML
-
-from pymatgen.core.composition import Composition
-from pymatgen.core.lattice import Lattice
-from pymatgen.core.operations import SymmOp
-from pymatgen.core.periodic_table import DummySpecie, DummySpecies, Element, Species, get_el_sp
-from pymatgen.core.sites import PeriodicSite, Site
-from pymatgen.core.structure import IMolecule, IStructure, Molecule, PeriodicNeighbor, SiteCollection, Structure
-from pymatgen.core.units import ArrayWithUnit, FloatWithUnit, Unit
-
 if TYPE_CHECKING:
     from typing import Any
 
+    from pymatgen.core.composition import Composition
+    from pymatgen.core.lattice import Lattice
+    from pymatgen.core.operations import SymmOp
+    from pymatgen.core.periodic_table import DummySpecie, DummySpecies, Element, Species, get_el_sp
+    from pymatgen.core.sites import PeriodicSite, Site
+    from pymatgen.core.structure import IMolecule, IStructure, Molecule, PeriodicNeighbor, SiteCollection, Structure
+    from pymatgen.core.units import ArrayWithUnit, FloatWithUnit, Unit
+
 __author__ = "Pymatgen Development Team"
 __email__ = "pymatgen@googlegroups.com"
 __maintainer__ = "Shyue Ping Ong, Matthew Horton, Janosh Riebesell"
 __maintainer_email__ = "shyuep@gmail.com"
 
-try:
-    __version__ = version("pymatgen")
-except PackageNotFoundError:  # pragma: no cover
-    # package is not installed
-    pass
-
-
 SETTINGS_FILE: str = os.path.join(os.path.expanduser("~"), ".config", ".pmgrc.yaml")
 OLD_SETTINGS_FILE: str = os.path.join(os.path.expanduser("~"), ".pmgrc.yaml")
 MODULE_DIR: str = os.path.dirname(os.path.abspath(__file__))
@@ -46,11 +37,12 @@ def _load_pmg_settings() -> dict[str, Any]:
     settings_file = os.getenv("PMG_CONFIG_FILE") or SETTINGS_FILE
 
     # Load .pmgrc.yaml file
-    yaml = YAML()
     for file_path in (settings_file, OLD_SETTINGS_FILE):
         try:
             with open(file_path, encoding="utf-8") as yml_file:
-                settings = yaml.load(yml_file) or {}
+                from ruamel.yaml import YAML
+
+                settings = YAML().load(yml_file) or {}
             break
         except FileNotFoundError:
             continue
@@ -80,3 +72,63 @@ def _load_pmg_settings() -> dict[str, Any]:
 
 SETTINGS = _load_pmg_settings()
 locals().update(SETTINGS)
+
+# Public classes are imported on first attribute access (PEP 562) so that
+# `import pymatgen.core` only pays for the submodules that are actually used.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Composition": "composition",
+    "Lattice": "lattice",
+    "SymmOp": "operations",
+    "DummySpecie": "periodic_table",
+    "DummySpecies": "periodic_table",
+    "Element": "periodic_table",
+    "Species": "periodic_table",
+    "get_el_sp": "periodic_table",
+    "PeriodicSite": "sites",
+    "Site": "sites",
+    "IMolecule": "structure",
+    "IStructure": "structure",
+    "Molecule": "structure",
+    "PeriodicNeighbor": "structure",
+    "SiteCollection": "structure",
+    "Structure": "structure",
+    "ArrayWithUnit": "units",
+    "FloatWithUnit": "units",
+    "Unit": "units",
+}
+
+__all__ = [  # noqa: PLE0604
+    "MODULE_DIR",
+    "OLD_SETTINGS_FILE",
+    "PKG_DIR",
+    "ROOT",
+    "SETTINGS",
+    "SETTINGS_FILE",
+    *_LAZY_IMPORTS,
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public classes and submodules of pymatgen.core."""
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("pymatgen")
+        except PackageNotFoundError:  # pragma: no cover
+            # package is not installed
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+    elif not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        submodule = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = submodule
+        return submodule
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
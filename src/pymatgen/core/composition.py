@@ -11,12 +11,11 @@ import re
 import string
 import warnings
 from collections import defaultdict
-from functools import total_ordering
-from itertools import combinations_with_replacement, product
+from functools import cached_property, lru_cache, total_ordering
 from typing import TYPE_CHECKING, cast
 
 from monty.dev import deprecated
-from monty.fractions import gcd, gcd_float
+from monty.fractions import gcd_float
 from monty.json import MSONable
 from monty.serialization import loadfn
 
@@ -34,6 +33,15 @@ if TYPE_CHECKING:
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Keys that get_el_sp would return unchanged
+_SPECIES_TYPES = (Element, Species, DummySpecies)
+
+# Tolerance for ties between oxidation state scores
+_OXI_SCORE_TOL = 1e-12
+
+# Lazily computed attributes of a Composition, dropped when pickling
+_CACHED_ATTRS = frozenset(("_hash", "_reduced_composition_and_factor", "_reduced_formula_cache", "chemical_system"))
+
 
 @total_ordering
 class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, Stringify):
@@ -138,6 +146,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
     # Prior probability of oxidation used by oxi_state_guesses
     oxi_prob: ClassVar[dict | None] = None
 
+    _data: dict[Element | Species, float]
+
     def __init__(self, *args, strict: bool = False, **kwargs) -> None:
         """Very flexible Composition construction, similar to the built-in Python
         dict(). Also extended to allow simple string init.
@@ -167,7 +177,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         # it's much faster to recognize a composition and use the el_map than
         # to pass the composition to {}
         if len(args) == 1 and isinstance(args[0], type(self)):
-            elem_map = args[0]
+            elem_map = args[0]._data
         elif len(args) == 1 and isinstance(args[0], str):
             elem_map = self._parse_formula(args[0])  # type: ignore[assignment]
         elif len(args) == 1 and isinstance(args[0], float) and math.isnan(args[0]):
@@ -180,7 +190,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             if val < -type(self).amount_tolerance and not self.allow_negative:
                 raise ValueError("Amounts in Composition cannot be negative!")
             if abs(val) >= type(self).amount_tolerance:
-                elem_amt[get_el_sp(key)] = val
+                # Keys coming from another Composition are already resolved
+                elem_amt[key if isinstance(key, _SPECIES_TYPES) else get_el_sp(key)] = val
                 self._n_atoms += abs(val)
         self._data = elem_amt
         if strict and not self.valid:
@@ -262,10 +273,10 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         if not isinstance(other, type(self) | dict):
             return NotImplemented
 
-        new_el_map: dict[SpeciesLike, float] = defaultdict(float)
-        new_el_map.update(self)
+        new_el_map: dict[Element | Species, float] = defaultdict(float)
+        new_el_map.update(self._data)
         for key, val in other.items():
-            new_el_map[get_el_sp(key)] += val
+            new_el_map[key if isinstance(key, _SPECIES_TYPES) else get_el_sp(key)] += val
         return type(self)(new_el_map, allow_negative=self.allow_negative)
 
     def __sub__(self, other: object) -> Self:
@@ -280,10 +291,10 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         if not isinstance(other, type(self) | dict):
             return NotImplemented
 
-        new_el_map: dict[SpeciesLike, float] = defaultdict(float)
-        new_el_map.update(self)
+        new_el_map: dict[Element | Species, float] = defaultdict(float)
+        new_el_map.update(self._data)
         for key, val in other.items():
-            new_el_map[get_el_sp(key)] -= val
+            new_el_map[key if isinstance(key, _SPECIES_TYPES) else get_el_sp(key)] -= val
         return type(self)(new_el_map, allow_negative=self.allow_negative)
 
     def __mul__(self, other: object) -> Self:
@@ -292,19 +303,27 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         """
         if not isinstance(other, int | float):
             return NotImplemented
-        return type(self)({el: self[el] * other for el in self}, allow_negative=self.allow_negative)
+        return type(self)({el: amt * other for el, amt in self._data.items()}, allow_negative=self.allow_negative)
 
     __rmul__ = __mul__
 
     def __truediv__(self, other: object) -> Self:
         if not isinstance(other, int | float):
             return NotImplemented
-        return type(self)({el: self[el] / other for el in self}, allow_negative=self.allow_negative)
+        return type(self)({el: amt / other for el, amt in self._data.items()}, allow_negative=self.allow_negative)
 
     __div__ = __truediv__
 
     def __hash__(self) -> int:
         """Hash based on the chemical system."""
+        return self._hash
+
+    def __getstate__(self) -> dict:
+        # Cached values are not pickled: hashes of Species differ between processes
+        return {key: val for key, val in self.__dict__.items() if key not in _CACHED_ATTRS}
+
+    @cached_property
+    def _hash(self) -> int:
         return hash(frozenset(self._data))
 
     def __repr__(self) -> str:
@@ -422,6 +441,10 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             tuple[Composition, float]: Normalized Composition and multiplicative factor,
             i.e. "Li4Fe4P4O16" returns (Composition("LiFePO4"), 4).
         """
+        return self._reduced_composition_and_factor
+
+    @cached_property
+    def _reduced_composition_and_factor(self) -> tuple[Self, float]:
         factor: float = self.get_reduced_formula_and_factor()[1]
         return self / factor, factor
 
@@ -442,13 +465,25 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             tuple[str, float]: Normalized formula and multiplicative factor,
                 i.e., "Li4Fe4P4O16" returns (LiFePO4, 4).
         """
-        all_int: bool = all(abs(val - round(val)) < type(self).amount_tolerance for val in self.values())
+        # Compositions are immutable, so the result is computed once per ordering
+        cache = self._reduced_formula_cache
+        if iupac_ordering not in cache:
+            cache[iupac_ordering] = self._get_reduced_formula_and_factor(iupac_ordering)
+        return cache[iupac_ordering]
+
+    @cached_property
+    def _reduced_formula_cache(self) -> dict[bool, tuple[str, float]]:
+        return {}
+
+    def _get_reduced_formula_and_factor(self, iupac_ordering: bool) -> tuple[str, float]:
+        """Uncached implementation of get_reduced_formula_and_factor."""
+        all_int: bool = all(abs(val - round(val)) < type(self).amount_tolerance for val in self._data.values())
         if not all_int:
             return self.formula.replace(" ", ""), 1
 
-        el_amt_dict: dict[str, int] = {key: round(val) for key, val in self.get_el_amt_dict().items()}
+        el_amt: tuple[tuple[str, int], ...] = tuple((key, round(val)) for key, val in self.get_el_amt_dict().items())
         factor: float
-        formula, factor = reduce_formula(el_amt_dict, iupac_ordering=iupac_ordering)
+        formula, factor = _reduce_formula_cached(el_amt, iupac_ordering)
 
         # Do not "completely reduce" certain formulas
         if formula in type(self).special_formulas:
@@ -530,7 +565,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         """The set of elements in the Composition. E.g. {"O", "Si"} for SiO2."""
         return {el.symbol for el in self.elements}
 
-    @property
+    @cached_property
     def chemical_system(self) -> str:
         """The chemical system of a Composition, for example "O-Si" for
         SiO2. Chemical system is a string of a list of elements
@@ -605,49 +640,16 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                 Defaults to True.
 
         Returns:
-            Composition with that formula.
+            dict[str, float]: Symbol to amount mapping of that formula.
 
         Notes:
             In the case of Metallofullerene formula (e.g. Y3N@C80),
             the @ mark will be dropped and passed to parser.
-        """
-        # Raise error if formula contains special characters or only spaces and/or numbers
-        if strict and re.match(r"[\s\d.*/]*$", formula):
-            raise ValueError(f"Invalid {formula=}")
-
-        # For Metallofullerene like "Y3N@C80"
-        formula = formula.replace("@", "")
-        # Square brackets are used in formulas to denote coordination complexes (gh-3583)
-        formula = formula.replace("[", "(")
-        formula = formula.replace("]", ")")
-        # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
-        formula = formula.replace("{", "(")
-        formula = formula.replace("}", ")")
-
-        def get_sym_dict(form: str, factor: float) -> dict[str, float]:
-            sym_dict: dict[str, float] = defaultdict(float)
-            for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
-                el = match[1]
-                amt = 1.0
-                if match[2].strip() != "":
-                    amt = float(match[2])
-                sym_dict[el] += amt * factor
-                form = form.replace(match.group(), "", 1)
-            if form.strip():
-                raise ValueError(f"{form} is an invalid formula!")
-            return sym_dict
 
-        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        while match:
-            factor = 1.0
-            if match[2] != "":
-                factor = float(match[2])
-            unit_sym_dict = get_sym_dict(match[1], factor)
-            expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
-            expanded_formula = formula.replace(match.group(), expanded_sym, 1)
-            formula = expanded_formula
-            match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        return get_sym_dict(formula, 1)
+            Parsed formulas are memoized in an LRU cache, so repeatedly
+            constructing the same Composition only parses it once.
+        """
+        return dict(_parse_formula_cached(formula, strict))
 
     @property
     def anonymized_formula(self) -> str:
@@ -658,7 +660,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         """
         reduced = self.element_composition
         if all(val == int(val) for val in self.values()):
-            reduced /= gcd(*(int(i) for i in self.values()))
+            reduced /= math.gcd(*(int(i) for i in self.values()))
 
         anon = ""
         for elem, amt in zip(string.ascii_uppercase, sorted(reduced.values()), strict=False):
@@ -1087,80 +1089,25 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         if not all(amt == int(amt) for amt in comp.values()):
             raise ValueError("Charge balance analysis requires integer values in Composition!")
 
-        # For each element, determine all possible sum of oxidations
-        # (taking into account nsites for that particular element)
+        # Candidate oxidation states of each element and their prior probabilities
         el_amt = comp.get_el_amt_dict()
-        elements = list(el_amt)
-        el_sums: list = []  # matrix: dim1= el_idx, dim2=possible sums
-        el_sum_scores: defaultdict = defaultdict(set)  # dict of el_idx, sum -> score
-        el_best_oxid_combo: dict = {}  # dict of el_idx, sum -> oxid combo with best score
-        for idx, el in enumerate(elements):
-            el_sum_scores[idx] = {}
-            el_best_oxid_combo[idx] = {}
-            el_sums.append([])
+        el_oxids: list[tuple[float, ...]] = []
+        el_probs: list[tuple[float, ...]] = []
+        for el in el_amt:
             if oxi_states_override.get(el):
                 oxids: list | tuple = oxi_states_override[el]
             elif all_oxi_states:
                 oxids = Element(el).oxidation_states
             else:
                 oxids = Element(el).icsd_oxidation_states or Element(el).common_oxidation_states
+            el_oxids.append(tuple(oxids))
+            el_probs.append(tuple(type(self).oxi_prob.get(Species(el, o), 0) for o in oxids))  # type: ignore[union-attr]
 
-            # Get all possible combinations of oxidation states
-            # and sum each combination
-            for oxid_combo in combinations_with_replacement(oxids, int(el_amt[el])):
-                # List this sum as a possible option
-                oxid_sum = sum(oxid_combo)
-                if oxid_sum not in el_sums[idx]:
-                    el_sums[idx].append(oxid_sum)
-
-                # Determine how probable is this combo?
-                score = sum(type(self).oxi_prob.get(Species(el, o), 0) for o in oxid_combo)  # type: ignore[union-attr]
-
-                # If it is the most probable combo for a certain sum,
-                # store the combination
-                if oxid_sum not in el_sum_scores[idx] or score > el_sum_scores[idx].get(oxid_sum, 0):
-                    el_sum_scores[idx][oxid_sum] = score
-                    el_best_oxid_combo[idx][oxid_sum] = oxid_combo
-
-        # Determine which combination of oxidation states for each element
-        # is the most probable
-        all_sols = []  # will contain all solutions
-        all_oxid_combo = []  # will contain the best combination of oxidation states for each site
-        all_scores = []  # will contain a score for each solution
-        for x in product(*el_sums):
-            # Each x is a trial of one possible oxidation sum for each element
-            if sum(x) == target_charge:  # charge balance condition
-                el_sum_sol = dict(zip(elements, x, strict=True))  # element->oxid_sum
-                # Normalize oxid_sum by amount to get avg oxid state
-                sol = {el: v / el_amt[el] for el, v in el_sum_sol.items()}
-                # Add the solution to the list of solutions
-                all_sols.append(sol)
-
-                # Determine the score for this solution
-                score = 0
-                for idx, v in enumerate(x):
-                    score += el_sum_scores[idx][v]
-                all_scores.append(score)
-
-                # Collect the combination of oxidation states for each site
-                all_oxid_combo.append(
-                    {e: el_best_oxid_combo[idx][v] for idx, (e, v) in enumerate(zip(elements, x, strict=True))}
-                )
-
-        # Sort the solutions from highest to lowest score
-        if all_scores:
-            all_sols, all_oxid_combo = zip(
-                *(
-                    (y, x)
-                    for (z, y, x) in sorted(
-                        zip(all_scores, all_sols, all_oxid_combo, strict=True),
-                        key=lambda pair: pair[0],
-                        reverse=True,
-                    )
-                ),
-                strict=True,
-            )
-        return tuple(all_sols), tuple(all_oxid_combo)
+        all_sols, all_oxid_combo = _get_oxi_state_guesses_cached(
+            tuple((el, int(amt)) for el, amt in el_amt.items()), tuple(el_oxids), tuple(el_probs), target_charge
+        )
+        # Hand out copies so callers cannot modify the cached solutions
+        return tuple(dict(sol) for sol in all_sols), tuple(dict(combo) for combo in all_oxid_combo)
 
     @staticmethod
     def ranked_compositions_from_indeterminate_formula(
@@ -1342,6 +1289,170 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                         yield match
 
 
+@lru_cache(maxsize=4096)
+def _parse_formula_cached(formula: str, strict: bool) -> tuple[tuple[str, float], ...]:
+    """Memoized implementation of Composition._parse_formula."""
+    # Raise error if formula contains special characters or only spaces and/or numbers
+    if strict and re.match(r"[\s\d.*/]*$", formula):
+        raise ValueError(f"Invalid {formula=}")
+
+    # For Metallofullerene like "Y3N@C80"
+    formula = formula.replace("@", "")
+    # Square brackets are used in formulas to denote coordination complexes (gh-3583)
+    formula = formula.replace("[", "(")
+    formula = formula.replace("]", ")")
+    # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
+    formula = formula.replace("{", "(")
+    formula = formula.replace("}", ")")
+
+    def get_sym_dict(form: str, factor: float) -> dict[str, float]:
+        sym_dict: dict[str, float] = defaultdict(float)
+        for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
+            el = match[1]
+            amt = 1.0
+            if match[2].strip() != "":
+                amt = float(match[2])
+            sym_dict[el] += amt * factor
+            form = form.replace(match.group(), "", 1)
+        if form.strip():
+            raise ValueError(f"{form} is an invalid formula!")
+        return sym_dict
+
+    match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    while match:
+        factor = 1.0
+        if match[2] != "":
+            factor = float(match[2])
+        unit_sym_dict = get_sym_dict(match[1], factor)
+        expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
+        expanded_formula = formula.replace(match.group(), expanded_sym, 1)
+        formula = expanded_formula
+        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    return tuple(get_sym_dict(formula, 1).items())
+
+
+def _get_oxi_sum_table(
+    oxids: tuple[float, ...], probs: tuple[float, ...], n_sites: int
+) -> dict[float, tuple[float, tuple[float, ...]]]:
+    """Find the most probable oxidation states of n_sites sites of one element for every possible
+    sum of oxidation states.
+
+    This is a bounded knapsack over the candidate oxidation states: best[j][m][total] is the highest
+    score of m sites that only use oxids[j:] and sum to total. It replaces enumerating all
+    combinations_with_replacement(oxids, n_sites), whose number grows polynomially with n_sites to the
+    power of the number of candidate states, while giving the same result, including which combination
+    wins ties (the first one in combinations_with_replacement order).
+
+    Args:
+        oxids (tuple[float, ...]): Candidate oxidation states.
+        probs (tuple[float, ...]): Prior probability (score) of each candidate oxidation state.
+        n_sites (int): Number of sites of the element.
+
+    Sums are compared rounded to 8 decimals, so that fractional oxidation states add up to the
+    same sum in any order.
+
+    Returns:
+        dict[float, tuple[float, tuple[float, ...]]]: Sum of oxidation states to the score and
+            oxidation states of the best combination, ordered like the first occurrence of each sum in
+            combinations_with_replacement(oxids, n_sites).
+    """
+    n_oxids = len(oxids)
+    best: list[list[dict[float, float]]] = [[{} for _ in range(n_sites + 1)] for _ in range(n_oxids + 1)]
+    best[n_oxids][0][0] = 0.0
+    for j in range(n_oxids - 1, -1, -1):
+        for m in range(n_sites + 1):
+            # Either no more sites with oxids[j], or one more site with oxids[j]
+            scores = dict(best[j + 1][m])
+            if m:
+                for total, score in best[j][m - 1].items():
+                    key = round(total + oxids[j], 8)
+                    if key not in scores or score + probs[j] > scores[key]:
+                        scores[key] = score + probs[j]
+            best[j][m] = scores
+
+    def backtrack(total: float, use_score: bool) -> tuple[int, ...]:
+        """Lexicographically first combination (as oxids indices) with this total,
+        optionally restricted to combinations with the best score.
+        """
+        indices: list[int] = []
+        j, m = 0, n_sites
+        while m:
+            prev = round(total - oxids[j], 8)
+            if prev in best[j][m - 1] and (
+                not use_score or best[j][m - 1][prev] + probs[j] >= best[j][m][total] - _OXI_SCORE_TOL
+            ):
+                indices.append(j)
+                total, m = prev, m - 1
+            else:
+                j += 1
+        return tuple(indices)
+
+    table: dict[float, tuple[float, tuple[float, ...]]] = {}
+    for total in sorted(best[0][n_sites], key=lambda total: backtrack(total, use_score=False)):
+        # Sum like the first combination with this sum, as the sums of combinations used to be
+        first = sum(oxids[idx] for idx in backtrack(total, use_score=False))
+        indices = backtrack(total, use_score=True)
+        table[first] = (sum(probs[idx] for idx in indices), tuple(oxids[idx] for idx in indices))
+    return table
+
+
+@lru_cache(maxsize=1024)
+def _get_oxi_state_guesses_cached(
+    el_amt: tuple[tuple[str, int], ...],
+    el_oxids: tuple[tuple[float, ...], ...],
+    el_probs: tuple[tuple[float, ...], ...],
+    target_charge: float,
+) -> tuple[tuple[dict[str, float], ...], tuple[dict[str, tuple[float, ...]], ...]]:
+    """Charge-balanced oxidation state guesses ranked by score, see Composition._get_oxi_state_guesses.
+
+    The result only depends on the arguments, so it is memoized: ingestion pipelines guess
+    oxidation states for the same compositions over and over.
+    """
+    elements = [el for el, _amt in el_amt]
+    tables = [
+        _get_oxi_sum_table(oxids, probs, amt)
+        for (_el, amt), oxids, probs in zip(el_amt, el_oxids, el_probs, strict=True)
+    ]
+
+    # Achievable totals of the oxidation state sums of elements idx:, to prune the search below
+    suffix_totals: list[set[float]] = [{0}]
+    for table in reversed(tables):
+        suffix_totals.append({round(total + rest, 8) for total in table for rest in suffix_totals[-1]})
+    suffix_totals.reverse()
+
+    # Only visit the charge-balanced combinations of per-element sums, in the order of
+    # itertools.product over the tables so that the stable sort below ranks ties as before
+    all_sols = []  # will contain all solutions
+    all_oxid_combo = []  # will contain the best combination of oxidation states for each site
+    all_scores = []  # will contain a score for each solution
+    stack: list[tuple[int, tuple[float, ...]]] = [(0, ())]
+    while stack:
+        idx, x = stack.pop()
+        if idx == len(tables):
+            if sum(x) == target_charge:  # charge balance condition
+                # Normalize oxid_sum by amount to get avg oxid state
+                all_sols.append({el: v / amt for (el, amt), v in zip(el_amt, x, strict=True)})
+                all_scores.append(sum(tables[el_idx][v][0] for el_idx, v in enumerate(x)))
+                all_oxid_combo.append(
+                    {el: tables[el_idx][v][1] for el_idx, (el, v) in enumerate(zip(elements, x, strict=True))}
+                )
+            continue
+        partial = sum(x)
+        for total in reversed(tables[idx]):
+            if round(target_charge - partial - total, 8) in suffix_totals[idx + 1]:
+                stack.append((idx + 1, (*x, total)))
+
+    # Sort the solutions from highest to lowest score
+    order = sorted(range(len(all_scores)), key=lambda sol_idx: all_scores[sol_idx], reverse=True)
+    return tuple(all_sols[sol_idx] for sol_idx in order), tuple(all_oxid_combo[sol_idx] for sol_idx in order)
+
+
+@lru_cache(maxsize=4096)
+def _reduce_formula_cached(sym_amt: tuple[tuple[str, int], ...], iupac_ordering: bool) -> tuple[str, int]:
+    """Memoized reduce_formula for integer amounts, used by Composition.get_reduced_formula_and_factor."""
+    return reduce_formula(dict(sym_amt), iupac_ordering=iupac_ordering)
+
+
 def reduce_formula(
     sym_amt: Mapping[str, float],
     iupac_ordering: bool = False,
@@ -1369,7 +1480,7 @@ def reduce_formula(
     # Enforce integer for calculating greatest common divisor
     factor: int = 1
     if all(int(i) == i for i in sym_amt.values()):
-        factor = abs(gcd(*(int(i) for i in sym_amt.values())))
+        factor = math.gcd(*(int(i) for i in sym_amt.values()))
 
     # If the composition contains polyanion
     poly_anions: list[str] = []
@@ -8,11 +8,12 @@ import logging
 import math
 import warnings
 from fractions import Fraction
-from functools import reduce
+from functools import lru_cache, reduce
 from itertools import chain, combinations, product
 from typing import TYPE_CHECKING, Literal, cast
 
 import numpy as np
+from joblib import Parallel, delayed
 from monty.fractions import lcm
 from scipy.cluster.hierarchy import fcluster, linkage
 from scipy.spatial.distance import squareform
@@ -820,6 +821,54 @@ class GrainBoundaryGenerator:
             coords_are_cartesian=True,
         )
 
+    def gb_from_sigmas(
+        self,
+        sigmas: Sequence[int],
+        rotation_axis: tuple[int, int, int],
+        ratio: list[int] | None = None,
+        n_jobs: int = 1,
+        **kwargs,
+    ) -> dict[int, list[GrainBoundary]]:
+        """Generate the GBs for all rotation angles of several sigma values.
+
+        The sigma values and rotation angles are enumerated once up to the largest
+        sigma and the GBs are generated in parallel with joblib.
+
+        Args:
+            sigmas (Sequence[int]): sigma values of the GBs. Each has to be a
+                possible sigma value for the rotation axis.
+            rotation_axis (tuple of 3): Rotation axis of GB e.g.: (1, 1, 0).
+            ratio (list[int]): lattice axial ratio, see gb_from_parameters.
+            n_jobs (int): Number of joblib workers used to generate the GBs.
+                Defaults to 1, -1 uses all CPUs.
+            **kwargs: Passed to gb_from_parameters, e.g. plane or expand_times.
+
+        Returns:
+            dict[int, list[GrainBoundary]]: GBs for each sigma value, in order
+                of increasing rotation angle.
+        """
+        sigma_dict = self._get_sigma_dict(
+            max(sigmas),
+            rotation_axis,
+            lat_type=self.lat_type,
+            ratio=None if ratio is None else cast("tuple[int, int]", tuple(ratio)),
+        )
+        if invalid := [sigma for sigma in sigmas if sigma not in sigma_dict]:
+            raise ValueError(f"{invalid} are not possible sigma values for {rotation_axis=}")
+
+        tasks = [(sigma, angle) for sigma in dict.fromkeys(sigmas) for angle in sorted(sigma_dict[sigma])]
+        gbs = Parallel(n_jobs=n_jobs)(
+            delayed(self.gb_from_parameters)(
+                rotation_axis, angle, ratio=None if ratio is None else list(ratio), **kwargs
+            )
+            for _, angle in tasks
+        )
+
+        sigma_gbs: dict[int, list[GrainBoundary]] = {sigma: [] for sigma in sigmas}
+        for (sigma, _), gb in zip(tasks, gbs, strict=True):
+            sigma_gbs[sigma].append(gb)
+        return sigma_gbs
+
     def get_ratio(
         self,
         max_denominator: int = 5,
@@ -1298,16 +1347,12 @@ class GrainBoundaryGenerator:
         scale[hh, hh] = 1
         scale[kk, kk] = least_mul
         scale[ll, ll] = sigma / least_mul
-        n_final = None
-        for idx in range(least_mul):
-            check_int = idx * new_rot[:, kk] + (sigma / least_mul) * new_rot[:, ll]
-            if all(np.round(x, 5).is_integer() for x in list(check_int)):
-                n_final = idx
-                break
+        check_int = np.round(np.arange(least_mul)[:, None] * new_rot[:, kk] + (sigma / least_mul) * new_rot[:, ll], 5)
+        n_finals = np.flatnonzero(np.all(check_int == np.floor(check_int), axis=1))
 
-        if n_final is None:
+        if len(n_finals) == 0:
             raise RuntimeError("Something is wrong. Check if this GB exists or not")
-        scale[kk, ll] = n_final
+        scale[kk, ll] = n_finals[0]
         # Each row of mat_csl is the CSL lattice vector
         csl_init = np.rint(np.dot(np.dot(r_matrix, trans), scale)).astype(int).T
         if abs(r_axis[hh]) > 1:
@@ -1363,54 +1408,7 @@ class GrainBoundaryGenerator:
                 you need to analyze the symmetry of the structure. Different angles may
                 result in equivalent microstructures.
         """
-        # Make sure math.gcd(r_axis) == 1
-        if reduce(math.gcd, r_axis) != 1:
-            r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
-
-        # Count the number of odds in r_axis
-        odd_r = len(list(filter(lambda x: x % 2 == 1, r_axis)))
-        # Compute the max n we need to enumerate
-        if odd_r == 3:
-            a_max = 4
-        elif odd_r == 0:
-            a_max = 1
-        else:
-            a_max = 2
-        n_max = int(np.sqrt(cutoff * a_max / sum(np.array(r_axis) ** 2)))
-        # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n_loop in range(1, n_max + 1):
-            n = n_loop
-            m_max = int(np.sqrt(cutoff * a_max - n**2 * sum(np.array(r_axis) ** 2)))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    n = 1 if m == 0 else n_loop
-                    # Construct the quadruple [m, U,V,W], count the number of odds in
-                    # quadruple to determine the parameter a, refer to the reference
-                    quadruple = [m] + [x * n for x in r_axis]
-                    odd_qua = len(list(filter(lambda x: x % 2 == 1, quadruple)))
-                    if odd_qua == 4:
-                        a = 4
-                    elif odd_qua == 2:
-                        a = 2
-                    else:
-                        a = 1
-                    sigma = round((m**2 + n**2 * sum(np.array(r_axis) ** 2)) / a)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            if m == 0:
-                                angle = 180.0
-                            else:
-                                angle = 2 * np.arctan(n * np.sqrt(sum(np.array(r_axis) ** 2)) / m) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            if m == 0:
-                                angle = 180.0
-                            else:
-                                angle = 2 * np.arctan(n * np.sqrt(sum(np.array(r_axis) ** 2)) / m) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-        return sigmas
+        return _copy_sigmas(_enum_sigma_cubic(cutoff, tuple(r_axis)))
 
     @staticmethod
     def enum_sigma_hex(
@@ -1439,94 +1437,7 @@ class GrainBoundaryGenerator:
                 you need to analyze the symmetry of the structure. Different angles may
                 result in equivalent microstructures.
         """
-        # Make sure math.gcd(r_axis) == 1
-        if reduce(math.gcd, r_axis) != 1:
-            r_axis = cast(
-                "tuple[int, int, int] | tuple[int, int, int,int]",
-                tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis),
-            )
-
-        # Transform four index notation to three index notation
-        if len(r_axis) == 4:
-            u1 = r_axis[0]
-            v1 = r_axis[1]
-            w1 = r_axis[3]
-            u = 2 * u1 + v1
-            v = 2 * v1 + u1
-            w = w1
-        else:
-            u, v, w = r_axis  # type: ignore[misc]
-
-        # Make sure mu, mv are coprime integers
-        if c2_a2_ratio is None:
-            mu, mv = [1, 1]
-            if w != 0 and (u != 0 or (v != 0)):
-                raise RuntimeError("For irrational c2/a2, CSL only exist for [0,0,1] or [u,v,0] and m = 0")
-        else:
-            mu, mv = c2_a2_ratio
-            if math.gcd(mu, mv) != 1:
-                temp = math.gcd(mu, mv)
-                mu = round(mu / temp)
-                mv = round(mv / temp)
-
-        # Refer to the meaning of d in reference
-        d = (u**2 + v**2 - u * v) * mv + w**2 * mu
-
-        # Compute the max n we need to enumerate
-        n_max = int(np.sqrt((cutoff * 12 * mu * mv) / abs(d)))
-
-        # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
-            if (c2_a2_ratio is None) and w == 0:
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * 12 * mu * mv - n**2 * d) / (3 * mu)))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                        (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                        (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                        (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                        (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of the rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                        (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                        (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                        (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                        (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = 3 * mu * m**2 + d * n**2
-                    all_list = R_list_inv + R_list + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse.
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round((3 * mu * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-        return sigmas
+        return _copy_sigmas(_enum_sigma_hex(cutoff, tuple(r_axis), _as_ratio_key(c2_a2_ratio)))
 
     @staticmethod
     def enum_sigma_rho(
@@ -1555,107 +1466,7 @@ class GrainBoundaryGenerator:
                 angles, you need to analyze the symmetry of the structure. Different
                 angles may result in equivalent microstructures.
         """
-        # Transform four index notation to three index notation
-        if len(r_axis) == 4:
-            u1 = r_axis[0]
-            v1 = r_axis[1]
-            w1 = r_axis[3]
-            u = 2 * u1 + v1 + w1
-            v = v1 + w1 - u1
-            w = w1 - 2 * v1 - u1
-            r_axis = (u, v, w)
-
-        # Make sure math.(r_axis) == 1
-        if reduce(math.gcd, r_axis) != 1:
-            r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
-        u, v, w = r_axis  # type: ignore[misc]
-
-        # Make sure mu, mv are coprime integers
-        if ratio_alpha is None:
-            mu, mv = [1, 1]
-            if u + v + w != 0 and (u != v or u != w):
-                raise RuntimeError("For irrational ratio_alpha, CSL only exist for [1,1,1] or [u, v, -(u+v)] and m =0")
-        else:
-            mu, mv = ratio_alpha
-            if math.gcd(mu, mv) != 1:
-                temp = math.gcd(mu, mv)
-                mu = round(mu / temp)
-                mv = round(mv / temp)
-
-        # Refer to the meaning of d in reference
-        d = (u**2 + v**2 + w**2) * (mu - 2 * mv) + 2 * mv * (v * w + w * u + u * v)
-        # Compute the max n we need to enumerate
-        n_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv))) / abs(d)))
-
-        # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
-            if ratio_alpha is None and u + v + w == 0:
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv)) - n**2 * d) / (mu)))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                        + 2 * mv * (v - w) * m * n
-                        - 2 * mv * v * w * n**2
-                        + mu * m**2,
-                        2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                        + 2 * mv * (w - u) * m * n
-                        - 2 * mv * u * w * n**2
-                        + mu * m**2,
-                        2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                        + 2 * mv * (u - v) * m * n
-                        - 2 * mv * u * v * n**2
-                        + mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of the rotation matrix
-                    R_list_inv = [
-                        (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                        + 2 * mv * (v - w) * m * n
-                        - 2 * mv * v * w * n**2
-                        + mu * m**2,
-                        2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                        + 2 * mv * (w - u) * m * n
-                        - 2 * mv * u * w * n**2
-                        + mu * m**2,
-                        2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                        + 2 * mv * (u - v) * m * n
-                        - 2 * mv * u * v * n**2
-                        + mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * m**2 + d * n**2
-                    all_list = R_list_inv + R_list + [F]
-                    # Compute the max common factors for the elements of the rotation matrix and its inverse.
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round(abs(F / com_fac))
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180.0
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-        return sigmas
+        return _copy_sigmas(_enum_sigma_rho(cutoff, tuple(r_axis), _as_ratio_key(ratio_alpha)))
 
     @staticmethod
     def enum_sigma_tet(
@@ -1684,80 +1495,7 @@ class GrainBoundaryGenerator:
                 angles, you need to analyze the symmetry of the structure. Different
                 angles may result in equivalent microstructures.
         """
-        # Make sure math.gcd(r_axis) == 1
-        if reduce(math.gcd, r_axis) != 1:
-            r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
-
-        u, v, w = r_axis
-
-        # Make sure mu, mv are coprime integers
-        if c2_a2_ratio is None:
-            mu, mv = [1, 1]
-            if w != 0 and (u != 0 or (v != 0)):
-                raise RuntimeError("For irrational c2/a2, CSL only exist for [0,0,1] or [u,v,0] and m = 0")
-        else:
-            mu, mv = c2_a2_ratio
-            if math.gcd(mu, mv) != 1:
-                temp = math.gcd(mu, mv)
-                mu = round(mu / temp)
-                mv = round(mv / temp)
-
-        # Refer to the meaning of d in reference
-        d = (u**2 + v**2) * mv + w**2 * mu
-
-        # Compute the max n we need to enumerate
-        n_max = int(np.sqrt((cutoff * 4 * mu * mv) / d))
-
-        # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
-            m_max = 0 if c2_a2_ratio is None and w == 0 else int(np.sqrt((cutoff * 4 * mu * mv - n**2 * d) / mu))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * u * mv * n**2 - 2 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * v * mu * m * n,
-                        2 * u * v * mv * n**2 + 2 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * u * mu * m * n,
-                        2 * u * w * mv * n**2 - 2 * v * mv * m * n,
-                        2 * v * w * mv * n**2 + 2 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * u * mv * n**2 - 2 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * v * mu * m * n,
-                        2 * u * v * mv * n**2 + 2 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * u * mu * m * n,
-                        2 * u * w * mv * n**2 - 2 * v * mv * m * n,
-                        2 * v * w * mv * n**2 + 2 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * m**2 + d * n**2
-                    all_list = R_list + R_list_inv + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round((mu * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-
-        return sigmas
+        return _copy_sigmas(_enum_sigma_tet(cutoff, tuple(r_axis), _as_ratio_key(c2_a2_ratio)))
 
     @staticmethod
     def enum_sigma_ort(
@@ -1789,113 +1527,7 @@ class GrainBoundaryGenerator:
                 angles, you need to analyze the symmetry of the structure. Different
                 angles may result in equivalent microstructures.
         """
-        # Make sure math.gcd(r_axis) == 1
-        if reduce(math.gcd, r_axis) != 1:
-            r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
-
-        u, v, w = r_axis
-
-        # Make sure mu, lambda, mv are coprime integers
-        if None in c2_b2_a2_ratio:
-            mu, lam, mv = c2_b2_a2_ratio
-            non_none = [i for i in c2_b2_a2_ratio if i is not None]
-            if len(non_none) < 2:
-                raise RuntimeError("No CSL exist for two irrational numbers")
-            non1, non2 = non_none
-            if reduce(math.gcd, non_none) != 1:  # type: ignore[arg-type]
-                temp = reduce(math.gcd, non_none)  # type: ignore[arg-type]
-                non1 = round(non1 / temp)
-                non2 = round(non2 / temp)
-            if mu is None:
-                lam = non1
-                mv = non2
-                mu = 1
-                if w != 0 and (u != 0 or (v != 0)):
-                    raise RuntimeError("For irrational c2, CSL only exist for [0,0,1] or [u,v,0] and m = 0")
-            elif lam is None:
-                mu = non1
-                mv = non2
-                lam = 1
-                if v != 0 and (u != 0 or (w != 0)):
-                    raise RuntimeError("For irrational b2, CSL only exist for [0,1,0] or [u,0,w] and m = 0")
-            elif mv is None:
-                mu = non1
-                lam = non2
-                mv = 1
-                if u != 0 and (w != 0 or (v != 0)):
-                    raise RuntimeError("For irrational a2, CSL only exist for [1,0,0] or [0,v,w] and m = 0")
-        else:
-            mu, lam, mv = c2_b2_a2_ratio
-            if reduce(math.gcd, c2_b2_a2_ratio) != 1:  # type: ignore[arg-type]
-                temp = reduce(math.gcd, c2_b2_a2_ratio)  # type: ignore[arg-type]
-                mu = round(mu / temp)
-                mv = round(mv / temp)
-                lam = round(lam / temp)
-            if u == 0 and v == 0:
-                mu = 1
-            if u == 0 and w == 0:
-                lam = 1
-            if v == 0 and w == 0:
-                mv = 1
-        # Refer to the reference for the meaning of d
-        d = (mv * u**2 + lam * v**2) * mv + w**2 * mu * mv
-
-        # Compute the max n we need to enumerate
-        n_max = int(np.sqrt((cutoff * 4 * mu * mv * mv * lam) / d))
-        # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
-            mu_temp, lam_temp, mv_temp = c2_b2_a2_ratio
-            if (mu_temp is None and w == 0) or (lam_temp is None and v == 0) or (mv_temp is None and u == 0):
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * 4 * mu * mv * lam * mv - n**2 * d) / mu / lam))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                        2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                        2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                        (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * mv * mu * (v * w * n**2 - u * m * n),
-                        2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                        2 * lam * mv * (v * w * n**2 + u * m * n),
-                        (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                        2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                        2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                        (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * mv * mu * (v * w * n**2 - u * m * n),
-                        2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                        2 * lam * mv * (v * w * n**2 + u * m * n),
-                        (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * lam * m**2 + d * n**2
-                    all_list = R_list + R_list_inv + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse.
-                    com_fac = reduce(math.gcd, all_list)  # type: ignore[arg-type]
-                    sigma = round((mu * lam * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-
-        return sigmas
+        return _copy_sigmas(_enum_sigma_ort(cutoff, tuple(r_axis), _as_ratio_key(c2_b2_a2_ratio)))
 
     @staticmethod
     def enum_possible_plane_cubic(
@@ -2003,6 +1635,34 @@ class GrainBoundaryGenerator:
             If the sigma value is not correct, return the rotation angle corresponding
             to the correct possible sigma value right smaller than the wrong sigma value provided.
         """
+        sigma_dict = GrainBoundaryGenerator._get_sigma_dict(sigma, r_axis, lat_type=lat_type, ratio=ratio)
+        sigmas = list(sigma_dict)
+        if not sigmas:
+            raise RuntimeError("This is a wrong sigma value, and no sigma exists smaller than this value.")
+        if sigma in sigmas:
+            rotation_angles = sigma_dict[sigma]
+        else:
+            sigmas.sort()
+            warnings.warn(
+                "This is not the possible sigma value according to the rotation axis!"
+                "The nearest neighbor sigma and its corresponding angle are returned",
+                stacklevel=2,
+            )
+            rotation_angles = sigma_dict[sigmas[-1]]
+        rotation_angles.sort()
+        return rotation_angles
+
+    @staticmethod
+    def _get_sigma_dict(
+        cutoff: int,
+        r_axis: tuple[int, int, int] | tuple[int, int, int, int],
+        lat_type: str = "c",
+        ratio: tuple[int, int] | tuple[int, int, int] | None = None,
+    ) -> dict[int, list[float]]:
+        """Enumerate the sigma values and rotation angles up to cutoff with the
+        enum_sigma_* function of the given lattice type, see get_rotation_angle_from_sigma
+        for the arguments.
+        """
         lat_type = lat_type.lower()
 
         # Check r_axis length
@@ -2022,7 +1682,7 @@ class GrainBoundaryGenerator:
         if lat_type == "c":
             logger.info("Make sure this is for cubic system")
             sigma_dict = GrainBoundaryGenerator.enum_sigma_cubic(
-                cutoff=sigma, r_axis=cast("tuple[int, int, int]", r_axis)
+                cutoff=cutoff, r_axis=cast("tuple[int, int, int]", r_axis)
             )
 
         elif lat_type == "t":
@@ -2030,7 +1690,7 @@ class GrainBoundaryGenerator:
             if ratio is None:
                 logger.info("Make sure this is for irrational c2/a2 ratio")
             sigma_dict = GrainBoundaryGenerator.enum_sigma_tet(
-                cutoff=sigma,
+                cutoff=cutoff,
                 r_axis=cast("tuple[int, int, int]", r_axis),
                 c2_a2_ratio=cast("tuple[int, int]", ratio),
             )
@@ -2038,7 +1698,7 @@ class GrainBoundaryGenerator:
         elif lat_type == "o":
             logger.info("Make sure this is for orthorhombic system")
             sigma_dict = GrainBoundaryGenerator.enum_sigma_ort(
-                cutoff=sigma,
+                cutoff=cutoff,
                 r_axis=cast("tuple[int, int, int]", r_axis),
                 c2_b2_a2_ratio=cast("tuple[int, int, int]", ratio),
             )
@@ -2048,7 +1708,7 @@ class GrainBoundaryGenerator:
             if ratio is None:
                 logger.info("Make sure this is for irrational c2/a2 ratio")
             sigma_dict = GrainBoundaryGenerator.enum_sigma_hex(
-                cutoff=sigma, r_axis=r_axis, c2_a2_ratio=cast("tuple[int, int]", ratio)
+                cutoff=cutoff, r_axis=r_axis, c2_a2_ratio=cast("tuple[int, int]", ratio)
             )
 
         elif lat_type == "r":
@@ -2056,29 +1716,14 @@ class GrainBoundaryGenerator:
             if ratio is None:
                 logger.info("Make sure this is for irrational (1+2*cos(alpha)/cos(alpha) ratio")
             sigma_dict = GrainBoundaryGenerator.enum_sigma_rho(
-                cutoff=sigma,
+                cutoff=cutoff,
                 r_axis=cast("tuple[int, int, int]", r_axis),
                 ratio_alpha=cast("tuple[int, int]", ratio),
             )
 
         else:
             raise RuntimeError("Lattice type not implemented")
-
-        sigmas = list(sigma_dict)
-        if not sigmas:
-            raise RuntimeError("This is a wrong sigma value, and no sigma exists smaller than this value.")
-        if sigma in sigmas:
-            rotation_angles = sigma_dict[sigma]
-        else:
-            sigmas.sort()
-            warnings.warn(
-                "This is not the possible sigma value according to the rotation axis!"
-                "The nearest neighbor sigma and its corresponding angle are returned",
-                stacklevel=2,
-            )
-            rotation_angles = sigma_dict[sigmas[-1]]
-        rotation_angles.sort()
-        return rotation_angles
+        return sigma_dict
 
     @staticmethod
     def slab_from_csl(
@@ -2377,6 +2022,410 @@ class GrainBoundaryGenerator:
         return cast("tuple[int, int, int]", miller)
 
 
+# Sigma tables only depend on the lattice type, rotation axis, axial ratio and
+# cutoff, so they are shared by every GrainBoundaryGenerator in the session.
+_SIGMA_CACHE_SIZE = 256
+
+
+def _as_ratio_key(ratio: Sequence | None) -> tuple | None:
+    """Hashable form of an axial ratio for the sigma table cache."""
+    return None if ratio is None else tuple(ratio)
+
+
+def _copy_sigmas(sigmas: dict[int, list[float]]) -> dict[int, list[float]]:
+    """Copy of a cached sigma table that callers are free to modify."""
+    return {sigma: list(angles) for sigma, angles in sigmas.items()}
+
+
+def _get_csl_pairs(m_maxes: list[int], dtype: type = np.int64) -> tuple[NDArray, NDArray]:
+    """All (n, m) candidates in enumeration order, i.e. n-major with
+    0 <= m <= m_maxes[n - 1] and gcd(m, n) == 1 or m == 0.
+    """
+    n_list = []
+    m_list = []
+    for n, m_max in enumerate(m_maxes, start=1):
+        m = np.arange(m_max + 1, dtype=np.int64)
+        m = m[(np.gcd(m, n) == 1) | (m == 0)]
+        n_list.append(np.full(len(m), n, dtype=np.int64))
+        m_list.append(m)
+    if not n_list:
+        return np.zeros(0, dtype=dtype), np.zeros(0, dtype=dtype)
+    return np.concatenate(n_list).astype(dtype), np.concatenate(m_list).astype(dtype)
+
+
+def _get_csl_dtype(r_axis: Sequence[int], ratio: Sequence[int], m_maxes: list[int]) -> type:
+    """Integer dtype for the CSL matrix elements. The elements are quadratic in
+    the axis, ratio and (n, m), fall back to Python integers if int64 could overflow.
+    """
+    max_axis = max(abs(x) for x in (*r_axis, 1))
+    max_ratio = max(abs(x) for x in (*ratio, 1))
+    max_nm = len(m_maxes) + max(m_maxes, default=0) + 1
+    return np.int64 if 64 * (max_axis * max_ratio * max_nm) ** 2 < 2**62 else object
+
+
+def _get_csl_angles(n: NDArray, m: NDArray, get_tan: Callable[[NDArray, NDArray], NDArray]) -> NDArray:
+    """Rotation angles in degree, 180 for m == 0 and 2 * arctan(get_tan(n, m)) otherwise."""
+    angles = np.full(len(m), 180.0)
+    nonzero = m != 0
+    tan = get_tan(n[nonzero].astype(float), m[nonzero].astype(float))
+    angles[nonzero] = 2 * np.arctan(tan) / np.pi * 180
+    return angles
+
+
+def _group_csl_sigmas(
+    sigmas: NDArray,
+    n: NDArray,
+    m: NDArray,
+    cutoff: int,
+    get_tan: Callable[[NDArray, NDArray], NDArray],
+) -> dict[int, list[float]]:
+    """Group the rotation angles of the (n, m) candidates by their rounded sigma
+    values within (1, cutoff], in order of first appearance.
+    """
+    mask = (sigmas > 1) & (sigmas <= cutoff)
+    angles = _get_csl_angles(n[mask], m[mask], get_tan)
+    grouped: dict[int, list[float]] = {}
+    for sigma, angle in zip(sigmas[mask].astype(np.int64).tolist(), angles.tolist(), strict=True):
+        sigma_angles = grouped.setdefault(sigma, [])
+        if angle not in sigma_angles:
+            sigma_angles.append(angle)
+    return grouped
+
+
+def _get_csl_sigmas(
+    r_list: Callable[[NDArray], list],
+    F: NDArray,
+    m: NDArray,
+) -> NDArray:
+    """Rounded sigma values F / gcd(R, R^-1, F) for all candidates, where
+    r_list(m) gives the nine elements of the rotation matrix (not yet divided
+    by F) and r_list(-m) those of its inverse.
+    """
+    com_fac = np.gcd.reduce([*r_list(m), *r_list(-m), F], axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.rint(np.asarray(F / com_fac, dtype=float))
+
+
+@lru_cache(maxsize=_SIGMA_CACHE_SIZE)
+def _enum_sigma_cubic(cutoff: int, r_axis: tuple[int, int, int]) -> dict[int, list[float]]:
+    """Cached implementation of GrainBoundaryGenerator.enum_sigma_cubic."""
+    # Make sure math.gcd(r_axis) == 1
+    if reduce(math.gcd, r_axis) != 1:
+        r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
+
+    # Count the number of odds in r_axis
+    odd_r = len(list(filter(lambda x: x % 2 == 1, r_axis)))
+    # Compute the max n we need to enumerate
+    if odd_r == 3:
+        a_max = 4
+    elif odd_r == 0:
+        a_max = 1
+    else:
+        a_max = 2
+    r_norm2 = sum(np.array(r_axis) ** 2)
+    n_max = int(np.sqrt(cutoff * a_max / r_norm2))
+    m_maxes = [int(np.sqrt(cutoff * a_max - n**2 * r_norm2)) for n in range(1, n_max + 1)]
+
+    # Enumerate all possible n, m to give possible sigmas within the cutoff
+    n, m = _get_csl_pairs(m_maxes, _get_csl_dtype(r_axis, (a_max,), m_maxes))
+    n[m == 0] = 1
+    # Construct the quadruple [m, U,V,W], count the number of odds in
+    # quadruple to determine the parameter a, refer to the reference
+    odd_qua = (m % 2 == 1).astype(int) + sum((x * n) % 2 == 1 for x in r_axis)
+    a = np.where(odd_qua == 4, 4, np.where(odd_qua == 2, 2, 1))
+    sigmas = np.rint(np.asarray((m**2 + n**2 * r_norm2) / a, dtype=float))
+    return _group_csl_sigmas(sigmas, n, m, cutoff, lambda n, m: n * np.sqrt(r_norm2) / m)
+
+
+@lru_cache(maxsize=_SIGMA_CACHE_SIZE)
+def _enum_sigma_hex(
+    cutoff: int,
+    r_axis: tuple[int, int, int] | tuple[int, int, int, int],
+    c2_a2_ratio: tuple[int, int] | None,
+) -> dict[int, list[float]]:
+    """Cached implementation of GrainBoundaryGenerator.enum_sigma_hex."""
+    # Make sure math.gcd(r_axis) == 1
+    if reduce(math.gcd, r_axis) != 1:
+        r_axis = cast(
+            "tuple[int, int, int] | tuple[int, int, int,int]",
+            tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis),
+        )
+
+    # Transform four index notation to three index notation
+    if len(r_axis) == 4:
+        u1 = r_axis[0]
+        v1 = r_axis[1]
+        w1 = r_axis[3]
+        u = 2 * u1 + v1
+        v = 2 * v1 + u1
+        w = w1
+    else:
+        u, v, w = r_axis  # type: ignore[misc]
+
+    # Make sure mu, mv are coprime integers
+    if c2_a2_ratio is None:
+        mu, mv = [1, 1]
+        if w != 0 and (u != 0 or (v != 0)):
+            raise RuntimeError("For irrational c2/a2, CSL only exist for [0,0,1] or [u,v,0] and m = 0")
+    else:
+        mu, mv = c2_a2_ratio
+        if math.gcd(mu, mv) != 1:
+            temp = math.gcd(mu, mv)
+            mu = round(mu / temp)
+            mv = round(mv / temp)
+
+    # Refer to the meaning of d in reference
+    d = (u**2 + v**2 - u * v) * mv + w**2 * mu
+
+    # Compute the max n we need to enumerate
+    n_max = int(np.sqrt((cutoff * 12 * mu * mv) / abs(d)))
+    m_maxes = []
+    for n_int in range(1, n_max + 1):
+        m_max = 0 if c2_a2_ratio is None and w == 0 else int(np.sqrt((cutoff * 12 * mu * mv - n_int**2 * d) / (3 * mu)))
+        m_maxes.append(m_max)
+        if m_max == 0:
+            break
+
+    # Enumerate all possible n, m to give possible sigmas within the cutoff
+    n, m = _get_csl_pairs(m_maxes, _get_csl_dtype((u, v, w), (mu, mv), m_maxes))
+
+    def r_list(m: NDArray) -> list:
+        # Construct the rotation matrix, refer to the reference
+        return [
+            (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
+            (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
+            2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
+            (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
+            (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
+            2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
+            (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
+            (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
+            (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
+        ]
+
+    sigmas = _get_csl_sigmas(r_list, 3 * mu * m**2 + d * n**2, m)
+    return _group_csl_sigmas(sigmas, n, m, cutoff, lambda n, m: n / m * np.sqrt(d / 3.0 / mu))
+
+
+@lru_cache(maxsize=_SIGMA_CACHE_SIZE)
+def _enum_sigma_rho(
+    cutoff: int,
+    r_axis: tuple[int, int, int] | tuple[int, int, int, int],
+    ratio_alpha: tuple[int, int] | None,
+) -> dict[int, list[float]]:
+    """Cached implementation of GrainBoundaryGenerator.enum_sigma_rho."""
+    # Transform four index notation to three index notation
+    if len(r_axis) == 4:
+        u1 = r_axis[0]
+        v1 = r_axis[1]
+        w1 = r_axis[3]
+        u = 2 * u1 + v1 + w1
+        v = v1 + w1 - u1
+        w = w1 - 2 * v1 - u1
+        r_axis = (u, v, w)
+
+    # Make sure math.(r_axis) == 1
+    if reduce(math.gcd, r_axis) != 1:
+        r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
+    u, v, w = r_axis  # type: ignore[misc]
+
+    # Make sure mu, mv are coprime integers
+    if ratio_alpha is None:
+        mu, mv = [1, 1]
+        if u + v + w != 0 and (u != v or u != w):
+            raise RuntimeError("For irrational ratio_alpha, CSL only exist for [1,1,1] or [u, v, -(u+v)] and m =0")
+    else:
+        mu, mv = ratio_alpha
+        if math.gcd(mu, mv) != 1:
+            temp = math.gcd(mu, mv)
+            mu = round(mu / temp)
+            mv = round(mv / temp)
+
+    # Refer to the meaning of d in reference
+    d = (u**2 + v**2 + w**2) * (mu - 2 * mv) + 2 * mv * (v * w + w * u + u * v)
+    # Compute the max n we need to enumerate
+    n_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv))) / abs(d)))
+    m_maxes = []
+    for n_int in range(1, n_max + 1):
+        if ratio_alpha is None and u + v + w == 0:
+            m_max = 0
+        else:
+            m_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv)) - n_int**2 * d) / (mu)))
+        m_maxes.append(m_max)
+        if m_max == 0:
+            break
+
+    # Enumerate all possible n, m to give possible sigmas within the cutoff
+    n, m = _get_csl_pairs(m_maxes, _get_csl_dtype((u, v, w), (mu, mv), m_maxes))
+
+    def r_list(m: NDArray) -> list:
+        # Construct the rotation matrix, refer to the reference
+        return [
+            (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2 + 2 * mv * (v - w) * m * n - 2 * mv * v * w * n**2 + mu * m**2,
+            2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
+            2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
+            2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
+            (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2 + 2 * mv * (w - u) * m * n - 2 * mv * u * w * n**2 + mu * m**2,
+            2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
+            2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
+            2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
+            (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2 + 2 * mv * (u - v) * m * n - 2 * mv * u * v * n**2 + mu * m**2,
+        ]
+
+    sigmas = np.abs(_get_csl_sigmas(r_list, mu * m**2 + d * n**2, m))
+    return _group_csl_sigmas(sigmas, n, m, cutoff, lambda n, m: n / m * np.sqrt(d / mu))
+
+
+@lru_cache(maxsize=_SIGMA_CACHE_SIZE)
+def _enum_sigma_tet(
+    cutoff: int,
+    r_axis: tuple[int, int, int],
+    c2_a2_ratio: tuple[int, int] | None,
+) -> dict[int, list[float]]:
+    """Cached implementation of GrainBoundaryGenerator.enum_sigma_tet."""
+    # Make sure math.gcd(r_axis) == 1
+    if reduce(math.gcd, r_axis) != 1:
+        r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
+
+    u, v, w = r_axis
+
+    # Make sure mu, mv are coprime integers
+    if c2_a2_ratio is None:
+        mu, mv = [1, 1]
+        if w != 0 and (u != 0 or (v != 0)):
+            raise RuntimeError("For irrational c2/a2, CSL only exist for [0,0,1] or [u,v,0] and m = 0")
+    else:
+        mu, mv = c2_a2_ratio
+        if math.gcd(mu, mv) != 1:
+            temp = math.gcd(mu, mv)
+            mu = round(mu / temp)
+            mv = round(mv / temp)
+
+    # Refer to the meaning of d in reference
+    d = (u**2 + v**2) * mv + w**2 * mu
+
+    # Compute the max n we need to enumerate
+    n_max = int(np.sqrt((cutoff * 4 * mu * mv) / d))
+    m_maxes = []
+    for n_int in range(1, n_max + 1):
+        m_max = 0 if c2_a2_ratio is None and w == 0 else int(np.sqrt((cutoff * 4 * mu * mv - n_int**2 * d) / mu))
+        m_maxes.append(m_max)
+        if m_max == 0:
+            break
+
+    # Enumerate all possible n, m to give possible sigmas within the cutoff
+    n, m = _get_csl_pairs(m_maxes, _get_csl_dtype((u, v, w), (mu, mv), m_maxes))
+
+    def r_list(m: NDArray) -> list:
+        # Construct the rotation matrix, refer to the reference
+        return [
+            (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
+            2 * v * u * mv * n**2 - 2 * w * mu * m * n,
+            2 * u * w * mu * n**2 + 2 * v * mu * m * n,
+            2 * u * v * mv * n**2 + 2 * w * mu * m * n,
+            (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
+            2 * v * w * mu * n**2 - 2 * u * mu * m * n,
+            2 * u * w * mv * n**2 - 2 * v * mv * m * n,
+            2 * v * w * mv * n**2 + 2 * u * mv * m * n,
+            (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
+        ]
+
+    sigmas = _get_csl_sigmas(r_list, mu * m**2 + d * n**2, m)
+    return _group_csl_sigmas(sigmas, n, m, cutoff, lambda n, m: n / m * np.sqrt(d / mu))
+
+
+@lru_cache(maxsize=_SIGMA_CACHE_SIZE)
+def _enum_sigma_ort(
+    cutoff: int,
+    r_axis: tuple[int, int, int],
+    c2_b2_a2_ratio: tuple[int | None, int | None, int | None],
+) -> dict[int, list[float]]:
+    """Cached implementation of GrainBoundaryGenerator.enum_sigma_ort."""
+    # Make sure math.gcd(r_axis) == 1
+    if reduce(math.gcd, r_axis) != 1:
+        r_axis = cast("tuple[int, int, int]", tuple(round(x / reduce(math.gcd, r_axis)) for x in r_axis))
+
+    u, v, w = r_axis
+
+    # Make sure mu, lambda, mv are coprime integers
+    if None in c2_b2_a2_ratio:
+        mu, lam, mv = c2_b2_a2_ratio
+        non_none = [i for i in c2_b2_a2_ratio if i is not None]
+        if len(non_none) < 2:
+            raise RuntimeError("No CSL exist for two irrational numbers")
+        non1, non2 = non_none
+        if reduce(math.gcd, non_none) != 1:  # type: ignore[arg-type]
+            temp = reduce(math.gcd, non_none)  # type: ignore[arg-type]
+            non1 = round(non1 / temp)
+            non2 = round(non2 / temp)
+        if mu is None:
+            lam = non1
+            mv = non2
+            mu = 1
+            if w != 0 and (u != 0 or (v != 0)):
+                raise RuntimeError("For irrational c2, CSL only exist for [0,0,1] or [u,v,0] and m = 0")
+        elif lam is None:
+            mu = non1
+            mv = non2
+            lam = 1
+            if v != 0 and (u != 0 or (w != 0)):
+                raise RuntimeError("For irrational b2, CSL only exist for [0,1,0] or [u,0,w] and m = 0")
+        elif mv is None:
+            mu = non1
+            lam = non2
+            mv = 1
+            if u != 0 and (w != 0 or (v != 0)):
+                raise RuntimeError("For irrational a2, CSL only exist for [1,0,0] or [0,v,w] and m = 0")
+    else:
+        mu, lam, mv = cast("tuple[int, int, int]", c2_b2_a2_ratio)
+        if reduce(math.gcd, (mu, lam, mv)) != 1:
+            temp = reduce(math.gcd, (mu, lam, mv))
+            mu = round(mu / temp)
+            mv = round(mv / temp)
+            lam = round(lam / temp)
+        if u == 0 and v == 0:
+            mu = 1
+        if u == 0 and w == 0:
+            lam = 1
+        if v == 0 and w == 0:
+            mv = 1
+    # Refer to the reference for the meaning of d
+    d = (mv * u**2 + lam * v**2) * mv + w**2 * mu * mv
+
+    # Compute the max n we need to enumerate
+    n_max = int(np.sqrt((cutoff * 4 * mu * mv * mv * lam) / d))
+    mu_temp, lam_temp, mv_temp = c2_b2_a2_ratio
+    m_maxes = []
+    for n_int in range(1, n_max + 1):
+        if (mu_temp is None and w == 0) or (lam_temp is None and v == 0) or (mv_temp is None and u == 0):
+            m_max = 0
+        else:
+            m_max = int(np.sqrt((cutoff * 4 * mu * mv * lam * mv - n_int**2 * d) / mu / lam))
+        m_maxes.append(m_max)
+        if m_max == 0:
+            break
+
+    # Enumerate all possible n, m to give possible sigmas within the cutoff
+    n, m = _get_csl_pairs(m_maxes, _get_csl_dtype((u, v, w), (mu, lam, mv), m_maxes))
+
+    def r_list(m: NDArray) -> list:
+        # Construct the rotation matrix, refer to the reference
+        return [
+            (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
+            2 * lam * (v * u * mv * n**2 - w * mu * m * n),
+            2 * mu * (u * w * mv * n**2 + v * lam * m * n),
+            2 * mv * (u * v * mv * n**2 + w * mu * m * n),
+            (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
+            2 * mv * mu * (v * w * n**2 - u * m * n),
+            2 * mv * (u * w * mv * n**2 - v * lam * m * n),
+            2 * lam * mv * (v * w * n**2 + u * m * n),
+            (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
+        ]
+
+    sigmas = _get_csl_sigmas(r_list, mu * lam * m**2 + d * n**2, m)
+    return _group_csl_sigmas(sigmas, n, m, cutoff, lambda n, m: n / m * np.sqrt(d / mu / lam))
+
+
 def fix_pbc(structure: Structure, matrix: NDArray = None) -> Structure:
     """Wrap all frac_coords of the input structure within [0, 1].
 
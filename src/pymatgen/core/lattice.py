@@ -19,9 +19,10 @@ from monty.json import MSONable
 
 from pymatgen.util.coord import pbc_shortest_vectors
 from pymatgen.util.due import Doi, due
+from pymatgen.util.numba import njit
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
     from typing import Literal
 
     from numpy.typing import ArrayLike, NDArray
@@ -72,6 +73,7 @@ class Lattice(MSONable):
         self._diags = None
         self._lll_matrix_mappings: dict[float, tuple[NDArray[np.float64], NDArray[np.float64]]] = {}
         self._lll_inverse = None
+        self._niggli_matrices: dict[float, NDArray[np.float64]] = {}
 
         self.pbc = pbc
 
@@ -978,11 +980,18 @@ class Lattice(MSONable):
 
         for idx, all_j in enumerate(gamma_b):
             inds = np.logical_and(all_j[:, None], np.logical_and(alpha_b, beta_b[idx][None, :]))
-            for j, k in np.argwhere(inds):
-                scale_m = np.array((f_a[idx], f_b[j], f_c[k]), dtype=np.int64)  # type: ignore[index]
-                if abs(np.linalg.det(scale_m)) < 1e-8:
-                    continue
+            js, ks = np.nonzero(inds)
+            if len(js) == 0:
+                continue
+
+            # Check all candidate (j, k) pairs for this idx at once
+            scale_ms = np.empty((len(js), 3, 3), dtype=np.int64)
+            scale_ms[:, 0] = f_a[idx]  # type: ignore[index]
+            scale_ms[:, 1] = f_b[js]  # type: ignore[index]
+            scale_ms[:, 2] = f_c[ks]  # type: ignore[index]
+            valid = np.abs(np.linalg.det(scale_ms)) >= 1e-8
 
+            for j, k, scale_m in zip(js[valid], ks[valid], scale_ms[valid], strict=True):
                 aligned_m = np.array((c_a[idx], c_b[j], c_c[k]))
 
                 rotation_m = None if skip_rotation_matrix else np.linalg.solve(aligned_m, other_lattice.matrix)
@@ -1040,7 +1049,7 @@ class Lattice(MSONable):
             Lattice: LLL reduced
         """
         if delta not in self._lll_matrix_mappings:
-            self._lll_matrix_mappings[delta] = self._calculate_lll()
+            self._lll_matrix_mappings[delta] = self._calculate_lll(delta)
         return type(self)(self._lll_matrix_mappings[delta][0])
 
     def _calculate_lll(self, delta: float = 0.75) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
@@ -1056,71 +1065,7 @@ class Lattice(MSONable):
         Returns:
             Reduced lattice matrix, mapping to get to that lattice.
         """
-        # Transpose the lattice matrix first so that basis vectors are columns.
-        # Makes life easier.
-
-        a = self._matrix.copy().T
-
-        b = np.zeros((3, 3))  # Vectors after the Gram-Schmidt process
-        u = np.zeros((3, 3))  # Gram-Schmidt coefficients
-        m = np.zeros(3)  # These are the norm squared of each vec
-
-        b[:, 0] = a[:, 0]
-        m[0] = np.dot(b[:, 0], b[:, 0])
-        for i in range(1, 3):
-            u[i, :i] = np.dot(a[:, i].T, b[:, :i]) / m[:i]
-            b[:, i] = a[:, i] - np.dot(b[:, :i], u[i, :i].T)
-            m[i] = np.dot(b[:, i], b[:, i])
-
-        k = 2
-
-        mapping = np.identity(3, dtype=np.double)
-        while k <= 3:
-            # Size reduction
-            for i in range(k - 1, 0, -1):
-                q = round(u[k - 1, i - 1])
-                if q != 0:
-                    # Reduce the k-th basis vector
-                    a[:, k - 1] -= q * a[:, i - 1]
-                    mapping[:, k - 1] -= q * mapping[:, i - 1]
-                    uu = list(u[i - 1, 0 : (i - 1)])
-                    uu.append(1)  # type:ignore[arg-type]
-                    # Update the GS coefficients
-                    u[k - 1, 0:i] -= q * np.array(uu)
-
-            # Check the Lovasz condition
-            if np.dot(b[:, k - 1], b[:, k - 1]) >= (delta - abs(u[k - 1, k - 2]) ** 2) * np.dot(
-                b[:, (k - 2)], b[:, (k - 2)]
-            ):
-                # Increment k if the Lovasz condition holds
-                k += 1
-            else:
-                # If the Lovasz condition fails, swap the k-th and (k-1)-th basis vector
-                v = a[:, k - 1].copy()
-                a[:, k - 1] = a[:, k - 2].copy()
-                a[:, k - 2] = v
-
-                v_m = mapping[:, k - 1].copy()
-                mapping[:, k - 1] = mapping[:, k - 2].copy()
-                mapping[:, k - 2] = v_m
-
-                # Update the Gram-Schmidt coefficients
-                for s in range(k - 1, k + 1):
-                    u[s - 1, : (s - 1)] = np.dot(a[:, s - 1].T, b[:, : (s - 1)]) / m[: (s - 1)]
-                    b[:, s - 1] = a[:, s - 1] - np.dot(b[:, : (s - 1)], u[s - 1, : (s - 1)].T)
-                    m[s - 1] = np.dot(b[:, s - 1], b[:, s - 1])
-
-                if k > 2:
-                    k -= 1
-                else:
-                    # We have to do p/q, so do lstsq(q.T, p.T).T instead
-                    p = np.dot(a[:, k:3].T, b[:, (k - 2) : k])
-                    q = np.diag(m[(k - 2) : k])
-
-                    result = np.linalg.lstsq(q.T, p.T, rcond=None)[0].T
-                    u[k:3, (k - 2) : k] = result
-
-        return a.T, mapping.T  # type: ignore[return-value]
+        return _lll_reduce(self._matrix, delta)
 
     def get_lll_frac_coords(self, frac_coords: ArrayLike) -> NDArray[np.float64]:
         """Given fractional coordinates in the lattice basis, returns corresponding
@@ -1151,113 +1096,19 @@ class Lattice(MSONable):
         Returns:
             Lattice: Niggli-reduced lattice.
         """
+        if tol not in self._niggli_matrices:
+            self._niggli_matrices[tol] = self._calculate_niggli(tol)
+        return type(self)(self._niggli_matrices[tol])
+
+    def _calculate_niggli(self, tol: float) -> NDArray[np.float64]:
+        """Calculate the Niggli reduced lattice matrix, see get_niggli_reduced_lattice."""
         # lll reduction is more stable for skewed cells
         matrix = self.lll_matrix
         e = tol * self.volume ** (1 / 3)
 
         # Define metric tensor
         G = np.dot(matrix, matrix.T)
-
-        # This sets an upper limit on the number of iterations.
-        for _ in range(100):
-            # The steps are labelled as Ax as per the labelling scheme in the
-            # paper.
-            A, B, C, E, N, Y = (
-                G[0, 0],
-                G[1, 1],
-                G[2, 2],
-                2 * G[1, 2],
-                2 * G[0, 2],
-                2 * G[0, 1],
-            )
-
-            if B + e < A or (abs(A - B) < e and abs(E) > abs(N) + e):
-                # A1
-                M = np.array([[0, -1, 0], [-1, 0, 0], [0, 0, -1]])
-                G = np.dot(np.transpose(M), np.dot(G, M))
-                # update lattice parameters based on new G (gh-3657)
-                A, B, C, E, N, Y = (
-                    G[0, 0],
-                    G[1, 1],
-                    G[2, 2],
-                    2 * G[1, 2],
-                    2 * G[0, 2],
-                    2 * G[0, 1],
-                )
-
-            if (C + e < B) or (abs(B - C) < e and abs(N) > abs(Y) + e):
-                # A2
-                M = np.array([[-1, 0, 0], [0, 0, -1], [0, -1, 0]])
-                G = np.dot(np.transpose(M), np.dot(G, M))
-                continue
-
-            ll = 0 if abs(E) < e else E / abs(E)
-            m = 0 if abs(N) < e else N / abs(N)
-            n = 0 if abs(Y) < e else Y / abs(Y)
-            if ll * m * n == 1:
-                # A3
-                i = -1 if ll == -1 else 1
-                j = -1 if m == -1 else 1
-                k = -1 if n == -1 else 1
-                M = np.diag((i, j, k))
-                G = np.dot(np.transpose(M), np.dot(G, M))
-            elif ll * m * n in (0, -1):
-                # A4
-                i = -1 if ll == 1 else 1
-                j = -1 if m == 1 else 1
-                k = -1 if n == 1 else 1
-
-                if i * j * k == -1:
-                    if n == 0:
-                        k = -1
-                    elif m == 0:
-                        j = -1
-                    elif ll == 0:
-                        i = -1
-                M = np.diag((i, j, k))
-                G = np.dot(np.transpose(M), np.dot(G, M))
-
-            A, B, C, E, N, Y = (
-                G[0, 0],
-                G[1, 1],
-                G[2, 2],
-                2 * G[1, 2],
-                2 * G[0, 2],
-                2 * G[0, 1],
-            )
-
-            # A5
-            if abs(E) > B + e or (abs(E - B) < e and Y - e > 2 * N) or (abs(E + B) < e and -e > Y):
-                M = np.array([[1, 0, 0], [0, 1, -E / abs(E)], [0, 0, 1]])
-                G = np.dot(np.transpose(M), np.dot(G, M))
-                continue
-
-            # A6
-            if abs(N) > A + e or (abs(A - N) < e and Y - e > 2 * E) or (abs(A + N) < e and -e > Y):
-                M = np.array([[1, 0, -N / abs(N)], [0, 1, 0], [0, 0, 1]])
-                G = np.dot(np.transpose(M), np.dot(G, M))
-                continue
-
-            # A7
-            if abs(Y) > A + e or (abs(A - Y) < e and N - e > 2 * E) or (abs(A + Y) < e and -e > N):
-                M = np.array([[1, -Y / abs(Y), 0], [0, 1, 0], [0, 0, 1]])
-                G = np.dot(np.transpose(M), np.dot(G, M))
-                continue
-
-            # A8
-            if -e > E + N + Y + A + B or (abs(E + N + Y + A + B) < e < Y + (A + N) * 2):
-                M = np.array([[1, 0, 1], [0, 1, 1], [0, 0, 1]])
-                G = np.dot(np.transpose(M), np.dot(G, M))
-                continue
-
-            break
-
-        A = G[0, 0]
-        B = G[1, 1]
-        C = G[2, 2]
-        E = 2 * G[1, 2]
-        N = 2 * G[0, 2]
-        Y = 2 * G[0, 1]
+        A, B, C, E, N, Y = _niggli_reduce_metric((G[0, 0], G[1, 1], G[2, 2], 2 * G[1, 2], 2 * G[0, 2], 2 * G[0, 1]), e)
         a = math.sqrt(A)
         b = math.sqrt(B)
         c = math.sqrt(C)
@@ -1268,9 +1119,8 @@ class Lattice(MSONable):
 
         mapped = self.find_mapping(lattice, e, skip_rotation_matrix=True)
         if mapped is not None:
-            if np.linalg.det(mapped[0].matrix) > 0:
-                return mapped[0]  # type:ignore[return-value]
-            return type(self)(-mapped[0].matrix)
+            matrix = mapped[0].matrix
+            return matrix if np.linalg.det(matrix) > 0 else -matrix
 
         raise ValueError("can't find niggli")
 
@@ -1602,6 +1452,7 @@ class Lattice(MSONable):
         self,
         frac_coords1: ArrayLike,
         frac_coords2: ArrayLike,
+        block_size: int | None = None,
     ) -> NDArray[np.float64]:
         """Get the distances between two lists of coordinates taking into
         account periodic boundary conditions and the lattice. Note that this
@@ -1614,13 +1465,27 @@ class Lattice(MSONable):
                 0.7] or [[1.1, 1.2, 4.3], [0.5, 0.6, 0.7]]. It can be a single
                 coord or any array of coords.
             frac_coords2: Second set of fractional coordinates.
+            block_size (int | None): Compute the distances of at most this many
+                coords of frac_coords1 at a time. This bounds the intermediate
+                (block_size x N x 3) shortest vectors instead of allocating them for
+                all M x N pairs. Defaults to None for all at once.
 
         Returns:
             2d array of Cartesian distances. E.g the distance between
             frac_coords1[i] and frac_coords2[j] is distances[i,j]
         """
-        _v, d2 = pbc_shortest_vectors(self, frac_coords1, frac_coords2, return_d2=True)
-        return np.sqrt(d2)
+        frac_coords1 = np.asarray(frac_coords1, dtype=np.float64)
+        if block_size is None or frac_coords1.ndim == 1 or len(frac_coords1) <= block_size:
+            _v, d2 = pbc_shortest_vectors(self, frac_coords1, frac_coords2, return_d2=True)
+            return np.sqrt(d2)
+
+        frac_coords2 = np.asarray(frac_coords2, dtype=np.float64).reshape(-1, 3)
+        distances = np.empty((len(frac_coords1), len(frac_coords2)))
+        for start in range(0, len(frac_coords1), max(block_size, 1)):
+            block = slice(start, start + block_size)
+            _v, d2 = pbc_shortest_vectors(self, frac_coords1[block], frac_coords2, return_d2=True)
+            np.sqrt(d2, out=distances[block])
+        return distances
 
     def is_hexagonal(
         self,
@@ -1755,6 +1620,153 @@ class Lattice(MSONable):
         return analyzer.get_symmetry_operations()
 
 
+# Cached on disk, as compiling the linear algebra takes several seconds
+@njit(cache=True)
+def _lll_reduce(matrix: NDArray[np.float64], delta: float) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Lenstra-Lenstra-Lovasz reduction of the rows of a 3x3 matrix, see
+    Lattice._calculate_lll. Only uses array operations supported by numba.
+
+    Returns:
+        Reduced matrix, mapping to get to that matrix.
+    """
+    # Basis vectors are kept as rows so that numba works on contiguous arrays
+    a = matrix.copy()
+
+    b = np.zeros((3, 3))  # Vectors after the Gram-Schmidt process
+    u = np.zeros((3, 3))  # Gram-Schmidt coefficients
+    m = np.zeros(3)  # These are the norm squared of each vec
+
+    b[0] = a[0]
+    m[0] = np.dot(b[0], b[0])
+    for i in range(1, 3):
+        u[i, :i] = np.dot(b[:i], a[i]) / m[:i]
+        b[i] = a[i] - np.dot(u[i, :i], b[:i])
+        m[i] = np.dot(b[i], b[i])
+
+    k = 2
+
+    mapping = np.identity(3)
+    while k <= 3:
+        # Size reduction
+        for i in range(k - 1, 0, -1):
+            q = round(u[k - 1, i - 1])
+            if q != 0:
+                # Reduce the k-th basis vector
+                a[k - 1] -= q * a[i - 1]
+                mapping[k - 1] -= q * mapping[i - 1]
+                # Update the GS coefficients
+                u[k - 1, 0 : (i - 1)] -= q * u[i - 1, 0 : (i - 1)]
+                u[k - 1, i - 1] -= q
+
+        # Check the Lovasz condition
+        if np.dot(b[k - 1], b[k - 1]) >= (delta - abs(u[k - 1, k - 2]) ** 2) * np.dot(b[k - 2], b[k - 2]):
+            # Increment k if the Lovasz condition holds
+            k += 1
+        else:
+            # If the Lovasz condition fails, swap the k-th and (k-1)-th basis vector
+            v = a[k - 1].copy()
+            a[k - 1] = a[k - 2]
+            a[k - 2] = v
+
+            v_m = mapping[k - 1].copy()
+            mapping[k - 1] = mapping[k - 2]
+            mapping[k - 2] = v_m
+
+            # Update the Gram-Schmidt coefficients
+            for s in range(k - 1, k + 1):
+                u[s - 1, : (s - 1)] = np.dot(b[: (s - 1)], a[s - 1]) / m[: (s - 1)]
+                b[s - 1] = a[s - 1] - np.dot(u[s - 1, : (s - 1)], b[: (s - 1)])
+                m[s - 1] = np.dot(b[s - 1], b[s - 1])
+
+            if k > 2:
+                k -= 1
+            else:
+                # We have to do p/q, so do lstsq(q.T, p.T).T instead. numba
+                # only supports a float rcond, -1 meaning machine precision.
+                p = np.dot(a[k:3], b[(k - 2) : k].T)
+                q = np.diag(m[(k - 2) : k])
+
+                result = np.linalg.lstsq(q.T, p.T, rcond=-1.0)[0].T
+                u[k:3, (k - 2) : k] = result
+
+    return a, mapping
+
+
+@njit(cache=True)
+def _niggli_reduce_metric(
+    params: tuple[float, float, float, float, float, float],
+    e: float,
+) -> tuple[float, float, float, float, float, float]:
+    """Niggli reduction of the metric tensor parameters
+    A, B, C, E, N, Y = G00, G11, G22, 2 * G12, 2 * G02, 2 * G01 with
+    the steps labelled A1-A8 in Grosse-Kunstleve et al., see
+    Lattice.get_niggli_reduced_lattice. Each step applies the change of
+    basis to the parameters directly instead of transforming G.
+    """
+    A, B, C, E, N, Y = params
+    # This sets an upper limit on the number of iterations.
+    for _ in range(100):
+        if B + e < A or (abs(A - B) < e and abs(E) > abs(N) + e):
+            # A1, swap a and b
+            A, B, E, N = B, A, N, E
+
+        if (C + e < B) or (abs(B - C) < e and abs(N) > abs(Y) + e):
+            # A2, swap b and c
+            B, C, N, Y = C, B, Y, N
+            continue
+
+        ll = 0 if abs(E) < e else E / abs(E)
+        m = 0 if abs(N) < e else N / abs(N)
+        n = 0 if abs(Y) < e else Y / abs(Y)
+        if ll * m * n == 1:
+            # A3
+            i = -1 if ll == -1 else 1
+            j = -1 if m == -1 else 1
+            k = -1 if n == -1 else 1
+            E, N, Y = E * j * k, N * i * k, Y * i * j
+        elif ll * m * n in (0, -1):
+            # A4
+            i = -1 if ll == 1 else 1
+            j = -1 if m == 1 else 1
+            k = -1 if n == 1 else 1
+
+            if i * j * k == -1:
+                if n == 0:
+                    k = -1
+                elif m == 0:
+                    j = -1
+                elif ll == 0:
+                    i = -1
+            E, N, Y = E * j * k, N * i * k, Y * i * j
+
+        # A5, c -> c - sign(E) * b
+        if abs(E) > B + e or (abs(E - B) < e and Y - e > 2 * N) or (abs(E + B) < e and -e > Y):
+            sign = E / abs(E)
+            C, E, N = B + C - sign * E, E - 2 * sign * B, N - sign * Y
+            continue
+
+        # A6, c -> c - sign(N) * a
+        if abs(N) > A + e or (abs(A - N) < e and Y - e > 2 * E) or (abs(A + N) < e and -e > Y):
+            sign = N / abs(N)
+            C, E, N = A + C - sign * N, E - sign * Y, N - 2 * sign * A
+            continue
+
+        # A7, b -> b - sign(Y) * a
+        if abs(Y) > A + e or (abs(A - Y) < e and N - e > 2 * E) or (abs(A + Y) < e and -e > N):
+            sign = Y / abs(Y)
+            B, E, Y = A + B - sign * Y, E - sign * N, Y - 2 * sign * A
+            continue
+
+        # A8, c -> a + b + c
+        if -e > E + N + Y + A + B or (abs(E + N + Y + A + B) < e < Y + (A + N) * 2):
+            C, E, N = A + B + C + E + N + Y, 2 * B + E + Y, 2 * A + N + Y
+            continue
+
+        break
+
+    return A, B, C, E, N, Y
+
+
 def get_integer_index(
     miller_index: tuple[int, ...],
     round_dp: int = 4,
@@ -1943,6 +1955,97 @@ def get_points_in_spheres(
     return neighbors
 
 
+def find_points_in_spheres_batch(
+    coords: Sequence[ArrayLike] | NDArray[np.float64],
+    lattices: Sequence[ArrayLike] | NDArray[np.float64],
+    r: float,
+    pbc: bool | ArrayLike = True,
+    n_points: Sequence[int] | NDArray[np.int_] | None = None,
+    numerical_tol: float = 1e-8,
+    exclude_self: bool = True,
+    n_workers: int = 1,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], NDArray[np.float64], NDArray[np.int64]]:
+    """Neighbor lists of many periodic systems in one call.
+
+    Every system is treated as in IStructure.get_neighbor_list, i.e. all
+    its points are used as centers. The Cython neighbor search releases the
+    GIL, so with n_workers > 1 the systems are processed concurrently in a
+    thread pool without pickling any data.
+
+    Args:
+        coords: Cartesian coordinates, either a sequence of (n_i, 3) arrays
+            (one per system) or a single packed (sum(n_i), 3) array together
+            with n_points.
+        lattices: (M, 3, 3) lattice matrices, one per system.
+        r (float): Cutoff radius.
+        pbc (bool | ArrayLike): Periodicity. Either a single bool, a (3,)
+            sequence shared by all systems or a (M, 3) array.
+        n_points (Sequence[int]): Number of points of each system when
+            coords is packed. Defaults to None.
+        numerical_tol (float): Numerical tolerance for distances.
+        exclude_self (bool): Whether to exclude each point neighboring
+            itself within numerical_tol. Defaults to True.
+        n_workers (int): Number of threads. Defaults to 1.
+
+    Returns:
+        tuple: (center_indices, points_indices, offset_vectors, distances, offsets)
+            concatenated over all systems. Indices are relative to their own
+            system and the pairs of system i are the rows
+            offsets[i]:offsets[i + 1].
+    """
+    from pymatgen.optimization.neighbors import find_points_in_spheres
+
+    if n_points is not None:
+        packed = np.ascontiguousarray(coords, dtype=float).reshape(-1, 3)
+        bounds = np.concatenate([[0], np.cumsum(n_points)])
+        if bounds[-1] != len(packed):
+            raise ValueError(f"sum(n_points)={bounds[-1]} does not match the {len(packed)} packed coordinates")
+        coords = [packed[start:end] for start, end in itertools.pairwise(bounds)]
+    lattices = np.asarray(lattices, dtype=float).reshape(-1, 3, 3)
+    if len(coords) != len(lattices):
+        raise ValueError(f"Got {len(coords)} coordinate sets but {len(lattices)} lattices")
+    pbcs = np.broadcast_to(np.asarray(pbc, dtype=np.int64), (len(lattices), 3))
+
+    def _neighbor_list(idx: int) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+        cart_coords = np.ascontiguousarray(coords[idx], dtype=float).reshape(-1, 3)
+        center_indices, points_indices, images, distances = find_points_in_spheres(
+            cart_coords,
+            cart_coords,
+            r=r,
+            pbc=np.ascontiguousarray(pbcs[idx]),
+            lattice=np.ascontiguousarray(lattices[idx]),
+            tol=numerical_tol,
+        )
+        if exclude_self:
+            cond = ~((center_indices == points_indices) & (distances <= numerical_tol))
+            return center_indices[cond], points_indices[cond], images[cond], distances[cond]
+        return center_indices, points_indices, images, distances
+
+    if n_workers == 1:
+        results = [_neighbor_list(idx) for idx in range(len(lattices))]
+    else:
+        from joblib import Parallel, delayed
+
+        results = Parallel(n_jobs=n_workers, prefer="threads")(
+            delayed(_neighbor_list)(idx) for idx in range(len(lattices))
+        )
+
+    offsets = np.zeros(len(results) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(res[0]) for res in results])
+    if not results:
+        return (
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+            np.empty((0, 3), dtype=float),
+            np.array([], dtype=float),
+            offsets,
+        )
+    center_indices, points_indices, images, distances = (
+        np.concatenate(arrays) for arrays in zip(*results, strict=True)
+    )
+    return center_indices, points_indices, images.reshape(-1, 3), distances, offsets
+
+
 # The following internal functions are used in the get_points_in_sphere method
 def _compute_cube_index(
     coords: NDArray[np.float64],
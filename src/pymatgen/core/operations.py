@@ -7,7 +7,8 @@ import math
 import re
 import string
 import warnings
-from typing import TYPE_CHECKING, Literal, cast
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Literal, cast, overload
 
 import numpy as np
 from monty.json import MSONable
@@ -17,7 +18,6 @@ from pymatgen.util.due import Doi, due
 from pymatgen.util.string import transformation_to_string
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
     from typing import Any
 
     from numpy.typing import ArrayLike, NDArray
@@ -683,3 +683,147 @@ class MagSymmOp(SymmOp):
             MagneticSymmOp from dict representation.
         """
         return cls(dct["matrix"], tol=dct["tolerance"], time_reversal=dct["time_reversal"])
+
+
+class SymmOpSet(Sequence):
+    """A set of symmetry operations stored as stacked rotation matrices and
+    translation vectors, to apply all operations to many points at once.
+
+    Indexing and iterating give back the SymmOp objects the set was created from.
+
+    Attributes:
+        rotations (NDArray): shape (n_ops, 3, 3). Rotation matrices.
+        translations (NDArray): shape (n_ops, 3). Translation vectors.
+    """
+
+    def __init__(self, symm_ops: Sequence[SymmOp]) -> None:
+        """
+        Args:
+            symm_ops (Sequence[SymmOp]): Symmetry operations, in the order they are applied.
+        """
+        self._symm_ops = list(symm_ops)
+        affine_matrices = np.array([op.affine_matrix for op in self._symm_ops], dtype=np.float64).reshape(-1, 4, 4)
+        self.rotations = affine_matrices[:, :3, :3]
+        self.translations = affine_matrices[:, :3, 3]
+
+    @overload
+    def __getitem__(self, idx: int) -> SymmOp: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[SymmOp]: ...
+
+    def __getitem__(self, idx):
+        return self._symm_ops[idx]
+
+    def __len__(self) -> int:
+        return len(self._symm_ops)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} operations>)"
+
+    @classmethod
+    def from_rotations_and_translations(cls, rotations: ArrayLike, translations: ArrayLike, tol: float = 0.1) -> Self:
+        """Create a set of symmetry operations from stacked rotation matrices and translation vectors.
+
+        Args:
+            rotations (ArrayLike): shape (n_ops, 3, 3). Rotation matrices.
+            translations (ArrayLike): shape (n_ops, 3). Translation vectors.
+            tol (float): Tolerance of the SymmOps. Defaults to 0.1.
+        """
+        return cls(
+            [
+                SymmOp.from_rotation_and_translation(rot, trans, tol=tol)
+                for rot, trans in zip(np.asarray(rotations), np.asarray(translations), strict=True)
+            ]
+        )
+
+    def operate_multi(self, points: ArrayLike) -> NDArray[np.float64]:
+        """Apply all operations to all points.
+
+        Args:
+            points (ArrayLike): shape (..., 3). Points.
+
+        Returns:
+            NDArray: shape (n_ops, ..., 3). Points after each operation.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        new_points = np.einsum("oij,...j->o...i", self.rotations, points)
+        return new_points + self.translations.reshape(len(self), *[1] * (points.ndim - 1), 3)
+
+    def apply_rotation_only(self, vectors: ArrayLike) -> NDArray[np.float64]:
+        """Apply the rotations of all operations to all vectors.
+
+        Args:
+            vectors (ArrayLike): shape (..., 3). Vectors.
+
+        Returns:
+            NDArray: shape (n_ops, ..., 3). Vectors after each rotation.
+        """
+        return np.einsum("oij,...j->o...i", self.rotations, np.asarray(vectors, dtype=np.float64))
+
+    def get_orbits(self, points: ArrayLike, tol: float = 1e-5, wrap: bool = True) -> list[NDArray[np.float64]]:
+        """Get the orbit of each point, i.e. its distinct images under the operations.
+
+        Images are listed in the order of the operations, keeping the first of
+        duplicates. Two images are duplicates if the sum of absolute differences of
+        their coordinates is below tol, as in pymatgen.symmetry.groups.in_array_list.
+
+        Args:
+            points (ArrayLike): shape (n_points, 3). Points.
+            tol (float): Tolerance for determining if images are the same. Set to 0
+                for exact matching. Defaults to 1e-5.
+            wrap (bool): Whether images are fractional coordinates to wrap into the
+                unit cell (after rounding to 10 decimals). Defaults to True.
+
+        Returns:
+            list[NDArray]: Orbit of each point as an array of shape (orbit size, 3).
+        """
+        from pymatgen.symmetry.groups import get_first_unique_mask
+
+        images = self.operate_multi(np.reshape(points, (-1, 3)))
+        if wrap:
+            images = np.mod(np.round(images, decimals=10), 1)
+        return [orbit[get_first_unique_mask(orbit, tol)] for orbit in images.transpose(1, 0, 2)]
+
+    def are_symmetrically_related_vectors(
+        self,
+        from_a: NDArray[np.float64],
+        to_a: NDArray[np.float64],
+        r_a: NDArray[np.float64],
+        from_b: NDArray[np.float64],
+        to_b: NDArray[np.float64],
+        r_b: NDArray[np.float64],
+        tol: float = 0.001,
+    ) -> tuple[NDArray[np.bool_], NDArray[np.bool_]]:
+        """SymmOp.are_symmetrically_related_vectors for all operations at once.
+
+        Args:
+            from_a (3x1 array): Starting point of the first vector.
+            to_a (3x1 array): Ending point of the first vector.
+            r_a (3x1 array): Change of unit cell of the first vector.
+            from_b (3x1 array): Starting point of the second vector.
+            to_b (3x1 array): Ending point of the second vector.
+            r_b (3x1 array): Change of unit cell of the second vector.
+            tol (float): Absolute tolerance for checking distance.
+
+        Returns:
+            tuple[NDArray, NDArray]: shape (n_ops,) each. Whether the vectors are related
+                by each operation, and whether they are related with starting and end
+                point exchanged (only where not related without exchange).
+        """
+        vec = self.operate_multi(np.array([from_a, to_a], dtype=np.float64))
+        floored = np.floor(vec)
+        floored[np.abs(vec - floored) > 1 - tol] += 1
+
+        r_c = self.apply_rotation_only(r_a) - floored[:, 0] + floored[:, 1]
+        from_c = vec[:, 0] % 1
+        to_c = vec[:, 1] % 1
+
+        def allclose(arr1, arr2, atol=1e-8):
+            # np.allclose along the last axis
+            return (np.abs(arr1 - arr2) <= atol + 1e-5 * np.abs(arr2)).all(axis=-1)
+
+        is_related = allclose(from_b, from_c, atol=tol) & allclose(to_b, to_c) & allclose(r_b, r_c, atol=tol)
+        is_reversed = allclose(to_b, from_c, atol=tol) & allclose(from_b, to_c) & allclose(r_b, -r_c, atol=tol)
+        is_reversed &= ~is_related
+        return is_related | is_reversed, is_reversed
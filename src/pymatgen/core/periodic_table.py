@@ -34,14 +34,45 @@ if TYPE_CHECKING:
 
     from pymatgen.util.typing import SpeciesLike
 
-# Load element data (periodic table) from JSON file
-# NOTE: you should not update the JSON file manually,
-# see `dev_scripts/generate_periodic_table_yaml_json.py`
-with gzip.open(Path(__file__).absolute().parent / "periodic_table.json.gz", mode="rb") as ptable_json:
-    _RAW_PT_DATA: dict = orjson.loads(ptable_json.read())
 
-_PT_UNIT: dict[str, str] = _RAW_PT_DATA.pop("_unit")
-_PT_DATA: dict[str, Any] = _RAW_PT_DATA
+@functools.cache
+def _load_pt_data() -> tuple[dict[str, Any], dict[str, str]]:
+    """Load element data (periodic table) and its units from JSON file.
+
+    The file is only read on first use to keep `import pymatgen.core` fast.
+    NOTE: you should not update the JSON file manually,
+    see `dev_scripts/generate_periodic_table_yaml_json.py`
+    """
+    with gzip.open(Path(__file__).absolute().parent / "periodic_table.json.gz", mode="rb") as ptable_json:
+        raw_pt_data: dict = orjson.loads(ptable_json.read())
+    pt_unit: dict[str, str] = raw_pt_data.pop("_unit")
+    return raw_pt_data, pt_unit
+
+
+def _pt_data() -> dict[str, Any]:
+    """Element data keyed by symbol."""
+    return _load_pt_data()[0]
+
+
+def _pt_unit() -> dict[str, str]:
+    """Units of the element data properties."""
+    return _load_pt_data()[1]
+
+
+# Element attributes populated by ElementBase._load_data on first access
+_LAZY_ELEMENT_ATTRS: frozenset[str] = frozenset(
+    {
+        "symbol",
+        "Z",
+        "A",
+        "long_name",
+        "_data",
+        "_is_named_isotope",
+        "_atomic_radius",
+        "_atomic_mass",
+        "_atomic_mass_number",
+    }
+)
 
 _PT_ROW_SIZES: tuple[int, ...] = (2, 8, 8, 18, 18, 32, 32)
 
@@ -140,32 +171,37 @@ class ElementBase(Enum):
             - Some attributes are calculated or derived based on predefined constants
                 and rules.
         """
-        self.symbol = symbol
-        data = _PT_DATA[symbol]
+        # Element data is read lazily on first attribute access, see _load_data.
+        # This keeps the creation of the Element enum members cheap.
+
+    def _load_data(self) -> None:
+        """Populate the element attributes from the periodic table data."""
+        self.symbol = symbol = self.value
+        data = _pt_data()[symbol]
 
         # Store key variables for quick access
         self.Z = data["Atomic no"]
 
         self._is_named_isotope = data.get("Is named isotope", False)
         if self._is_named_isotope:
-            for sym, info in _PT_DATA.items():
+            for sym, info in _pt_data().items():
                 if info["Atomic no"] == self.Z and not info.get("Is named isotope", False):
                     self.symbol = sym
                     break
             # For specified/named isotopes, treat the same as named element
             # (the most common isotope). Then we pad the data block with the
             # entries for the named element.
-            data = {**_PT_DATA[self.symbol], **data}
+            data = {**_pt_data()[self.symbol], **data}
 
         at_r: float | None = data.get("Atomic radius")
-        self._atomic_radius = None if at_r is None else Length(at_r, _PT_UNIT["Atomic radius"])
+        self._atomic_radius = None if at_r is None else Length(at_r, _pt_unit()["Atomic radius"])
 
-        self._atomic_mass = Mass(data["Atomic mass"], _PT_UNIT["Atomic mass"])
+        self._atomic_mass = Mass(data["Atomic mass"], _pt_unit()["Atomic mass"])
 
         self._atomic_mass_number = None
         self.A = data.get("Atomic mass no")
         if self.A is not None:
-            self._atomic_mass_number = Mass(self.A, _PT_UNIT["Atomic mass no"])
+            self._atomic_mass_number = Mass(self.A, _pt_unit()["Atomic mass no"])
 
         self.long_name = data["Name"]
         self._data = data
@@ -177,8 +213,12 @@ class ElementBase(Enum):
             item (str): Attribute name.
 
         Raises:
-            AttributeError: If item not in _PT_DATA.
+            AttributeError: If item not in the element data.
         """
+        if item in _LAZY_ELEMENT_ATTRS and "_data" not in self.__dict__:
+            self._load_data()
+            return getattr(self, item)
+
         if item not in {
             "mendeleev_no",
             "electrical_resistivity",
@@ -222,7 +262,7 @@ class ElementBase(Enum):
         if isinstance(val, list | dict):
             return val
 
-        unit: str | None = _PT_UNIT.get(prop_name)
+        unit: str | None = _pt_unit().get(prop_name)
 
         if unit is not None:
             if unit in SUPPORTED_UNIT_NAMES:
@@ -354,7 +394,7 @@ class ElementBase(Enum):
             radius = sum(radii.values()) / len(radii)
         else:
             radius = 0.0
-        return FloatWithUnit(radius, _PT_UNIT["Ionic radii"])
+        return FloatWithUnit(radius, _pt_unit()["Ionic radii"])
 
     @property
     def average_cationic_radius(self) -> FloatWithUnit:
@@ -363,8 +403,8 @@ class ElementBase(Enum):
         data is present.
         """
         if "Ionic radii" in self._data and (radii := [v for k, v in self._data["Ionic radii"].items() if int(k) > 0]):
-            return FloatWithUnit(sum(radii) / len(radii), _PT_UNIT["Ionic radii"])
-        return FloatWithUnit(0.0, _PT_UNIT["Ionic radii"])
+            return FloatWithUnit(sum(radii) / len(radii), _pt_unit()["Ionic radii"])
+        return FloatWithUnit(0.0, _pt_unit()["Ionic radii"])
 
     @property
     def average_anionic_radius(self) -> FloatWithUnit:
@@ -373,8 +413,8 @@ class ElementBase(Enum):
         data is present.
         """
         if "Ionic radii" in self._data and (radii := [v for k, v in self._data["Ionic radii"].items() if int(k) < 0]):
-            return FloatWithUnit(sum(radii) / len(radii), _PT_UNIT["Ionic radii"])
-        return FloatWithUnit(0.0, _PT_UNIT["Ionic radii"])
+            return FloatWithUnit(sum(radii) / len(radii), _pt_unit()["Ionic radii"])
+        return FloatWithUnit(0.0, _pt_unit()["Ionic radii"])
 
     @property
     def ionic_radii(self) -> dict[int, FloatWithUnit]:
@@ -382,7 +422,7 @@ class ElementBase(Enum):
         {oxidation state: ionic radii}. Radii are given in angstrom.
         """
         if "Ionic radii" in self._data:
-            return {int(k): FloatWithUnit(v, _PT_UNIT["Ionic radii"]) for k, v in self._data["Ionic radii"].items()}
+            return {int(k): FloatWithUnit(v, _pt_unit()["Ionic radii"]) for k, v in self._data["Ionic radii"].items()}
         return {}
 
     @property
@@ -573,7 +613,7 @@ class ElementBase(Enum):
         Returns:
             Element with atomic number Z.
         """
-        for sym, data in _PT_DATA.items():
+        for sym, data in _pt_data().items():
             atomic_mass_num = data.get("Atomic mass no") if A else None
             if data["Atomic no"] == Z and atomic_mass_num == A:
                 return Element(sym)
@@ -594,7 +634,7 @@ class ElementBase(Enum):
         uk_to_us = {"aluminium": "aluminum", "caesium": "cesium"}
         name = uk_to_us.get(name.lower(), name)
 
-        for sym, data in _PT_DATA.items():
+        for sym, data in _pt_data().items():
             if data["Name"] == name.capitalize():
                 return Element(sym)
 
@@ -621,7 +661,7 @@ class ElementBase(Enum):
         Note:
             The 18 group number system is used, i.e. noble gases are group 18.
         """
-        for sym in _PT_DATA:
+        for sym in _pt_data():
             el = Element(sym)
             if 57 <= el.Z <= 71:
                 el_pseudo_row = 8
@@ -801,7 +841,7 @@ class ElementBase(Enum):
         e*millibarns for various isotopes.
         """
         return {
-            k: FloatWithUnit(v, _PT_UNIT["NMR Quadrupole Moment"])
+            k: FloatWithUnit(v, _pt_unit()["NMR Quadrupole Moment"])
             for k, v in self.data.get("NMR Quadrupole Moment", {}).items()
         }
 
@@ -20,7 +20,7 @@ import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from fnmatch import fnmatch
-from typing import TYPE_CHECKING, Literal, cast, get_args, overload
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast, get_args, overload
 
 import numpy as np
 import orjson
@@ -29,20 +29,16 @@ from monty.io import zopen
 from monty.json import MSONable
 from numpy.linalg import norm
 from ruamel.yaml import YAML
-from scipy.cluster.hierarchy import fcluster, linkage
-from scipy.linalg import expm, polar
-from scipy.spatial.distance import squareform
 from tabulate import tabulate
 
-from pymatgen.core.bonds import CovalentBond, get_bond_length
+from pymatgen.core.bonds import CovalentBond, bond_lengths, get_bond_length
 from pymatgen.core.composition import Composition
-from pymatgen.core.lattice import Lattice, get_points_in_spheres
+from pymatgen.core.lattice import Lattice, find_points_in_spheres_batch, get_points_in_spheres
 from pymatgen.core.operations import SymmOp
 from pymatgen.core.periodic_table import DummySpecies, Element, Species, get_el_sp
 from pymatgen.core.sites import PeriodicSite, Site
 from pymatgen.core.units import Length, Mass
 from pymatgen.electronic_structure.core import Magmom
-from pymatgen.symmetry.maggroups import MagneticSpaceGroup
 from pymatgen.util.coord import all_distances, get_angle, lattice_points_in_supercell
 from pymatgen.util.due import Doi, due
 
@@ -59,8 +55,10 @@ if TYPE_CHECKING:
     from ase.optimize.optimize import Optimizer
     from matgl.ext.ase import TrajectoryObserver
     from numpy.typing import ArrayLike, NDArray
+    from scipy.sparse import csr_array
     from typing_extensions import Self
 
+    from pymatgen.symmetry.maggroups import MagneticSpaceGroup
     from pymatgen.util.typing import CompositionLike, PathLike, SpeciesLike
 
 FileFormats: TypeAlias = Literal[
@@ -80,6 +78,222 @@ FileFormats: TypeAlias = Literal[
 StructureSources: TypeAlias = Literal["Materials Project", "COD"]
 
 
+def _wrap_into_box(coords: NDArray[np.float64], box: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Wrap Cartesian coords into an orthorhombic box [0, box), as required by periodic KD-trees."""
+    wrapped = np.mod(coords, box)
+    # np.mod can round tiny negative values up to exactly box
+    wrapped[wrapped >= box] = 0
+    return wrapped
+
+
+def _get_translation_supercell_matrix(trans_vecs: NDArray[np.float64]) -> NDArray[np.int64] | None:
+    """Get the supercell matrix relating a cell to the smaller cell spanned by its
+    pure translations.
+
+    Args:
+        trans_vecs: Fractional translation vectors mapping the structure onto itself,
+            including the zero vector.
+
+    Returns:
+        Supercell matrix in the upper triangular Hermite normal form used by
+        IStructure.get_primitive_structure, with determinant len(trans_vecs). None if
+        the translations do not form a group.
+    """
+    n_trans = len(trans_vecs)
+    # The translations of a group of order n_trans are multiples of 1/n_trans
+    trans = np.round(np.asarray(trans_vecs) * n_trans).astype(np.int64) % n_trans
+    if len(np.unique(trans, axis=0)) != n_trans:
+        return None
+
+    # Upper triangular basis: the shortest positive step along each axis among the
+    # translations with zero components along the previous axes
+    basis = n_trans * np.eye(3, dtype=np.int64)
+    mask = np.ones(n_trans, dtype=bool)
+    for idx in range(3):
+        steps = trans[mask, idx]
+        if np.any(steps > 0):
+            step = steps[steps > 0].min()
+            if n_trans % step != 0:
+                return None
+            basis[idx] = trans[mask][np.argmax(steps == step)]
+        mask &= trans[:, idx] == 0
+    if np.prod(np.diag(basis)) != n_trans**2:
+        return None
+
+    inv_basis = n_trans * np.linalg.inv(basis)
+    supercell_matrix = np.round(inv_basis).astype(np.int64)
+    if not np.allclose(inv_basis, supercell_matrix, rtol=0, atol=1e-6):
+        return None
+
+    # Reduce the off-diagonal elements into [0, diagonal)
+    supercell_matrix[:, 2] -= supercell_matrix[1, 2] // supercell_matrix[1, 1] * supercell_matrix[:, 1]
+    supercell_matrix[:, 1] -= supercell_matrix[0, 1] // supercell_matrix[0, 0] * supercell_matrix[:, 0]
+    supercell_matrix[:, 2] -= supercell_matrix[0, 2] // supercell_matrix[0, 0] * supercell_matrix[:, 0]
+    return supercell_matrix
+
+
+@due.dcite(
+    Doi("10.1063/1.4878664"),
+    description="Improved initial guess for minimum energy path calculations",
+)
+def _relax_idpp(
+    frac_coords: NDArray[np.float64],
+    lattice_matrices: NDArray[np.float64],
+    pbc: tuple[bool, bool, bool],
+    fractions: NDArray[np.float64],
+    *,
+    max_iter: int = 1000,
+    gtol: float = 1e-3,
+    step_size: float = 0.05,
+    max_disp: float = 0.05,
+    spring_const: float = 5.0,
+) -> NDArray[np.float64]:
+    """Relax the intermediate images of a path towards the image dependent pair
+    potential (IDPP) path of Smidstrup et al., with the end points fixed.
+
+    The pair distances of each image are pulled towards a linear interpolation of
+    the end point distances, weighted by 1/d^4, using nudged elastic band steepest
+    descent. All images are held in one stacked array. Memory and time per
+    iteration scale as n_images * n_sites^2.
+
+    Args:
+        frac_coords (np.ndarray): Fractional coords of shape (n_images, n_sites, 3).
+        lattice_matrices (np.ndarray): Lattice matrix of each image, (n_images, 3, 3).
+        pbc (tuple[bool, bool, bool]): Periodic boundary conditions.
+        fractions (np.ndarray): Position of each image along the path, from 0 at the
+            first image to 1 at the last.
+        max_iter (int): Maximum number of steepest descent steps. Defaults to 1000.
+        gtol (float): Convergence threshold on the largest force on any atom.
+            Defaults to 1e-3.
+        step_size (float): Step size of the steepest descent. Defaults to 0.05.
+        max_disp (float): Maximum displacement of an atom per step in Angstrom.
+            Defaults to 0.05.
+        spring_const (float): Spring constant between neighboring images.
+            Defaults to 5.0.
+
+    Returns:
+        np.ndarray: Relaxed fractional coords of shape (n_images, n_sites, 3).
+    """
+    frac_coords = np.array(frac_coords, dtype=np.float64)
+    pbc_mask = np.array(pbc, dtype=bool)
+    inv_matrices = np.linalg.inv(lattice_matrices)
+    n_images, n_sites, _ = frac_coords.shape
+
+    def get_frac_diffs(idx: int) -> NDArray[np.float64]:
+        """Fractional vectors between all sites of an image."""
+        return frac_coords[idx][None, :, :] - frac_coords[idx][:, None, :]
+
+    # The minimum images of the initial path are kept throughout, so that the
+    # forces of pairs about half a cell apart do not flip between steps
+    offsets = np.zeros((n_images, n_sites, n_sites, 3), dtype=np.int64)
+    for idx in range(n_images):
+        offsets[idx][..., pbc_mask] = np.round(get_frac_diffs(idx)[..., pbc_mask])
+
+    def get_pair_vectors(idx: int) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Vectors and distances between all sites of an image."""
+        vecs = np.dot(get_frac_diffs(idx) - offsets[idx], lattice_matrices[idx])
+        dists = np.linalg.norm(vecs, axis=-1)
+        # Self pairs have zero vectors and so do not contribute
+        np.fill_diagonal(dists, 1)
+        return vecs, dists
+
+    start_dists = get_pair_vectors(0)[1]
+    end_dists = get_pair_vectors(n_images - 1)[1]
+
+    forces = np.zeros((n_images - 2, n_sites, 3))
+    for _ in range(max_iter):
+        for idx in range(1, n_images - 1):
+            vecs, dists = get_pair_vectors(idx)
+            diff = start_dists + fractions[idx] * (end_dists - start_dists) - dists
+            # Derivative of (target - d)^2 / d^4 with respect to d, divided by d
+            grad = -(2 * diff + 4 * diff**2 / dists) / dists**5
+            forces[idx - 1] = np.einsum("ij,ijk->ik", grad, vecs)
+
+        # Keep the component perpendicular to the path and add springs along it
+        cart_coords = np.matmul(frac_coords, lattice_matrices)
+        segments = np.diff(cart_coords, axis=0)
+        seg_lengths = np.linalg.norm(segments.reshape(n_images - 1, -1), axis=1)
+        units = np.divide(
+            segments, seg_lengths[:, None, None], out=np.zeros_like(segments), where=seg_lengths[:, None, None] > 0
+        )
+        tangents = units[:-1] + units[1:]
+        tan_norms = np.linalg.norm(tangents.reshape(n_images - 2, -1), axis=1)[:, None, None]
+        tangents = np.divide(tangents, tan_norms, out=np.zeros_like(tangents), where=tan_norms > 0)
+        parallel = np.sum(forces * tangents, axis=(1, 2)) - spring_const * (seg_lengths[1:] - seg_lengths[:-1])
+        total_forces = forces - parallel[:, None, None] * tangents
+
+        force_norms = np.linalg.norm(total_forces, axis=-1)
+        if np.max(force_norms) < gtol:
+            break
+
+        disp = step_size * total_forces
+        disp_norms = step_size * force_norms[..., None]
+        disp *= np.minimum(1, max_disp / np.maximum(disp_norms, np.finfo(float).tiny))
+        frac_coords[1:-1] += np.matmul(disp, inv_matrices[1:-1])
+    else:
+        warnings.warn(f"IDPP relaxation did not converge within {max_iter} iterations.", stacklevel=3)
+
+    return frac_coords
+
+
+def _to_site_composition(species: SpeciesLike | CompositionLike) -> Composition:
+    """Convert the species of a site to a Composition the same way Site does."""
+    if not isinstance(species, Composition):
+        try:
+            species = Composition({get_el_sp(species): 1})  # type: ignore[arg-type]
+        except TypeError:
+            species = Composition(species)
+    if species.num_atoms > 1 + Composition.amount_tolerance:
+        raise ValueError("Species occupancies sum to more than 1!")
+    return species
+
+
+class _SiteColumns(NamedTuple):
+    """Columnar (array-backed) storage of the sites of an IStructure.
+
+    Species are stored once in a table of unique Compositions and referenced
+    per site by index. PeriodicSite objects are only built from these columns
+    when individual sites are accessed.
+    """
+
+    lattice: Lattice
+    frac_coords: NDArray[np.float64]
+    species_table: tuple[Composition, ...]
+    species_indices: NDArray[np.intp]
+    site_properties: dict[str, Sequence]
+    labels: list[str | None] | None
+
+    @property
+    def num_sites(self) -> int:
+        """Number of sites."""
+        return len(self.species_indices)
+
+    @property
+    def species_and_occu(self) -> list[Composition]:
+        """Composition of each site."""
+        table = self.species_table
+        return [table[idx] for idx in self.species_indices]
+
+    @property
+    def is_ordered(self) -> bool:
+        """Whether all sites hold a single species with occupancy 1."""
+        return all(comp.num_atoms == len(comp) == 1 for comp in self.species_table)
+
+    def species_strings(self) -> list[str]:
+        """Species string (as in Site.species_string) of each species table entry."""
+        strings = []
+        for comp in self.species_table:
+            if comp.num_atoms == len(comp) == 1:
+                strings.append(str(next(iter(comp))))
+            else:
+                strings.append(", ".join(f"{sp}:{comp[sp]:.3}" for sp in sorted(comp)))
+        return strings
+
+    def counts(self) -> NDArray[np.intp]:
+        """Number of sites referencing each species table entry."""
+        return np.bincount(self.species_indices, minlength=len(self.species_table))
+
+
 class Neighbor(Site):
     """Simple Site subclass to contain a neighboring atom that skips all the unnecessary checks for speed. Can be
     used as a fixed-length tuple of size 3 to retain backwards compatibility with past use cases.
@@ -1004,6 +1218,61 @@ class SiteCollection(collections.abc.Sequence, ABC):
         return AseAtomsAdaptor.get_structure(atoms, cls=cls, **kwargs)  # type:ignore[type-var,return-value]
 
 
+class _NeighborListCache(NamedTuple):
+    """Neighbor list of all sites of a structure (self pairs included) with
+    the pairs sorted by center site, as cached by IStructure.
+    """
+
+    r: float
+    lattice_matrix: NDArray[np.float64]
+    n_sites: int
+    center_indices: NDArray[np.int64]
+    points_indices: NDArray[np.int64]
+    images: NDArray[np.float64]
+    distances: NDArray[np.float64]
+
+    @classmethod
+    def from_neighbor_list(
+        cls,
+        r: float,
+        lattice: Lattice,
+        n_sites: int,
+        neighbor_list: tuple[NDArray, NDArray, NDArray, NDArray],
+    ) -> Self:
+        """Sort a neighbor list by center site and wrap it with the cell it belongs to."""
+        order = np.argsort(neighbor_list[0], kind="stable")
+        return cls(r, lattice.matrix.copy(), n_sites, *(arr[order] for arr in neighbor_list))
+
+    def matches(self, lattice: Lattice, n_sites: int) -> bool:
+        """Whether the cache was built for this lattice and number of sites."""
+        return self.n_sites == n_sites and np.array_equal(self.lattice_matrix, lattice.matrix)
+
+    def get_neighbor_list(
+        self,
+        r: float,
+        centers: NDArray[np.int64],
+        numerical_tol: float,
+        exclude_self: bool,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+        """Neighbor list of the given center sites within r, with the same
+        conventions as IStructure.get_neighbor_list(r, sites=...).
+        """
+        bounds = np.searchsorted(self.center_indices, np.arange(self.n_sites + 1))
+        starts, ends = bounds[centers], bounds[centers + 1]
+        lengths = ends - starts
+        rows = np.repeat(ends - np.cumsum(lengths), lengths) + np.arange(lengths.sum())
+        center_indices = np.repeat(np.arange(len(centers)), lengths)
+        points_indices = self.points_indices[rows]
+        images = self.images[rows].reshape(-1, 3)
+        distances = self.distances[rows]
+
+        # Same cutoff criteria as find_points_in_spheres
+        cond = distances <= r if r < 1 else distances**2 < r**2 + numerical_tol
+        if exclude_self:
+            cond &= ~((center_indices == points_indices) & (distances <= numerical_tol))
+        return center_indices[cond], points_indices[cond], images[cond], distances[cond]
+
+
 class IStructure(SiteCollection, MSONable):
     """Basic immutable Structure object with periodicity. Essentially a sequence
     of PeriodicSites having a common lattice. IStructure is made to be
@@ -1073,30 +1342,104 @@ class IStructure(SiteCollection, MSONable):
 
         self._lattice = lattice if isinstance(lattice, Lattice) else Lattice(lattice)
 
-        sites = []
-        for idx, specie in enumerate(species):
-            prop = None
-            if site_properties:
-                prop = {key: val[idx] for key, val in site_properties.items() if val is not None}
-
-            label = labels[idx] if labels else None
+        # Sites are stored column-wise and PeriodicSite objects are only
+        # created once individual sites are accessed (see _sites).
+        n_sites = len(species)
+        frac_coords: NDArray[np.float64] = np.array(coords, dtype=np.float64).reshape(n_sites, 3)
+        if coords_are_cartesian:
+            frac_coords = self._lattice.get_fractional_coords(frac_coords)
+        if to_unit_cell:
+            pbc = np.array(self._lattice.pbc)
+            frac_coords[:, pbc] = np.mod(frac_coords[:, pbc], 1)
 
-            site = PeriodicSite(
-                specie,
-                np.array(coords[idx]),
-                self._lattice,
-                to_unit_cell,
-                coords_are_cartesian=coords_are_cartesian,
-                properties=prop,
-                label=label,
-            )
-            sites.append(site)
-        self._sites: tuple[PeriodicSite, ...] = tuple(sites)
+        species_table: list[Composition] = []
+        species_indices = np.empty(n_sites, dtype=np.intp)
+        seen: dict[Any, int] = {}
+        for idx, specie in enumerate(species):
+            # Strings and atomic numbers are keyed by value, other (possibly
+            # unhashable) species by identity
+            key = (type(specie), specie) if isinstance(specie, str | int) else id(specie)
+            if key not in seen:
+                seen[key] = len(species_table)
+                species_table.append(_to_site_composition(specie))
+            species_indices[idx] = seen[key]
+
+        site_props: dict[str, Sequence] = {}
+        for key, val in (site_properties or {}).items():
+            if val is None:
+                continue
+            if len(val) < n_sites:
+                raise StructureError(f"Site property {key!r} has {len(val)} values for {n_sites} sites")
+            site_props[key] = list(val)
+
+        self._site_columns: _SiteColumns | None = _SiteColumns(
+            self._lattice,
+            frac_coords,
+            tuple(species_table),
+            species_indices,
+            site_props,
+            list(labels) if labels else None,
+        )
         if validate_proximity and not self.is_valid():
             raise StructureError(f"sites are less than {self.DISTANCE_TOLERANCE} Angstrom apart!")
         self._charge = charge
         self._properties = properties or {}
 
+    # Structures unpickled from older versions only have materialized sites
+    _site_columns: _SiteColumns | None = None
+    # Neighbor lists keyed by numerical_tol, None if caching is disabled
+    _neighbor_cache: dict[float, _NeighborListCache] | None = None
+
+    @property
+    def _sites(self) -> tuple[PeriodicSite, ...] | list[PeriodicSite]:  # type: ignore[override]
+        """The PeriodicSite objects, built from the columnar storage on first access."""
+        if self._site_columns is not None:
+            self._materialize_sites()
+        return self.__dict__["_sites"]
+
+    @_sites.setter
+    def _sites(self, sites: Sequence[PeriodicSite]) -> None:
+        self._site_columns = None
+        self.__dict__["_sites"] = sites
+        self.clear_neighbor_cache()
+
+    def _materialize_sites(self) -> None:
+        """Convert the columnar site storage into PeriodicSite objects.
+
+        Once materialized, the PeriodicSite objects are the single source of
+        truth so that in-place modifications of sites are never lost.
+        """
+        columns = cast("_SiteColumns", self._site_columns)
+        table = columns.species_table
+        props = columns.site_properties
+        labels = columns.labels
+        sites = [
+            PeriodicSite(
+                table[sp_idx],
+                frac_coords,
+                columns.lattice,
+                properties={key: val[idx] for key, val in props.items()},
+                label=labels[idx] if labels else None,
+                skip_checks=True,
+            )
+            for idx, (sp_idx, frac_coords) in enumerate(zip(columns.species_indices, columns.frac_coords, strict=True))
+        ]
+        # Bypass the _sites setter, which would also clear the neighbor cache
+        self.__dict__["_sites"] = sites if isinstance(self, collections.abc.MutableSequence) else tuple(sites)
+        self._site_columns = None
+
+    def _set_site_columns(self, columns: _SiteColumns) -> None:
+        """Replace the lattice and all sites with columnar site storage."""
+        self.__dict__.pop("_sites", None)
+        self._lattice = columns.lattice
+        self._site_columns = columns
+        self.clear_neighbor_cache()
+
+    def __len__(self) -> int:
+        if (columns := self._site_columns) is not None:
+            return columns.num_sites
+        return len(self._sites)
+
     def __eq__(self, other: object) -> bool:
         """Define equality by comparing all three attributes: lattice, sites, properties."""
         needed_attrs = ("lattice", "sites", "properties")
@@ -1155,23 +1498,27 @@ class IStructure(SiteCollection, MSONable):
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
 
-        new_sites = []
-        for site in self:
-            for vec in cart_lattice:
-                periodic_site = PeriodicSite(
-                    site.species,
-                    site.coords + vec,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                    skip_checks=True,
-                    label=site.label,
-                )
-                new_sites.append(periodic_site)
+        # Tile all sites over the lattice points at once, keeping the order of
+        # all images of the first site, then all images of the second site, etc.
+        n_images = len(cart_lattice)
+        cart_coords = (self.cart_coords[:, None, :] + cart_lattice[None, :, :]).reshape(-1, 3)
+        species = [comp for comp in self.species_and_occu for _ in range(n_images)]
+        site_properties = {
+            key: [val for val in vals for _ in range(n_images)] for key, vals in self.site_properties.items()
+        }
+        labels = [label for label in self.labels for _ in range(n_images)]
 
         new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge, to_unit_cell=True)
+        return Structure(
+            new_lattice,
+            species,
+            cart_coords,
+            charge=new_charge,
+            to_unit_cell=True,
+            coords_are_cartesian=True,
+            site_properties=site_properties,
+            labels=labels,
+        )
 
     def __rmul__(self, scaling_matrix):
         """Similar to __mul__ to preserve commutativeness."""
@@ -1360,8 +1707,8 @@ class IStructure(SiteCollection, MSONable):
         all_coords: list[NDArray[np.float64]] = []
         all_site_properties: dict[str, list] = defaultdict(list)
         all_labels: list[str | None] = []
-        for idx, (sp, c) in enumerate(zip(species, frac_coords, strict=True)):
-            cc = spg.get_orbit(c, tol=tol)
+        orbits = spg.get_orbits(frac_coords, tol=tol)
+        for idx, (sp, cc) in enumerate(zip(species, orbits, strict=True)):
             all_sp.extend([sp] * len(cc))
             all_coords.extend(cc)
             label = labels[idx] if labels else None
@@ -1444,6 +1791,8 @@ class IStructure(SiteCollection, MSONable):
 
         magmoms = [Magmom(m) for m in site_properties["magmom"]]
 
+        from pymatgen.symmetry.maggroups import MagneticSpaceGroup
+
         if not isinstance(msg, MagneticSpaceGroup):
             msg = MagneticSpaceGroup(msg)
 
@@ -1514,9 +1863,18 @@ class IStructure(SiteCollection, MSONable):
     @property
     def charge(self) -> float:
         """Overall charge of the structure."""
-        formal_charge = super().charge
+        if (columns := self._site_columns) is not None:
+            formal_charge = float(
+                sum(
+                    (getattr(specie, "oxi_state", 0) or 0) * amt * int(count)
+                    for comp, count in zip(columns.species_table, columns.counts(), strict=True)
+                    for specie, amt in comp.items()
+                )
+            )
+        else:
+            formal_charge = super().charge
         if self._charge is None:
-            return super().charge
+            return formal_charge
         if abs(formal_charge - self._charge) > 1e-8:
             warnings.warn(
                 f"Structure charge ({self._charge}) is set to be not equal to the sum of oxidation states"
@@ -1530,7 +1888,57 @@ class IStructure(SiteCollection, MSONable):
         """The distance matrix between all sites in the structure. For
         periodic structures, this should return the nearest image distance.
         """
-        return self.lattice.get_all_distances(self.frac_coords, self.frac_coords)
+        return self.get_distance_matrix()
+
+    def get_distance_matrix(self, max_memory: float | None = 2**30) -> NDArray[np.float64]:
+        """The distance matrix between all sites in the structure (nearest image
+        distances), computed in blocks of rows to bound the memory used.
+
+        Args:
+            max_memory (float | None): Memory budget in bytes for the intermediate
+                arrays, on top of the returned N x N matrix. Defaults to 1 GiB.
+                None to compute all rows at once.
+
+        Returns:
+            np.ndarray: N x N distances.
+        """
+        frac_coords = self.frac_coords
+        block_size = None
+        if max_memory is not None:
+            # Shortest vectors (3 floats) and squared distances (1 float) per pair
+            block_size = max(1, int(max_memory // (32 * max(len(self), 1))))
+        return self.lattice.get_all_distances(frac_coords, frac_coords, block_size=block_size)
+
+    def get_sparse_distance_matrix(self, r: float, numerical_tol: float = 1e-8) -> csr_array:
+        """Sparse distance matrix holding only the (nearest image) distances
+        between sites within r of each other. Built from the neighbor list, so
+        memory scales with the number of neighbor pairs instead of N^2.
+
+        Args:
+            r (float): Cutoff radius in Angstrom.
+            numerical_tol (float): Same as in get_neighbor_list.
+
+        Returns:
+            scipy.sparse.csr_array: N x N distances. Entry [i, j] is the shortest distance
+                between sites i and j if it is within r, and not stored otherwise. The
+                diagonal is not stored. Coinciding sites are stored as explicit zeros.
+        """
+        from scipy.sparse import csr_array
+
+        center_indices, points_indices, _images, distances = self.get_neighbor_list(r, numerical_tol=numerical_tol)
+        off_diagonal = center_indices != points_indices
+        center_indices = center_indices[off_diagonal]
+        points_indices = points_indices[off_diagonal]
+        distances = distances[off_diagonal]
+
+        # Keep the shortest of all periodic images of each pair
+        order = np.lexsort((distances, points_indices, center_indices))
+        center_indices, points_indices, distances = center_indices[order], points_indices[order], distances[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (np.diff(center_indices) != 0) | (np.diff(points_indices) != 0)
+
+        n_sites = len(self)
+        return csr_array((distances[first], (center_indices[first], points_indices[first])), shape=(n_sites, n_sites))
 
     @property
     def lattice(self) -> Lattice:
@@ -1553,6 +1961,78 @@ class IStructure(SiteCollection, MSONable):
         """Whether the Lattice is periodic in all directions."""
         return self._lattice.is_3d_periodic
 
+    @property
+    def cart_coords(self) -> NDArray[np.float64]:
+        """An np.array of the Cartesian coordinates of sites in the structure."""
+        if (columns := self._site_columns) is not None:
+            return columns.lattice.get_cartesian_coords(columns.frac_coords)
+        return super().cart_coords
+
+    @property
+    def species(self) -> list[Element | Species]:
+        """Only works for ordered structures.
+
+        Raises:
+            AttributeError: If structure is disordered.
+
+        Returns:
+            list[Species]: species at each site of the structure.
+        """
+        if (columns := self._site_columns) is not None:
+            if not columns.is_ordered:
+                raise AttributeError("species property only supports ordered structures!")
+            table = [next(iter(comp)) for comp in columns.species_table]
+            return [table[idx] for idx in columns.species_indices]
+        return super().species
+
+    @property
+    def species_and_occu(self) -> list[Composition]:
+        """List of species and occupancies at each site of the structure."""
+        if (columns := self._site_columns) is not None:
+            return columns.species_and_occu
+        return super().species_and_occu
+
+    @property
+    def site_properties(self) -> dict[str, Sequence]:
+        """The site properties as a dict of sequences.
+        E.g. {"magmom": (5, -5), "charge": (-4, 4)}.
+        """
+        if (columns := self._site_columns) is not None:
+            return {key: list(val) for key, val in columns.site_properties.items()}
+        return super().site_properties
+
+    @property
+    def labels(self) -> list[str | None]:
+        """Site labels as a list."""
+        if (columns := self._site_columns) is not None:
+            species_strings = columns.species_strings()
+            labels = columns.labels or [None] * columns.num_sites
+            return [
+                label if label is not None else species_strings[sp_idx]
+                for label, sp_idx in zip(labels, columns.species_indices, strict=True)
+            ]
+        return super().labels
+
+    @property
+    def composition(self) -> Composition:
+        """The structure's corresponding Composition object."""
+        if (columns := self._site_columns) is not None:
+            elem_map: dict[SpeciesLike, float] = defaultdict(float)
+            for comp, count in zip(columns.species_table, columns.counts(), strict=True):
+                for species, occu in comp.items():
+                    elem_map[species] += occu * int(count)
+            return Composition(elem_map)
+        return super().composition
+
+    @property
+    def is_ordered(self) -> bool:
+        """Check if structure is ordered, meaning no partial occupancies in any
+        of the sites.
+        """
+        if (columns := self._site_columns) is not None:
+            return columns.is_ordered
+        return super().is_ordered
+
     def get_space_group_info(
         self,
         symprec: float = 1e-2,
@@ -1612,6 +2092,8 @@ class IStructure(SiteCollection, MSONable):
     @property
     def frac_coords(self):
         """Fractional coordinates as a Nx3 numpy array."""
+        if (columns := self._site_columns) is not None:
+            return columns.frac_coords.copy()
         return np.array([site.frac_coords for site in self])
 
     @property
@@ -1814,6 +2296,20 @@ class IStructure(SiteCollection, MSONable):
         Returns:
             tuple: (center_indices, points_indices, offset_vectors, distances)
         """
+        if self._neighbor_cache is not None:
+            cached = self._get_cached_neighbor_list(r, sites, numerical_tol, exclude_self)
+            if cached is not None:
+                return cached
+        return self._get_neighbor_list(r, sites, numerical_tol, exclude_self)
+
+    def _get_neighbor_list(
+        self,
+        r: float,
+        sites: Sequence[PeriodicSite] | None = None,
+        numerical_tol: float = 1e-8,
+        exclude_self: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Uncached implementation of get_neighbor_list."""
         try:
             from pymatgen.optimization.neighbors import find_points_in_spheres
         except ImportError:
@@ -1822,10 +2318,11 @@ class IStructure(SiteCollection, MSONable):
             return self._get_neighbor_list_py(r, list(sites), exclude_self=exclude_self)
 
         else:
-            if sites is None:
-                sites = self.sites
-            site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
             cart_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
+            if sites is None:
+                site_coords = cart_coords
+            else:
+                site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
             lattice_matrix = np.ascontiguousarray(self.lattice.matrix, dtype=float)
             pbc = np.ascontiguousarray(self.pbc, dtype=np.int64)
             center_indices, points_indices, images, distances = find_points_in_spheres(
@@ -1847,6 +2344,61 @@ class IStructure(SiteCollection, MSONable):
                 distances[cond],
             )
 
+    def enable_neighbor_cache(self, enable: bool = True) -> Self:
+        """Enable (or disable) caching of neighbor lists.
+
+        With the cache enabled, get_neighbor_list, get_all_neighbors and
+        get_neighbors (and hence NearNeighbors strategies using them) share
+        one neighbor search per numerical_tol. A cached search with a cutoff
+        at least as large as the requested one is answered by filtering the
+        cached pairs, so the order of the returned pairs may differ from an
+        uncached call. The cache is cleared by the mutating methods of
+        Structure (and whenever the lattice changes), but not when individual
+        sites are modified in place, e.g. struct[0].frac_coords = ..., in which
+        case clear_neighbor_cache has to be called.
+
+        Args:
+            enable (bool): Whether to enable the cache. Defaults to True.
+
+        Returns:
+            Structure: self
+        """
+        self._neighbor_cache = {} if enable else None
+        return self
+
+    def clear_neighbor_cache(self) -> None:
+        """Drop all cached neighbor lists. Caching stays enabled if it was."""
+        if self._neighbor_cache:
+            self._neighbor_cache = {}
+
+    def _get_cached_neighbor_list(
+        self,
+        r: float,
+        sites: Sequence[PeriodicSite] | None,
+        numerical_tol: float,
+        exclude_self: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """get_neighbor_list answered from the neighbor cache. Returns None if
+        some of the sites do not belong to the structure.
+        """
+        cache = cast("dict[float, _NeighborListCache]", self._neighbor_cache)
+        entry = cache.get(numerical_tol)
+        if entry is None or entry.r < r or not entry.matches(self._lattice, len(self)):
+            neighbor_list = self._get_neighbor_list(r, numerical_tol=numerical_tol, exclude_self=False)
+            entry = cache[numerical_tol] = _NeighborListCache.from_neighbor_list(
+                r, self._lattice, len(self), neighbor_list
+            )
+
+        if sites is None:
+            centers: NDArray[np.int64] = np.arange(len(self))
+        else:
+            site_indices = {id(site): idx for idx, site in enumerate(self._sites)}
+            try:
+                centers = np.array([site_indices[id(site)] for site in sites], dtype=np.int64)
+            except KeyError:
+                return None
+        return entry.get_neighbor_list(r, centers, numerical_tol, exclude_self)
+
     def get_symmetric_neighbor_list(
         self,
         r: float,
@@ -1893,14 +2445,14 @@ class IStructure(SiteCollection, MSONable):
         from pymatgen.symmetry.groups import SpaceGroup
 
         if sg is None:
-            ops = SpaceGroup(self.get_space_group_info()[0]).symmetry_ops
+            ops = SpaceGroup(self.get_space_group_info()[0]).symmetry_op_set
 
         else:
             try:  # first assume sg is int
                 sgp = SpaceGroup.from_int_number(int(sg))
             except ValueError:
                 sgp = SpaceGroup(sg)
-            ops = sgp.symmetry_ops
+            ops = sgp.symmetry_op_set
 
             lattice = self.lattice
 
@@ -1966,16 +2518,21 @@ class IStructure(SiteCollection, MSONable):
                         from_b = self[bonds[0][jdx]].frac_coords
                         to_b = self[bonds[1][jdx]].frac_coords
                         r_b = bonds[2][jdx]
-                        for op in ops:
-                            are_related, is_reversed = op.are_symmetrically_related_vectors(
-                                from_a, to_a, r_a, from_b, to_b, r_b
+                        # Test all operations at once, for both directions of r_b since each
+                        # operation that relates the reversed bond swaps its sites and reverses r_b
+                        related = {}
+                        for sign in (1, -1):
+                            related[sign] = ops.are_symmetrically_related_vectors(
+                                from_a, to_a, r_a, from_b, to_b, sign * r_b
                             )
-                            if are_related and not is_reversed:
-                                symmetry_indices[jdx] = symmetry_index
-                                symmetry_ops[jdx] = op
-                            elif are_related:
+                        sign = 1
+                        for op_idx in np.flatnonzero(related[1][0] | related[-1][0]):
+                            are_related, is_reversed = related[sign][0][op_idx], related[sign][1][op_idx]
+                            if are_related:
                                 symmetry_indices[jdx] = symmetry_index
-                                symmetry_ops[jdx] = op
+                                symmetry_ops[jdx] = ops[op_idx]
+                            if is_reversed:
+                                sign = -sign
                                 bonds[0][jdx], bonds[1][jdx] = (
                                     bonds[1][jdx],
                                     bonds[0][jdx],
@@ -2406,11 +2963,16 @@ class IStructure(SiteCollection, MSONable):
         pbc: bool = True,
         autosort_tol: float = 0,
         end_amplitude: float = 1,
+        idpp: bool = False,
+        idpp_kwargs: dict | None = None,
     ) -> list[Self]:
         """Interpolate between this structure and end_structure. Useful for
         construction of NEB inputs. To obtain useful results, the cell setting
         and order of sites must consistent across the start and end structures.
 
+        All images are generated at once from a stacked array of coordinates and
+        only build their PeriodicSites when individual sites are accessed.
+
         Args:
             end_structure (Structure): structure to interpolate between this
                 structure and end. Must be in the same setting and have the
@@ -2434,6 +2996,12 @@ class IStructure(SiteCollection, MSONable):
                 (default), 0.5 implies distortion to a point halfway
                 between structure and end_structure, and -1 implies full
                 distortion in the opposite direction to end_structure.
+            idpp (bool): Whether to pre-relax the intermediate images towards the
+                image dependent pair potential (IDPP) path, which avoids atoms
+                coming unphysically close along linearly interpolated paths.
+                Scales as n_sites^2 per image. Defaults to False.
+            idpp_kwargs (dict): Options for the IDPP relaxation, i.e. max_iter,
+                gtol, step_size, max_disp and spring_const. Defaults to None.
 
         Returns:
             List of interpolated structures. The starting and ending
@@ -2450,41 +3018,28 @@ class IStructure(SiteCollection, MSONable):
         images = nimages if isinstance(nimages, collections.abc.Iterable) else np.arange(nimages + 1) / nimages
 
         # Check that both structures have the same species
-        for idx, site in enumerate(self):
-            if site.species != end_structure[idx].species:
-                raise ValueError(f"Different species!\nStructure 1:\n{self}\nStructure 2\n{end_structure}")
+        if self.species_and_occu != end_structure.species_and_occu:
+            raise ValueError(f"Different species!\nStructure 1:\n{self}\nStructure 2\n{end_structure}")
 
         start_coords = np.array(self.frac_coords)
         end_coords = np.array(end_structure.frac_coords)
 
         if autosort_tol:
-            dist_matrix = self.lattice.get_all_distances(start_coords, end_coords)
-            site_mappings: dict[int, list[int]] = defaultdict(list)
-            unmapped_start_ind = []
-            for idx, row in enumerate(dist_matrix):
-                ind = np.where(row < autosort_tol)[0]
-                if len(ind) == 1:
-                    site_mappings[idx].append(ind[0])
-                else:
-                    unmapped_start_ind.append(idx)
+            # Sites of end_structure within autosort_tol of each site in this structure
+            is_close = self.lattice.get_all_distances(start_coords, end_coords) < autosort_tol
+            is_mapped = np.count_nonzero(is_close, axis=1) == 1
+            unmapped_start_ind = np.flatnonzero(~is_mapped).tolist()
 
             if len(unmapped_start_ind) > 1:
                 raise ValueError(f"Unable to reliably match structures with {autosort_tol = }, {unmapped_start_ind = }")
 
             sorted_end_coords = np.zeros_like(end_coords)
-            matched = []
-            for idx, j in site_mappings.items():
-                if len(j) > 1:
-                    raise ValueError(
-                        f"Unable to reliably match structures with auto_sort_tol = {autosort_tol}. "
-                        "More than one site match!"
-                    )
-                sorted_end_coords[idx] = end_coords[j[0]]
-                matched.append(j[0])
+            matched = np.argmax(is_close[is_mapped], axis=1)
+            sorted_end_coords[is_mapped] = end_coords[matched]
 
             if len(unmapped_start_ind) == 1:
                 idx = unmapped_start_ind[0]
-                j = next(iter(set(range(len(start_coords))) - set(matched)))  # type: ignore[arg-type]
+                j = np.setdiff1d(np.arange(len(start_coords)), matched)[0]
                 sorted_end_coords[idx] = end_coords[j]
 
             end_coords = sorted_end_coords
@@ -2492,33 +3047,39 @@ class IStructure(SiteCollection, MSONable):
         vec = end_amplitude * (end_coords - start_coords)
         if pbc:
             vec[:, self.pbc] -= np.round(vec[:, self.pbc])
-        sp = self.species_and_occu
-        structs = []
+
+        # Coords of all images as one (n_images, n_sites, 3) array
+        fractions = np.array(list(images), dtype=np.float64)
+        frac_coords = start_coords + np.multiply.outer(fractions, vec)
 
         if interpolate_lattices:
             # Interpolate lattice matrices using polar decomposition
             # u is a unitary rotation, p is stretch
+            from scipy.linalg import polar
+
             _u, p = polar(np.dot(end_structure.lattice.matrix.T, np.linalg.inv(self.lattice.matrix.T)))
             lvec = end_amplitude * (p - np.identity(3))
             lstart = self.lattice.matrix.T
+            lattices = [Lattice(np.dot(np.identity(3) + x * lvec, lstart).T) for x in fractions]
+        else:
+            lattices = [self.lattice] * len(fractions)
 
-        for x in images:
-            if interpolate_lattices:
-                l_a = np.dot(np.identity(3) + x * lvec, lstart).T  # type: ignore[reportPossiblyUnboundVariable]
-                lattice = Lattice(l_a)
-            else:
-                lattice = self.lattice
-            frac_coords = start_coords + x * vec
-            structs.append(
-                type(self)(
-                    lattice,
-                    sp,
-                    frac_coords,
-                    site_properties=self.site_properties,
-                    labels=self.labels,
-                )
+        if idpp and len(fractions) > 2 and fractions[-1] != fractions[0]:
+            frac_coords = _relax_idpp(
+                frac_coords,
+                np.array([lattice.matrix for lattice in lattices]),
+                self.pbc,
+                (fractions - fractions[0]) / (fractions[-1] - fractions[0]),
+                **(idpp_kwargs or {}),
             )
-        return structs
+
+        sp = self.species_and_occu
+        site_properties = self.site_properties
+        labels = self.labels
+        return [
+            type(self)(lattice, sp, coords, site_properties=site_properties, labels=labels)
+            for lattice, coords in zip(lattices, frac_coords, strict=True)
+        ]
 
     def get_miller_index_from_site_indexes(
         self,
@@ -2605,23 +3166,26 @@ class IStructure(SiteCollection, MSONable):
         super_ftol = np.divide(tolerance, self.lattice.abc)
         super_ftol_2 = super_ftol * 2
 
-        def pbc_coord_intersection(fc1, fc2, tol):
-            """Get the fractional coords in fc1 that have coordinates
-            within tolerance to some coordinate in fc2.
-            """
-            dist = fc1[:, None, :] - fc2[None, :, :]
-            dist -= np.round(dist)
-            return fc1[np.any(np.all(dist < tol, axis=-1), axis=-1)]
-
         # Here we reduce the number of min_vecs by enforcing that every
         # vector in min_vecs approximately maps each site onto a similar site.
         # The subsequent processing is O(fu^3 * min_vecs) = O(n^4) if we do no
         # reduction.
         # This reduction is O(n^3) so usually is an improvement. Using double
-        # the tolerance because both vectors are approximate
+        # the tolerance because both vectors are approximate. Blocks of sites are
+        # checked at once, sized to keep the distance array small.
         for group in sorted(grouped_frac_coords, key=len):
-            for frac_coords in group:
-                min_vecs = pbc_coord_intersection(min_vecs, group - frac_coords, super_ftol_2)
+            start = 0
+            while start < len(group):
+                n_block = max(1, 2**20 // (len(min_vecs) * len(group)))
+                block = group[start : start + n_block]
+                dist = min_vecs[:, None, None, :] - (group[None, None, :, :] - block[None, :, None, :])
+                dist = np.abs(dist - np.round(dist))
+                min_vecs = min_vecs[np.all(np.any(np.all(dist < super_ftol_2, axis=-1), axis=-1), axis=-1)]
+                start += n_block
+
+        # Only the identity maps the structure onto itself
+        if len(min_vecs) == 1:
+            return self.copy()
 
         def get_hnf(form_units):
             """Get all possible distinct supercell matrices given a
@@ -2663,8 +3227,81 @@ class IStructure(SiteCollection, MSONable):
             np.fill_diagonal(non_nbrs, val=True)
             grouped_non_nbrs.append(non_nbrs)
 
+        def get_cell_structure(inv_m, latt_mat, size):
+            """Get the structure in the cell given by a supercell matrix, merging
+            equivalent sites. None if the sites do not map onto each other.
+            """
+            new_m = np.dot(inv_m, self.lattice.matrix)
+            ftol = np.divide(tolerance, np.sqrt(np.sum(new_m**2, axis=1)))
+
+            new_coords = []
+            new_sp = []
+            new_props = defaultdict(list)
+            new_labels = []
+            for gsites, gf_coords, non_nbrs in zip(grouped_sites, grouped_frac_coords, grouped_non_nbrs, strict=True):
+                all_frac = np.dot(gf_coords, latt_mat)
+
+                # Calculate grouping of equivalent sites, represented by
+                # adjacency matrix
+                fdist = all_frac[None, :, :] - all_frac[:, None, :]
+                fdist = np.abs(fdist - np.round(fdist))
+                close_in_prim = np.all(fdist < ftol[None, None, :], axis=-1)
+                groups = np.logical_and(close_in_prim, non_nbrs)
+
+                # Check that groups are correct
+                if not np.all(np.sum(groups, axis=0) == size):
+                    return None
+
+                # Check that groups are all cliques
+                for group in groups:
+                    if not np.all(groups[group][:, group]):
+                        return None
+
+                # Add the new sites, averaging positions
+                added = np.zeros(len(gsites))
+                new_frac_coords = all_frac % 1
+                for grp_idx, group in enumerate(groups):
+                    if not added[grp_idx]:
+                        added[group] = True
+                        inds = np.where(group)[0]
+                        coords = new_frac_coords[inds[0]]
+                        for inner_idx, ind in enumerate(inds[1:]):
+                            offset = new_frac_coords[ind] - coords
+                            coords += (offset - np.round(offset)) / (inner_idx + 2)
+                        new_sp.append(gsites[inds[0]].species)
+                        for k in gsites[inds[0]].properties:
+                            new_props[k].append(gsites[inds[0]].properties[k])
+                        new_labels.append(gsites[inds[0]].label)
+                        new_coords.append(coords)
+
+            inv_m = np.linalg.inv(latt_mat)
+            new_latt = Lattice(np.dot(inv_m, self.lattice.matrix))
+            return Structure(
+                new_latt,
+                new_sp,
+                new_coords,
+                site_properties=new_props,
+                labels=new_labels,
+                coords_are_cartesian=False,
+            )
+
         num_fu = functools.reduce(math.gcd, map(len, grouped_sites))
+
+        # The pure translations span the primitive cell, so try reducing to it
+        # directly before searching over supercell matrices
+        if not constrain_latt and num_fu % len(min_vecs) == 0:
+            latt_mat = _get_translation_supercell_matrix(min_vecs - np.round(min_vecs))
+            if latt_mat is not None:
+                struct = get_cell_structure(np.linalg.inv(latt_mat), latt_mat, len(min_vecs))
+                if struct is not None:
+                    return struct.get_primitive_structure(
+                        tolerance=tolerance, use_site_props=use_site_props
+                    ).get_reduced_structure()
+
         for size, ms in get_hnf(num_fu):
+            # Every lattice vector of the smaller cell must be one of the translations
+            if size > len(min_vecs):
+                break
             inv_ms = np.linalg.inv(ms)
 
             # Find sets of lattice vectors that are present in min_vecs
@@ -2676,68 +3313,8 @@ class IStructure(SiteCollection, MSONable):
             inds = np.all(any_close, axis=-1)
 
             for inv_m, latt_mat in zip(inv_ms[inds], ms[inds], strict=True):
-                new_m = np.dot(inv_m, self.lattice.matrix)
-                ftol = np.divide(tolerance, np.sqrt(np.sum(new_m**2, axis=1)))
-
-                valid = True
-                new_coords = []
-                new_sp = []
-                new_props = defaultdict(list)
-                new_labels = []
-                for gsites, gf_coords, non_nbrs in zip(
-                    grouped_sites, grouped_frac_coords, grouped_non_nbrs, strict=True
-                ):
-                    all_frac = np.dot(gf_coords, latt_mat)
-
-                    # Calculate grouping of equivalent sites, represented by
-                    # adjacency matrix
-                    fdist = all_frac[None, :, :] - all_frac[:, None, :]
-                    fdist = np.abs(fdist - np.round(fdist))
-                    close_in_prim = np.all(fdist < ftol[None, None, :], axis=-1)
-                    groups = np.logical_and(close_in_prim, non_nbrs)
-
-                    # Check that groups are correct
-                    if not np.all(np.sum(groups, axis=0) == size):
-                        valid = False
-                        break
-
-                    # Check that groups are all cliques
-                    for group in groups:
-                        if not np.all(groups[group][:, group]):
-                            valid = False
-                            break
-                    if not valid:
-                        break
-
-                    # Add the new sites, averaging positions
-                    added = np.zeros(len(gsites))
-                    new_frac_coords = all_frac % 1
-                    for grp_idx, group in enumerate(groups):
-                        if not added[grp_idx]:
-                            added[group] = True
-                            inds = np.where(group)[0]
-                            coords = new_frac_coords[inds[0]]
-                            for inner_idx, ind in enumerate(inds[1:]):
-                                offset = new_frac_coords[ind] - coords
-                                coords += (offset - np.round(offset)) / (inner_idx + 2)
-                            new_sp.append(gsites[inds[0]].species)
-                            for k in gsites[inds[0]].properties:
-                                new_props[k].append(gsites[inds[0]].properties[k])
-                            new_labels.append(gsites[inds[0]].label)
-                            new_coords.append(coords)
-
-                if valid:
-                    inv_m = np.linalg.inv(latt_mat)
-                    new_latt = Lattice(np.dot(inv_m, self.lattice.matrix))
-                    struct = Structure(
-                        new_latt,
-                        new_sp,
-                        new_coords,
-                        site_properties=new_props,
-                        labels=new_labels,
-                        coords_are_cartesian=False,
-                    )
-
+                struct = get_cell_structure(inv_m, latt_mat, size)
+                if struct is not None:
                     # Default behavior
                     primitive = struct.get_primitive_structure(
                         tolerance=tolerance,
@@ -2846,6 +3423,10 @@ class IStructure(SiteCollection, MSONable):
             "lattice": latt_dict,
             "properties": self.properties,
         }
+        if (columns := self._site_columns) is not None and verbosity in {0, 1}:
+            dct["sites"] = self._columns_as_site_dicts(columns, verbosity=verbosity)
+            return dct
+
         for site in self:
             site_dict = site.as_dict(verbosity=verbosity)
             del site_dict["lattice"]
@@ -2858,6 +3439,36 @@ class IStructure(SiteCollection, MSONable):
         dct["sites"] = sites
         return dct
 
+    def _columns_as_site_dicts(self, columns: _SiteColumns, verbosity: Literal[0, 1] = 1) -> list[dict[str, Any]]:
+        """Site dicts as in PeriodicSite.as_dict, built directly from the columnar storage."""
+        table_dicts = []
+        for comp in columns.species_table:
+            species = []
+            for spec, occu in comp.items():
+                spec_dct = spec.as_dict()
+                del spec_dct["@module"]
+                del spec_dct["@class"]
+                spec_dct["occu"] = occu
+                species.append(spec_dct)
+            table_dicts.append(species)
+
+        props = columns.site_properties
+        labels = self.labels
+        xyz = columns.lattice.get_cartesian_coords(columns.frac_coords).tolist() if verbosity > 0 else None
+        sites = []
+        for idx, (sp_idx, abc) in enumerate(zip(columns.species_indices, columns.frac_coords.tolist(), strict=True)):
+            site_dict: dict[str, Any] = {
+                "species": [dict(spec_dct) for spec_dct in table_dicts[sp_idx]],
+                "abc": abc,
+                "properties": {key: val[idx] for key, val in props.items()},
+            }
+            if verbosity != 0:
+                site_dict["label"] = labels[idx]
+            if xyz is not None:
+                site_dict["xyz"] = xyz[idx]
+            sites.append(site_dict)
+        return sites
+
     def as_dataframe(self) -> pd.DataFrame:
         """Create a Pandas DataFrame of the sites.
         Structure-level attributes are stored in DataFrame.attrs.
@@ -3437,6 +4048,43 @@ class IStructure(SiteCollection, MSONable):
         return dictdata
 
 
+def get_neighbor_lists(
+    structures: Sequence[IStructure],
+    r: float,
+    numerical_tol: float = 1e-8,
+    exclude_self: bool = True,
+    n_workers: int = 1,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Get the neighbor lists of many structures at once. This is equivalent to
+    calling IStructure.get_neighbor_list on each structure, but avoids the
+    per-call overhead and can spread the structures over several threads.
+
+    Args:
+        structures (Sequence[IStructure]): Structures to get neighbor lists for.
+        r (float): Radius of sphere.
+        numerical_tol (float): Numerical tolerance for distances, see
+            IStructure.get_neighbor_list.
+        exclude_self (bool): whether to exclude atom neighboring with itself within
+            numerical tolerance distance, default to True
+        n_workers (int): Number of threads. Defaults to 1.
+
+    Returns:
+        tuple: (center_indices, points_indices, offset_vectors, distances, offsets).
+            The first four are the concatenated neighbor lists of all structures
+            with site indices relative to each structure, the neighbor pairs of
+            structures[i] being the rows offsets[i]:offsets[i + 1].
+    """
+    return find_points_in_spheres_batch(
+        [struct.cart_coords for struct in structures],
+        [struct.lattice.matrix for struct in structures],
+        r=r,
+        pbc=[struct.pbc for struct in structures] or True,
+        numerical_tol=numerical_tol,
+        exclude_self=exclude_self,
+        n_workers=n_workers,
+    )
+
+
 class IMolecule(SiteCollection, MSONable):
     """Basic immutable Molecule object without periodicity. Essentially a
     sequence of sites. IMolecule is made to be immutable so that they can
@@ -3695,11 +4343,48 @@ class IMolecule(SiteCollection, MSONable):
         Returns:
             List of bonds
         """
-        bonds = []
-        for site1, site2 in itertools.combinations(self._sites, 2):
-            if CovalentBond.is_bonded(site1, site2, tol):
-                bonds.append(CovalentBond(site1, site2))
-        return bonds
+        sites = self._sites
+        return [CovalentBond(sites[idx1], sites[idx2]) for idx1, idx2 in self.get_covalent_bond_indices(tol)]
+
+    def get_covalent_bond_indices(self, tol: float = 0.2) -> NDArray[np.int64]:
+        """Determine the covalent bonds in a molecule as pairs of site indices.
+
+        Same criterion as CovalentBond.is_bonded, but candidate pairs are found
+        with a KD-tree, so this scales as O(N log N) instead of O(N^2).
+
+        Args:
+            tol (float): The tol to determine bonds in a structure. See
+                CovalentBond.is_bonded.
+
+        Raises:
+            ValueError: If there is no bond length data for a pair of elements in the molecule.
+
+        Returns:
+            np.ndarray: (n_bonds, 2) site indices i < j of the bonds, sorted.
+        """
+        from scipy.spatial import KDTree
+
+        symbols = [next(iter(comp)).symbol for comp in self.species_and_occu]
+        unique_symbols, sym_indices, counts = np.unique(symbols, return_inverse=True, return_counts=True)
+
+        # Longest bond length (over all bond orders) for each pair of elements
+        max_lengths = np.zeros((len(unique_symbols), len(unique_symbols)))
+        for idx1, idx2 in itertools.combinations_with_replacement(range(len(unique_symbols)), 2):
+            if idx1 == idx2 and counts[idx1] < 2:
+                continue
+            syms = (str(unique_symbols[idx1]), str(unique_symbols[idx2]))
+            if syms not in bond_lengths:
+                raise ValueError(f"No bond data for elements {syms[0]} - {syms[1]}")
+            max_lengths[idx1, idx2] = max_lengths[idx2, idx1] = max(bond_lengths[syms].values())
+        cutoffs = (1 + tol) * max_lengths
+
+        coords = self.cart_coords
+        if len(coords) < 2:
+            return np.empty((0, 2), dtype=np.int64)
+        pairs = KDTree(coords).query_pairs(cutoffs.max(), output_type="ndarray").astype(np.int64)
+        dists = np.linalg.norm(coords[pairs[:, 0]] - coords[pairs[:, 1]], axis=1)
+        pairs = pairs[dists < cutoffs[sym_indices[pairs[:, 0]], sym_indices[pairs[:, 1]]]]
+        return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
 
     def get_zmatrix(self) -> str:
         """Get a z-matrix representation of the molecule."""
@@ -3891,6 +4576,8 @@ class IMolecule(SiteCollection, MSONable):
         Returns:
             Structure containing molecule in a box.
         """
+        from scipy.spatial import KDTree
+
         if offset is None:
             offset = np.array([0, 0, 0])
 
@@ -3907,6 +4594,8 @@ class IMolecule(SiteCollection, MSONable):
 
         centered_coords = self.cart_coords - self.center_of_mass + offset
         rng = np.random.default_rng()
+        box = np.array(lattice.abc)
+        tree = None
 
         for i, j, k in itertools.product(
             list(range(images[0])),
@@ -3931,10 +4620,11 @@ class IMolecule(SiteCollection, MSONable):
                             raise ValueError("Molecule crosses boundary of box")
                     if not all_coords:
                         break
-                    distances = lattice.get_all_distances(
-                        lattice.get_fractional_coords(new_coords),
-                        lattice.get_fractional_coords(all_coords),  # type:ignore[arg-type]
-                    )
+                    # Shortest periodic distance to the molecules placed so far
+                    # (the box is orthorhombic so the KD-tree can wrap around it)
+                    if tree is None:
+                        tree = KDTree(_wrap_into_box(np.array(all_coords), box), boxsize=box)
+                    distances, _ = tree.query(_wrap_into_box(new_coords, box))
                     if np.amin(distances) > min_dist:
                         break
             else:
@@ -3946,6 +4636,7 @@ class IMolecule(SiteCollection, MSONable):
                     if x_max > a or x_min < 0 or y_max > b or y_min < 0 or z_max > c or z_min < 0:
                         raise ValueError("Molecule crosses boundary of box")
             all_coords.extend(new_coords)
+            tree = None
 
         site_props = {key: sequence * nimages for key, sequence in self.site_properties.items()}  # type: ignore[operator]
 
@@ -4221,8 +4912,6 @@ class Structure(IStructure, collections.abc.MutableSequence):
             properties=properties,
         )
 
-        self._sites: list[PeriodicSite] = list(self._sites)  # type: ignore[assignment]
-
     def __setitem__(
         self,
         idx: int | slice | Sequence[int] | SpeciesLike,
@@ -4290,10 +4979,12 @@ class Structure(IStructure, collections.abc.MutableSequence):
                     self._sites[ii].frac_coords = site[1]  # type: ignore[index,assignment]
                 if len(site) > 2:
                     self._sites[ii].properties = site[2]  # type: ignore[assignment, index]
+        self.clear_neighbor_cache()
 
     def __delitem__(self, idx: SupportsIndex | slice) -> None:
         """Delete a site from the Structure."""
         self._sites.__delitem__(idx)
+        self.clear_neighbor_cache()
 
     @property
     def lattice(self) -> Lattice:
@@ -4305,8 +4996,12 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(lattice, Lattice):
             lattice = Lattice(lattice)
         self._lattice = lattice
-        for site in self:
-            site.lattice = lattice
+        if (columns := self._site_columns) is not None:
+            self._site_columns = columns._replace(lattice=lattice)
+        else:
+            for site in self:
+                site.lattice = lattice
+        self.clear_neighbor_cache()
 
     def append(  # type:ignore[override]
         self,
@@ -4374,6 +5069,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                     raise ValueError("New site is too close to an existing site!")
 
         cast("list[PeriodicSite]", self.sites).insert(idx, new_site)
+        self.clear_neighbor_cache()
 
         return self
 
@@ -4411,6 +5107,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
 
         new_site = PeriodicSite(species, frac_coords, self._lattice, properties=properties, label=label)
         cast("list[PeriodicSite]", self.sites)[idx] = new_site
+        self.clear_neighbor_cache()
 
         return self
 
@@ -4524,6 +5221,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                 label=site.label,
             )
             self._sites.append(s_new)
+        self.clear_neighbor_cache()
 
         return self
 
@@ -4655,6 +5353,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
             Structure: self sorted.
         """
         self._sites.sort(key=key, reverse=reverse)
+        self.clear_neighbor_cache()
         return self
 
     def translate_sites(
@@ -4691,6 +5390,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
             if to_unit_cell:
                 f_coords = [np.mod(f, 1) if p else f for p, f in zip(self.lattice.pbc, f_coords, strict=True)]
             self[idx].frac_coords = f_coords
+        self.clear_neighbor_cache()
 
         return self
 
@@ -4729,6 +5429,8 @@ class Structure(IStructure, collections.abc.MutableSequence):
 
         theta %= 2 * np.pi
 
+        from scipy.linalg import expm
+
         rm = expm(np.cross(np.eye(3), axis / norm(axis)) * theta)
         for idx in indices:
             site = self[idx]
@@ -4808,11 +5510,11 @@ class Structure(IStructure, collections.abc.MutableSequence):
         # TODO (janosh) maybe default in_place to False after a depreciation period
         struct: Structure = self if in_place else self.copy()
         supercell: Structure = struct * scaling_matrix
+        columns = cast("_SiteColumns", supercell._site_columns)
         if to_unit_cell:
-            for site in supercell:
-                site.to_unit_cell(in_place=True)
-        struct.sites = supercell.sites
-        struct.lattice = supercell.lattice
+            pbc = np.array(columns.lattice.pbc)
+            columns.frac_coords[:, pbc] = np.mod(columns.frac_coords[:, pbc], 1)
+        struct._set_site_columns(columns)
 
         return struct
 
@@ -4858,6 +5560,9 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if mode.lower()[0] not in {"s", "d", "a"}:
             raise ValueError(f"Illegal {mode=}, should start with a/d/s.")
 
+        from scipy.cluster.hierarchy import fcluster, linkage
+        from scipy.spatial.distance import squareform
+
         dist_mat: NDArray[np.float64] = self.distance_matrix
         np.fill_diagonal(dist_mat, 0)
 
@@ -5379,6 +6084,8 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
 
         theta %= 2 * np.pi
 
+        from scipy.linalg import expm
+
         rm = expm(np.cross(np.eye(3), axis / norm(axis)) * theta)
 
         for idx in indices:
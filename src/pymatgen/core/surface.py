@@ -25,6 +25,7 @@ from typing import TYPE_CHECKING, cast
 
 import numpy as np
 import orjson
+from joblib import Parallel, delayed
 from monty.fractions import lcm
 from scipy.cluster.hierarchy import fcluster, linkage
 from scipy.spatial.distance import squareform
@@ -866,6 +867,22 @@ def get_slab_regions(
     return [(sorted_sites[0].frac_coords[2], sorted_sites[-1].frac_coords[2])]
 
 
+def _add_bulk_site_types(structure: Structure | IStructure, spg_analyzer: SpacegroupAnalyzer | None = None) -> None:
+    """Add Wyckoff symbols and equivalent sites to a bulk structure in place, unless present.
+
+    Args:
+        structure (Structure): The bulk structure.
+        spg_analyzer (SpacegroupAnalyzer): Analyzer of the structure, to reuse its symmetry dataset.
+    """
+    if "bulk_wyckoff" not in structure.site_properties or "bulk_equivalent" not in structure.site_properties:
+        spg_analyzer = spg_analyzer or SpacegroupAnalyzer(structure)
+        structure.add_site_property("bulk_wyckoff", spg_analyzer.get_symmetry_dataset().wyckoffs)  # type: ignore[union-attr]
+        structure.add_site_property(  # type: ignore[union-attr]
+            "bulk_equivalent",
+            spg_analyzer.get_symmetry_dataset().equivalent_atoms.tolist(),
+        )
+
+
 class SlabGenerator:
     """Generate different slabs using shift values determined by where
     a unique termination can be found, along with other criteria such as where a
@@ -948,19 +965,6 @@ class SlabGenerator:
             divisor = abs(reduce(math.gcd, vector))  # type: ignore[arg-type]
             return cast("tuple[int, int, int]", tuple(int(idx / divisor) for idx in vector))
 
-        def add_site_types() -> None:
-            """Add Wyckoff symbols and equivalent sites to the initial structure."""
-            if (
-                "bulk_wyckoff" not in initial_structure.site_properties
-                or "bulk_equivalent" not in initial_structure.site_properties
-            ):
-                spg_analyzer = SpacegroupAnalyzer(initial_structure)
-                initial_structure.add_site_property("bulk_wyckoff", spg_analyzer.get_symmetry_dataset().wyckoffs)
-                initial_structure.add_site_property(
-                    "bulk_equivalent",
-                    spg_analyzer.get_symmetry_dataset().equivalent_atoms.tolist(),
-                )
-
         def calculate_surface_normal() -> np.ndarray:
             """Calculate the unit surface normal vector using the reciprocal
             lattice vector.
@@ -1042,7 +1046,7 @@ class SlabGenerator:
 
         # Add Wyckoff symbols and equivalent sites to the initial structure,
         # to help identify types of sites in the generated slab
-        add_site_types()
+        _add_bulk_site_types(initial_structure)
 
         # Calculate the surface normal
         lattice = initial_structure.lattice
@@ -1070,6 +1074,8 @@ class SlabGenerator:
         self.primitive = primitive
         self._normal = normal  # TODO (@DanielYang59): used only in unit test
         self.reorient_lattice = reorient_lattice
+        # Reduced OUCs found in get_slab by slab lattice parameters, with the OUC they were reduced from
+        self._reduced_ouc_cache: dict[tuple, tuple[Structure, Structure]] = {}
 
         _a, _b, c = self.oriented_unit_cell.lattice.matrix
         self._proj_height = abs(np.dot(normal, c))
@@ -1164,17 +1170,21 @@ class SlabGenerator:
         # Reorient the lattice to get the correctly reduced cell
         ouc = self.oriented_unit_cell.copy()
         if self.primitive:
-            # Find a reduced OUC
+            # Find a reduced OUC, which is shared by all terminations with the same slab lattice
             slab_l = struct.lattice
-            ouc = ouc.get_primitive_structure(
-                constrain_latt={
-                    "a": slab_l.a,
-                    "b": slab_l.b,
-                    "alpha": slab_l.alpha,
-                    "beta": slab_l.beta,
-                    "gamma": slab_l.gamma,
-                }
-            )
+            constrain_latt = {
+                "a": slab_l.a,
+                "b": slab_l.b,
+                "alpha": slab_l.alpha,
+                "beta": slab_l.beta,
+                "gamma": slab_l.gamma,
+            }
+            cache_key = tuple(constrain_latt.values())
+            source_ouc, reduced_ouc = self._reduced_ouc_cache.get(cache_key, (None, None))
+            if source_ouc is not self.oriented_unit_cell:
+                reduced_ouc = ouc.get_primitive_structure(constrain_latt=constrain_latt)
+                self._reduced_ouc_cache[cache_key] = (self.oriented_unit_cell, reduced_ouc)
+            ouc = reduced_ouc.copy()
 
             # Ensure lattice a and b are consistent between the OUC and the Slab
             ouc = ouc if (slab_l.a == ouc.lattice.a and slab_l.b == ouc.lattice.b) else self.oriented_unit_cell
@@ -1352,10 +1362,8 @@ class SlabGenerator:
 
         # Filter out surfaces that might be the same
         if filter_out_sym_slabs:
-            matcher = StructureMatcher(ltol=tol, stol=tol, primitive_cell=False, scale=False)
-
             final_slabs: list[Slab] = []
-            for group in matcher.group_structures(slabs):
+            for group in _group_equivalent_slabs(slabs, tol):
                 # For each unique slab, symmetrize the
                 # surfaces by removing sites from the bottom
                 if symmetrize:
@@ -1366,8 +1374,7 @@ class SlabGenerator:
 
             # Filter out similar surfaces generated by symmetrization
             if symmetrize:
-                matcher_sym = StructureMatcher(ltol=tol, stol=tol, primitive_cell=False, scale=False)
-                final_slabs = [group[0] for group in matcher_sym.group_structures(final_slabs)]
+                final_slabs = [group[0] for group in _group_equivalent_slabs(final_slabs, tol)]
         else:
             final_slabs = slabs
 
@@ -1567,6 +1574,119 @@ class SlabGenerator:
         return non_stoich_slabs
 
 
+def _get_slab_fingerprint(slab: Structure) -> dict[str, Any]:
+    """Cheap invariants of a slab used to rule out matches before running the StructureMatcher.
+
+    The main invariant is the layer profile: for each species, the sorted distances
+    of its sites from the center of the slab along the surface normal, in units of
+    the out-of-plane lattice height. It does not depend on the choice of in-plane
+    lattice vectors, on in-plane translations or on flipping the slab over.
+
+    Returns:
+        dict: the fingerprint.
+    """
+    lattice = slab.lattice
+    height = lattice.volume / np.linalg.norm(np.cross(lattice.matrix[0], lattice.matrix[1]))
+
+    # Unwrap the fractional heights at the widest gap, which should be the vacuum
+    frac_z = np.mod(slab.frac_coords[:, 2], 1)
+    sorted_z = np.sort(frac_z)
+    gaps = np.diff(sorted_z, append=sorted_z[0] + 1)
+    vacuum_idx = np.argmax(gaps)
+    frac_z = np.mod(frac_z - sorted_z[(vacuum_idx + 1) % len(sorted_z)], 1)
+
+    dists = np.abs(frac_z - frac_z.mean())
+    labels = np.array([site.species_string for site in slab])
+    species = sorted(set(labels))
+    return {
+        "species": [(label, np.count_nonzero(labels == label)) for label in species],
+        "profile": np.concatenate([np.sort(dists[labels == label]) for label in species]),
+        # How much wider the vacuum is than any gap between layers
+        "vacuum_margin": gaps[vacuum_idx] - np.partition(gaps, -2)[-2] if len(gaps) > 1 else gaps[0],
+        "height": height,
+        "max_in_plane": max(lattice.a, lattice.b),
+        "volume_per_site": lattice.volume / len(slab),
+    }
+
+
+def _may_be_equivalent(fp1: dict[str, Any], fp2: dict[str, Any], ltol: float, stol: float) -> bool:
+    """Whether two slabs can be matched by a StructureMatcher with primitive_cell=False
+    and scale=False, judged from their fingerprints. False is only returned when a match
+    is impossible within the matcher tolerances.
+
+    For a match the lattice vectors of one slab are mapped onto vectors of the other
+    within the length tolerance ltol. When the out-of-plane height of each slab exceeds
+    the in-plane lattice parameters of the other by more than that, the in-plane
+    vectors can only be mapped onto in-plane vectors, so that the surface normals
+    coincide. The matched sites are then displaced by at most stol * (V/n)^(1/3),
+    which bounds the difference between the layer profiles as long as these
+    displacements cannot change which gap between the layers is the vacuum.
+    """
+    if fp1["species"] != fp2["species"]:
+        return False
+    min_height = min(fp1["height"], fp2["height"])
+    if min_height <= (1 + ltol) * max(fp1["max_in_plane"], fp2["max_in_plane"]):
+        return True
+
+    max_disp = stol * (1 + ltol) * max(fp1["volume_per_site"], fp2["volume_per_site"]) ** (1 / 3)
+    # Shifts of the slab center add up to the same displacement again
+    frac_tol = 2 * max_disp * (1 + ltol) / min_height
+    if min(fp1["vacuum_margin"], fp2["vacuum_margin"]) <= 2 * frac_tol:
+        return True
+    return bool(np.all(np.abs(fp1["profile"] - fp2["profile"]) <= frac_tol))
+
+
+def _group_equivalent_slabs(slabs: list[Slab], tol: float) -> list[list[Slab]]:
+    """Group symmetrically equivalent slabs.
+
+    This gives the same groups in the same order as StructureMatcher.group_structures
+    with ltol=stol=tol, primitive_cell=False and scale=False. Slabs are first split into
+    clusters which cannot match each other according to their fingerprints (see
+    _may_be_equivalent), so that the matcher only compares slabs within a cluster.
+    """
+    matcher = StructureMatcher(ltol=tol, stol=tol, primitive_cell=False, scale=False)
+    fingerprints = [_get_slab_fingerprint(slab) for slab in slabs]
+
+    # Connected components of the "may be equivalent" graph, using union-find
+    parents = list(range(len(slabs)))
+
+    def find_root(idx: int) -> int:
+        while parents[idx] != idx:
+            parents[idx] = parents[parents[idx]]
+            idx = parents[idx]
+        return idx
+
+    for idx, jdx in itertools.combinations(range(len(slabs)), 2):
+        if find_root(idx) != find_root(jdx) and _may_be_equivalent(fingerprints[idx], fingerprints[jdx], tol, tol):
+            parents[find_root(jdx)] = find_root(idx)
+
+    clusters: dict[int, list[int]] = {}
+    for idx in range(len(slabs)):
+        clusters.setdefault(find_root(idx), []).append(idx)
+
+    indexed_groups: list[list[int]] = []
+    for indices in clusters.values():
+        positions = {id(slabs[idx]): idx for idx in indices}
+        indexed_groups.extend(
+            [positions[id(slab)] for slab in group]
+            for group in matcher.group_structures([slabs[idx] for idx in indices])
+        )
+
+    # group_structures orders groups by composition hash, then by their first slab
+    indexed_groups.sort(key=lambda group: (matcher._comparator.get_hash(slabs[group[0]].composition), group[0]))
+    return [[slabs[idx] for idx in group] for group in indexed_groups]
+
+
+def _get_miller_slabs(
+    structure: Structure | IStructure,
+    miller_index: tuple[int, ...],
+    generator_kwargs: dict[str, Any],
+    slab_kwargs: dict[str, Any],
+) -> list[Slab]:
+    """Generate the slabs of one Miller index for generate_all_slabs, run in worker processes."""
+    return SlabGenerator(structure, miller_index, **generator_kwargs).get_slabs(**slab_kwargs)
+
+
 def generate_all_slabs(
     structure: Structure | IStructure,
     max_index: int,
@@ -1584,6 +1704,7 @@ def generate_all_slabs(
     repair: bool = False,
     include_reconstructions: bool = False,
     in_unit_planes: bool = False,
+    n_jobs: int = 1,
 ) -> list[Slab]:
     """Find all unique Slabs up to a given Miller index.
 
@@ -1644,36 +1765,43 @@ def generate_all_slabs(
             Fe(100) will have more layers. The slab thickness
             will be in min_slab_size/math.ceil(self._proj_height/dhkl)
             multiples of oriented unit cells.
+        n_jobs (int): Number of processes over which the Miller indices are
+            distributed, with -1 for all CPUs. Defaults to 1, i.e. serial.
     """
-    all_slabs: list[Slab] = []
-
-    for miller in get_symmetrically_distinct_miller_indices(structure, max_index):
-        gen = SlabGenerator(
-            structure,
-            miller,
-            min_slab_size,
-            min_vacuum_size,
-            lll_reduce=lll_reduce,
-            center_slab=center_slab,
-            primitive=primitive,
-            max_normal_search=max_normal_search,
-            in_unit_planes=in_unit_planes,
-        )
-        slabs = gen.get_slabs(
-            bonds=bonds,
-            tol=tol,
-            ftol=ftol,
-            symmetrize=symmetrize,
-            max_broken_bonds=max_broken_bonds,
-            repair=repair,
-        )
+    # The bulk symmetry is analyzed once, rather than separately for every Miller index
+    spg_analyzer = SpacegroupAnalyzer(structure)
+    _add_bulk_site_types(structure, spg_analyzer)
+
+    generator_kwargs = {
+        "min_slab_size": min_slab_size,
+        "min_vacuum_size": min_vacuum_size,
+        "lll_reduce": lll_reduce,
+        "center_slab": center_slab,
+        "primitive": primitive,
+        "max_normal_search": max_normal_search,
+        "in_unit_planes": in_unit_planes,
+    }
+    slab_kwargs = {
+        "bonds": bonds,
+        "tol": tol,
+        "ftol": ftol,
+        "symmetrize": symmetrize,
+        "max_broken_bonds": max_broken_bonds,
+        "repair": repair,
+    }
+    millers = get_symmetrically_distinct_miller_indices(structure, max_index, spg_analyzer=spg_analyzer)
+    miller_slabs = Parallel(n_jobs=n_jobs)(
+        delayed(_get_miller_slabs)(structure, miller, generator_kwargs, slab_kwargs) for miller in millers
+    )
 
+    all_slabs: list[Slab] = []
+    for miller, slabs in zip(millers, miller_slabs, strict=True):
         if len(slabs) > 0:
             logger.debug(f"{miller} has {len(slabs)} slabs... ")
             all_slabs.extend(slabs)
 
     if include_reconstructions:
-        symbol = SpacegroupAnalyzer(structure).get_space_group_symbol()
+        symbol = spg_analyzer.get_space_group_symbol()
         # Enumerate through all reconstructions in the
         # archive available for this particular spacegroup
         for name, instructions in RECONSTRUCTIONS_ARCHIVE.items():
@@ -2030,6 +2158,7 @@ def get_symmetrically_distinct_miller_indices(
     structure: Structure | IStructure,
     max_index: int,
     return_hkil: bool = False,
+    spg_analyzer: SpacegroupAnalyzer | None = None,
 ) -> list:
     """Find all symmetrically distinct indices below a certain max-index
     for a given structure. Analysis is based on the symmetry of the
@@ -2042,6 +2171,8 @@ def get_symmetrically_distinct_miller_indices(
             All other indices are equivalent to one of these.
         return_hkil (bool): Whether to return hkil (True) form of Miller
             index for hexagonal systems, or hkl (False).
+        spg_analyzer (SpacegroupAnalyzer): Analyzer of the structure, to reuse
+            an existing symmetry analysis. Defaults to None, i.e. a new one.
     """
     # Get a list of all hkls for conventional (including equivalent)
     rng = list(range(-max_index, max_index + 1))[::-1]
@@ -2052,11 +2183,12 @@ def get_symmetrically_distinct_miller_indices(
     conv_hkl_list = sorted(conv_hkl_list, key=lambda x: max(np.abs(x)))
 
     # Get distinct hkl planes from the rhombohedral setting if trigonal
-    spg_analyzer = SpacegroupAnalyzer(structure)
-    if spg_analyzer.get_crystal_system() == "trigonal":
+    spg_analyzer = spg_analyzer or SpacegroupAnalyzer(structure)
+    crystal_system = spg_analyzer.get_crystal_system()
+    if crystal_system == "trigonal":
         transf = spg_analyzer.get_conventional_to_primitive_transformation_matrix()
         miller_list: list[tuple[int, int, int]] = [hkl_transformation(transf, hkl) for hkl in conv_hkl_list]
-        prim_structure = SpacegroupAnalyzer(structure).get_primitive_standard_structure()
+        prim_structure = spg_analyzer.get_primitive_standard_structure()
         symm_ops = prim_structure.lattice.get_recp_symmetry_operation()
 
     else:
@@ -2070,7 +2202,7 @@ def get_symmetrically_distinct_miller_indices(
         denom = abs(reduce(math.gcd, miller))  # type: ignore[arg-type]
         miller = cast("tuple[int, int, int]", tuple(int(idx / denom) for idx in miller))
         if not _is_in_miller_family(miller, unique_millers, symm_ops):
-            if spg_analyzer.get_crystal_system() == "trigonal":
+            if crystal_system == "trigonal":
                 # Now we find the distinct primitive hkls using
                 # the primitive symmetry operations and their
                 # corresponding hkls in the conventional setting
@@ -2082,7 +2214,7 @@ def get_symmetrically_distinct_miller_indices(
                 unique_millers.append(miller)
                 unique_millers_conv.append(miller)
 
-    if return_hkil and spg_analyzer.get_crystal_system() in {"trigonal", "hexagonal"}:
+    if return_hkil and crystal_system in {"trigonal", "hexagonal"}:
         return [(hkl[0], hkl[1], -1 * hkl[0] - hkl[1], hkl[2]) for hkl in unique_millers_conv]
 
     return unique_millers_conv
@@ -6,6 +6,7 @@ which provides basic methods for creating and manipulating rank 2 tensors.
 from __future__ import annotations
 
 import collections
+import functools
 import itertools
 import os
 import string
@@ -23,7 +24,7 @@ from pymatgen.core.operations import SymmOp
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
     from typing import Any
 
     from numpy.typing import NDArray
@@ -327,9 +328,8 @@ class Tensor(np.ndarray, MSONable):
             symprec (float): symmetry tolerance for the Spacegroup Analyzer
                 used to generate the symmetry operations
         """
-        sga = SpacegroupAnalyzer(structure, symprec)
-        symm_ops = sga.get_symmetry_operations(cartesian=True)
-        return sum(self.transform(symm_op) for symm_op in symm_ops) / len(symm_ops)
+        rotations = _get_cartesian_rotations(structure, symprec)
+        return type(self)(_fit_stack(np.asarray(self)[None], rotations)[0])
 
     def is_fit_to_structure(self, structure: Structure, tol: float = 1e-2) -> bool:
         """Test whether a tensor is invariant with respect to the
@@ -346,10 +346,7 @@ class Tensor(np.ndarray, MSONable):
     @property
     def voigt(self) -> NDArray[np.float64]:
         """The tensor in Voigt notation."""
-        v_matrix = np.zeros(self._vscale.shape, dtype=self.dtype)
-        this_voigt_map = self.get_voigt_dict(self.rank)
-        for ind, v in this_voigt_map.items():
-            v_matrix[v] = self[ind]
+        v_matrix = _to_voigt_stack(np.asarray(self)[None], self._vscale.shape)[0]
         if not self.is_voigt_symmetric():
             warnings.warn("Tensor is not symmetric, information may be lost in Voigt conversion.", stacklevel=2)
         return v_matrix * self._vscale
@@ -359,16 +356,7 @@ class Tensor(np.ndarray, MSONable):
         by grouping indices into pairs and constructing a sequence of
         possible permutations to be used in a tensor transpose.
         """
-        transpose_pieces = [[[0 for _ in range(self.rank % 2)]]]
-        transpose_pieces += [[list(range(j, j + 2))] for j in range(self.rank % 2, self.rank, 2)]
-        for n in range(self.rank % 2, len(transpose_pieces)):
-            if len(transpose_pieces[n][0]) == 2:
-                transpose_pieces[n] += [transpose_pieces[n][0][::-1]]
-        for trans_seq in itertools.product(*transpose_pieces):
-            transpose_seq = list(itertools.chain(*trans_seq))
-            if (self - self.transpose(transpose_seq) > tol).any():
-                return False
-        return True
+        return _is_voigt_symmetric_stack(np.asarray(self)[None], tol)
 
     @staticmethod
     def get_voigt_dict(rank: int) -> dict[tuple[int, ...], tuple[int, ...]]:
@@ -402,10 +390,7 @@ class Tensor(np.ndarray, MSONable):
         if voigt_input.shape != t._vscale.shape:
             raise ValueError("Invalid shape for Voigt matrix")
         voigt_input = voigt_input / t._vscale  # (ruff-preview) noqa: PLR6104
-        this_voigt_map = t.get_voigt_dict(rank)
-        for ind, v in this_voigt_map.items():
-            t[ind] = voigt_input[v]
-        return cls(t)
+        return cls(_from_voigt_stack(voigt_input[None], rank)[0])
 
     @staticmethod
     def get_ieee_rotation(
@@ -422,6 +407,14 @@ class Tensor(np.ndarray, MSONable):
             refine_rotation (bool): whether to refine the rotation
                 using SquareTensor.refine_rotation
         """
+        key = (_get_structure_key(structure), refine_rotation)
+        if key not in _IEEE_ROTATION_CACHE:
+            _cache_put(_IEEE_ROTATION_CACHE, key, Tensor._get_ieee_rotation(structure, refine_rotation))
+        return SquareTensor(_IEEE_ROTATION_CACHE[key].copy())
+
+    @staticmethod
+    def _get_ieee_rotation(structure: Structure, refine_rotation: bool) -> SquareTensor:
+        """Uncached implementation of get_ieee_rotation."""
         # Check conventional setting:
         sga = SpacegroupAnalyzer(structure)
         dataset = sga.get_symmetry_dataset()
@@ -733,6 +726,46 @@ class TensorCollection(collections.abc.Sequence, MSONable):
     def __iter__(self):
         return iter(self.tensors)
 
+    def to_array(self) -> NDArray:
+        """The tensors stacked into a single (K, 3, ..., 3) array.
+
+        Raises:
+            ValueError: if the collection holds tensors of different ranks.
+        """
+        if len({tensor.rank for tensor in self}) > 1:
+            raise ValueError("Cannot stack tensors of different ranks into one array.")
+        return np.array([np.asarray(tensor) for tensor in self], dtype=float)
+
+    def _get_stacks(self) -> list[tuple[type, list[int], NDArray]]:
+        """Group tensors by class and rank, each group stacked into a (K, 3, ..., 3) array
+        together with the positions of its members in the collection.
+        """
+        groups: dict[tuple[type, int], list[int]] = {}
+        for idx, tensor in enumerate(self.tensors):
+            groups.setdefault((type(tensor), tensor.ndim), []).append(idx)
+        return [
+            (tensor_cls, indices, np.stack([np.asarray(self.tensors[idx]) for idx in indices]))
+            for (tensor_cls, _rank), indices in groups.items()
+        ]
+
+    def _map_stacks(self, func: Callable[[NDArray], NDArray], keep_attributes: bool = False) -> Self:
+        """Apply a function mapping (K, 3, ..., 3) stacks to stacks of the same shape to every
+        group of tensors, returning a new collection in the original order.
+
+        If keep_attributes, results are views carrying over the attributes (e.g. Voigt scaling)
+        of the input tensors, as for copies; otherwise they are rebuilt with the tensor constructors.
+        """
+        new_tensors: list = [None] * len(self)
+        for tensor_cls, indices, stack in self._get_stacks():
+            for idx, new_array in zip(indices, func(stack), strict=True):
+                if keep_attributes:
+                    new_tensor = new_array.view(tensor_cls)
+                    new_tensor.__array_finalize__(self.tensors[idx])
+                else:
+                    new_tensor = tensor_cls(new_array)
+                new_tensors[idx] = new_tensor
+        return type(self)(new_tensors)
+
     def zeroed(self, tol: float = 1e-3) -> Self:
         """
         Args:
@@ -741,7 +774,13 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection where small values are set to 0.
         """
-        return type(self)([tensor.zeroed(tol) for tensor in self])
+
+        def _zeroed(stack: NDArray) -> NDArray:
+            stack = stack.copy()
+            stack[abs(stack) < tol] = 0
+            return stack
+
+        return self._map_stacks(_zeroed, keep_attributes=True)
 
     def transform(self, symm_op: SymmOp) -> Self:
         """Transforms TensorCollection with a symmetry operation.
@@ -752,7 +791,7 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.transform(symm_op) for tensor in self])
+        return self._map_stacks(lambda stack: _transform_stack(stack, symm_op.rotation_matrix))
 
     def rotate(self, matrix, tol: float = 1e-3) -> Self:
         """Rotates TensorCollection.
@@ -764,12 +803,15 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.rotate(matrix, tol) for tensor in self])
+        matrix = SquareTensor(matrix)
+        if not matrix.is_rotation(tol):
+            raise ValueError("Rotation matrix is not valid.")
+        return self._map_stacks(lambda stack: _transform_stack(stack, np.asarray(matrix, dtype=float)))
 
     @property
     def symmetrized(self) -> Self:
         """TensorCollection where all tensors are symmetrized."""
-        return type(self)([tensor.symmetrized for tensor in self])
+        return self._map_stacks(_symmetrize_stack)
 
     def is_symmetric(self, tol: float = 1e-5) -> bool:
         """
@@ -779,7 +821,7 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are symmetric.
         """
-        return all(tensor.is_symmetric(tol) for tensor in self)
+        return all(np.allclose(stack, _symmetrize_stack(stack), atol=tol, rtol=0) for *_, stack in self._get_stacks())
 
     def fit_to_structure(
         self,
@@ -795,7 +837,8 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.fit_to_structure(structure, symprec) for tensor in self])
+        rotations = _get_cartesian_rotations(structure, symprec)
+        return self._map_stacks(lambda stack: _fit_stack(stack, rotations))
 
     def is_fit_to_structure(
         self,
@@ -810,12 +853,25 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are fitted to Structure.
         """
-        return all(tensor.is_fit_to_structure(structure, tol) for tensor in self)
+        rotations = _get_cartesian_rotations(structure, 0.1)
+        return all(
+            np.allclose(stack, _fit_stack(stack, rotations), atol=tol, rtol=0) for *_, stack in self._get_stacks()
+        )
 
     @property
     def voigt(self) -> list[NDArray[np.float64]]:
         """TensorCollection where all tensors are in Voigt form."""
-        return [tensor.voigt for tensor in self]
+        voigt_list: list = [None] * len(self)
+        is_voigt_symmetric = True
+        for _tensor_cls, indices, stack in self._get_stacks():
+            vscales = np.stack([self.tensors[idx]._vscale for idx in indices])
+            v_stack = _to_voigt_stack(stack, vscales.shape[1:]) * vscales
+            is_voigt_symmetric &= _is_voigt_symmetric_stack(stack)
+            for idx, v_matrix in zip(indices, v_stack, strict=True):
+                voigt_list[idx] = v_matrix
+        if not is_voigt_symmetric:
+            warnings.warn("Tensor is not symmetric, information may be lost in Voigt conversion.", stacklevel=2)
+        return voigt_list
 
     @property
     def ranks(self) -> list:
@@ -830,7 +886,7 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are voigt symmetric.
         """
-        return all(tensor.is_voigt_symmetric(tol) for tensor in self)
+        return all(_is_voigt_symmetric_stack(stack, tol) for *_, stack in self._get_stacks())
 
     @classmethod
     def from_voigt(
@@ -847,7 +903,21 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return cls([base_class.from_voigt(v) for v in voigt_input_list])
+        voigt_inputs = [np.asarray(v) for v in voigt_input_list]
+        groups: dict[tuple[int, ...], list[int]] = {}
+        for idx, v in enumerate(voigt_inputs):
+            groups.setdefault(v.shape, []).append(idx)
+
+        tensors: list = [None] * len(voigt_inputs)
+        for shape, indices in groups.items():
+            rank = sum(shape) // 3
+            template = base_class(np.zeros([3] * rank))
+            if shape != template._vscale.shape:
+                raise ValueError("Invalid shape for Voigt matrix")
+            v_stack = np.stack([voigt_inputs[idx] for idx in indices]) / template._vscale
+            for idx, array in zip(indices, _from_voigt_stack(v_stack, rank), strict=True):
+                tensors[idx] = base_class(array)
+        return cls(tensors)
 
     def convert_to_ieee(
         self,
@@ -865,7 +935,18 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.convert_to_ieee(structure, initial_fit, refine_rotation) for tensor in self])
+        rotation = Tensor.get_ieee_rotation(structure, refine_rotation)
+        if not rotation.is_rotation(1e-2):
+            raise ValueError("Rotation matrix is not valid.")
+        rotation_matrix = np.asarray(rotation, dtype=float)
+        rotations = _get_cartesian_rotations(structure, 0.1) if initial_fit else None
+
+        def _convert(stack: NDArray) -> NDArray:
+            if rotations is not None:
+                stack = _fit_stack(stack, rotations)
+            return _transform_stack(stack, rotation_matrix)
+
+        return self._map_stacks(_convert)
 
     def round(self, *args, **kwargs) -> Self:
         """Round all tensors.
@@ -877,12 +958,23 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.round(*args, **kwargs) for tensor in self])
+        return self._map_stacks(lambda stack: np.round(stack, *args, **kwargs))
 
     @property
     def voigt_symmetrized(self) -> Self:
         """TensorCollection where all tensors are voigt symmetrized."""
-        return type(self)([tensor.voigt_symmetrized for tensor in self])
+        if any(rank % 2 != 0 or rank < 2 for rank in self.ranks):
+            raise ValueError("V-symmetrization requires rank even and >= 2")
+        voigt_list = self.voigt
+        new_tensors: list = [None] * len(self)
+        for tensor_cls, indices, stack in self._get_stacks():
+            rank = stack.ndim - 1
+            template = tensor_cls(np.zeros([3] * rank))
+            v_stack = np.stack([voigt_list[idx] for idx in indices])
+            v_stack = _symmetrize_stack(v_stack) / template._vscale
+            for idx, array in zip(indices, _from_voigt_stack(v_stack, rank), strict=True):
+                new_tensors[idx] = tensor_cls(array)
+        return type(self)(new_tensors)
 
     def as_dict(self, voigt: bool = False) -> dict:
         """
@@ -1025,6 +1117,121 @@ def get_uvec(vec: NDArray[np.float64]) -> NDArray[np.float64]:
     return vec if norm < 1e-8 else vec / norm
 
 
+# Bounded caches of structure symmetry data, shared by Tensor and TensorCollection so that
+# processing many tensors of the same structure only runs the symmetry analysis once
+_SYMMETRY_CACHE_SIZE = 256
+_CARTESIAN_ROTATIONS_CACHE: dict[tuple, NDArray] = {}
+_IEEE_ROTATION_CACHE: dict[tuple, SquareTensor] = {}
+
+
+def _cache_put(cache: dict, key: tuple, value: Any) -> None:
+    """Insert into one of the symmetry caches, evicting the oldest entry when full."""
+    if len(cache) >= _SYMMETRY_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def _get_structure_key(structure: Structure) -> tuple:
+    """Hashable key of everything the SpacegroupAnalyzer sees of a structure."""
+    return (
+        structure.lattice.matrix.tobytes(),
+        structure.frac_coords.tobytes(),
+        tuple(structure.species_and_occu),
+        repr(structure.site_properties.get("magmom")),
+    )
+
+
+def _get_cartesian_rotations(structure: Structure, symprec: float) -> NDArray:
+    """Cartesian rotation matrices of the symmetry operations of a structure
+    as a read-only (n_ops, 3, 3) array, cached per structure and symprec.
+    """
+    key = (_get_structure_key(structure), symprec)
+    if key not in _CARTESIAN_ROTATIONS_CACHE:
+        symm_ops = SpacegroupAnalyzer(structure, symprec).get_symmetry_operations(cartesian=True)
+        rotations = np.array([symm_op.rotation_matrix for symm_op in symm_ops])
+        rotations.setflags(write=False)
+        _cache_put(_CARTESIAN_ROTATIONS_CACHE, key, rotations)
+    return _CARTESIAN_ROTATIONS_CACHE[key]
+
+
+def _transform_stack(stack: NDArray, rotation: NDArray) -> NDArray:
+    """Rotate every tensor of a (K, 3, ..., 3) stack, T'_ab.. = R_ai R_bj .. T_ij..
+
+    The rotation is contracted with one index at a time, each a single matrix product
+    over the whole stack whose new index is moved to the end, which brings the indices
+    back into order after a full pass.
+    """
+    for _ in range(stack.ndim - 1):
+        stack = np.tensordot(stack, rotation, axes=([1], [1]))
+    return np.ascontiguousarray(stack)
+
+
+def _fit_stack(stack: NDArray, rotations: NDArray) -> NDArray:
+    """Average every tensor of a (K, 3, ..., 3) stack over a set of rotations."""
+    fitted = np.zeros(stack.shape)
+    for rotation in rotations:
+        fitted += _transform_stack(stack, rotation)
+    return fitted / len(rotations)
+
+
+def _symmetrize_stack(stack: NDArray) -> NDArray:
+    """Average every tensor of a (K, ...) stack over all permutations of its indices."""
+    perms = list(itertools.permutations(range(1, stack.ndim)))
+    symmetrized = np.zeros(stack.shape)
+    for perm in perms:
+        symmetrized += np.transpose(stack, (0, *perm))
+    return symmetrized / len(perms)
+
+
+def _is_voigt_symmetric_stack(stack: NDArray, tol: float = 1e-6) -> bool:
+    """Whether all tensors of a (K, 3, ..., 3) stack are invariant under swapping
+    the indices within each Voigt pair, see Tensor.is_voigt_symmetric.
+    """
+    rank = stack.ndim - 1
+    transpose_pieces = [[[0] * (rank % 2)]]
+    transpose_pieces += [[[j, j + 1], [j + 1, j]] for j in range(rank % 2, rank, 2)]
+    for trans_seq in itertools.product(*transpose_pieces):
+        transpose_seq = [0, *(idx + 1 for idx in itertools.chain(*trans_seq))]
+        if (stack - stack.transpose(transpose_seq) > tol).any():
+            return False
+    return True
+
+
+@functools.cache
+def _get_voigt_indices(rank: int) -> tuple[tuple, tuple, tuple, tuple]:
+    """Fancy indices between full and Voigt notation for a given rank.
+
+    Returns:
+        tensor and Voigt indices for the conversion to Voigt notation, in which the last
+        of the tensor entries sharing a Voigt entry is used, followed by tensor and Voigt
+        indices for the conversion from Voigt notation covering every tensor entry.
+    """
+    voigt_dict = Tensor.get_voigt_dict(rank)
+    to_voigt = {v_ind: ind for ind, v_ind in voigt_dict.items()}
+    return (
+        tuple(np.array(axis, dtype=int) for axis in zip(*to_voigt.values(), strict=True)),
+        tuple(np.array(axis, dtype=int) for axis in zip(*to_voigt, strict=True)),
+        tuple(np.array(axis, dtype=int) for axis in zip(*voigt_dict, strict=True)),
+        tuple(np.array(axis, dtype=int) for axis in zip(*voigt_dict.values(), strict=True)),
+    )
+
+
+def _to_voigt_stack(stack: NDArray, voigt_shape: tuple[int, ...]) -> NDArray:
+    """Convert a (K, 3, ..., 3) stack to unscaled Voigt notation."""
+    tensor_ind, voigt_ind, _, _ = _get_voigt_indices(stack.ndim - 1)
+    v_stack = np.zeros((len(stack), *voigt_shape), dtype=stack.dtype)
+    v_stack[(slice(None), *voigt_ind)] = stack[(slice(None), *tensor_ind)]
+    return v_stack
+
+
+def _from_voigt_stack(v_stack: NDArray, rank: int) -> NDArray:
+    """Convert an unscaled stack of Voigt-notation tensors to a (K, 3, ..., 3) stack."""
+    _, _, tensor_ind, voigt_ind = _get_voigt_indices(rank)
+    stack = np.zeros((len(v_stack), *[3] * rank))
+    stack[(slice(None), *tensor_ind)] = v_stack[(slice(None), *voigt_ind)]
+    return stack
+
+
 def symmetry_reduce(
     tensors,
     structure: Structure,
@@ -1050,16 +1257,30 @@ def symmetry_reduce(
     """
     sga = SpacegroupAnalyzer(structure, **kwargs)
     symm_ops = sga.get_symmetry_operations(cartesian=True)
+    rotations = np.array([symm_op.rotation_matrix for symm_op in symm_ops])
+
+    def _get_images(tensor) -> NDArray:
+        """All symmetry images of a tensor as an (n_ops, 3, ..., 3) array."""
+        rank = np.ndim(tensor)
+        lc = string.ascii_lowercase
+        old, new = lc[:rank], lc[rank : 2 * rank]
+        einsum_string = ",".join(f"z{n}{o}" for n, o in zip(new, old, strict=True)) + f",{old}->z{new}"
+        return np.einsum(einsum_string, *[rotations] * rank, np.asarray(tensor))
+
     unique_mapping = TensorMapping([tensors[0]], [[]], tol=tol)
+    unique_images = [_get_images(tensors[0])]
     for tensor in tensors[1:]:
-        is_unique = True
-        for unique_tensor, symm_op in itertools.product(unique_mapping, symm_ops):
-            if np.allclose(unique_tensor.transform(symm_op), tensor, atol=tol):
-                unique_mapping[unique_tensor].append(symm_op)
-                is_unique = False
+        array = np.asarray(tensor)
+        for unique_tensor, images in zip(unique_mapping, unique_images, strict=True):
+            # Same criterion as np.allclose(image, tensor, atol=tol), for all images at once
+            axes = tuple(range(1, images.ndim))
+            matches = np.all(np.abs(images - array) <= tol + 1e-5 * np.abs(array), axis=axes)
+            if matches.any():
+                unique_mapping[unique_tensor].append(symm_ops[np.argmax(matches)])
                 break
-        if is_unique:
+        else:
             unique_mapping[tensor] = []
+            unique_images.append(_get_images(tensor))
     return unique_mapping
 
 
@@ -1096,6 +1317,9 @@ class TensorMapping(collections.abc.MutableMapping):
         self._tensor_list = list(tensors)  # needs to be a list
         self._value_list = list(values)  # needs to be a list
         self.tol = tol
+        # Keys stacked into an over-allocated array for vectorized lookups, see _get_tensor_array
+        self._tensor_array: NDArray | None = None
+        self._n_stacked = 0
 
     def __getitem__(self, item):
         index = self._get_item_index(item)
@@ -1115,6 +1339,7 @@ class TensorMapping(collections.abc.MutableMapping):
         index = self._get_item_index(key)
         self._tensor_list.pop(index)
         self._value_list.pop(index)
+        self._tensor_array = None
 
     def __len__(self) -> int:
         return len(self._tensor_list)
@@ -1138,9 +1363,36 @@ class TensorMapping(collections.abc.MutableMapping):
             return None
         item = np.array(item)
         axis = tuple(range(1, len(item.shape) + 1))
-        mask = np.all(np.abs(np.array(self._tensor_list) - item) < self.tol, axis=axis)
+        mask = np.all(np.abs(self._get_tensor_array() - item) < self.tol, axis=axis)
         indices = np.where(mask)[0]
         if len(indices) > 1:
             raise ValueError("Tensor key collision.")
 
         return None if len(indices) == 0 else indices[0]
+
+    def _get_tensor_array(self) -> NDArray:
+        """The keys as one array. Keys appended since the last call are copied into
+        spare rows, with the capacity doubled when full, so that building a mapping
+        one key at a time does not restack all previous keys on every insertion.
+        """
+        n_tensors = len(self._tensor_list)
+        if self._tensor_array is not None and self._n_stacked < n_tensors:
+            new_array = np.array(self._tensor_list[self._n_stacked :])
+            if new_array.shape[1:] != self._tensor_array.shape[1:] or (
+                np.result_type(self._tensor_array, new_array) != self._tensor_array.dtype
+            ):
+                self._tensor_array = None
+            else:
+                if n_tensors > len(self._tensor_array):
+                    grown = np.empty((2 * n_tensors, *new_array.shape[1:]), dtype=self._tensor_array.dtype)
+                    grown[: self._n_stacked] = self._tensor_array[: self._n_stacked]
+                    self._tensor_array = grown
+                self._tensor_array[self._n_stacked : n_tensors] = new_array
+                self._n_stacked = n_tensors
+
+        if self._tensor_array is None:
+            array = np.array(self._tensor_list)
+            self._tensor_array = np.empty((2 * n_tensors, *array.shape[1:]), dtype=array.dtype)
+            self._tensor_array[:n_tensors] = array
+            self._n_stacked = n_tensors
+        return self._tensor_array[:n_tensors]
@@ -4,16 +4,21 @@ either relaxation or molecular dynamics.
 
 from __future__ import annotations
 
+import collections.abc
+import copy
 import itertools
+import json
+import os
+import shutil
 import warnings
 from fnmatch import fnmatch
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryFile
 from typing import TYPE_CHECKING, TypeAlias, cast
 
 import numpy as np
 from monty.io import zopen
-from monty.json import MSONable
+from monty.json import MontyDecoder, MontyEncoder, MSONable
 
 from pymatgen.core.structure import Composition, DummySpecies, Element, Lattice, Molecule, Species, Structure
 from pymatgen.io.ase import NO_ASE_ERR, AseAtomsAdaptor
@@ -26,7 +31,7 @@ else:
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
-    from typing import Any
+    from typing import Any, Literal
 
     from typing_extensions import Self
 
@@ -875,3 +880,553 @@ class Trajectory(MSONable):
             temp_file.close()
 
         return ase_traj
+
+
+class DiskTrajectory(Trajectory):
+    """Trajectory stored on disk and memory-mapped, for trajectories larger than memory.
+
+    The trajectory is a directory with a JSON manifest, raw binary files for the coords,
+    lattices (if not constant) and numeric per-frame site properties (e.g. forces,
+    velocities), and frame properties as JSON lines in chunks of chunk_size frames.
+    Frames are read on access only: indexing with an int reads one frame, and slices
+    return an in-memory Trajectory whose coords are views of the memory-mapped array.
+
+    Frames can be appended while a simulation runs (append, extend), without copying
+    the existing frames. The manifest records the number of valid frames and is
+    replaced atomically, so a reader never sees a partially written frame.
+
+    Example:
+        >>> traj = DiskTrajectory.create("md_run", species, lattice=lattice)
+        >>> for structure in md_steps:
+        ...     traj.append(structure)  # structure.properties become frame properties
+        >>> traj = DiskTrajectory("md_run")
+        >>> traj[-1], traj[1000:2000:10], traj.coords.shape
+    """
+
+    def __init__(self, path: PathLike, mode: Literal["r", "a"] = "r") -> None:
+        """Open a trajectory written by DiskTrajectory.create or from_trajectory.
+
+        Args:
+            path (PathLike): Directory of the trajectory.
+            mode ("r" | "a"): "r" for read-only, "a" to allow appending frames.
+        """
+        if mode not in {"r", "a"}:
+            raise ValueError(f"Invalid {mode=}, must be 'r' or 'a'")
+        self.path = os.fspath(path)
+        self.mode = mode
+        manifest_path = os.path.join(self.path, "manifest.json")
+        if not os.path.isfile(manifest_path):
+            raise FileNotFoundError(f"No {type(self).__name__} found at {self.path}")
+        with open(manifest_path, encoding="utf-8") as file:
+            self._manifest: dict[str, Any] = json.load(file)
+
+        decoder = MontyDecoder()
+        self.species = decoder.process_decoded(self._manifest["species"])
+        self.charge = self._manifest["charge"]
+        self.spin_multiplicity = self._manifest["spin_multiplicity"]
+        self.constant_lattice = self._manifest["constant_lattice"]
+        self.time_step = self._manifest["time_step"]
+        self._constant_site_props: dict[str, Any] | None = decoder.process_decoded(self._manifest["site_properties"])
+        self._chunk_cache: tuple[int, list[dict]] | None = None
+
+        if mode == "a":
+            self._discard_partial_frames()
+        self._map_arrays()
+
+    @classmethod
+    def create(
+        cls,
+        path: PathLike,
+        species: list[str | Element | Species | DummySpecies | Composition],
+        lattice: Lattice | np.ndarray | None = None,
+        *,
+        charge: float | None = None,
+        spin_multiplicity: float | None = None,
+        constant_lattice: bool = True,
+        time_step: float | None = None,
+        site_properties: dict | None = None,
+        chunk_size: int = 1000,
+        overwrite: bool = False,
+    ) -> Self:
+        """Create an empty trajectory on disk, open for appending frames.
+
+        Args:
+            path (PathLike): Directory of the trajectory.
+            species: shape (N,). Species on each site, as in Trajectory.
+            lattice: shape (3, 3). Lattice of a Structure-based trajectory with constant
+                lattice. None for Molecule-based trajectories or if constant_lattice is False.
+            charge: Charge of a Molecule-based trajectory.
+            spin_multiplicity: Spin multiplicity of a Molecule-based trajectory.
+            constant_lattice: Whether all frames share the same lattice. If False, the
+                lattice of each frame is stored.
+            time_step: Time step of MD simulation in femto-seconds.
+            site_properties: Site properties that are the same for all frames. Other site
+                properties are stored per frame.
+            chunk_size: Number of frames per frame properties file. Defaults to 1000.
+            overwrite: Whether to replace an existing trajectory at path. Defaults to False.
+
+        Returns:
+            DiskTrajectory: Open in append mode.
+        """
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(f"{path} already exists, pass overwrite=True to replace it")
+            shutil.rmtree(path)
+        os.makedirs(path)
+
+        is_molecule = lattice is None and constant_lattice
+        if isinstance(lattice, Lattice):
+            lattice = lattice.matrix
+        if is_molecule and charge is None:
+            charge = 0
+        manifest = {
+            "format": "pymatgen.core.trajectory.DiskTrajectory",
+            "version": 1,
+            "species": json.loads(json.dumps(species, cls=MontyEncoder)),
+            "n_sites": len(species),
+            "n_frames": 0,
+            "chunk_size": chunk_size,
+            "is_molecule": is_molecule,
+            "charge": int(charge or 0) if is_molecule else None,
+            "spin_multiplicity": spin_multiplicity if is_molecule else None,
+            "constant_lattice": None if is_molecule else constant_lattice,
+            "lattice": None if lattice is None else np.asarray(lattice, dtype=np.float64).tolist(),
+            "time_step": time_step,
+            "site_properties": json.loads(json.dumps(site_properties, cls=MontyEncoder)),
+            "site_property_columns": None,
+            "has_frame_properties": False,
+            "has_record_site_properties": False,
+        }
+        _write_json_atomic(os.path.join(path, "manifest.json"), manifest)
+        return cls(path, mode="a")
+
+    @classmethod
+    def from_trajectory(
+        cls, path: PathLike, trajectory: Trajectory, chunk_size: int = 1000, overwrite: bool = False
+    ) -> Self:
+        """Write an in-memory Trajectory to disk.
+
+        Args:
+            path (PathLike): Directory of the trajectory.
+            trajectory (Trajectory): Trajectory to write.
+            chunk_size: Number of frames per frame properties file. Defaults to 1000.
+            overwrite: Whether to replace an existing trajectory at path. Defaults to False.
+
+        Returns:
+            DiskTrajectory: Open in append mode.
+        """
+        trajectory.to_positions()
+        constant_lattice = trajectory.lattice is None or bool(trajectory.constant_lattice)
+        site_props = trajectory.site_properties if isinstance(trajectory.site_properties, dict) else None
+        disk_traj = cls.create(
+            path,
+            trajectory.species,
+            lattice=trajectory.lattice if trajectory.lattice is not None and constant_lattice else None,
+            charge=trajectory.charge,
+            spin_multiplicity=trajectory.spin_multiplicity,
+            constant_lattice=constant_lattice,
+            time_step=trajectory.time_step,
+            site_properties=site_props,
+            chunk_size=chunk_size,
+            overwrite=overwrite,
+        )
+        disk_traj.extend(trajectory)
+        return disk_traj
+
+    def __getitem__(self, frames: ValidIndex) -> Molecule | Structure | Trajectory:  # type: ignore[override]
+        """Get a frame as Structure/Molecule (int) or an in-memory Trajectory of frames (slice or list).
+
+        Only the selected frames are read. For slices, coords and lattices are views of
+        the memory-mapped arrays.
+        """
+        self.to_positions()
+        if isinstance(frames, int | np.integer):
+            frames = int(frames)
+            if not -len(self) <= frames < len(self):
+                raise IndexError(f"index={frames} out of range, trajectory only has {len(self)} frames")
+            return super().__getitem__(frames % len(self))
+
+        if isinstance(frames, slice):
+            selected: list[int] = list(range(*frames.indices(len(self))))
+            coords = self.coords[frames]
+            lattice = self.lattice if self.constant_lattice or self.lattice is None else self.lattice[frames]
+        elif isinstance(frames, list | np.ndarray):
+            selected = [int(idx) for idx in frames]
+            if bad_frames := [idx for idx in selected if not -len(self) <= idx < len(self)]:
+                raise IndexError(f"index={bad_frames} out of range, trajectory only has {len(self)} frames")
+            coords = self.coords[selected]
+            lattice = self.lattice if self.constant_lattice or self.lattice is None else self.lattice[selected]
+        else:
+            raise TypeError(f"bad index={frames!r}, expected one of [{', '.join(str(ValidIndex).split(' | '))}]")
+
+        frame_properties = self.frame_properties
+        return Trajectory(
+            species=self.species,
+            coords=coords,
+            charge=self.charge,
+            spin_multiplicity=self.spin_multiplicity,
+            lattice=lattice,
+            site_properties=self._get_site_props(selected),
+            frame_properties=None if frame_properties is None else [frame_properties[idx] for idx in selected],
+            constant_lattice=self.constant_lattice,
+            time_step=self.time_step,
+        )
+
+    @property
+    def frame_properties(self) -> Sequence[dict | None] | None:  # type: ignore[override]
+        """Frame properties of all frames, read from disk on access. None if no frame has any."""
+        if not self._manifest["has_frame_properties"]:
+            return None
+        return _FrameRecordView(self, "properties")
+
+    @frame_properties.setter
+    def frame_properties(self, frame_properties: Any) -> None:
+        raise AttributeError(f"frame_properties of a {type(self).__name__} can only be added with append/extend")
+
+    @property
+    def site_properties(self) -> SitePropsType | Sequence[dict] | None:  # type: ignore[override]
+        """Site properties: a dict if they are the same for all frames, else a
+        sequence of dicts (one per frame) read from disk on access.
+        """
+        if not self._manifest["site_property_columns"] and not self._manifest["has_record_site_properties"]:
+            return self._constant_site_props
+        return _FrameRecordView(self, "site_properties")
+
+    @site_properties.setter
+    def site_properties(self, site_properties: Any) -> None:
+        raise AttributeError(f"site_properties of a {type(self).__name__} can only be added with append/extend")
+
+    def append(self, structure: Structure | Molecule) -> None:
+        """Append a frame. The properties of the structure are stored as frame properties
+        and its site properties as (per-frame) site properties.
+
+        Args:
+            structure (Structure | Molecule): Frame to append, with the same species.
+        """
+        if isinstance(structure, Structure):
+            coords = structure.frac_coords
+            lattice = structure.lattice.matrix
+        else:
+            coords, lattice = structure.cart_coords, None
+        if [str(sp) for sp in structure.species_and_occu] != [str(sp) for sp in self._species_compositions()]:
+            raise ValueError("Cannot append a frame with different species to the trajectory.")
+        self._write_frames(
+            coords[None],
+            None if lattice is None else lattice[None],
+            [structure.site_properties],
+            [structure.properties or None],
+        )
+
+    def extend(self, trajectory: Trajectory) -> None:
+        """Append the frames of a trajectory, without reading the frames already on disk.
+
+        Args:
+            trajectory (Trajectory): Trajectory to append, with the same species and time step.
+        """
+        if (self.lattice is None) != (trajectory.lattice is None):
+            raise ValueError("Cannot combine Molecule- and Structure-based Trajectory. objects.")
+        if self.time_step != trajectory.time_step:
+            raise ValueError(
+                "Cannot extend trajectory. Time steps of the trajectories are "
+                f"incompatible: {self.time_step} and {trajectory.time_step}."
+            )
+        if [str(sp) for sp in trajectory.species] != [str(sp) for sp in self.species]:
+            raise ValueError(
+                "Cannot extend trajectory. Species in the trajectories are "
+                f"incompatible: {self.species} and {trajectory.species}."
+            )
+        trajectory.to_positions()
+
+        n_frames = len(trajectory)
+        lattices = None
+        if trajectory.lattice is not None:
+            lattices = np.asarray(trajectory.lattice, dtype=np.float64)
+            if lattices.ndim == 2:
+                lattices = np.broadcast_to(lattices, (n_frames, 3, 3))
+        site_props = trajectory.site_properties
+        if site_props is None or isinstance(site_props, dict):
+            site_props = [site_props or {}] * n_frames
+        frame_props: Sequence[dict | None] = [None] * n_frames
+        if trajectory.frame_properties:
+            frame_props = trajectory.frame_properties
+        self._write_frames(np.asarray(trajectory.coords, dtype=np.float64), lattices, site_props, frame_props)
+
+    def to_trajectory(self) -> Trajectory:
+        """Load the whole trajectory into an in-memory Trajectory."""
+        traj = cast("Trajectory", self[:])
+        traj.coords = np.array(traj.coords)
+        if traj.lattice is not None:
+            traj.lattice = np.array(traj.lattice)
+        traj.base_positions = traj.coords[0]
+        return traj
+
+    def to_positions(self) -> None:
+        """Convert displacements back into positions, by mapping the positions on disk again."""
+        if self.coords_are_displacement:
+            self._map_arrays()
+
+    def to_displacements(self) -> None:
+        """Convert positions into displacements between consecutive frames, as Trajectory.to_displacements.
+
+        The files on disk keep the positions. The displacements are computed chunk_size frames
+        at a time into a temporary memory-mapped file, so they do not need to fit in memory.
+        """
+        if self.coords_are_displacement:
+            return
+        positions = self.coords
+        n_frames = len(positions)
+        if n_frames == 0:
+            displacements = np.empty_like(positions)
+        else:
+            with TemporaryFile() as file:
+                displacements = np.memmap(file, dtype=positions.dtype, mode="w+", shape=positions.shape)
+            displacements[0] = 0
+        chunk_size = self._manifest["chunk_size"]
+        for start in range(1, n_frames, chunk_size):
+            end = min(start + chunk_size, n_frames)
+            chunk = np.subtract(positions[start:end], positions[start - 1 : end - 1])
+            if self.lattice is not None:
+                # Undo wrapping into the cell, see Trajectory.to_displacements
+                chunk -= np.around(chunk)
+            displacements[start:end] = chunk
+
+        self.coords = displacements
+        self.coords_are_displacement = True
+
+    def as_dict(self) -> dict:
+        """Return the trajectory as the MSONable dict of an in-memory Trajectory."""
+        return self.to_trajectory().as_dict()
+
+    def _write_frames(
+        self,
+        coords: np.ndarray,
+        lattices: np.ndarray | None,
+        site_props: Sequence[dict],
+        frame_props: Sequence[dict | None],
+    ) -> None:
+        """Append frames to the files on disk, then commit them to the manifest.
+
+        The frames are fully encoded against a copy of the manifest before anything is
+        written. If writing fails, the committed manifest is kept and the data already
+        appended to the files is discarded.
+        """
+        if self.mode != "a":
+            raise OSError(f"{type(self).__name__} was opened read-only, use mode='a' to append")
+        manifest = copy.deepcopy(self._manifest)
+        n_new = len(coords)
+        if n_new == 0:
+            return
+        if coords.shape[1:] != (manifest["n_sites"], 3):
+            raise ValueError(f"coords must have shape (M, {manifest['n_sites']}, 3), got {coords.shape}")
+
+        arrays: dict[str, np.ndarray] = {"coords": np.ascontiguousarray(coords, dtype="<f8")}
+        if manifest["is_molecule"]:
+            if lattices is not None:
+                raise ValueError("Cannot append Structure frames to a Molecule-based trajectory.")
+        elif lattices is None:
+            raise ValueError("Cannot append Molecule frames to a Structure-based trajectory.")
+        elif manifest["constant_lattice"]:
+            if manifest["lattice"] is None:
+                manifest["lattice"] = lattices[0].tolist()
+            if not np.allclose(lattices, manifest["lattice"]):
+                raise ValueError("Lattice of appended frames differs from the constant lattice of the trajectory.")
+        else:
+            arrays["lattice"] = np.ascontiguousarray(lattices, dtype="<f8")
+
+        # Site properties: constant ones are skipped, numeric per-frame ones are stored
+        # as arrays, other per-frame ones go to the JSON records with the frame properties
+        constant = self._constant_site_props or {}
+        if manifest["site_property_columns"] is None:
+            manifest["site_property_columns"] = {
+                key: {"dtype": np.asarray(val).dtype.str, "shape": list(np.shape(val))}
+                for key, val in (site_props[0] or {}).items()
+                if _is_numeric_site_prop(val, manifest["n_sites"])
+                and not (key in constant and _equal_site_props(val, constant[key]))
+            }
+        columns = manifest["site_property_columns"]
+        records = []
+        column_data = {
+            key: np.full((n_new, *spec["shape"]), np.nan if np.dtype(spec["dtype"]).kind == "f" else 0, spec["dtype"])
+            for key, spec in columns.items()
+        }
+        for idx, (props, frame_prop) in enumerate(zip(site_props, frame_props, strict=True)):
+            record: dict[str, Any] = {}
+            if frame_prop is not None:
+                record["properties"] = frame_prop
+            for key, val in (props or {}).items():
+                if key in columns and np.shape(val) == tuple(columns[key]["shape"]):
+                    column_data[key][idx] = val
+                elif not (key in constant and _equal_site_props(val, constant[key])):
+                    record.setdefault("site_properties", {})[key] = val
+            records.append(record)
+        for col_idx, key in enumerate(columns):
+            arrays[f"site_property_{col_idx}"] = column_data[key]
+        lines = [json.dumps(record, cls=MontyEncoder) + "\n" for record in records]
+
+        manifest["n_frames"] += n_new
+        manifest["has_frame_properties"] |= any(record.get("properties") is not None for record in records)
+        manifest["has_record_site_properties"] |= any("site_properties" in record for record in records)
+        try:
+            for name, data in arrays.items():
+                with open(os.path.join(self.path, f"{name}.bin"), mode="ab") as file:
+                    file.write(data.tobytes())
+            self._append_lines(lines)
+            _write_json_atomic(os.path.join(self.path, "manifest.json"), manifest)
+        except BaseException:
+            self._discard_partial_frames()
+            raise
+        self._manifest = manifest
+        self._map_arrays()
+
+    def _append_lines(self, lines: list[str]) -> None:
+        """Append JSON lines of frame records to the chunk files."""
+        chunk_size = self._manifest["chunk_size"]
+        frame = self._manifest["n_frames"]
+        start = 0
+        while start < len(lines):
+            chunk_idx, offset = divmod(frame + start, chunk_size)
+            end = start + chunk_size - offset
+            with open(self._chunk_path(chunk_idx), mode="a", encoding="utf-8") as file:
+                file.writelines(lines[start:end])
+            start = end
+        self._chunk_cache = None
+
+    def _get_record(self, frame: int) -> dict:
+        """JSON record (frame and non-numeric site properties) of a frame."""
+        chunk_idx, offset = divmod(frame, self._manifest["chunk_size"])
+        if self._chunk_cache is None or self._chunk_cache[0] != chunk_idx:
+            with open(self._chunk_path(chunk_idx), encoding="utf-8") as file:
+                self._chunk_cache = (chunk_idx, [json.loads(line, cls=MontyDecoder) for line in file])
+        return self._chunk_cache[1][offset]
+
+    def _get_site_props(self, frames: ValidIndex) -> SitePropsType | None:
+        """Site properties of a frame (int) or list of frames."""
+        site_props = self.site_properties
+        if not isinstance(site_props, _FrameRecordView):
+            return self._constant_site_props
+        if isinstance(frames, int):
+            return site_props[frames]
+        return [site_props[idx] for idx in frames]  # type: ignore[union-attr]
+
+    def _get_frame_site_props(self, frame: int) -> dict:
+        """Constant, numeric per-frame and other per-frame site properties of a frame, merged."""
+        props = dict(self._constant_site_props or {})
+        for key, column in self._site_prop_columns.items():
+            props[key] = column[frame].tolist()
+        props.update(self._get_record(frame).get("site_properties", {}))
+        return props
+
+    def _species_compositions(self) -> list[Composition]:
+        return [
+            Composition({sp: 1}) if not isinstance(sp, dict | Composition) else Composition(sp) for sp in self.species
+        ]
+
+    def _chunk_path(self, chunk_idx: int) -> str:
+        return os.path.join(self.path, f"frames_{chunk_idx:06d}.jsonl")
+
+    def _array_specs(self) -> dict[str, tuple[np.dtype, tuple[int, ...]]]:
+        """Memory-mapped arrays: name -> (dtype, shape of one frame)."""
+        n_sites = self._manifest["n_sites"]
+        specs: dict[str, tuple[np.dtype, tuple[int, ...]]] = {"coords": (np.dtype("<f8"), (n_sites, 3))}
+        if not self._manifest["is_molecule"] and not self._manifest["constant_lattice"]:
+            specs["lattice"] = (np.dtype("<f8"), (3, 3))
+        for col_idx, spec in enumerate((self._manifest["site_property_columns"] or {}).values()):
+            specs[f"site_property_{col_idx}"] = (np.dtype(spec["dtype"]), tuple(spec["shape"]))
+        return specs
+
+    def _map_arrays(self) -> None:
+        """(Re)map the arrays on disk, e.g. after frames were appended."""
+        n_frames = self._manifest["n_frames"]
+        arrays = {}
+        for name, (dtype, shape) in self._array_specs().items():
+            if n_frames == 0:
+                arrays[name] = np.empty((0, *shape), dtype=dtype)
+            else:
+                path = os.path.join(self.path, f"{name}.bin")
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", shape=(n_frames, *shape))
+
+        self.coords = arrays["coords"]
+        self.coords_are_displacement = False
+        self.base_positions = self.coords[0] if n_frames else None  # type: ignore[assignment]
+        if self._manifest["is_molecule"]:
+            self.lattice = None
+        elif self._manifest["constant_lattice"]:
+            self.lattice = None if self._manifest["lattice"] is None else np.array(self._manifest["lattice"])
+        else:
+            self.lattice = arrays["lattice"]
+        self._site_prop_columns = {
+            key: arrays[f"site_property_{col_idx}"]
+            for col_idx, key in enumerate(self._manifest["site_property_columns"] or {})
+        }
+
+    def _discard_partial_frames(self) -> None:
+        """Truncate data of an interrupted append that is not recorded in the manifest."""
+        n_frames = self._manifest["n_frames"]
+        specs = self._array_specs()
+        for filename in os.listdir(self.path):
+            name, ext = os.path.splitext(filename)
+            if ext != ".bin":
+                continue
+            path = os.path.join(self.path, filename)
+            if name not in specs:
+                # E.g. site property arrays first written by the interrupted append
+                os.remove(path)
+                continue
+            dtype, shape = specs[name]
+            n_bytes = n_frames * dtype.itemsize * int(np.prod(shape))
+            if os.path.getsize(path) > n_bytes:
+                os.truncate(path, n_bytes)
+
+        chunk_size = self._manifest["chunk_size"]
+        chunk_idx, n_lines = divmod(n_frames, chunk_size)
+        while os.path.isfile(self._chunk_path(chunk_idx)):
+            with open(self._chunk_path(chunk_idx), encoding="utf-8") as file:
+                lines = file.readlines()
+            if len(lines) > n_lines:
+                with open(self._chunk_path(chunk_idx), mode="w", encoding="utf-8") as file:
+                    file.writelines(lines[:n_lines])
+            chunk_idx, n_lines = chunk_idx + 1, 0
+
+
+class _FrameRecordView(collections.abc.Sequence):
+    """Read-only sequence of the frame or site properties of each frame of a DiskTrajectory."""
+
+    def __init__(self, trajectory: DiskTrajectory, field: Literal["properties", "site_properties"]) -> None:
+        self._trajectory = trajectory
+        self._field = field
+
+    def __len__(self) -> int:
+        return len(self._trajectory)
+
+    def __getitem__(self, idx):  # type: ignore[override]
+        if isinstance(idx, slice):
+            return [self[frame] for frame in range(*idx.indices(len(self)))]
+        if not -len(self) <= idx < len(self):
+            raise IndexError(f"index={idx} out of range, trajectory only has {len(self)} frames")
+        idx %= len(self)
+        if self._field == "site_properties":
+            return self._trajectory._get_frame_site_props(idx)
+        return self._trajectory._get_record(idx).get("properties")
+
+
+def _is_numeric_site_prop(val: Any, n_sites: int) -> bool:
+    """Whether a site property can be stored as a (n_sites, ...) numeric array."""
+    try:
+        arr = np.asarray(val)
+    except ValueError:  # ragged
+        return False
+    return arr.dtype.kind in "biuf" and arr.ndim > 0 and len(arr) == n_sites
+
+
+def _equal_site_props(val1: Any, val2: Any) -> bool:
+    try:
+        return bool(np.array_equal(val1, val2))
+    except (TypeError, ValueError):
+        return val1 == val2
+
+
+def _write_json_atomic(path: str, obj: Any) -> None:
+    """Write a JSON file atomically, so readers see either the old or the new file."""
+    with open(f"{path}.tmp", mode="w", encoding="utf-8") as file:
+        json.dump(obj, file)
+    os.replace(f"{path}.tmp", path)
@@ -0,0 +1,527 @@
+"""Columnar on-disk storage for large collections of structures.
+
+A StructureStore is a directory holding one flat binary file per column (lattices,
+fractional coordinates, species indices, energies, numeric site properties, ...) and
+a small JSON manifest. Per-site columns of all structures are packed back to back and
+sliced with an offsets table, so that
+
+- loading is bounded by disk bandwidth instead of decoding per-site dicts,
+- the columns are memory-mapped and the i-th structure is read without loading the others,
+- new structures can be appended without rewriting the existing data.
+
+Everything that does not fit in a column (structure properties, non-numeric site
+properties, custom labels, entry parameters/data/energy adjustments) is stored as one
+JSON line per structure.
+
+Example:
+    >>> store = StructureStore.from_structures("mp_corpus", structures)
+    >>> store.extend(more_structures)
+    >>> store = StructureStore("mp_corpus")
+    >>> store[12345]  # reads only this structure
+    >>> store.lattices.shape, store.frac_coords.shape
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import shutil
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, overload
+
+import numpy as np
+from monty.json import MontyDecoder, MontyEncoder
+
+from pymatgen.core import Composition, Lattice, Structure
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any, Literal
+
+    from numpy.typing import NDArray
+    from typing_extensions import Self
+
+    from pymatgen.util.typing import PathLike
+
+__author__ = "Pymatgen Development Team"
+
+FORMAT_NAME = "pymatgen.io.columnar.StructureStore"
+FORMAT_VERSION = 1
+
+# Column name -> (dtype, shape of one row, whether there is one row per site or per structure)
+_COLUMNS: dict[str, tuple[str, tuple[int, ...], bool]] = {
+    "lattices": ("<f8", (3, 3), False),
+    "pbc": ("|b1", (3,), False),
+    "charges": ("<f8", (), False),
+    "n_sites": ("<i8", (), False),
+    "meta_n_bytes": ("<i8", (), False),
+    "energies": ("<f8", (), False),
+    "frac_coords": ("<f8", (3,), True),
+    "species_indices": ("<i4", (), True),
+}
+
+
+class StructureStore(Sequence):
+    """Columnar, memory-mapped, appendable store of Structures or ComputedStructureEntries.
+
+    A store holds either Structures or ComputedStructureEntries (or entries of one
+    subclass of it), fixed by the first item written to it. Indexing returns new
+    objects decoded from the columns; numeric site properties are stored as columns
+    and come back as (nested) lists.
+    """
+
+    def __init__(self, path: PathLike, mode: Literal["r", "a"] = "r") -> None:
+        """
+        Args:
+            path (PathLike): Directory of the store.
+            mode ("r" | "a"): "r" to open an existing store read-only, "a" to open
+                or create a store that structures can be appended to.
+        """
+        if mode not in {"r", "a"}:
+            raise ValueError(f"Invalid {mode=}, must be 'r' or 'a'")
+        self.path = os.fspath(path)
+        self.mode = mode
+        manifest_path = os.path.join(self.path, "manifest.json")
+
+        if os.path.isfile(manifest_path):
+            with open(manifest_path, encoding="utf-8") as file:
+                self._manifest: dict[str, Any] = json.load(file)
+            if self._manifest.get("format") != FORMAT_NAME:
+                raise ValueError(f"{self.path} is not a {type(self).__name__}")
+        elif mode == "a":
+            os.makedirs(self.path, exist_ok=True)
+            self._manifest = {
+                "format": FORMAT_NAME,
+                "version": FORMAT_VERSION,
+                "entry_type": None,
+                "n_structures": 0,
+                "n_sites": 0,
+                "meta_bytes": 0,
+                "species": [],
+                "site_properties": {},
+            }
+            self._write_manifest()
+        else:
+            raise FileNotFoundError(f"No {type(self).__name__} found at {self.path}")
+
+        self._species_lookup: dict[str, int] = {key: idx for idx, key in enumerate(self._manifest["species"])}
+        self._columns: dict[str, NDArray] = {}
+        self._decoded_species: list[Composition] = []
+        self._offsets: NDArray[np.int64] | None = None
+        self._meta_offsets: NDArray[np.int64] | None = None
+
+        if mode == "a":
+            self._discard_uncommitted()
+
+    @classmethod
+    def from_structures(
+        cls,
+        path: PathLike,
+        structures: Iterable[Structure | ComputedStructureEntry],
+        overwrite: bool = False,
+        chunk_size: int = 10_000,
+    ) -> Self:
+        """Write structures or ComputedStructureEntries to a new store.
+
+        Args:
+            path (PathLike): Directory of the store.
+            structures (Iterable[Structure | ComputedStructureEntry]): Items to store.
+            overwrite (bool): Whether to replace an existing store at path. Defaults to False.
+            chunk_size (int): Number of items encoded before writing them to disk. Defaults to 10000.
+
+        Returns:
+            StructureStore: The store, open for appending.
+        """
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(f"{path} already exists, pass overwrite=True to replace it")
+            shutil.rmtree(path)
+        store = cls(path, mode="a")
+        store.extend(structures, chunk_size=chunk_size)
+        return store
+
+    def __len__(self) -> int:
+        return self._manifest["n_structures"]
+
+    @overload
+    def __getitem__(self, idx: int) -> Structure | ComputedStructureEntry:
+        pass
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Structure | ComputedStructureEntry]:
+        pass
+
+    def __getitem__(self, idx: int | slice) -> Structure | ComputedStructureEntry | list:
+        if isinstance(idx, slice):
+            return [self._get(i) for i in range(*idx.indices(len(self)))]
+        idx = int(idx)
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"index {idx} out of range for {type(self).__name__} of length {len(self)}")
+        return self._get(idx)
+
+    def __iter__(self) -> Iterator[Structure | ComputedStructureEntry]:
+        return (self._get(idx) for idx in range(len(self)))
+
+    def __repr__(self) -> str:
+        entry_type = self._manifest["entry_type"] or "Structure"
+        return f"{type(self).__name__}({self.path!r}, {len(self)} {entry_type}s, {self._manifest['n_sites']} sites)"
+
+    @property
+    def entry_type(self) -> str | None:
+        """Class name of the stored items ("Structure", "ComputedStructureEntry" or the name
+        of a ComputedStructureEntry subclass), None if empty.
+        """
+        return self._manifest["entry_type"]
+
+    @property
+    def lattices(self) -> NDArray[np.float64]:
+        """Lattice matrices of all structures, shape (n_structures, 3, 3)."""
+        return self._column("lattices")
+
+    @property
+    def frac_coords(self) -> NDArray[np.float64]:
+        """Fractional coordinates of all sites of all structures, shape (n_sites, 3)."""
+        return self._column("frac_coords")
+
+    @property
+    def species_indices(self) -> NDArray[np.int32]:
+        """Index into species of every site of all structures, shape (n_sites,)."""
+        return self._column("species_indices")
+
+    @property
+    def species(self) -> list[Composition]:
+        """Table of distinct site species (as Compositions) referenced by species_indices."""
+        decoder = MontyDecoder()
+        for key in self._manifest["species"][len(self._decoded_species) :]:
+            self._decoded_species.append(Composition(dict(decoder.process_decoded(json.loads(key)))))
+        return self._decoded_species
+
+    @property
+    def offsets(self) -> NDArray[np.int64]:
+        """Site offsets of each structure, shape (n_structures + 1,). The sites of
+        structure i are rows offsets[i]:offsets[i + 1] of the per-site columns.
+        """
+        if self._offsets is None:
+            self._offsets = np.concatenate(([0], np.cumsum(self._column("n_sites"), dtype=np.int64)))
+        return self._offsets
+
+    @property
+    def energies(self) -> NDArray[np.float64]:
+        """Uncorrected energies of all entries, shape (n_structures,). NaN for Structures."""
+        return self._column("energies")
+
+    def get_site_property(self, key: str) -> NDArray:
+        """Column of a numeric site property for all sites of all structures.
+
+        Args:
+            key (str): Site property name.
+
+        Returns:
+            np.ndarray: shape (n_sites, ...). Rows of structures without the property are NaN (or 0 for integers).
+        """
+        if key not in self._manifest["site_properties"]:
+            raise KeyError(f"{key!r} is not stored as a site property column")
+        return self._column(f"site_property:{key}")
+
+    def append(self, structure: Structure | ComputedStructureEntry) -> None:
+        """Append a Structure or ComputedStructureEntry to the store.
+
+        Args:
+            structure (Structure | ComputedStructureEntry): Item to append.
+        """
+        self.extend([structure])
+
+    def extend(self, structures: Iterable[Structure | ComputedStructureEntry], chunk_size: int = 10_000) -> None:
+        """Append Structures or ComputedStructureEntries to the store.
+
+        Items are encoded in chunks of chunk_size and each chunk is appended to the column
+        files, so arbitrarily long iterables can be streamed into the store.
+
+        Args:
+            structures (Iterable[Structure | ComputedStructureEntry]): Items to append.
+            chunk_size (int): Number of items encoded before writing them to disk. Defaults to 10000.
+        """
+        if self.mode != "a":
+            raise OSError(f"{type(self).__name__} was opened read-only, use mode='a' to append")
+        chunk: list[Structure | ComputedStructureEntry] = []
+        for structure in structures:
+            chunk.append(structure)
+            if len(chunk) >= chunk_size:
+                self._write_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._write_chunk(chunk)
+
+    def _write_chunk(self, items: list[Structure | ComputedStructureEntry]) -> None:
+        """Append items to the column files and commit them to the manifest.
+
+        The chunk is encoded against a copy of the manifest, which only replaces the
+        committed one once written. If anything fails, the committed manifest is kept
+        and the data already appended to the files is discarded.
+        """
+        committed = self._manifest, self._species_lookup
+        self._manifest = copy.deepcopy(self._manifest)
+        self._species_lookup = dict(self._species_lookup)
+        try:
+            self._append_chunk(items)
+            self._write_manifest()
+        except BaseException:
+            self._manifest, self._species_lookup = committed
+            self._discard_uncommitted()
+            raise
+        finally:
+            self._columns.clear()
+            self._offsets = self._meta_offsets = None
+
+    def _append_chunk(self, items: list[Structure | ComputedStructureEntry]) -> None:
+        """Encode items into column arrays, append them to the files and update the manifest."""
+        manifest = self._manifest
+        rows: dict[str, list] = {name: [] for name in _COLUMNS}
+        site_prop_rows: dict[str, list[tuple[int, NDArray]]] = {}
+        meta_lines: list[bytes] = []
+        n_sites_before = manifest["n_sites"]
+        n_new_sites = 0
+
+        for item in items:
+            entry_type = type(item).__name__ if isinstance(item, ComputedStructureEntry) else "Structure"
+            if not isinstance(item, ComputedStructureEntry | Structure):
+                raise TypeError(f"Expected Structure or ComputedStructureEntry, got {type(item).__name__}")
+            if manifest["entry_type"] is None:
+                manifest["entry_type"] = entry_type
+            elif manifest["entry_type"] != entry_type:
+                raise TypeError(f"Cannot append a {entry_type} to a store of {manifest['entry_type']}s")
+
+            struct = item.structure if isinstance(item, ComputedStructureEntry) else item
+            n_sites = len(struct)
+            rows["lattices"].append(struct.lattice.matrix)
+            rows["pbc"].append(struct.lattice.pbc)
+            rows["charges"].append(struct.charge)
+            rows["n_sites"].append(n_sites)
+            rows["energies"].append(
+                item.uncorrected_energy if isinstance(item, ComputedStructureEntry) else float("nan")
+            )
+            rows["frac_coords"].append(struct.frac_coords.reshape(n_sites, 3))
+
+            species_indices, default_labels = self._encode_species(struct.species_and_occu)
+            rows["species_indices"].append(species_indices)
+
+            meta: dict[str, Any] = {}
+            if struct.properties:
+                meta["properties"] = struct.properties
+            labels = struct.labels
+            if labels != default_labels:
+                meta["labels"] = labels
+            site_prop_columns = []
+            for key, vals in struct.site_properties.items():
+                arr = self._as_site_property_column(key, vals, n_sites)
+                if arr is None:
+                    meta.setdefault("site_properties", {})[key] = vals
+                else:
+                    site_prop_rows.setdefault(key, []).append((n_sites_before + n_new_sites, arr))
+                    site_prop_columns.append(key)
+            if site_prop_columns:
+                meta["site_property_columns"] = site_prop_columns
+            if isinstance(item, ComputedStructureEntry):
+                meta["entry"] = _entry_metadata(item)
+
+            meta_lines.append(json.dumps(meta, cls=MontyEncoder).encode() + b"\n")
+            rows["meta_n_bytes"].append(len(meta_lines[-1]))
+            n_new_sites += n_sites
+
+        # Append to the column files
+        for name, (dtype, shape, per_site) in _COLUMNS.items():
+            if per_site:
+                data = np.concatenate(rows[name]) if rows[name] else np.empty((0, *shape))
+            else:
+                data = np.array(rows[name]).reshape(-1, *shape)
+            self._append_column(name, data.astype(dtype))
+
+        for key, spec in manifest["site_properties"].items():
+            col_dtype, col_shape = self._column_dtype(f"site_property:{key}")
+            data = np.full((n_new_sites, *col_shape), np.nan if col_dtype.kind == "f" else 0, dtype=col_dtype)
+            for start, arr in site_prop_rows.get(key, []):
+                data[start - n_sites_before : start - n_sites_before + len(arr)] = arr
+            self._append_column(f"site_property:{key}", data)
+            spec["n_rows"] += n_new_sites
+
+        with open(os.path.join(self.path, "meta.jsonl"), mode="ab") as file:
+            file.write(b"".join(meta_lines))
+
+        manifest["n_structures"] += len(items)
+        manifest["n_sites"] += n_new_sites
+        manifest["meta_bytes"] += sum(rows["meta_n_bytes"])
+
+    def _encode_species(self, species_and_occu: list[Composition]) -> tuple[NDArray[np.int32], list[str]]:
+        """Species table indices and default labels (species strings) of the sites."""
+        # Most sites share a handful of species, so only encode each distinct one once
+        local: dict[Composition, tuple[int, str]] = {}
+        indices = np.empty(len(species_and_occu), dtype=np.int32)
+        labels = []
+        for site_idx, comp in enumerate(species_and_occu):
+            if comp not in local:
+                key = json.dumps(list(comp.items()), cls=MontyEncoder)
+                if key not in self._species_lookup:
+                    self._species_lookup[key] = len(self._manifest["species"])
+                    self._manifest["species"].append(key)
+                if comp.num_atoms == len(comp) == 1:
+                    label = str(next(iter(comp)))
+                else:
+                    label = ", ".join(f"{sp}:{comp[sp]:.3}" for sp in sorted(comp))
+                local[comp] = (self._species_lookup[key], label)
+            indices[site_idx], label = local[comp]
+            labels.append(label)
+        return indices, labels
+
+    def _as_site_property_column(self, key: str, vals: Sequence, n_sites: int) -> NDArray | None:
+        """Site property values as a column array, or None if they should go to the JSON metadata."""
+        try:
+            arr = np.asarray(vals)
+        except ValueError:  # ragged
+            return None
+        if arr.dtype.kind not in "if" or arr.ndim == 0 or len(arr) != n_sites:
+            return None
+        # Only plain numbers (not e.g. Magmom) are stored as columns so they round-trip
+        if any(not isinstance(val, int | float | np.number | list | tuple | np.ndarray) for val in vals):
+            return None
+
+        specs = self._manifest["site_properties"]
+        dtype = np.dtype("<i8" if arr.dtype.kind == "i" else "<f8")
+        if key not in specs:
+            specs[key] = {
+                "file": f"site_property_{len(specs)}.bin",
+                "dtype": dtype.str,
+                "shape": list(arr.shape[1:]),
+                "n_rows": 0,
+            }
+            # Rows for the sites already in the store
+            col_dtype = np.dtype(specs[key]["dtype"])
+            fill = np.full(
+                (self._manifest["n_sites"], *arr.shape[1:]), np.nan if col_dtype.kind == "f" else 0, dtype=col_dtype
+            )
+            self._append_column(f"site_property:{key}", fill)
+            specs[key]["n_rows"] = self._manifest["n_sites"]
+        col_dtype, shape = self._column_dtype(f"site_property:{key}")
+        if tuple(arr.shape[1:]) != shape or not np.can_cast(arr.dtype, col_dtype, casting="same_kind"):
+            return None
+        return arr.astype(col_dtype)
+
+    def _get(self, idx: int) -> Structure | ComputedStructureEntry:
+        """Decode the idx-th structure or entry."""
+        start, end = self.offsets[idx], self.offsets[idx + 1]
+        meta = self._read_meta(idx)
+        species = self.species
+        site_properties: dict[str, Any] = {
+            key: self.get_site_property(key)[start:end].tolist() for key in meta.get("site_property_columns", [])
+        }
+        site_properties.update(meta.get("site_properties", {}))
+
+        pbc_x, pbc_y, pbc_z = (bool(flag) for flag in self._column("pbc")[idx])
+        struct = Structure(
+            Lattice(np.array(self.lattices[idx]), pbc=(pbc_x, pbc_y, pbc_z)),
+            [species[sp_idx] for sp_idx in self.species_indices[start:end]],
+            np.array(self.frac_coords[start:end]),
+            charge=float(self._column("charges")[idx]),
+            site_properties=site_properties or None,
+            labels=meta.get("labels"),
+            properties=meta.get("properties"),
+        )
+        if self._manifest["entry_type"] != "Structure":
+            # The @module and @class of the entry give its (sub)class
+            return MontyDecoder().process_decoded({**meta["entry"], "structure": struct})
+        return struct
+
+    def _read_meta(self, idx: int) -> dict[str, Any]:
+        """Read the JSON metadata line of the idx-th structure."""
+        if self._meta_offsets is None:
+            self._meta_offsets = np.concatenate(([0], np.cumsum(self._column("meta_n_bytes"), dtype=np.int64)))
+        start, end = self._meta_offsets[idx], self._meta_offsets[idx + 1]
+        with open(os.path.join(self.path, "meta.jsonl"), mode="rb") as file:
+            file.seek(start)
+            meta = json.loads(file.read(end - start))
+        # Entries are decoded by their from_dict once the structure is rebuilt
+        decoder = MontyDecoder()
+        return {key: val if key == "entry" else decoder.process_decoded(val) for key, val in meta.items()}
+
+    def _column_path(self, name: str) -> str:
+        if name.startswith("site_property:"):
+            return os.path.join(self.path, self._manifest["site_properties"][name.split(":", 1)[1]]["file"])
+        return os.path.join(self.path, f"{name}.bin")
+
+    def _column_dtype(self, name: str) -> tuple[np.dtype, tuple[int, ...]]:
+        if name.startswith("site_property:"):
+            spec = self._manifest["site_properties"][name.split(":", 1)[1]]
+            return np.dtype(spec["dtype"]), tuple(spec["shape"])
+        dtype, shape, _per_site = _COLUMNS[name]
+        return np.dtype(dtype), shape
+
+    def _column_rows(self) -> dict[str, int]:
+        """Number of rows of every column according to the manifest."""
+        n_rows = {
+            name: self._manifest["n_sites" if per_site else "n_structures"]
+            for name, (_dtype, _shape, per_site) in _COLUMNS.items()
+        }
+        for key, spec in self._manifest["site_properties"].items():
+            n_rows[f"site_property:{key}"] = spec["n_rows"]
+        return n_rows
+
+    def _column(self, name: str) -> NDArray:
+        """Memory-mapped (read-only) column."""
+        if name not in self._columns:
+            dtype, shape = self._column_dtype(name)
+            n_rows = self._column_rows()[name]
+            if n_rows == 0 or 0 in shape:
+                self._columns[name] = np.empty((n_rows, *shape), dtype=dtype)
+            else:
+                self._columns[name] = np.memmap(self._column_path(name), dtype=dtype, mode="r", shape=(n_rows, *shape))
+        return self._columns[name]
+
+    def _append_column(self, name: str, data: NDArray) -> None:
+        with open(self._column_path(name), mode="ab") as file:
+            file.write(np.ascontiguousarray(data).tobytes())
+
+    def _discard_uncommitted(self) -> None:
+        """Drop data of an interrupted append that is not recorded in the manifest."""
+        for name, n_rows in self._column_rows().items():
+            file_path = self._column_path(name)
+            if os.path.isfile(file_path):
+                dtype, shape = self._column_dtype(name)
+                n_bytes = n_rows * dtype.itemsize * int(np.prod(shape))
+                if os.path.getsize(file_path) > n_bytes:
+                    os.truncate(file_path, n_bytes)
+        meta_path = os.path.join(self.path, "meta.jsonl")
+        if os.path.isfile(meta_path) and os.path.getsize(meta_path) > self._manifest["meta_bytes"]:
+            os.truncate(meta_path, self._manifest["meta_bytes"])
+        # Site property columns first created by the interrupted append
+        known = {spec["file"] for spec in self._manifest["site_properties"].values()}
+        for filename in os.listdir(self.path):
+            if filename.startswith("site_property_") and filename.endswith(".bin") and filename not in known:
+                os.remove(os.path.join(self.path, filename))
+
+    def _write_manifest(self) -> None:
+        """Write the manifest atomically, it is the only record of how much data is valid."""
+        tmp_path = os.path.join(self.path, "manifest.json.tmp")
+        with open(tmp_path, mode="w", encoding="utf-8") as file:
+            json.dump(self._manifest, file)
+        os.replace(tmp_path, os.path.join(self.path, "manifest.json"))
+
+
+def _entry_metadata(entry: ComputedStructureEntry) -> dict[str, Any]:
+    """The dict of an entry without its structure, which is stored in the columns."""
+    if type(entry).as_dict is not ComputedStructureEntry.as_dict:
+        # Subclasses may add fields of their own, e.g. temp of a GibbsComputedStructureEntry
+        return {key: val for key, val in entry.as_dict().items() if key != "structure"}
+    return {
+        "@module": type(entry).__module__,
+        "@class": type(entry).__name__,
+        "energy": entry.uncorrected_energy,
+        "composition": entry.composition.as_dict(),
+        "correction": entry.correction,
+        "energy_adjustments": entry.energy_adjustments,
+        "parameters": entry.parameters,
+        "data": entry.data,
+        "entry_id": entry.entry_id,
+    }
@@ -3,24 +3,74 @@ This package implements modules for input and output to and from VASP. It
 imports the key classes form both vasp_input and vasp_output to allow most
 classes to be simply called as pymatgen.io.vasp.Incar for example, to retain
 backwards compatibility.
+
+The classes are imported lazily on first attribute access (PEP 562), so that
+e.g. reading an INCAR does not pay for importing the output parsers.
 """
 
 from __future__ import annotations
 
-from .inputs import Incar, Kpoints, Poscar, Potcar, PotcarSingle, VaspInput
-from .outputs import (
-    BSVasprun,
-    Chgcar,
-    Dynmat,
-    Elfcar,
-    Locpot,
-    Oszicar,
-    Outcar,
-    Procar,
-    Vaspout,
-    Vasprun,
-    VolumetricData,
-    Wavecar,
-    Waveder,
-    Xdatcar,
-)
+import importlib.util
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .inputs import Incar, Kpoints, Poscar, Potcar, PotcarSingle, VaspInput
+    from .outputs import (
+        BSVasprun,
+        Chgcar,
+        Dynmat,
+        Elfcar,
+        Locpot,
+        Oszicar,
+        Outcar,
+        Procar,
+        Vaspout,
+        Vasprun,
+        VolumetricData,
+        Wavecar,
+        Waveder,
+        Xdatcar,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    **dict.fromkeys(("Incar", "Kpoints", "Poscar", "Potcar", "PotcarSingle", "VaspInput"), "inputs"),
+    **dict.fromkeys(
+        (
+            "BSVasprun",
+            "Chgcar",
+            "Dynmat",
+            "Elfcar",
+            "Locpot",
+            "Oszicar",
+            "Outcar",
+            "Procar",
+            "Vaspout",
+            "Vasprun",
+            "VolumetricData",
+            "Wavecar",
+            "Waveder",
+            "Xdatcar",
+        ),
+        "outputs",
+    ),
+}
+
+__all__ = [*_LAZY_IMPORTS]  # noqa: PLE0604
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the public classes and submodules of pymatgen.io.vasp."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+    elif not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
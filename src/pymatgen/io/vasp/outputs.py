@@ -10,6 +10,7 @@ import re
 import warnings
 from collections import defaultdict
 from collections.abc import Iterable
+from contextlib import contextmanager
 from dataclasses import dataclass
 from glob import glob
 from io import BytesIO
@@ -20,7 +21,7 @@ from xml.etree import ElementTree as ET
 import numpy as np
 import orjson
 from monty.dev import requires
-from monty.io import reverse_readfile, zopen
+from monty.io import zopen
 from monty.json import MSONable, jsanitize
 from monty.os.path import zpath
 from monty.re import regrep
@@ -41,7 +42,7 @@ from pymatgen.io.common import VolumetricData as BaseVolumetricData
 from pymatgen.io.core import ParseError
 from pymatgen.io.vasp.inputs import Incar, Kpoints, KpointsSupportedModes, Poscar, Potcar
 from pymatgen.io.wannier90 import Unk
-from pymatgen.util.io_utils import clean_lines, micro_pyawk
+from pymatgen.util.io_utils import ParseCache, _any_pattern, clean_lines, micro_pyawk
 from pymatgen.util.num import make_symmetric_matrix_from_upper_tri
 
 try:
@@ -50,13 +51,13 @@ except ImportError:
     h5py = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
+    from collections.abc import Callable, Collection, Iterator, Sequence
     from typing import Literal, TypeAlias
 
     # Avoid name conflict with pymatgen.core.Element
     from xml.etree.ElementTree import Element as XML_Element
 
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.util.typing import Kpoint, PathLike
@@ -138,11 +139,16 @@ def _parse_vasp_array(elem) -> list[list[bool]] | NDArray[np.float64]:
     if elem.get("type") == "logical":
         return [[i == "T" for i in v.text.split()] for v in elem]
 
+    return _parse_vasp_rows([e.text for e in elem])
+
+
+def _parse_vasp_rows(rows: list[str], dtype: DTypeLike = np.float64) -> NDArray:
+    """Convert the text of many <r> or <v> rows to a 2D array in one call."""
     try:
         # numerical data, try parse with numpy loadtxt for efficiency:
-        return np.loadtxt([e.text for e in elem], ndmin=2, dtype=np.float64)
+        return np.loadtxt(rows, ndmin=2, dtype=dtype)
     except ValueError:  # unexpectedly couldn't re-shape to grid
-        return np.array([list(map(_vasprun_float, e.text.split())) for e in elem])
+        return np.array([list(map(_vasprun_float, row.split())) for row in rows], dtype=dtype)
 
 
 def _parse_from_incar(filename: PathLike, key: str) -> Any:
@@ -174,6 +180,350 @@ def _vasprun_float(flt: float | str) -> float:
         raise
 
 
+def _grep_lines(
+    lines: Iterable[str],
+    patterns: dict[str, str],
+    *,
+    postprocess: Callable | dict[str, Callable] = str,
+    first_only: Collection[str] = (),
+    terminate_on_match: bool = False,
+) -> dict[str, list[list]]:
+    """Search lines for several patterns in a single pass, collecting the
+    (postprocessed) groups of the first match of each pattern on every line,
+    like monty.re.regrep does.
+
+    Args:
+        lines (Iterable[str]): Lines to search, e.g. an open file.
+        patterns (dict[str, str]): Regular expressions by key.
+        postprocess (Callable | dict[str, Callable]): Conversion of the matched
+            groups, or one per key (str for keys not in it). Defaults to str.
+        first_only (Collection[str]): Keys for which only the first matching
+            line is kept.
+        terminate_on_match (bool): Whether to stop once every key has matched.
+
+    Returns:
+        dict[str, list[list]]: The groups of each match by key.
+    """
+    compiled = {key: re.compile(pattern) for key, pattern in patterns.items()}
+    prefilter = _any_pattern(compiled.values())
+
+    matches: dict[str, list[list]] = {key: [] for key in patterns}
+    active = dict(compiled)
+    unmatched = set(compiled)
+    for line in lines:
+        if prefilter is not None and prefilter.search(line) is None:
+            continue
+        for key, pattern in list(active.items()):
+            if match := pattern.search(line):
+                func = postprocess.get(key, str) if isinstance(postprocess, dict) else postprocess
+                matches[key].append([func(group) for group in match.groups()])
+                unmatched.discard(key)
+                if key in first_only:
+                    del active[key]
+        if not active or (terminate_on_match and not unmatched):
+            break
+    return matches
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Lazily yield the lines of text, with their line endings, without
+    copying the text (as StringIO does).
+    """
+    start, length = 0, len(text)
+    while start < length:
+        end = text.find("\n", start) + 1 or length
+        yield text[start:end]
+        start = end
+
+
+def _reverse_lines(text: str) -> Iterator[str]:
+    """Lazily yield the lines of text, with their line endings, last line first."""
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end - 1) + 1
+        yield text[start:end]
+        end = start
+
+
+def _parse_volumetric_grid(text: str, start: int, dim: Sequence[int]) -> tuple[NDArray | None, int]:
+    """Parse the grid block of a VASP volumetric data file (e.g. CHGCAR)
+    starting at offset start of text, x being the fastest index.
+
+    Returns:
+        tuple[NDArray | None, int]: The data of shape dim, or None if the
+            file ends before the grid does, and the offset after the block.
+    """
+    n_points = dim[0] * dim[1] * dim[2]
+    # VASP writes the grid as lines of equal width, so the block ends on the
+    # line holding the last point and is converted in one go
+    first_end = text.find("\n", start) + 1 or len(text)
+    if n_per_line := len(text[start:first_end].split()):
+        last_start = start + (-(-n_points // n_per_line) - 1) * (first_end - start)
+        end = text.find("\n", last_start) + 1 or len(text)
+        if last_start == start or text[last_start - 1 : last_start] == "\n":
+            try:
+                # Older NumPy only warns about, and stops at, unparsable data
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", DeprecationWarning)
+                    values = np.fromstring(text[start:end], sep=" ")
+            except (ValueError, DeprecationWarning):
+                values = None
+            if values is not None and len(values) == n_points:
+                return values.reshape(dim[::-1]).T, end
+
+    # Irregular layout, read up to the line holding the last point
+    tokens: list[str] = []
+    pos = start
+    while len(tokens) < n_points and pos < len(text):
+        end = text.find("\n", pos) + 1 or len(text)
+        tokens += text[pos:end].split()
+        pos = end
+    if len(tokens) < n_points:
+        return None, pos
+    return np.array(tokens[:n_points], dtype=float).reshape(dim[::-1]).T, pos
+
+
+def _format_fortran_float(flt: float) -> str:
+    """Fortran code prints floats with a leading zero in scientific
+    notation. When writing CHGCAR files, we adopt this convention
+    to ensure written CHGCAR files are byte-to-byte identical to
+    their input files as far as possible.
+
+    Args:
+        flt (float): Float to print.
+
+    Returns:
+        str: The float in Fortran format.
+    """
+    flt_str = f"{flt:.10E}"
+    if flt >= 0:
+        return f"0.{flt_str[0]}{flt_str[2:12]}E{int(flt_str[13:]) + 1:+03}"
+    return f"-.{flt_str[1]}{flt_str[3:13]}E{int(flt_str[14:]) + 1:+03}"
+
+
+def _format_volumetric_grid(values: NDArray) -> str:
+    """Format values as lines of 5 floats in Fortran format (see
+    _format_fortran_float), as in the grid blocks of VASP volumetric data files.
+    """
+    n_values = len(values)
+    n_full = n_values // 5 * 5
+    text = ("%+.10E" * n_values) % tuple(values.tolist())
+    # Shuffle the characters of all "+d.ddddddddddE+dd" at once. NaNs, infinities,
+    # 3-digit exponents and exponents shifted to 100 are left to _format_fortran_float.
+    if len(text) == 17 * n_values:
+        chars = np.frombuffer(text.encode(), dtype=np.uint8).reshape(n_values, 17)
+        exponent = (chars[:, 15].astype(np.int16) - 48) * 10 + chars[:, 16] - 48
+        exponent = np.where(chars[:, 14] == ord("-"), -exponent, exponent) + 1
+    if len(text) != 17 * n_values or (n_values and exponent.max() >= 100):
+        floats = [_format_fortran_float(flt) for flt in values.tolist()]
+        lines = [" " + " ".join(floats[idx : idx + 5]) + "\n" for idx in range(0, n_full, 5)]
+    else:
+        negative = chars[:, 0] == ord("-")
+        fortran = np.empty((n_values, 18), dtype=np.uint8)
+        fortran[:, 0] = ord(" ")
+        fortran[:, 1] = np.where(negative, ord("-"), ord("0"))
+        fortran[:, 2] = ord(".")
+        fortran[:, 3] = chars[:, 1]
+        fortran[:, 4:14] = chars[:, 3:13]
+        fortran[:, 14] = ord("E")
+        fortran[:, 15] = np.where(exponent < 0, ord("-"), ord("+"))
+        fortran[:, 16] = 48 + np.abs(exponent) // 10
+        fortran[:, 17] = 48 + np.abs(exponent) % 10
+
+        full = np.empty((n_full // 5, 91), dtype=np.uint8)
+        full[:, :90] = fortran[:n_full].reshape(-1, 90)
+        full[:, 90] = ord("\n")
+        lines = [full.tobytes().decode()]
+        floats = [row.tobytes().decode()[1:] for row in fortran[n_full:]]
+    if n_values > n_full:
+        lines.append(" " + " ".join(floats[n_full - n_values :]) + "  \n")
+    return "".join(lines)
+
+
+# Fields that can be selected with Vasprun(fields=...), mapped to the tags of
+# the vasprun.xml blocks that are only needed for them. The header (generator,
+# incar, kpoints, parameters, atominfo and the initial structure) is always parsed.
+_VASPRUN_HEADER_FIELDS = frozenset(
+    {"generator", "incar", "kpoints", "parameters", "atomic_symbols", "potcar_symbols", "initial_structure"}
+)
+_VASPRUN_FIELD_TAGS: dict[str, tuple[str, ...]] = {
+    "final_structure": (),
+    "final_energy": (),
+    "ionic_steps": (),
+    "structures": (),
+    "md_data": (),
+    "dos": ("dos",),
+    "eigenvalues": ("eigenvalues", "eigenvalues_kpoints_opt"),
+    "projected_eigenvalues": ("projected", "projected_kpoints_opt"),
+    "dielectric_data": ("dielectricfunction",),
+    "force_constants": ("dynmat",),
+}
+# Fields that need every <calculation> block rather than only the last one
+_VASPRUN_ALL_STEPS_FIELDS = frozenset({"ionic_steps", "structures", "md_data"})
+# Blocks that no field needs
+_VASPRUN_UNUSED_TAGS = ("electronvelocities",)
+
+_ML_LMLFF_PATTERN = re.compile(r"name=\"ML_LMLFF\"\s*>\s*T")
+
+
+class _VasprunLineFilter:
+    """File-like view of a vasprun.xml text stream that drops the lines of
+    unneeded blocks before they reach the XML parser, so no elements are ever
+    built for them. Relies on vasprun.xml having each block tag at the start
+    of its own line.
+    """
+
+    def __init__(
+        self,
+        stream,
+        *,
+        skip_tags: Iterable[str],
+        strip_tags: Iterable[str] = (),
+        all_steps: bool,
+        header_only: bool,
+        block_size: int = 1 << 16,
+    ) -> None:
+        """
+        Args:
+            stream: Text stream of the vasprun.xml.
+            skip_tags (Iterable[str]): Tags of the blocks to drop wherever they occur.
+            strip_tags (Iterable[str]): Tags of the blocks of which only the <array>
+                children are dropped, e.g. the projections of <projected>, keeping
+                their <eigenvalues>.
+            all_steps (bool): Whether to keep all <calculation> blocks. Otherwise only
+                the last complete one is kept, followed by an incomplete one if
+                the file is truncated. Always True for on-the-fly machine learning
+                runs (ML_LMLFF), whose MD steps are counted across all blocks.
+            header_only (bool): Whether to stop reading at the first <calculation>.
+            block_size (int): Number of characters read from stream at a time.
+        """
+        # Number of complete <calculation> blocks, including dropped ones
+        self.n_calculations = 0
+        self._chunks = self._filter(
+            stream, frozenset(skip_tags), frozenset(strip_tags), all_steps, header_only, block_size
+        )
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        """Read up to size characters of the filtered text, or all of it if size < 0."""
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            chunks.append(chunk)
+            length += len(chunk)
+        data = "".join(chunks)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+    @staticmethod
+    def _read_lines(stream, block_size: int) -> Iterator[str]:
+        """Yield blocks of whole lines read from stream."""
+        tail = ""
+        while block := stream.read(block_size):
+            block = tail + block
+            end = block.rfind("\n") + 1
+            if end:
+                yield block[:end]
+            tail = block[end:]
+        if tail:
+            yield tail
+
+    def _filter(
+        self,
+        stream,
+        skip_tags: frozenset[str],
+        strip_tags: frozenset[str],
+        all_steps: bool,
+        header_only: bool,
+        block_size: int,
+    ) -> Iterator[str]:
+        # Only lines starting with these tags change what is kept
+        child_tags = {"array", "eigenvalues"} if strip_tags else set()
+        tag_pattern = re.compile(
+            rf"^[ \t]*<(/?)({'|'.join(sorted({'calculation', *skip_tags, *strip_tags, *child_tags}))})(?=[\s/>])",
+            re.MULTILINE,
+        )
+        skip_tag = None
+        skip_depth = 0
+        # Depth of the stripped blocks, and of the <eigenvalues> within them
+        strip_depth = 0
+        strip_eigen_depth = 0
+        in_header = True
+        # The last complete and the current <calculation> when only the last is kept
+        last_calc: list[str] = []
+        calc: list[str] | None = None
+
+        def route(text: str) -> Iterator[str]:
+            nonlocal last_calc, all_steps
+            if skip_tag is not None or not text:
+                return
+            if calc is not None:
+                calc.append(text)
+                return
+            if in_header and _ML_LMLFF_PATTERN.search(text):
+                all_steps = True
+            if last_calc and text.strip():
+                yield from last_calc
+                last_calc = []
+            yield text
+
+        for block in self._read_lines(stream, block_size):
+            pos = 0
+            for match in tag_pattern.finditer(block):
+                yield from route(block[pos : match.start()])
+                pos = block.find("\n", match.end()) + 1 or len(block)
+                line = block[match.start() : pos]
+                closing, tag = bool(match[1]), match[2]
+
+                if skip_tag is not None:
+                    if tag == skip_tag:
+                        skip_depth += -1 if closing else 1
+                        if skip_depth == 0:
+                            skip_tag = None
+                    continue
+                if (tag in skip_tags or (tag == "array" and strip_depth and not strip_eigen_depth)) and not closing:
+                    # Blocks opened and closed on the same line are dropped right away
+                    if not (line.rstrip().endswith("/>") or f"</{tag}>" in line):
+                        skip_tag, skip_depth = tag, 1
+                    continue
+                if tag in strip_tags or tag in child_tags:
+                    if tag in strip_tags:
+                        strip_depth += -1 if closing else 1
+                    elif tag == "eigenvalues" and strip_depth:
+                        strip_eigen_depth += -1 if closing else 1
+                    yield from route(line)
+                    continue
+
+                # Only <calculation> tags reach here
+                if not closing:
+                    in_header = False
+                    if header_only:
+                        yield "</modeling>\n"
+                        return
+                    if not all_steps:
+                        calc = []
+                if calc is not None:
+                    calc.append(line)
+                    if closing:
+                        self.n_calculations += 1
+                        last_calc, calc = calc, None
+                    continue
+                if closing:
+                    self.n_calculations += 1
+                yield line
+            yield from route(block[pos:])
+
+        yield from last_calc
+        if calc is not None:
+            yield from calc
+
+
 @dataclass
 class KpointOptProps:
     """Simple container class to store KPOINTS_OPT data in a separate namespace. Used by Vasprun."""
@@ -236,8 +586,9 @@ class Vasprun(MSONable):
             and the imaginary part tensor ([energies],[[real_partxx,real_partyy,real_partzz,real_partxy,
             real_partyz,real_partxz]],[[imag_partxx,imag_partyy,imag_partzz,imag_partxy, imag_partyz, imag_partxz]]).
             The data can be the current, density or freq_dependent (BSE) dielectric data.
-        nionic_steps (int): The total number of ionic steps. This number is always equal to the total number
-            of steps in the actual run even if ionic_step_skip is used.
+        nionic_steps (int | None): The total number of ionic steps. This number is always equal to the total number
+            of steps in the actual run even if ionic_step_skip is used. None if only the header is parsed
+            with fields.
         force_constants (NDArray): Force constants computed in phonon DFPT run(IBRION = 8).
             The data is a 4D array of shape (natoms, natoms, 3, 3).
         normalmode_eigenvals (NDArray): Normal mode frequencies. 1D array of size 3*natoms.
@@ -276,6 +627,8 @@ class Vasprun(MSONable):
         occu_tol: float = 1e-8,
         separate_spins: bool = False,
         exception_on_bad_xml: bool = True,
+        fields: Collection[str] | None = None,
+        projected_eigen_dtype: DTypeLike = np.float64,
     ) -> None:
         """
         Args:
@@ -324,6 +677,23 @@ class Vasprun(MSONable):
                 proper vasprun.xml are parsed. You can set to False if you want
                 partial results (e.g., if you are monitoring a calculation during a
                 run), but use the results with care. A warning is issued.
+            fields (Collection[str]): Only parse the given fields, e.g.
+                {"final_structure", "final_energy", "parameters"}. Blocks of the
+                file that no selected field needs are dropped line by line before
+                they reach the XML parser, only the final ionic step is parsed
+                unless "ionic_steps", "structures" or "md_data" is selected, and
+                reading stops after the header (generator, incar, kpoints,
+                parameters, atomic_symbols, potcar_symbols, initial_structure)
+                if nothing else is selected, in which case the properties that
+                need the ionic steps (e.g. converged, final_energy) raise a
+                ValueError and nionic_steps is None. The other valid fields are
+                final_structure, final_energy, ionic_steps, structures, md_data,
+                dos, eigenvalues, projected_eigenvalues, dielectric_data and
+                force_constants. Cannot be combined with ionic_step_skip or
+                ionic_step_offset. Defaults to None, which parses everything.
+            projected_eigen_dtype (DTypeLike): Data type of the projected eigenvalues
+                and magnetisation. VASP writes them with 4 decimals, so np.float32
+                halves their memory at no loss. Defaults to np.float64.
         """
         self.filename = filename
         self.ionic_step_skip = ionic_step_skip
@@ -331,16 +701,51 @@ class Vasprun(MSONable):
         self.occu_tol = occu_tol
         self.separate_spins = separate_spins
         self.exception_on_bad_xml = exception_on_bad_xml
+        self.projected_eigen_dtype = projected_eigen_dtype
+        self._fields = None if fields is None else frozenset(fields)
 
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
+        if fields is not None:
+            fields = set(fields)
+            if unknown := fields - _VASPRUN_HEADER_FIELDS - set(_VASPRUN_FIELD_TAGS):
+                raise ValueError(
+                    f"Unknown Vasprun fields {sorted(unknown)}, valid fields are "
+                    f"{sorted(_VASPRUN_HEADER_FIELDS | set(_VASPRUN_FIELD_TAGS))}"
+                )
             if ionic_step_skip or ionic_step_offset:
+                raise ValueError("fields cannot be combined with ionic_step_skip or ionic_step_offset")
+
+        with zopen(filename, mode="rt", encoding="utf-8") as file:
+            if fields is not None:
+                skip_tags = {tag for field, tags in _VASPRUN_FIELD_TAGS.items() if field not in fields for tag in tags}
+                skip_tags.update(_VASPRUN_UNUSED_TAGS)
+                # The <eigenvalues> in <projected> come last, so win in a full
+                # parse. Only the projections are dropped to get the same ones.
+                strip_tags = skip_tags & {"projected", "projected_kpoints_opt"} if "eigenvalues" in fields else set()
+                header_only = not fields & set(_VASPRUN_FIELD_TAGS)
+                filtered = _VasprunLineFilter(
+                    file,
+                    skip_tags=skip_tags - strip_tags,
+                    strip_tags=strip_tags,
+                    all_steps=bool(fields & _VASPRUN_ALL_STEPS_FIELDS),
+                    header_only=header_only,
+                )
+                self._parse(
+                    filtered,
+                    parse_dos=parse_dos and "dos" in fields,
+                    parse_eigen=parse_eigen and "eigenvalues" in fields,
+                    parse_projected_eigen=parse_projected_eigen and "projected_eigenvalues" in fields,
+                )
+                # The count is unknown when reading stops after the header
+                self.nionic_steps: int | None = None if header_only else filtered.n_calculations
+
+            elif ionic_step_skip or ionic_step_offset:
                 # Remove parts of the xml file and parse the string
                 content: str = file.read()  # type:ignore[assignment]
                 steps: list[str] = content.split("<calculation>")
 
                 # The text before the first <calculation> is the preamble!
                 preamble: str = steps.pop(0)
-                self.nionic_steps: int = len(steps)
+                self.nionic_steps = len(steps)
                 new_steps = steps[ionic_step_offset :: int(ionic_step_skip or 1)]
 
                 # Add the tailing information in the last step from the run
@@ -368,7 +773,12 @@ class Vasprun(MSONable):
                 self.update_potcar_spec(parse_potcar_file)
                 self.update_charge_from_potcar(parse_potcar_file)
 
-        if self.incar.get("ALGO") not in {"Chi", "Bse"} and not self.converged and self.parameters.get("IBRION") != 0:
+        if (
+            self.ionic_steps
+            and self.incar.get("ALGO") not in {"Chi", "Bse"}
+            and not self.converged
+            and self.parameters.get("IBRION") != 0
+        ):
             msg = f"{filename} is an unconverged VASP run.\n"
             msg += f"Electronic convergence reached: {self.converged_electronic}.\n"
             msg += f"Ionic convergence reached: {self.converged_ionic}."
@@ -378,6 +788,20 @@ class Vasprun(MSONable):
                 stacklevel=2,
             )
 
+    @classmethod
+    def from_cache(cls, filename: PathLike, cache: ParseCache | PathLike | None = None, **kwargs) -> Self:
+        """Parse a file like cls(filename, **kwargs), reusing the result of an
+        earlier parse of the unchanged file with the same kwargs.
+
+        Args:
+            filename (PathLike): File to parse.
+            cache (ParseCache | PathLike): The cache, or its directory. Defaults
+                to ParseCache(), see there for the default directory.
+            **kwargs: Passed to cls.
+        """
+        cache = cache if isinstance(cache, ParseCache) else ParseCache(cache)
+        return cache.load(cls, filename, **kwargs)
+
     def _parse(
         self,
         stream,
@@ -397,6 +821,7 @@ class Vasprun(MSONable):
         md_data: list[dict] = []
         parsed_header: bool = False
         in_kpoints_opt: bool = False
+        in_electronvelocities: bool = False
         ml_run: bool = False
         try:
             # When parsing XML, start tags tell us when we have entered a block
@@ -417,6 +842,9 @@ class Vasprun(MSONable):
                         parsed_header = True
                     elif tag in ("eigenvalues_kpoints_opt", "projected_kpoints_opt"):
                         in_kpoints_opt = True
+                    elif tag == "electronvelocities":
+                        # Its <eigenvalues> are on a different k-point mesh
+                        in_electronvelocities = True
 
                 else:  # event == "end":
                     # The end event happens when we have read a block, so have
@@ -473,11 +901,16 @@ class Vasprun(MSONable):
                             except Exception:
                                 self.dos_has_errors = True
 
-                    elif parse_eigen and tag == "eigenvalues" and not in_kpoints_opt:
+                    elif parse_eigen and tag == "eigenvalues" and not (in_kpoints_opt or in_electronvelocities):
                         self.eigenvalues = self._parse_eigen(elem)
 
+                    elif tag == "electronvelocities":
+                        in_electronvelocities = False
+
                     elif parse_projected_eigen and tag == "projected" and not in_kpoints_opt:
-                        self.projected_eigenvalues, self.projected_magnetisation = self._parse_projected_eigen(elem)
+                        self.projected_eigenvalues, self.projected_magnetisation = self._parse_projected_eigen(
+                            elem, dtype=self.projected_eigen_dtype
+                        )
 
                     elif tag in ("eigenvalues_kpoints_opt", "projected_kpoints_opt"):
                         in_kpoints_opt = False
@@ -497,7 +930,7 @@ class Vasprun(MSONable):
                             (
                                 self.kpoints_opt_props.projected_eigenvalues,
                                 self.kpoints_opt_props.projected_magnetisation,
-                            ) = self._parse_projected_eigen(elem)
+                            ) = self._parse_projected_eigen(elem, dtype=self.projected_eigen_dtype)
 
                     elif tag == "dielectricfunction":
                         label = elem.attrib.get("comment", None)
@@ -575,11 +1008,23 @@ class Vasprun(MSONable):
         """List of Structures for each ionic step."""
         return [step["structure"] for step in self.ionic_steps]
 
+    def _check_ionic_steps_parsed(self, name: str) -> None:
+        """Raise a ValueError for a property that needs the ionic steps if
+        they were not parsed, i.e. with header-only fields.
+        """
+        fields = getattr(self, "_fields", None)
+        if fields is not None and not fields & set(_VASPRUN_FIELD_TAGS):
+            raise ValueError(
+                f"Vasprun.{name} needs the ionic steps, which are not parsed with fields={sorted(fields)}. "
+                "Add e.g. 'final_energy' to fields."
+            )
+
     @property
     def epsilon_static(self) -> list[float]:
         """The static part of the dielectric constant.
         Present only when it's a DFPT run (LEPSILON=TRUE).
         """
+        self._check_ionic_steps_parsed("epsilon_static")
         return self.ionic_steps[-1].get("epsilon", [])
 
     @property
@@ -587,6 +1032,7 @@ class Vasprun(MSONable):
         """The static part of the dielectric constant without any local
         field effects. Present only when it's a DFPT run (LEPSILON=TRUE).
         """
+        self._check_ionic_steps_parsed("epsilon_static_wolfe")
         return self.ionic_steps[-1].get("epsilon_rpa", [])
 
     @property
@@ -594,6 +1040,7 @@ class Vasprun(MSONable):
         """The ionic part of the static dielectric constant.
         Present when it's a DFPT run (LEPSILON=TRUE) and IBRION=5, 6, 7 or 8.
         """
+        self._check_ionic_steps_parsed("epsilon_ionic")
         return self.ionic_steps[-1].get("epsilon_ion", [])
 
     @property
@@ -645,6 +1092,7 @@ class Vasprun(MSONable):
     @property
     def converged_electronic(self) -> bool:
         """Whether electronic step converged in the final ionic step."""
+        self._check_ionic_steps_parsed("converged_electronic")
         final_elec_steps: list[dict[str, Any]] | Literal[0] = (
             self.ionic_steps[-1]["electronic_steps"] if self.incar.get("ALGO", "").lower() != "chi" else 0
         )
@@ -669,6 +1117,8 @@ class Vasprun(MSONable):
         In case IBRION=0 (MD) or EDIFFG=0, returns True if the max ionic
         steps are reached.
         """
+        self._check_ionic_steps_parsed("converged_ionic")
+        nionic_steps = cast("int", self.nionic_steps)
         nsw = self.parameters.get("NSW", 0)
         ibrion = self.parameters.get("IBRION", -1 if nsw in (-1, 0) else 0)
         if ibrion == 0:
@@ -681,9 +1131,9 @@ class Vasprun(MSONable):
         # Vasprun.converged_ionic = False.
         ediffg = self.parameters.get("EDIFFG", 1)
         if ibrion in {1, 2} and ediffg == 0:
-            return nsw <= 1 or nsw == len(self.ionic_steps)
+            return nsw <= 1 or nsw == nionic_steps
 
-        return nsw <= 1 or len(self.ionic_steps) < nsw
+        return nsw <= 1 or nionic_steps < nsw
 
     @property
     def converged(self) -> bool:
@@ -696,6 +1146,7 @@ class Vasprun(MSONable):
     @unitized("eV")
     def final_energy(self) -> float:
         """Final energy from the VASP run."""
+        self._check_ionic_steps_parsed("final_energy")
         try:
             final_istep = self.ionic_steps[-1]
             total_energy = final_istep["e_0_energy"]
@@ -860,7 +1311,8 @@ class Vasprun(MSONable):
 
         Count all the actual MD steps if ML enabled.
         """
-        return len(self.md_data) if self.md_data else self.nionic_steps
+        self._check_ionic_steps_parsed("md_n_steps")
+        return len(self.md_data) if self.md_data else cast("int", self.nionic_steps)
 
     def get_computed_entry(
         self,
@@ -1671,18 +2123,23 @@ class Vasprun(MSONable):
             orbs = [ss.text for ss in partial.find("array").findall("field")]  # type: ignore[union-attr]
             orbs.pop(0)
             lm = any("x" in s for s in orbs if s is not None)
-            for s in partial.find("array").find("set").findall("set"):  # type: ignore[union-attr]
+            # other 'spins' of SOC runs are x,y,z projections
+            spin_sets = [
+                s.findall("set")[: 1 if soc_run else None]
+                for s in partial.find("array").find("set").findall("set")  # type: ignore[union-attr]
+            ]
+            # The rows of all ions and spins are converted at once, then split
+            # into (ion, spin, energy, column)
+            data = _parse_vasp_rows([r.text for sets in spin_sets for ss in sets for r in ss])  # type: ignore[misc]
+            data = data.reshape(len(spin_sets), len(spin_sets[0]), -1, data.shape[-1]) if spin_sets else data
+            for ion_idx, sets in enumerate(spin_sets):
                 pdos: dict[Orbital | OrbitalType, dict[Spin, NDArray]] = defaultdict(dict)
 
-                for ss in s.findall("set"):
+                for spin_idx, ss in enumerate(sets):
                     spin = Spin.up if ss.attrib["comment"] == "spin 1" else Spin.down
-                    if spin != Spin.up and soc_run:  # other 'spins' are x,y,z SOC projections
-                        continue
-                    data = _parse_vasp_array(ss)
-                    _n_row, n_col = data.shape
-                    for col_idx in range(1, n_col):
+                    for col_idx in range(1, data.shape[-1]):
                         orb = Orbital(col_idx - 1) if lm else OrbitalType(col_idx - 1)
-                        pdos[orb][spin] = data[:, col_idx]  # type: ignore[index]
+                        pdos[orb][spin] = data[ion_idx, spin_idx, :, col_idx]
                 pdoss.append(pdos)
         elem.clear()
 
@@ -1697,43 +2154,48 @@ class Vasprun(MSONable):
     @staticmethod
     def _parse_eigen(elem: XML_Element) -> dict[Spin, NDArray]:
         """Parse eigenvalues."""
-        eigenvalues: dict[Spin, NDArray] = defaultdict(list)  # type:ignore[arg-type]
+        eigenvalues: dict[Spin, NDArray] = {}
         for s in elem.find("array").find("set").findall("set"):  # type: ignore[union-attr]
             spin = Spin.up if s.attrib["comment"] == "spin 1" else Spin.down
-            for ss in s.findall("set"):
-                eigenvalues[spin].append(_parse_vasp_array(ss))
-        eigenvalues = {spin: np.array(v) for spin, v in eigenvalues.items()}
+            # (kpoint, band, [eigenvalue, occupation]) from the rows of all k-points
+            data = _parse_vasp_rows([r.text for r in s.iter("r")])  # type: ignore[misc]
+            eigenvalues[spin] = data.reshape(len(s), -1, data.shape[-1])
         elem.clear()
         return eigenvalues
 
     @staticmethod
     def _parse_projected_eigen(
         elem: XML_Element,
+        dtype: DTypeLike = np.float64,
     ) -> tuple[dict[Spin, NDArray], NDArray | None]:
         """Parse projected eigenvalues."""
         root = elem.find("array").find("set")  # type: ignore[union-attr]
-        _proj_eigen: dict[int, NDArray] = defaultdict(list)  # type:ignore[arg-type]
-        for s in root.findall("set"):  # type: ignore[union-attr]
+        spin_sets = root.findall("set")  # type: ignore[union-attr]
+        # non-collinear magentism (also spin-orbit coupling) enabled, last three
+        # "spin channels" are the projected magnetization of the orbitals in the
+        # x, y, and z Cartesian coordinates
+        noncollinear = len(spin_sets) > 2
+        proj_mag = None
+        _proj_eigen: dict[int, NDArray] = {}
+        for s in spin_sets:
             spin: int = int(re.match(r"spin(\d+)", s.attrib["comment"])[1])  # type: ignore[index]
 
-            # Force spin to be +1 or -1
-            for ss in s.findall("set"):
-                dk = []
-                for sss in ss.findall("set"):
-                    db = _parse_vasp_array(sss)
-                    dk.append(db)
-                _proj_eigen[spin].append(dk)
-        _proj_eigen = {spin: np.array(v) for spin, v in _proj_eigen.items()}
-
-        if len(_proj_eigen) > 2:
-            # non-collinear magentism (also spin-orbit coupling) enabled, last three
-            # "spin channels" are the projected magnetization of the orbitals in the
-            # x, y, and z Cartesian coordinates
-            proj_mag = np.stack([_proj_eigen.pop(i) for i in range(2, 5)], axis=-1)  # type: ignore[call-overload]
+            # (kpoint, band, ion, orbital) from the rows of all k-points and bands
+            data = _parse_vasp_rows([r.text for r in s.iter("r")], dtype=dtype)  # type: ignore[misc]
+            data = data.reshape(len(s), len(s[0]), -1, data.shape[-1])
+            if not noncollinear or spin == 1:
+                _proj_eigen[spin] = data
+                continue
+
+            # The magnetization channels are written straight into one array
+            if proj_mag is None:
+                proj_mag = np.empty((*data.shape, 3), dtype=data.dtype)
+            proj_mag[..., spin - 2] = data
+
+        if noncollinear:
             proj_eigen: dict[Spin, NDArray] = {Spin.up: _proj_eigen[1]}
         else:
             proj_eigen = {Spin.up if k == 1 else Spin.down: v for k, v in _proj_eigen.items()}
-            proj_mag = None
 
         elem.clear()
         return proj_eigen, proj_mag
@@ -1772,6 +2234,7 @@ class BSVasprun(Vasprun):
         parse_potcar_file: bool | str = False,
         occu_tol: float = 1e-8,
         separate_spins: bool = False,
+        projected_eigen_dtype: DTypeLike = np.float64,
     ) -> None:
         """
         Args:
@@ -1793,10 +2256,13 @@ class BSVasprun(Vasprun):
                 reported for each individual spin channel. Defaults to False,
                 which computes the eigenvalue band properties independent of
                 the spin orientation. If True, the calculation must be spin-polarized.
+            projected_eigen_dtype (DTypeLike): Data type of the projected eigenvalues
+                and magnetisation. Defaults to np.float64.
         """
         self.filename = filename
         self.occu_tol = occu_tol
         self.separate_spins = separate_spins
+        self.projected_eigen_dtype = projected_eigen_dtype
 
         with zopen(filename, mode="rt", encoding="utf-8") as file:
             self.efermi = None
@@ -1842,7 +2308,9 @@ class BSVasprun(Vasprun):
                 elif tag == "eigenvalues" and not in_kpoints_opt:
                     self.eigenvalues = self._parse_eigen(elem)
                 elif parse_projected_eigen and tag == "projected" and not in_kpoints_opt:
-                    self.projected_eigenvalues, self.projected_magnetisation = self._parse_projected_eigen(elem)
+                    self.projected_eigenvalues, self.projected_magnetisation = self._parse_projected_eigen(
+                        elem, dtype=self.projected_eigen_dtype
+                    )
                 elif tag in ("eigenvalues_kpoints_opt", "projected_kpoints_opt"):
                     if self.kpoints_opt_props is None:
                         self.kpoints_opt_props = KpointOptProps()
@@ -1860,7 +2328,7 @@ class BSVasprun(Vasprun):
                         (
                             self.kpoints_opt_props.projected_eigenvalues,
                             self.kpoints_opt_props.projected_magnetisation,
-                        ) = self._parse_projected_eigen(elem)
+                        ) = self._parse_projected_eigen(elem, dtype=self.projected_eigen_dtype)
                 elif tag == "structure" and elem.attrib.get("name") == "finalpos":
                     self.final_structure = self._parse_structure(elem)
         self.vasp_version = self.generator["version"]
@@ -2041,6 +2509,8 @@ class Outcar:
         """
         self.filename: str = str(filename)
         self.is_stopped: bool = False
+        # Text of the OUTCAR while inside batch_read
+        self._text: str | None = None
 
         # Assume a compilation with parallelization enabled.
         # Will be checked later.
@@ -2069,8 +2539,12 @@ class Outcar:
         e_wo_entrp_pattern = re.compile(r"energy  without entropy\s*=\s+([\d\-\.]+)")
         e0_pattern = re.compile(r"energy\(sigma->0\)\s*=\s+([\d\-\.]+)")
 
+        # The decompressed OUTCAR is read only once for all of the parsing
+        with zopen(filename, mode="rt", encoding="utf-8") as file:
+            self._text = file.read()  # type:ignore[assignment]
+
         all_lines = []
-        for line in reverse_readfile(self.filename):
+        for line in _reverse_lines(self._text):  # type:ignore[arg-type]
             clean = line.strip()
             all_lines.append(clean)
             if clean.find("soft stop encountered!  aborting job") != -1:
@@ -2177,8 +2651,8 @@ class Outcar:
 
         # Data from beginning of OUTCAR
         run_stats["cores"] = None
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
-            for line in file:  # type:ignore[assignment]
+        with self._lines() as lines:
+            for line in lines:
                 if "serial" in line:
                     # Activate serial parallelization
                     run_stats["cores"] = 1
@@ -2202,19 +2676,49 @@ class Outcar:
         self.final_fr_energy = e_fr_energy
         self.data: dict[str, Any] = {}
 
-        # Read "number of bands" (NBANDS)
-        self.read_pattern(
-            {"nbands": r"number\s+of\s+bands\s+NBANDS=\s+(\d+)"},
-            terminate_on_match=True,
-            postprocess=int,
+        # Search for all single-line properties in one pass
+        energy_contrib_keys = (
+            "PSCENC",
+            "TEWEN",
+            "DENC",
+            "EXHF",
+            "XCENC",
+            "PAW double counting",
+            "EENTRO",
+            "EBANDS",
+            "EATOM",
+            "Ediel_sol",
         )
+        patterns = {
+            # "number of bands" (NBANDS)
+            "nbands": r"number\s+of\s+bands\s+NBANDS=\s+(\d+)",
+            # "total number of plane waves" (NPLWV)
+            "nplwv": r"total plane-waves  NPLWV =\s+(\*{6}|\d+)",
+            "drift": r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)",
+            "spin": r"ISPIN\s*=\s*2",
+            "noncollinear": r"LNONCOLLINEAR\s*=\s*T",
+            "ibrion": r"IBRION =\s+([\-\d]+)",
+            "epsilon": r"LEPSILON\s*=\s*T",
+            "calcpol": r"LCALCPOL\s*=\s*T",
+            "electrostatic": r"average \(electrostatic\) potential at core",
+            "nmr_cs": r"LCHIMAG\s*=\s*(T)",
+            "nmr_efg": r"NMR quadrupolar parameters",
+            "has_onsite_density_matrices": r"onsite density matrix",
+        }
+        for key in energy_contrib_keys:
+            if key == "PAW double counting":
+                patterns[key] = rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)"
+            else:
+                patterns[key] = rf"{key}\s+=\s+([\d\-\.]+)"
+        with self._lines() as lines:
+            self.data |= _grep_lines(
+                lines,
+                patterns,
+                postprocess={"nbands": int, "drift": float, "ibrion": int},
+                first_only={"nbands", "nplwv", "ibrion", "has_onsite_density_matrices"},
+            )
         self.data["nbands"] = self.data["nbands"][0][0]
 
-        # Read "total number of plane waves" (NPLWV)
-        self.read_pattern(
-            {"nplwv": r"total plane-waves  NPLWV =\s+(\*{6}|\d+)"},
-            terminate_on_match=True,
-        )
         try:
             self.data["nplwv"] = [[int(self.data["nplwv"][0][0])]]
         except ValueError:
@@ -2241,27 +2745,15 @@ class Outcar:
             except ValueError:
                 pass
 
-        # Read the drift
-        self.read_pattern(
-            {"drift": r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)"},
-            postprocess=float,
-        )
         self.drift = self.data.get("drift", [])
 
         # Check if calculation is spin polarized
-        self.read_pattern({"spin": r"ISPIN\s*=\s*2"})
         self.spin = bool(self.data.get("spin", False))
 
         # Check if calculation is non-collinear
-        self.read_pattern({"noncollinear": r"LNONCOLLINEAR\s*=\s*T"})
         self.noncollinear = bool(self.data.get("noncollinear", False))
 
         # Check if the calculation type is DFPT
-        self.read_pattern(
-            {"ibrion": r"IBRION =\s+([\-\d]+)"},
-            terminate_on_match=True,
-            postprocess=int,
-        )
         if self.data.get("ibrion", [[0]])[0][0] > 6:
             self.dfpt = True
             self.read_internal_strain_tensor()
@@ -2269,7 +2761,6 @@ class Outcar:
             self.dfpt = False
 
         # Check if LEPSILON is True and read piezo data if so
-        self.read_pattern({"epsilon": r"LEPSILON\s*=\s*T"})
         if self.data.get("epsilon", False):
             self.lepsilon = True
             self.read_lepsilon()
@@ -2280,7 +2771,6 @@ class Outcar:
             self.lepsilon = False
 
         # Check if LCALCPOL is True and read polarization data if so
-        self.read_pattern({"calcpol": r"LCALCPOL\s*=\s*T"})
         if self.data.get("calcpol", False):
             self.lcalcpol = True
             self.read_lcalcpol()
@@ -2292,11 +2782,9 @@ class Outcar:
         self.electrostatic_potential: list[float] | None = None
         self.ngf: list[int] | None = None
         self.sampling_radii: list[float] | None = None
-        self.read_pattern({"electrostatic": r"average \(electrostatic\) potential at core"})
         if self.data.get("electrostatic", False):
             self.read_electrostatic_potential()
 
-        self.read_pattern({"nmr_cs": r"LCHIMAG\s*=\s*(T)"})
         if self.data.get("nmr_cs"):
             self.nmr_cs: bool = True
             self.read_chemical_shielding()
@@ -2306,7 +2794,6 @@ class Outcar:
         else:
             self.nmr_cs = False
 
-        self.read_pattern({"nmr_efg": r"NMR quadrupolar parameters"})
         if self.data.get("nmr_efg"):
             self.nmr_efg: bool = True
             self.read_nmr_efg()
@@ -2314,10 +2801,6 @@ class Outcar:
         else:
             self.nmr_efg = False
 
-        self.read_pattern(
-            {"has_onsite_density_matrices": r"onsite density matrix"},
-            terminate_on_match=True,
-        )
         if "has_onsite_density_matrices" in self.data:
             self.has_onsite_density_matrices: bool = True
             self.read_onsite_density_matrices()
@@ -2326,26 +2809,65 @@ class Outcar:
 
         # Store the individual contributions to the final total energy
         final_energy_contribs = {}
-        for key in (
-            "PSCENC",
-            "TEWEN",
-            "DENC",
-            "EXHF",
-            "XCENC",
-            "PAW double counting",
-            "EENTRO",
-            "EBANDS",
-            "EATOM",
-            "Ediel_sol",
-        ):
-            if key == "PAW double counting":
-                self.read_pattern({key: rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)"})
-            else:
-                self.read_pattern({key: rf"{key}\s+=\s+([\d\-\.]+)"})
+        for key in energy_contrib_keys:
             if not self.data[key]:
                 continue
             final_energy_contribs[key] = sum(map(float, self.data[key][-1]))
         self.final_energy_contribs = final_energy_contribs
+        self._text = None
+
+    @contextmanager
+    def batch_read(self) -> Iterator[Self]:
+        """Read the OUTCAR only once for all read_* calls made in this context,
+        instead of once per call. The decompressed text is held in memory
+        until the context exits.
+
+        Example:
+            with outcar.batch_read():
+                outcar.read_elastic_tensor()
+                outcar.read_piezo_tensor()
+        """
+        if getattr(self, "_text", None) is not None:
+            yield self
+            return
+
+        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
+            self._text = file.read()  # type:ignore[assignment]
+        try:
+            yield self
+        finally:
+            self._text = None
+
+    @contextmanager
+    def _lines(self) -> Iterator[Iterator[str]]:
+        """Iterate over the lines of the OUTCAR, reusing the text read by
+        batch_read or streaming them from the file otherwise.
+        """
+        if getattr(self, "_text", None) is not None:
+            yield _iter_lines(self._text)  # type:ignore[arg-type]
+            return
+        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
+            yield file  # type:ignore[misc]
+
+    def _read_text(self) -> str:
+        """The decompressed text of the OUTCAR, reusing the text read by batch_read."""
+        if (text := getattr(self, "_text", None)) is not None:
+            return text
+        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
+            return file.read()  # type:ignore[return-value]
+
+    @classmethod
+    def from_cache(cls, filename: PathLike, cache: ParseCache | PathLike | None = None) -> Self:
+        """Parse an OUTCAR, reusing the result of an earlier parse of the
+        unchanged file.
+
+        Args:
+            filename (PathLike): OUTCAR filename to parse.
+            cache (ParseCache | PathLike): The cache, or its directory. Defaults
+                to ParseCache(), see there for the default directory.
+        """
+        cache = cache if isinstance(cache, ParseCache) else ParseCache(cache)
+        return cache.load(cls, filename)
 
     @staticmethod
     def _parse_sci_notation(line: str) -> list[float]:
@@ -2460,15 +2982,28 @@ class Outcar:
             results from regex and postprocess. Note that the values
             are list[list], because you can grep multiple items on one line.
         """
-        matches = regrep(
-            filename=self.filename,
-            patterns=patterns,
-            reverse=reverse,
-            terminate_on_match=terminate_on_match,
-            postprocess=postprocess,
-        )
-        for key in patterns:
-            self.data[key] = [i[0] for i in matches.get(key, [])]
+        if reverse and getattr(self, "_text", None) is not None:
+            self.data |= _grep_lines(
+                _reverse_lines(self._text),  # type:ignore[arg-type]
+                patterns,
+                postprocess=postprocess,
+                terminate_on_match=terminate_on_match,
+            )
+            return
+        if reverse:
+            matches = regrep(
+                filename=self.filename,
+                patterns=patterns,
+                reverse=reverse,
+                terminate_on_match=terminate_on_match,
+                postprocess=postprocess,
+            )
+            for key in patterns:
+                self.data[key] = [i[0] for i in matches.get(key, [])]
+            return
+
+        with self._lines() as lines:
+            self.data |= _grep_lines(lines, patterns, postprocess=postprocess, terminate_on_match=terminate_on_match)
 
     def read_table_pattern(
         self,
@@ -2519,8 +3054,7 @@ class Outcar:
         if last_one_only and first_one_only:
             raise ValueError("last_one_only and first_one_only options are incompatible")
 
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            text: str = file.read()  # type:ignore[assignment]
+        text = self._read_text()
         table_pattern_text = header_pattern + r"\s*^(?P<table_body>(?:\s+" + row_pattern + r")+)\s+" + footer_pattern
         table_pattern = re.compile(table_pattern_text, re.MULTILINE | re.DOTALL)
         rp = re.compile(row_pattern)
@@ -2599,9 +3133,8 @@ class Outcar:
         data: dict[str, Any] = {"REAL": [], "IMAGINARY": []}
         count = 0
         component = "IMAGINARY"
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            line: str
-            for line in file:  # type:ignore[assignment]
+        with self._lines() as lines:
+            for line in lines:
                 line = line.strip()
                 if re.match(plasma_pattern, line):
                     read_plasma = "intraband" if "intraband" in line else "interband"
@@ -2732,8 +3265,7 @@ class Outcar:
         row_pattern = r"\s+".join([r"([-]?\d+\.\d+)"] * 3)
         unsym_footer_pattern = r"^\s+SYMMETRIZED TENSORS\s+$"
 
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            text: str = file.read()  # type:ignore[assignment]
+        text = self._read_text()
         unsym_table_pattern_text = header_pattern + first_part_pattern + r"(?P<table_body>.+)" + unsym_footer_pattern
         table_pattern = re.compile(unsym_table_pattern_text, re.MULTILINE | re.DOTALL)
         row_pat = re.compile(row_pattern)
@@ -3042,7 +3574,8 @@ class Outcar:
             self.er_ev = {Spin.up: None, Spin.down: None}  # type:ignore[dict-item]
             self.er_bp = {Spin.up: None, Spin.down: None}  # type:ignore[dict-item]
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            with self._lines() as lines:
+                micro_pyawk(lines, search, self)  # type:ignore[arg-type]
 
             if self.er_ev[Spin.up] is not None and self.er_ev[Spin.down] is not None:
                 self.er_ev_tot = self.er_ev[Spin.up] + self.er_ev[Spin.down]  # type: ignore[operator,assignment]
@@ -3098,7 +3631,8 @@ class Outcar:
 
         self.internal_strain_ion = None
         self.internal_strain_tensor: list[NDArray[np.float64]] = []
-        micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+        with self._lines() as lines:
+            micro_pyawk(lines, search, self)  # type:ignore[arg-type]
 
     def read_lepsilon(self) -> None:
         """Read a LEPSILON run.
@@ -3248,7 +3782,8 @@ class Outcar:
             self.born_ion = None
             self.born: list | NDArray = []
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            with self._lines() as lines:
+                micro_pyawk(lines, search, self)  # type:ignore[arg-type]
 
             self.born = np.array(self.born)
 
@@ -3378,7 +3913,8 @@ class Outcar:
             self.piezo_ionic_index = None
             self.piezo_ionic_tensor = np.zeros((3, 6))
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            with self._lines() as lines:
+                micro_pyawk(lines, search, self)  # type:ignore[arg-type]
 
             self.dielectric_ionic_tensor = self.dielectric_ionic_tensor.tolist()  # type:ignore[assignment]
             self.piezo_ionic_tensor = self.piezo_ionic_tensor.tolist()  # type:ignore[assignment]
@@ -3478,12 +4014,14 @@ class Outcar:
                 ]
             )
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            with self._lines() as lines:
+                micro_pyawk(lines, search, self)  # type:ignore[arg-type]
 
             # Fix polarization units in new versions of VASP
             regex = r"^.*Ionic dipole moment: .*"
             search = [[regex, None, lambda x, y: x.append(y.group(0))]]
-            results = micro_pyawk(self.filename, search, [])  # type:ignore[arg-type]
+            with self._lines() as lines:
+                results = micro_pyawk(lines, search, [])  # type:ignore[arg-type]
 
             if "|e|" in results[0]:
                 self.p_elec *= -1  # type: ignore[operator]
@@ -3521,7 +4059,8 @@ class Outcar:
                 )
             )
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            with self._lines() as lines:
+                micro_pyawk(lines, search, self)  # type:ignore[arg-type]
 
             self.zval_dict: dict[str, float] = dict(zip(self.atom_symbols, self.zvals, strict=True))  # type: ignore[attr-defined]
 
@@ -3543,12 +4082,12 @@ class Outcar:
             The core state eigenenergie of the 2s AO of the 6th atom of the
             structure at the last ionic step is [5]["2s"][-1].
         """
-        with zopen(self.filename, mode="rt", encoding="utf-8") as foutcar:
-            line: str = foutcar.readline()  # type:ignore[assignment]
+        with self._lines() as foutcar:
+            line: str = next(foutcar, "")
             core_state_eigs: list[dict[str, list[float]]] = []
 
             while line != "":
-                line = foutcar.readline()  # type:ignore[assignment]
+                line = next(foutcar, "")
 
                 if "NIONS =" in line:
                     natom = int(line.split("NIONS =")[1])
@@ -3557,7 +4096,7 @@ class Outcar:
                 if "the core state eigen" in line:
                     iat = -1
                     while line != "":
-                        line = foutcar.readline()  # type:ignore[assignment]
+                        line = next(foutcar, "")
                         # don't know number of lines to parse without knowing
                         # specific species, so stop parsing when we reach
                         # "E-fermi" instead
@@ -3585,15 +4124,15 @@ class Outcar:
             The average core potential of the 2nd atom of the structure at the
             last ionic step is: [-1][1].
         """
-        with zopen(self.filename, mode="rt", encoding="utf-8") as foutcar:
-            line = foutcar.readline()
+        with self._lines() as foutcar:
+            line = next(foutcar, "")
             avg_core_pots: list[list[float]] = []
             while line != "":
-                line = foutcar.readline()
+                line = next(foutcar, "")
                 if "the norm of the test charge is" in line:
                     avg_pot: list[float] = []
                     while line != "":
-                        line = foutcar.readline()
+                        line = next(foutcar, "")
                         # don't know number of lines to parse without knowing
                         # specific species, so stop parsing when we reach
                         # "E-fermi" instead
@@ -3698,115 +4237,106 @@ class VolumetricData(BaseVolumetricData):
     """
 
     @staticmethod
-    def parse_file(filename: PathLike) -> tuple[Poscar, dict, dict]:
+    def parse_file(filename: PathLike, total_only: bool = False) -> tuple[Poscar, dict, dict]:
         """
         Parse a generic volumetric data file in the VASP like format.
         Used by subclasses for parsing files.
 
         Args:
             filename (PathLike): Path of file to parse.
+            total_only (bool): Only parse the first ("total") dataset, skipping
+                the spin (diff) datasets that may follow. Defaults to False.
 
         Returns:
             tuple[Poscar, dict, dict]: Poscar object, data dict, data_aug dict
         """
-        poscar_read = False
+        with zopen(filename, mode="rt", encoding="utf-8") as file:
+            text = file.read()
+
+        # The header is a POSCAR, ending at the first blank line
         poscar_string: list[str] = []
-        dataset: NDArray = np.zeros((1, 1, 1))
+        pos = 0
+        while pos < len(text):
+            end = text.find("\n", pos) + 1 or len(text)
+            line = text[pos:end].strip()
+            pos = end
+            if line != "" or len(poscar_string) == 0:
+                poscar_string.append(line)
+            else:
+                break
+        poscar = Poscar.from_str("\n".join(poscar_string))
+
         all_dataset: list[NDArray] = []
         # for holding any strings in input that are not Poscar
         # or VolumetricData (typically augmentation charges)
         all_dataset_aug: dict[int, list[str]] = {}
-        dim: list[int] = []
-        dimline = ""
-        read_dataset = False
-        ngrid_pts = 0
-        data_count = 0
-        poscar = None
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
-            for line in file:
-                original_line = line
-                line = line.strip()
-                if read_dataset:
-                    for tok in line.split():
-                        if data_count < ngrid_pts:
-                            # This complicated procedure is necessary because
-                            # VASP outputs x as the fastest index, followed by y
-                            # then z.
-                            no_x = data_count // dim[0]
-                            dataset[data_count % dim[0], no_x % dim[1], no_x // dim[1]] = float(tok)
-                            data_count += 1
-                    if data_count >= ngrid_pts:
-                        read_dataset = False
-                        data_count = 0
-                        all_dataset.append(dataset)
-
-                elif not poscar_read:
-                    if line != "" or len(poscar_string) == 0:
-                        poscar_string.append(line)  # type:ignore[arg-type]
-                    elif line == "":
-                        poscar = Poscar.from_str("\n".join(poscar_string))
-                        poscar_read = True
-
-                elif not dim:
-                    dim = [int(i) for i in line.split()]
-                    ngrid_pts = dim[0] * dim[1] * dim[2]
-                    dimline = line  # type:ignore[assignment]
-                    read_dataset = True
-                    dataset = np.zeros(dim)
-
-                elif line == dimline:
-                    # when line == dimline, expect volumetric data to follow
-                    # so set read_dataset to True
-                    read_dataset = True
-                    dataset = np.zeros(dim)
-
-                else:
-                    # store any extra lines that were not part of the
-                    # volumetric data so we know which set of data the extra
-                    # lines are associated with
-                    key = len(all_dataset) - 1
-                    if key not in all_dataset_aug:
-                        all_dataset_aug[key] = []
-                    all_dataset_aug[key].append(original_line)  # type:ignore[arg-type]
-
-            if len(all_dataset) == 4:
-                data = {
-                    "total": all_dataset[0],
-                    "diff_x": all_dataset[1],
-                    "diff_y": all_dataset[2],
-                    "diff_z": all_dataset[3],
-                }
-                data_aug = {
-                    "total": all_dataset_aug.get(0),
-                    "diff_x": all_dataset_aug.get(1),
-                    "diff_y": all_dataset_aug.get(2),
-                    "diff_z": all_dataset_aug.get(3),
-                }
+        end = text.find("\n", pos) + 1 or len(text)
+        dimline = text[pos:end].strip()
+        dim = [int(i) for i in dimline.split()]
+        pos = end
+        read_dataset = True
+        while pos < len(text):
+            if read_dataset:
+                dataset, pos = _parse_volumetric_grid(text, pos, dim)
+                # A dataset cut short at the end of the file is dropped
+                if dataset is not None:
+                    all_dataset.append(dataset)
+                read_dataset = False
+                continue
 
-                # Construct a "diff" dict for scalar-like magnetization density,
-                # referenced to an arbitrary direction (using same method as
-                # pymatgen.electronic_structure.core.Magmom, see
-                # Magmom documentation for justification for this)
-                # TODO: re-examine this, and also similar behavior in
-                # Magmom - @mkhorton
-                # TODO: does CHGCAR change with different SAXIS?
-                diff_xyz = np.array([data["diff_x"], data["diff_y"], data["diff_z"]])
-                diff_xyz = diff_xyz.reshape((3, dim[0] * dim[1] * dim[2]))
-                ref_direction = np.array([1.01, 1.02, 1.03])
-                ref_sign = np.sign(np.dot(ref_direction, diff_xyz))
-                diff = np.multiply(np.linalg.norm(diff_xyz, axis=0), ref_sign)
-                data["diff"] = diff.reshape((dim[0], dim[1], dim[2]))
-
-            elif len(all_dataset) == 2:
-                data = {"total": all_dataset[0], "diff": all_dataset[1]}
-                data_aug = {
-                    "total": all_dataset_aug.get(0),
-                    "diff": all_dataset_aug.get(1),
-                }
+            end = text.find("\n", pos) + 1 or len(text)
+            original_line = text[pos:end]
+            pos = end
+            if original_line.strip() == dimline:
+                # when line == dimline, expect volumetric data to follow
+                # so set read_dataset to True
+                if total_only:
+                    break
+                read_dataset = True
             else:
-                data = {"total": all_dataset[0]}
-                data_aug = {"total": all_dataset_aug.get(0)}
-            return poscar, data, data_aug  # type: ignore[return-value]
+                # store any extra lines that were not part of the
+                # volumetric data so we know which set of data the extra
+                # lines are associated with
+                all_dataset_aug.setdefault(len(all_dataset) - 1, []).append(original_line)
+
+        if len(all_dataset) == 4:
+            data = {
+                "total": all_dataset[0],
+                "diff_x": all_dataset[1],
+                "diff_y": all_dataset[2],
+                "diff_z": all_dataset[3],
+            }
+            data_aug = {
+                "total": all_dataset_aug.get(0),
+                "diff_x": all_dataset_aug.get(1),
+                "diff_y": all_dataset_aug.get(2),
+                "diff_z": all_dataset_aug.get(3),
+            }
+
+            # Construct a "diff" dict for scalar-like magnetization density,
+            # referenced to an arbitrary direction (using same method as
+            # pymatgen.electronic_structure.core.Magmom, see
+            # Magmom documentation for justification for this)
+            # TODO: re-examine this, and also similar behavior in
+            # Magmom - @mkhorton
+            # TODO: does CHGCAR change with different SAXIS?
+            diff_xyz = np.array([data["diff_x"], data["diff_y"], data["diff_z"]])
+            diff_xyz = diff_xyz.reshape((3, dim[0] * dim[1] * dim[2]))
+            ref_direction = np.array([1.01, 1.02, 1.03])
+            ref_sign = np.sign(np.dot(ref_direction, diff_xyz))
+            diff = np.multiply(np.linalg.norm(diff_xyz, axis=0), ref_sign)
+            data["diff"] = diff.reshape((dim[0], dim[1], dim[2]))
+
+        elif len(all_dataset) == 2:
+            data = {"total": all_dataset[0], "diff": all_dataset[1]}
+            data_aug = {
+                "total": all_dataset_aug.get(0),
+                "diff": all_dataset_aug.get(1),
+            }
+        else:
+            data = {"total": all_dataset[0]}
+            data_aug = {"total": all_dataset_aug.get(0)}
+        return poscar, data, data_aug  # type: ignore[return-value]
 
     def write_file(
         self,
@@ -3820,37 +4350,13 @@ class VolumetricData(BaseVolumetricData):
             vasp4_compatible (bool): True if the format is VASP4 compatible.
         """
 
-        def format_fortran_float(flt: float) -> str:
-            """Fortran code prints floats with a leading zero in scientific
-            notation. When writing CHGCAR files, we adopt this convention
-            to ensure written CHGCAR files are byte-to-byte identical to
-            their input files as far as possible.
-
-            Args:
-                flt (float): Float to print.
-
-            Returns:
-                str: The float in Fortran format.
-            """
-            flt_str = f"{flt:.10E}"
-            if flt >= 0:
-                return f"0.{flt_str[0]}{flt_str[2:12]}E{int(flt_str[13:]) + 1:+03}"
-            return f"-.{flt_str[1]}{flt_str[3:13]}E{int(flt_str[14:]) + 1:+03}"
-
         def write_spin(data_type: str) -> None:
-            lines = []
-            count = 0
             file.write(f"   {dim[0]}   {dim[1]}   {dim[2]}\n")  # type:ignore[arg-type]
-            for k, j, i in itertools.product(list(range(dim[2])), list(range(dim[1])), list(range(dim[0]))):
-                lines.append(format_fortran_float(self.data[data_type][i, j, k]))
-                count += 1
-                if count % 5 == 0:
-                    file.write(" " + "".join(lines) + "\n")  # type:ignore[arg-type]
-                    lines = []
-                else:
-                    lines.append(" ")
-            if count % 5 != 0:
-                file.write(" " + "".join(lines) + " \n")  # type:ignore[arg-type]
+            # Written in chunks of whole lines to bound the size of the formatted text
+            values = self.data[data_type].ravel(order="F")
+            chunk_size = 5 * 2**15
+            for idx in range(0, len(values), chunk_size):
+                file.write(_format_volumetric_grid(values[idx : idx + chunk_size]))  # type:ignore[arg-type]
 
             data: list | NDArray = self.data_aug.get(data_type, []) if self.data_aug is not None else []
             if isinstance(data, Iterable):
@@ -3900,16 +4406,18 @@ class Locpot(VolumetricData):
         self.name = poscar.comment
 
     @classmethod
-    def from_file(cls, filename: PathLike, **kwargs) -> Self:
+    def from_file(cls, filename: PathLike, total_only: bool = False, **kwargs) -> Self:
         """Read a LOCPOT file.
 
         Args:
             filename (PathLike): Path to LOCPOT file.
+            total_only (bool): Only read the total potential, skipping any
+                spin components. Defaults to False.
 
         Returns:
             Locpot
         """
-        poscar, data, _data_aug = VolumetricData.parse_file(filename)
+        poscar, data, _data_aug = VolumetricData.parse_file(filename, total_only=total_only)
         return cls(poscar, data, **kwargs)
 
 
@@ -3944,16 +4452,19 @@ class Chgcar(VolumetricData):
         self._distance_matrix: dict = {}
 
     @classmethod
-    def from_file(cls, filename: str) -> Self:
+    def from_file(cls, filename: str, total_only: bool = False) -> Self:
         """Read a CHGCAR file.
 
         Args:
             filename (str): Path to CHGCAR file.
+            total_only (bool): Only read the total charge density and its
+                augmentation occupancies, skipping the magnetization density
+                of spin-polarized runs. Defaults to False.
 
         Returns:
             Chgcar
         """
-        poscar, data, data_aug = VolumetricData.parse_file(filename)
+        poscar, data, data_aug = VolumetricData.parse_file(filename, total_only=total_only)
         return cls(poscar, data, data_aug=data_aug)  # type:ignore[arg-type]
 
     @property
@@ -2763,10 +2763,12 @@ class NEBSet(VaspInputSet):
         structures = [input_structures[0]]
         for s in input_structures[1:]:
             prev = structures[-1]
-            for idx, site in enumerate(s):
-                translate = np.round(prev[idx].frac_coords - site.frac_coords)
-                if np.any(np.abs(translate) > 0.5):
-                    s.translate_sites([idx], translate, to_unit_cell=False)
+            translate = np.round(prev.frac_coords - s.frac_coords)
+            jumped = np.any(np.abs(translate) > 0.5, axis=1)
+            # Sites that jumped by the same lattice vector are translated together
+            for vec in np.unique(translate[jumped], axis=0):
+                inds = np.flatnonzero(jumped & np.all(translate == vec, axis=1))
+                s.translate_sites(inds.tolist(), vec, to_unit_cell=False)
             structures.append(s)
         return structures
 
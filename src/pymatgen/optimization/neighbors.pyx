@@ -144,90 +144,93 @@ def find_points_in_spheres(
     else:
         ledge = r
 
-    get_max_and_min(center_coords, valid_max, valid_min)
-    for i_dim in range(3):
-        valid_max[i_dim] = valid_max[i_dim] + r + tol
-        valid_min[i_dim] = valid_min[i_dim] - r - tol
-
-    # Process PBC
-    get_frac_coords(lattice, inv_lattice, all_coords, offset_correction)
-    for i_pt in range(n_total):
+    # The heavy lifting does not touch Python objects, release the GIL so
+    # that neighbor lists of different structures can be built in threads
+    with nogil:
+        get_max_and_min(center_coords, valid_max, valid_min)
         for i_dim in range(3):
-            if pbc[i_dim]:
-                # Only wrap atoms when this dimension is PBC
-                all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim] % 1
-                offset_correction[i_pt, i_dim] = offset_correction[i_pt, i_dim] - all_frac_coords[i_pt, i_dim]
-            else:
-                all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim]
-                offset_correction[i_pt, i_dim] = 0
+            valid_max[i_dim] = valid_max[i_dim] + r + tol
+            valid_min[i_dim] = valid_min[i_dim] - r - tol
+
+        # Process PBC
+        get_frac_coords(lattice, inv_lattice, all_coords, offset_correction)
+        for i_pt in range(n_total):
+            for i_dim in range(3):
+                if pbc[i_dim]:
+                    # Only wrap atoms when this dimension is PBC
+                    all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim] % 1
+                    offset_correction[i_pt, i_dim] = offset_correction[i_pt, i_dim] - all_frac_coords[i_pt, i_dim]
+                else:
+                    all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim]
+                    offset_correction[i_pt, i_dim] = 0
 
-    # Compute the reciprocal lattice in place
-    get_reciprocal_lattice(lattice, reciprocal_lattice)
+        # Compute the reciprocal lattice in place
+        get_reciprocal_lattice(lattice, reciprocal_lattice)
 
-    get_max_rep(reciprocal_lattice, max_rep, r)
+        get_max_rep(reciprocal_lattice, max_rep, r)
 
-    # Get fractional coordinates of center points in place
-    get_frac_coords(lattice, inv_lattice, center_coords, frac_coords)
+        # Get fractional coordinates of center points in place
+        get_frac_coords(lattice, inv_lattice, center_coords, frac_coords)
 
-    get_bounds(frac_coords, max_rep, &pbc[0], max_bounds, min_bounds)
+        get_bounds(frac_coords, max_rep, &pbc[0], max_bounds, min_bounds)
 
-    for i_dim in range(3):
-        nlattice *= (max_bounds[i_dim] - min_bounds[i_dim])
-    matmul(all_frac_coords, lattice, coords_in_cell)
-
-    # Get translated images, coordinates and indices
-    for i in range(min_bounds[0], max_bounds[0]):
-        for j in range(min_bounds[1], max_bounds[1]):
-            for k in range(min_bounds[2], max_bounds[2]):
-                for i_pt in range(n_total):
-                    for i_dim in range(3):
-                        coord_temp[i_dim] = <double>i * lattice[0, i_dim] + \
-                                        <double>j * lattice[1, i_dim] + \
-                                        <double>k * lattice[2, i_dim] + \
-                                        coords_in_cell[i_pt, i_dim]
-                    if (
-                            (coord_temp[0] > valid_min[0]) &
-                            (coord_temp[0] < valid_max[0]) &
-                            (coord_temp[1] > valid_min[1]) &
-                            (coord_temp[1] < valid_max[1]) &
-                            (coord_temp[2] > valid_min[2]) &
-                            (coord_temp[2] < valid_max[2])
-                    ):
-                        offsets_p_temp[3*count] = i
-                        offsets_p_temp[3*count+1] = j
-                        offsets_p_temp[3*count+2] = k
-                        indices_p_temp[count] = i_pt
-                        expanded_coords_p_temp[3*count] = coord_temp[0]
-                        expanded_coords_p_temp[3*count+1] = coord_temp[1]
-                        expanded_coords_p_temp[3*count+2] = coord_temp[2]
-                        count += 1
-                        if count >= n_atoms:  # exceeding current memory
-                            n_atoms += n_atoms
-                            offsets_p_temp = <double*> realloc(
-                                offsets_p_temp, n_atoms * 3 * sizeof(double)
-                            )
-                            expanded_coords_p_temp = <double*> realloc(
-                                expanded_coords_p_temp, n_atoms * 3 * sizeof(double)
-                            )
-                            indices_p_temp = <np.int64_t*> realloc(
-                                indices_p_temp, n_atoms * sizeof(np.int64_t)
-                            )
+        for i_dim in range(3):
+            nlattice *= (max_bounds[i_dim] - min_bounds[i_dim])
+        matmul(all_frac_coords, lattice, coords_in_cell)
+
+        # Get translated images, coordinates and indices
+        for i in range(min_bounds[0], max_bounds[0]):
+            for j in range(min_bounds[1], max_bounds[1]):
+                for k in range(min_bounds[2], max_bounds[2]):
+                    for i_pt in range(n_total):
+                        for i_dim in range(3):
+                            coord_temp[i_dim] = <double>i * lattice[0, i_dim] + \
+                                            <double>j * lattice[1, i_dim] + \
+                                            <double>k * lattice[2, i_dim] + \
+                                            coords_in_cell[i_pt, i_dim]
                         if (
-                                offset_final is NULL or
-                                expanded_coords_p_temp is NULL or
-                                indices_p_temp is NULL
+                                (coord_temp[0] > valid_min[0]) &
+                                (coord_temp[0] < valid_max[0]) &
+                                (coord_temp[1] > valid_min[1]) &
+                                (coord_temp[1] < valid_max[1]) &
+                                (coord_temp[2] > valid_min[2]) &
+                                (coord_temp[2] < valid_max[2])
                         ):
-                            failed_malloc = 1
-                            break
+                            offsets_p_temp[3*count] = i
+                            offsets_p_temp[3*count+1] = j
+                            offsets_p_temp[3*count+2] = k
+                            indices_p_temp[count] = i_pt
+                            expanded_coords_p_temp[3*count] = coord_temp[0]
+                            expanded_coords_p_temp[3*count+1] = coord_temp[1]
+                            expanded_coords_p_temp[3*count+2] = coord_temp[2]
+                            count += 1
+                            if count >= n_atoms:  # exceeding current memory
+                                n_atoms += n_atoms
+                                offsets_p_temp = <double*> realloc(
+                                    offsets_p_temp, n_atoms * 3 * sizeof(double)
+                                )
+                                expanded_coords_p_temp = <double*> realloc(
+                                    expanded_coords_p_temp, n_atoms * 3 * sizeof(double)
+                                )
+                                indices_p_temp = <np.int64_t*> realloc(
+                                    indices_p_temp, n_atoms * sizeof(np.int64_t)
+                                )
+                            if (
+                                    offset_final is NULL or
+                                    expanded_coords_p_temp is NULL or
+                                    indices_p_temp is NULL
+                            ):
+                                failed_malloc = 1
+                                break
+                    else:
+                        continue
+                    break
                 else:
                     continue
                 break
             else:
                 continue
             break
-        else:
-            continue
-        break
 
     if failed_malloc:
         raise MemoryError("A realloc of memory of failed!")
@@ -306,50 +309,51 @@ def find_points_in_spheres(
     compute_cube_index(center_coords, valid_min, ledge, center_indices3)
     three_to_one(center_indices3, ncube[1], ncube[2], center_indices1)
 
-    count = 0
-    for i in range(n_center):
-        for j in range(27):
-            if neighbor_map[center_indices1[i], j] == -1:
-                continue
-            cube_index_temp = neighbor_map[center_indices1[i], j]
-            link_index = head[cube_index_temp]
-            while link_index != -1:
-                d_temp2 = distance2(expanded_coords, center_coords, link_index, i, 3)
-                if d_temp2 < r2 + tol:
-                    index_1[count] = i
-                    index_2[count] = indices[link_index]
-                    offset_final[3*count] = offsets[link_index, 0] - offset_correction[indices[link_index], 0]
-                    offset_final[3*count + 1] = offsets[link_index, 1] - offset_correction[indices[link_index], 1]
-                    offset_final[3*count + 2] = offsets[link_index, 2] - offset_correction[indices[link_index], 2]
-                    distances[count] = sqrt(d_temp2)
+    with nogil:
+        count = 0
+        for i in range(n_center):
+            for j in range(27):
+                if neighbor_map[center_indices1[i], j] == -1:
+                    continue
+                cube_index_temp = neighbor_map[center_indices1[i], j]
+                link_index = head[cube_index_temp]
+                while link_index != -1:
+                    d_temp2 = distance2(expanded_coords, center_coords, link_index, i, 3)
+                    if d_temp2 < r2 + tol:
+                        index_1[count] = i
+                        index_2[count] = indices[link_index]
+                        offset_final[3*count] = offsets[link_index, 0] - offset_correction[indices[link_index], 0]
+                        offset_final[3*count + 1] = offsets[link_index, 1] - offset_correction[indices[link_index], 1]
+                        offset_final[3*count + 2] = offsets[link_index, 2] - offset_correction[indices[link_index], 2]
+                        distances[count] = sqrt(d_temp2)
 
-                    count += 1
-                    # Increasing the memory size by allocating incrementally
-                    # malloc_chunk more memory locations, I found it 3x faster to do so
-                    # compared to using vectors in cpp
-                    if count >= malloc_chunk:
-                        malloc_chunk += malloc_chunk  # double the size
-                        index_1 = <np.int64_t*> realloc(index_1, malloc_chunk * sizeof(np.int64_t))
-                        index_2 = <np.int64_t*> realloc(index_2, malloc_chunk*sizeof(np.int64_t))
-                        offset_final = <double*> realloc(
-                            offset_final, 3*malloc_chunk*sizeof(double)
-                        )
-                        distances = <double*> realloc(
-                            distances, malloc_chunk*sizeof(double)
-                        )
-                        if (
-                                index_1 is NULL or index_2 is NULL or
-                                offset_final is NULL or distances is NULL
-                        ):
-                            failed_malloc = 1
-                            break
-                link_index = atom_indices[link_index]
+                        count += 1
+                        # Increasing the memory size by allocating incrementally
+                        # malloc_chunk more memory locations, I found it 3x faster to do so
+                        # compared to using vectors in cpp
+                        if count >= malloc_chunk:
+                            malloc_chunk += malloc_chunk  # double the size
+                            index_1 = <np.int64_t*> realloc(index_1, malloc_chunk * sizeof(np.int64_t))
+                            index_2 = <np.int64_t*> realloc(index_2, malloc_chunk*sizeof(np.int64_t))
+                            offset_final = <double*> realloc(
+                                offset_final, 3*malloc_chunk*sizeof(double)
+                            )
+                            distances = <double*> realloc(
+                                distances, malloc_chunk*sizeof(double)
+                            )
+                            if (
+                                    index_1 is NULL or index_2 is NULL or
+                                    offset_final is NULL or distances is NULL
+                            ):
+                                failed_malloc = 1
+                                break
+                    link_index = atom_indices[link_index]
+                else:
+                    continue
+                break
             else:
                 continue
             break
-        else:
-            continue
-        break
 
     if failed_malloc:
         raise MemoryError("A realloc of memory of failed!")
@@ -475,7 +479,7 @@ cdef void get_cube_neighbors(
 cdef int compute_offset_vectors(
         np.int64_t* ovectors,
         np.int64_t n
-    ) nogil:
+    ) noexcept nogil:
     cdef:
         int i, j, k, ind
         int count = 0
@@ -509,7 +513,7 @@ cdef double distance2(
         np.int64_t index1,
         np.int64_t index2,
         np.int64_t size
-    ) nogil:
+    ) noexcept nogil:
     """Faster way to compute the distance squared by not using slice
     but providing indices in each matrix.
     """
@@ -528,7 +532,7 @@ cdef void get_bounds(
         const np.int64_t[3] pbc,
         np.int64_t[3] max_bounds,
         np.int64_t[3] min_bounds
-    ) nogil:
+    ) noexcept nogil:
     """
     Given the fractional coordinates and the number of repeation needed in each
     direction (max_rep), compute the translational bounds in each dimension.
@@ -554,7 +558,7 @@ cdef void get_frac_coords(
         double[:, ::1] inv_lattice,
         const double[:, ::1] cart_coords,
         double[:, ::1] frac_coords
-    ) nogil:
+    ) noexcept nogil:
     """
     Compute the fractional coordinates.
     """
@@ -565,7 +569,7 @@ cdef void matmul(
         const double[:, ::1] m1,
         const double[:, ::1] m2,
         double [:, ::1] out
-    ) nogil:
+    ) noexcept nogil:
     """
     Matrix multiplication.
     """
@@ -582,7 +586,7 @@ cdef void matmul(
 cdef void matrix_inv(
         const double[:, ::1] matrix,
         double[:, ::1] inv
-    ) nogil:
+    ) noexcept nogil:
     """
     Matrix inversion.
     """
@@ -597,7 +601,7 @@ cdef void matrix_inv(
 
 cdef double matrix_det(
         const double[:, ::1] matrix
-    ) nogil:
+    ) noexcept nogil:
     """
     Matrix determinant.
     """
@@ -611,7 +615,7 @@ cdef void get_max_rep(
         const double[:, ::1] reciprocal_lattice,
         double[3] max_rep,
         double r
-    ) nogil:
+    ) noexcept nogil:
     """
     Get maximum repetition in each directions.
     """
@@ -626,7 +630,7 @@ cdef void get_max_rep(
 cdef void get_reciprocal_lattice(
         const double[:, ::1] lattice,
         double[:, ::1] reciprocal_lattice
-    ) nogil:
+    ) noexcept nogil:
     """
     Compute the reciprocal lattice.
     """
@@ -643,7 +647,7 @@ cdef void recip_component(
         const double[::1] a2,
         const double[::1] a3,
         double[::1] out
-    ) nogil:
+    ) noexcept nogil:
     """
     Compute the reciprocal lattice vector.
     """
@@ -660,7 +664,7 @@ cdef void recip_component(
 cdef double inner(
     const double[3] x,
     const double[3] y
-    ) nogil:
+    ) noexcept nogil:
     """
     Compute inner product of 3d vectors.
     """
@@ -676,7 +680,7 @@ cdef void cross(
         const double[3] x,
         const double[3] y,
         double[3] out
-    ) nogil:
+    ) noexcept nogil:
     """
     Cross product of vector x and y, output in out.
     """
@@ -686,7 +690,7 @@ cdef void cross(
 
 cdef double norm(
         const double[::1] vec
-    ) nogil:
+    ) noexcept nogil:
     """
     Vector norm.
     """
@@ -703,7 +707,7 @@ cdef void get_max_and_min(
         const double[:, ::1] coords,
         double[3] max_coords,
         double[3] min_coords
-    ) nogil:
+    ) noexcept nogil:
     """
     Compute the lower (min_coords) and upper (max_coords) boundaries along each dimension.
     """
@@ -728,7 +732,7 @@ cdef void compute_cube_index(
         const double[3] global_min,
         double radius,
         np.int64_t[:, ::1] return_indices
-    ) nogil:
+    ) noexcept nogil:
     """
     Computes the cube indices for a set of coordinates based on radius.
     """
@@ -745,7 +749,7 @@ cdef void three_to_one(
         np.int64_t ny,
         np.int64_t nz,
         np.int64_t[::1] label1d
-    ) nogil:
+    ) noexcept nogil:
     """
     3D vector representation to 1D.
     """
@@ -760,7 +764,7 @@ cdef bint distance_vertices(
         const double[8][3] center,
         const double[8][3] off,
         double r
-    ) nogil:
+    ) noexcept nogil:
     cdef:
         unsigned int i, j
         double d2
@@ -781,7 +785,7 @@ cdef void offset_cube(
         np.int64_t m,
         np.int64_t l,
         const double[8][3] (&offsetted)
-    ) nogil:
+    ) noexcept nogil:
     cdef unsigned int i, j, k
 
     for i in range(2):
@@ -1734,16 +1734,24 @@ class SpacegroupOperations(list):
         Returns:
             bool: True if the two sets of sites are symmetrically equivalent.
         """
-
-        def in_sites(site):
-            return any(test_site.is_periodic_image(site, symm_prec, check_lattice=False) for test_site in sites1)
-
-        for op in self:
-            new_sites2 = [PeriodicSite(site.species, op.operate(site.frac_coords), site.lattice) for site in sites2]
-            for site in new_sites2:
-                if not in_sites(site):
-                    break
-            else:
+        from pymatgen.core.operations import SymmOpSet
+
+        site_list1, site_list2 = list(sites1), list(sites2)
+        if not site_list2:
+            return len(self) > 0
+        if not site_list1:
+            return False
+
+        # Images of sites2 under each operation must be periodic images of sites of sites1 with the same species
+        same_species = np.array([[site1.species == site2.species for site1 in site_list1] for site2 in site_list2])
+        pbc = np.array(site_list1[0].lattice.pbc)
+        frac_coords1 = np.array([site.frac_coords for site in site_list1])
+        new_frac_coords2 = SymmOpSet(self).operate_multi([site.frac_coords for site in site_list2])
+        for new_coords in new_frac_coords2:
+            frac_diff = new_coords[:, None] - frac_coords1[None]
+            frac_diff[..., pbc] -= np.round(frac_diff[..., pbc])
+            is_image = (np.abs(frac_diff) <= symm_prec).all(axis=-1) & same_species
+            if is_image.any(axis=1).all():
                 return True
         return False
 
@@ -29,7 +29,7 @@ if TYPE_CHECKING:
     from pymatgen.core.lattice import Lattice
 
     # Don't import at runtime to avoid circular import
-    from pymatgen.core.operations import SymmOp  # noqa: TC004
+    from pymatgen.core.operations import SymmOp, SymmOpSet  # noqa: TC004
 
     CrystalSystem: TypeAlias = Literal[
         "cubic",
@@ -74,6 +74,21 @@ class SymmetryGroup(Sequence, Stringify, ABC):
             List of symmetry operations associated with the group.
         """
 
+    @property
+    def symmetry_op_set(self) -> SymmOpSet:
+        """Symmetry operations as a SymmOpSet, to apply them all at once.
+
+        The operations are in the order of iterating over symmetry_ops, which is the
+        order of indexing the group and of the points of orbits. As SymmOp has a
+        constant hash, for a set of SymmOps this order is a fixed permutation of the
+        order in which the operations were added, see _get_set_iteration_order.
+        """
+        from pymatgen.core.operations import SymmOpSet
+
+        if getattr(self, "_symmetry_op_set", None) is None:
+            self._symmetry_op_set = SymmOpSet(list(self.symmetry_ops))
+        return self._symmetry_op_set
+
     def __contains__(self, item: object) -> bool:
         if not isinstance(item, SymmOp):
             return NotImplemented
@@ -90,10 +105,10 @@ class SymmetryGroup(Sequence, Stringify, ABC):
     def __getitem__(self, item: slice) -> Sequence[SymmOp]: ...
 
     def __getitem__(self, item: int | slice) -> SymmOp | Sequence[SymmOp]:
-        return list(self.symmetry_ops)[item]
+        return self.symmetry_op_set[item]
 
     def __len__(self) -> int:
-        return len(self.symmetry_ops)
+        return len(self.symmetry_op_set)
 
     def is_subgroup(self, supergroup: SymmetryGroup) -> bool:
         """True if this group is a subgroup of the supplied group.
@@ -202,12 +217,7 @@ class PointGroup(SymmetryGroup):
         Returns:
             list[array]: Orbit for point.
         """
-        orbit: list[np.ndarray] = []
-        for o in self.symmetry_ops:
-            pp = o.operate(p)
-            if not in_array_list(orbit, pp, tol=tol):
-                orbit.append(pp)
-        return orbit
+        return list(self.symmetry_op_set.get_orbits(np.array([p]), tol=tol, wrap=False)[0])
 
     def is_subgroup(self, supergroup: PointGroup) -> bool:
         """True if this group is a subgroup of the supplied group.
@@ -359,7 +369,8 @@ class SpaceGroup(SymmetryGroup):
         elif int_symbol in SpaceGroup.full_sg_mapping:
             int_symbol = SpaceGroup.full_sg_mapping[int_symbol]
 
-        self._symmetry_ops: set[SymmOp] | None
+        self._symmetry_ops: set[SymmOp] | None = None
+        self._unique_ops: list[SymmOp] | None
 
         for spg in SpaceGroup.SYMM_OPS:
             if int_symbol in [
@@ -385,7 +396,7 @@ class SpaceGroup(SymmetryGroup):
                     self.point_group = spg["point_group"]
                 self.int_number = spg["number"]
                 self.order = len(ops)
-                self._symmetry_ops = {*ops}
+                self._unique_ops = _get_unique_ops(ops)
                 break
         else:
             if int_symbol not in SpaceGroup.sg_encoding:
@@ -414,7 +425,7 @@ class SpaceGroup(SymmetryGroup):
             self.int_number = data["int_number"]
             self.order = data["order"]
 
-            self._symmetry_ops = None
+            self._unique_ops = None
 
     def _generate_full_symmetry_ops(self) -> np.ndarray:
         symm_ops = np.array(self.generators)
@@ -479,12 +490,31 @@ class SpaceGroup(SymmetryGroup):
         """Full set of symmetry operations as matrices. Lazily initialized as
         generation sometimes takes a bit of time.
         """
-        from pymatgen.core.operations import SymmOp
-
         if self._symmetry_ops is None:
-            self._symmetry_ops = {SymmOp(m) for m in self._generate_full_symmetry_ops()}
+            self._symmetry_ops = set(self._get_unique_ops())
         return self._symmetry_ops
 
+    @property
+    def symmetry_op_set(self) -> SymmOpSet:
+        """Symmetry operations as a SymmOpSet, to apply them all at once. Ordered
+        as iterating over symmetry_ops, but without building that set, which
+        takes O(order^2) comparisons of SymmOps.
+        """
+        from pymatgen.core.operations import SymmOpSet
+
+        if getattr(self, "_symmetry_op_set", None) is None:
+            ops = self._get_unique_ops()
+            self._symmetry_op_set = SymmOpSet([ops[idx] for idx in _get_set_iteration_order(ops)])
+        return self._symmetry_op_set
+
+    def _get_unique_ops(self) -> list[SymmOp]:
+        """Distinct symmetry operations, in the order they are added to symmetry_ops."""
+        from pymatgen.core.operations import SymmOp
+
+        if self._unique_ops is None:
+            self._unique_ops = _get_unique_ops([SymmOp(m) for m in self._generate_full_symmetry_ops()])
+        return self._unique_ops
+
     def get_orbit(self, p: ArrayLike, tol: float = 1e-5) -> list[np.ndarray]:
         """Get the orbit for a point.
 
@@ -497,13 +527,20 @@ class SpaceGroup(SymmetryGroup):
         Returns:
             list[array]: Orbit for point.
         """
-        orbit: list[np.ndarray] = []
-        for o in self.symmetry_ops:
-            pp = o.operate(p)
-            pp = np.mod(np.round(pp, decimals=10), 1)
-            if not in_array_list(orbit, pp, tol=tol):
-                orbit.append(pp)
-        return orbit
+        return list(self.symmetry_op_set.get_orbits(np.array([p]), tol=tol)[0])
+
+    def get_orbits(self, points: ArrayLike, tol: float = 1e-5) -> list[np.ndarray]:
+        """Get the orbits of many points at once.
+
+        Args:
+            points: Points as an Nx3 array.
+            tol: Tolerance for determining if sites are the same. 1e-5 should
+                be sufficient for most purposes. Set to 0 for exact matching.
+
+        Returns:
+            list[array]: Orbit of each point as an array of shape (orbit size, 3).
+        """
+        return self.symmetry_op_set.get_orbits(points, tol=tol)
 
     def get_orbit_and_generators(self, p: ArrayLike, tol: float = 1e-5) -> tuple[list[np.ndarray], list[SymmOp]]:
         """Get the orbit and its generators for a point.
@@ -519,16 +556,14 @@ class SpaceGroup(SymmetryGroup):
         """
         from pymatgen.core.operations import SymmOp
 
-        orbit: list[np.ndarray] = [np.array(p, dtype=float)]
+        symmetry_op_set = self.symmetry_op_set
+        images = np.mod(np.round(symmetry_op_set.operate_multi(p), decimals=10), 1)
+        images = np.concatenate([np.array(p, dtype=float)[None], images])
+        is_unique = get_first_unique_mask(images, tol)
+
         identity = SymmOp.from_rotation_and_translation(np.eye(3), np.zeros(3))
-        generators: list[SymmOp] = [identity]
-        for o in self.symmetry_ops:
-            pp = o.operate(p)
-            pp = np.mod(np.round(pp, decimals=10), 1)
-            if not in_array_list(orbit, pp, tol=tol):
-                orbit.append(pp)
-                generators.append(o)
-        return orbit, generators
+        generators = [identity, *(op for op, unique in zip(symmetry_op_set, is_unique[1:], strict=True) if unique)]
+        return list(images[is_unique]), generators
 
     def is_compatible(self, lattice: Lattice, tol: float = 1e-5, angle_tol: float = 5) -> bool:
         """Check whether a particular lattice is compatible with the
@@ -746,3 +781,92 @@ def in_array_list(array_list: list[np.ndarray] | np.ndarray, arr: np.ndarray, to
     if not tol:
         return any(np.all(array_list == arr[None, :], axes))
     return any(np.sum(np.abs(array_list - arr[None, :]), axes) < tol)
+
+
+def get_first_unique_mask(arrays: np.ndarray, tol: float = 1e-5) -> np.ndarray:
+    """Vectorized deduplication with in_array_list: mask of the arrays kept when
+    adding them one by one to a list if not already in the list.
+
+    Args:
+        arrays (np.ndarray): shape (n, ...). Arrays to deduplicate.
+        tol (float): The tolerance. Defaults to 1e-5. If 0, an exact match is done.
+
+    Returns:
+        np.ndarray: shape (n,). Whether each array is kept.
+    """
+    n_arrays = len(arrays)
+    flat = np.reshape(arrays, (n_arrays, -1))
+    # Matching arrays (sum of absolute differences < tol) have projections onto a
+    # vector of weights <= 1 closer than tol, so only neighbors in sorted order need
+    # to be compared. Irrational weights separate e.g. permuted coordinates.
+    weights = 0.7548776662466927 ** np.arange(flat.shape[1])
+    keys = flat @ weights
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    if tol:
+        window_ends = np.searchsorted(sorted_keys, sorted_keys + tol, side="left")
+    else:
+        window_ends = np.searchsorted(sorted_keys, sorted_keys, side="right")
+    window_ends = np.maximum(window_ends, np.arange(1, n_arrays + 1))
+
+    pairs = []
+    for offset in range(1, int((window_ends - np.arange(n_arrays)).max())):
+        idx = np.arange(n_arrays - offset)
+        idx = idx[idx + offset < window_ends[idx]]
+        diffs = np.abs(flat[order[idx]] - flat[order[idx + offset]]).sum(axis=1)
+        is_match = diffs == 0 if not tol else diffs < tol
+        pairs.append(np.sort(np.stack([order[idx[is_match]], order[idx[is_match] + offset]], axis=1), axis=1))
+    first, second = np.concatenate(pairs).T if pairs else np.empty((2, 0), dtype=int)
+
+    is_unique = np.ones(n_arrays, dtype=bool)
+    is_unique[second] = False
+    # Greedy selection only differs if some array matches only earlier arrays that
+    # were discarded themselves, which requires a non-transitive match within tol
+    is_covered = is_unique.copy()
+    is_covered[second[is_unique[first]]] = True
+    if is_covered.all():
+        return is_unique
+    for idx in np.unique(second):
+        is_unique[idx] = not is_unique[first[second == idx]].any()
+    return is_unique
+
+
+def _get_unique_ops(ops: list[SymmOp]) -> list[SymmOp]:
+    """The SymmOps kept when adding them one by one to a set, which compares
+    them with SymmOp.__eq__ as they all have the same hash.
+    """
+    matrices = np.array([op.affine_matrix for op in ops])
+    tols = np.array([op.tol for op in ops])
+    # matches[i, j]: ops[i] == ops[j], i.e. np.allclose(matrix_i, matrix_j, atol=tol_i)
+    diffs = np.abs(matrices[:, None] - matrices[None])
+    matches = (diffs <= tols[:, None, None, None] + 1e-5 * np.abs(matrices[None])).all(axis=(2, 3))
+    is_unique = np.ones(len(ops), dtype=bool)
+    for idx in np.flatnonzero(np.tril(matches.T, k=-1).any(axis=1)):
+        is_unique[idx] = not matches[:idx, idx][is_unique[:idx]].any()
+    return [op for op, unique in zip(ops, is_unique, strict=True) if unique]
+
+
+class _HashKey:
+    """Key with a given hash, only equal to itself."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, hash_value: int) -> None:
+        self._hash = hash_value
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+def _get_set_iteration_order(items: list) -> list[int]:
+    """Order in which set(items) iterates over the items, for distinct items with
+    equal hashes (e.g. SymmOps).
+
+    All items are placed in the hash table by probing from the same slot, so the
+    order is a fixed permutation of the insertion order that only depends on the
+    number of items and their hash. It is found by building a set of keys with the
+    same hash that are cheap to compare, instead of comparing the items themselves.
+    """
+    keys = [_HashKey(hash(item)) for item in items]
+    index = {id(key): idx for idx, key in enumerate(keys)}
+    return [index[id(key)] for key in set(keys)]
@@ -25,7 +25,7 @@ from pymatgen.analysis.structure_matcher import SpinComparator, StructureMatcher
 from pymatgen.analysis.structure_prediction.substitution_probability import SubstitutionPredictor
 from pymatgen.command_line.enumlib_caller import EnumError, EnumlibAdaptor
 from pymatgen.command_line.mcsqs_caller import run_mcsqs
-from pymatgen.core import DummySpecies, Element, Species, Structure, get_el_sp
+from pymatgen.core import DummySpecies, Element, Lattice, Species, Structure, get_el_sp
 from pymatgen.core.interface import GrainBoundaryGenerator
 from pymatgen.core.surface import SlabGenerator
 from pymatgen.electronic_structure.core import Spin
@@ -1529,16 +1529,12 @@ class CubicSupercellTransformation(AbstractTransformation):
             target_sc_size = self.min_length
             while sc_not_found:
                 target_sc_lat_vecs = np.eye(3, 3) * target_sc_size
-                length_vecs, n_atoms, superstructure, self.transformation_matrix = self.get_possible_supercell(
-                    lat_vecs, structure, target_sc_lat_vecs
+                length_vecs, n_atoms, sc_lattice, self.transformation_matrix = self._get_possible_supercell_lattice(
+                    lat_vecs, len(structure), target_sc_lat_vecs
                 )
                 # Check if constraints are satisfied
-                if self.check_constraints(
-                    length_vecs=length_vecs,
-                    n_atoms=n_atoms,
-                    superstructure=superstructure,
-                ):
-                    return superstructure
+                if self._check_constraints(length_vecs, n_atoms, sc_lattice):
+                    return SupercellTransformation(self.transformation_matrix).apply_transformation(structure)
 
                 # Increase threshold until proposed supercell meets requirements
                 target_sc_size += self.step_size
@@ -1560,12 +1556,12 @@ class CubicSupercellTransformation(AbstractTransformation):
 
         for size_a, size_b, size_c in combined_list:
             target_sc_lat_vecs = np.array([[size_a, 0, 0], [0, size_b, 0], [0, 0, size_c]])
-            length_vecs, n_atoms, superstructure, self.transformation_matrix = self.get_possible_supercell(
-                lat_vecs, structure, target_sc_lat_vecs
+            length_vecs, n_atoms, sc_lattice, self.transformation_matrix = self._get_possible_supercell_lattice(
+                lat_vecs, len(structure), target_sc_lat_vecs
             )
             # Check if constraints are satisfied
-            if self.check_constraints(length_vecs=length_vecs, n_atoms=n_atoms, superstructure=superstructure):
-                return superstructure
+            if self._check_constraints(length_vecs, n_atoms, sc_lattice):
+                return SupercellTransformation(self.transformation_matrix).apply_transformation(structure)
 
             self.check_exceptions(length_vecs, n_atoms)
         raise AttributeError("Unable to find orthorhombic supercell")
@@ -1589,6 +1585,10 @@ class CubicSupercellTransformation(AbstractTransformation):
             bool
 
         """
+        return self._check_constraints(length_vecs, n_atoms, superstructure.lattice)
+
+    def _check_constraints(self, length_vecs, n_atoms, sc_lattice: Lattice) -> bool:
+        """Check if the supercell constraints are met, given only the supercell lattice."""
         return bool(
             (
                 np.min(np.linalg.norm(length_vecs, axis=1)) >= self.min_length
@@ -1596,7 +1596,7 @@ class CubicSupercellTransformation(AbstractTransformation):
             )
             and (
                 not self.force_90_degrees
-                or np.all(np.absolute(np.array(superstructure.lattice.angles) - 90) < self.angle_tolerance)
+                or np.all(np.absolute(np.array(sc_lattice.angles) - 90) < self.angle_tolerance)
             )
         )
 
@@ -1608,6 +1608,22 @@ class CubicSupercellTransformation(AbstractTransformation):
         Returns:
             length_vecs, n_atoms, superstructure, transformation_matrix
         """
+        length_vecs, _n_atoms, _sc_lattice, transformation_matrix = (
+            CubicSupercellTransformation._get_possible_supercell_lattice(lat_vecs, len(structure), target_sc_lat_vecs)
+        )
+        st = SupercellTransformation(transformation_matrix)
+        superstructure = st.apply_transformation(structure)
+        n_atoms = len(superstructure)
+        return length_vecs, n_atoms, superstructure, transformation_matrix
+
+    @staticmethod
+    def _get_possible_supercell_lattice(lat_vecs, n_sites: int, target_sc_lat_vecs):
+        """Same as get_possible_supercell but without building the supercell structure,
+        whose lattice and number of atoms follow from the transformation matrix.
+
+        Returns:
+            length_vecs, n_atoms, supercell lattice, transformation_matrix
+        """
         transformation_matrix = target_sc_lat_vecs @ np.linalg.inv(lat_vecs)
         # round the entries of T and force T to be non-singular
         transformation_matrix = _round_and_make_arr_singular(  # type: ignore[assignment]
@@ -1634,11 +1650,9 @@ class CubicSupercellTransformation(AbstractTransformation):
                 length6_vec,
             ]
         )
-        # Get number of atoms
-        st = SupercellTransformation(transformation_matrix)
-        superstructure = st.apply_transformation(structure)
-        n_atoms = len(superstructure)
-        return length_vecs, n_atoms, superstructure, transformation_matrix
+        # Number of atoms of the supercell, as made by SupercellTransformation
+        n_atoms = n_sites * round(abs(np.linalg.det(transformation_matrix)))
+        return length_vecs, n_atoms, Lattice(proposed_sc_lat_vecs), transformation_matrix
 
 
 class AddAdsorbateTransformation(AbstractTransformation):
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import pickle
 import re
+import tempfile
 import warnings
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from monty.io import zopen
 
+from pymatgen.core import SETTINGS
+from pymatgen.core import __version__ as PMG_VERSION
+
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
-    from pathlib import Path
-    from typing import Any
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Any, TypeVar
+
+    from pymatgen.util.typing import PathLike
+
+    T = TypeVar("T")
 
 __author__ = "Shyue Ping Ong, Rickard Armiento, Anubhav Jain, G Matteo, Ioannis Petousis"
 __copyright__ = "Copyright 2011, The Materials Project"
@@ -50,8 +63,24 @@ def clean_lines(
             yield clean_string
 
 
+def _any_pattern(patterns: Iterable[re.Pattern]) -> re.Pattern | None:
+    """Combine patterns into one alternation, which matches a line if any of
+    them does, to rule out the many lines that match none in a single search.
+
+    Returns None for patterns that cannot be combined, i.e. those with flags,
+    backreferences or repeated group names.
+    """
+    patterns = list(patterns)
+    if any(p.flags != re.UNICODE or re.search(r"\\\d|\(\?P=", p.pattern) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+    except re.error:
+        return None
+
+
 def micro_pyawk(
-    filename: str | Path,
+    filename: str | Path | Iterable[str],
     search: list[tuple[re.Pattern | str, Callable, Callable]],
     results: Any | None = None,
     debug: Callable | None = None,
@@ -65,7 +94,8 @@ def micro_pyawk(
     Pattern.match.
 
     Args:
-        filename (PathLike): The file to search through.
+        filename (PathLike | Iterable[str]): The file to search through, or its
+            lines, e.g. an open text stream.
         search (list[tuple[Pattern | str, Callable, Callable]]): The "search program" of
             3 elements, i.e. [(regex, test, run), ...].
             Here `regex` is either a Pattern object, or a string that we compile
@@ -95,10 +125,20 @@ def micro_pyawk(
         (re.compile(regex), test, run) for regex, test, run in search
     ]
 
-    with zopen(filename, mode="rt", encoding="utf-8") as file:
+    prefilter = _any_pattern(regex for regex, _test, _run in searches)
+
+    # Lines passed in are iterated over as they are, their owner closes them
+    stream: AbstractContextManager[Iterable[str]]
+    if isinstance(filename, (str, os.PathLike)):
+        stream = zopen(filename, mode="rt", encoding="utf-8")
+    else:
+        stream = nullcontext(filename)
+    with stream as file:
         for line in file:
+            if prefilter is not None and prefilter.search(line) is None:
+                continue
             for regex, test, run in searches:
-                match = re.search(regex, line)
+                match = regex.search(line)
 
                 if match is not None and (test is None or test(results, line)):
                     if debug is not None:
@@ -109,3 +149,178 @@ def micro_pyawk(
                         postdebug(results, match)
 
     return results
+
+
+class ParseCache:
+    """Persistent cache of parsed output files, e.g. Vasprun or Outcar objects.
+
+    Each entry is a JSON metadata file plus a binary blob holding the pickled
+    object, with the data of its NumPy arrays stored out-of-band as raw bytes.
+    Entries are keyed by the parser class, its options and the path, size,
+    modification time and content hash of the parsed file, so any change to
+    the file or the options causes a fresh parse. Least recently used entries
+    are evicted once the cache exceeds max_size.
+
+    Loading an entry unpickles it, so only point a ParseCache at a directory
+    you trust. Files read by the parser besides the parsed file itself (e.g.
+    POTCARs for Vasprun) are not part of the key.
+    """
+
+    # Alignment of the array blobs in a .bin file
+    _ALIGN = 64
+    # Entry keys are hex digests, other files in the cache directory are left alone
+    _KEY_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+    def __init__(self, cache_dir: PathLike | None = None, max_size: int = 2**30) -> None:
+        """
+        Args:
+            cache_dir (PathLike): Directory of the cache. Defaults to the
+                PMG_PARSE_CACHE_DIR setting, or ~/.cache/pymatgen/parse.
+            max_size (int): Maximum total size of the cache in bytes. Defaults to 1 GiB.
+        """
+        if cache_dir is None:
+            cache_dir = SETTINGS.get("PMG_PARSE_CACHE_DIR") or Path.home() / ".cache" / "pymatgen" / "parse"
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+
+    def load(self, cls: Callable[..., T], filename: PathLike, **kwargs) -> T:
+        """Get cls(filename, **kwargs) from the cache, or parse and store it.
+
+        Args:
+            cls (Callable): The parser, e.g. Vasprun.
+            filename (PathLike): The file to parse.
+            **kwargs: Options passed to cls.
+
+        Returns:
+            The parsed object.
+        """
+        key, meta = self._fingerprint(cls, filename, kwargs)
+        obj = self._read(key)
+        if obj is None:
+            obj = cls(filename, **kwargs)
+            self._write(key, meta, obj)
+        return obj
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for key in self._keys():
+            self._remove(key)
+
+    def _keys(self) -> list[str]:
+        """Keys of the entries in the cache directory, i.e. key.json files with a key.bin."""
+        return [
+            path.stem
+            for path in self.cache_dir.glob("*.json")
+            if self._KEY_PATTERN.fullmatch(path.stem) and path.with_suffix(".bin").is_file()
+        ]
+
+    def _fingerprint(self, cls: Callable, filename: PathLike, options: dict[str, Any]) -> tuple[str, dict]:
+        path = Path(filename).resolve()
+        stat = path.stat()
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, mode="rb") as file:
+            while chunk := file.read(1 << 20):
+                digest.update(chunk)
+
+        meta = {
+            "parser": f"{cls.__module__}.{cls.__qualname__}",
+            "options": json.loads(json.dumps(options, sort_keys=True, default=_json_default)),
+            "path": str(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "content_hash": digest.hexdigest(),
+            "pymatgen_version": PMG_VERSION,
+        }
+        key = hashlib.blake2b(json.dumps(meta, sort_keys=True).encode(), digest_size=16).hexdigest()
+        return key, meta
+
+    def _read(self, key: str) -> Any:
+        json_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(json_path, encoding="utf-8") as file:
+                meta = json.load(file)
+            with open(self.cache_dir / f"{key}.bin", mode="rb") as file:
+                # A writable buffer, so the arrays of the loaded object are writable
+                blob = bytearray(meta["nbytes"])
+                if (n_bytes := file.readinto(blob)) != meta["nbytes"]:
+                    raise EOFError(f"read {n_bytes} of {meta['nbytes']} bytes")
+            view = memoryview(blob)
+            buffers = [view[offset : offset + size] for offset, size in meta["buffers"]]
+            obj = pickle.loads(view[: meta["pickle_size"]], buffers=buffers)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            warnings.warn(f"Removing unreadable parse cache entry {json_path}: {exc}", stacklevel=3)
+            self._remove(key)
+            return None
+
+        # Mark as recently used for eviction
+        os.utime(json_path)
+        return obj
+
+    def _write(self, key: str, meta: dict, obj: Any) -> None:
+        pickle_buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=pickle_buffers.append)
+
+        chunks: list[bytes | memoryview] = [data]
+        offset = len(data)
+        buffers = []
+        for pickle_buffer in pickle_buffers:
+            raw = pickle_buffer.raw()
+            padding = -offset % self._ALIGN
+            chunks.append(bytes(padding))
+            offset += padding
+            buffers.append((offset, raw.nbytes))
+            chunks.append(raw)
+            offset += raw.nbytes
+        meta = {**meta, "pickle_size": len(data), "buffers": buffers, "nbytes": offset}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # The .json is written last, so an entry is only visible once complete
+        _write_atomic(self.cache_dir / f"{key}.bin", chunks)
+        _write_atomic(self.cache_dir / f"{key}.json", [json.dumps(meta, indent=2).encode()])
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for key in self._keys():
+            json_path = self.cache_dir / f"{key}.json"
+            try:
+                size = json_path.stat().st_size + (self.cache_dir / f"{key}.bin").stat().st_size
+                entries.append((json_path.stat().st_mtime_ns, size, key))
+            except FileNotFoundError:
+                continue
+            total += size
+
+        for _mtime, size, key in sorted(entries):
+            if total <= self.max_size:
+                break
+            self._remove(key)
+            total -= size
+
+    def _remove(self, key: str) -> None:
+        for suffix in (".json", ".bin"):
+            (self.cache_dir / f"{key}{suffix}").unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, chunks: list) -> None:
+    """Write chunks to path through a temporary file, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode="wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _json_default(obj: Any) -> Any:
+    """Make parser options such as sets, paths and dtypes JSON serializable."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(map(str, obj))
+    if isinstance(obj, os.PathLike):
+        return os.fspath(obj)
+    return repr(obj)
@@ -10,10 +10,14 @@ try:
     from numba import jit, njit
 except ImportError:
 
-    def njit(func):
-        """Replacement for numba.njit when numba is not installed that does nothing."""
-        return func
+    def njit(func=None, **_kwargs):
+        """Replacement for numba.njit when numba is not installed that does nothing.
+        Like numba.njit, it can also be called with options, e.g. @njit(cache=True).
+        """
+        return func if func is not None else lambda func: func
 
-    def jit(func):
-        """Replacement for numba.jit when numba is not installed that does nothing."""
-        return func
+    def jit(func=None, **_kwargs):
+        """Replacement for numba.jit when numba is not installed that does nothing.
+        Like numba.jit, it can also be called with options, e.g. @jit(cache=True).
+        """
+        return func if func is not None else lambda func: func
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from numpy.testing import assert_allclose
+from pytest import approx
 
 from pymatgen.analysis.interfaces.coherent_interfaces import (
     CoherentInterfaceBuilder,
@@ -48,6 +49,27 @@ class TestInterfaceBuilder(MatSciTest):
         # no apparent reason. The author should fix this.
         assert len(list(builder.get_interfaces(termination=("O2_Pmmm_1", "Si_R-3m_1")))) >= 6
 
+    def test_get_all_interfaces(self):
+        builder = CoherentInterfaceBuilder(
+            film_structure=self.sio2_conventional,
+            substrate_structure=self.si_conventional,
+            film_miller=(1, 0, 0),
+            substrate_miller=(1, 1, 1),
+        )
+
+        all_interfaces = builder.get_all_interfaces(n_jobs=2, gap=1.5)
+        assert list(all_interfaces) == builder.terminations
+        for termination, interfaces in all_interfaces.items():
+            expected = list(builder.get_interfaces(termination, gap=1.5))
+            assert len(interfaces) == len(expected) > 0
+            for interface, expected_interface in zip(interfaces, expected, strict=True):
+                assert interface == expected_interface
+                assert interface.gap == approx(1.5)
+                assert interface.interface_properties["termination"] == termination
+
+        interfaces = builder.get_all_interfaces(terminations=builder.terminations[1:], film_thickness=2)
+        assert list(interfaces) == builder.terminations[1:]
+
 
 class TestCoherentInterfaceBuilder:
     def setup_method(self):
@@ -6,7 +6,9 @@ from pytest import approx
 
 from pymatgen.analysis.interfaces.zsl import (
     ZSLGenerator,
+    _reduce_vector_sets,
     fast_norm,
+    gen_sl_transform_matrices,
     get_factors,
     is_same_vectors,
     reduce_vectors,
@@ -71,3 +73,36 @@ class TestZSLGen(MatSciTest):
         for match in matches:
             assert match is not None
             assert isinstance(match.match_area, float)
+
+    def test_reduce_vector_sets(self):
+        vector_sets = np.dot(gen_sl_transform_matrices(12), self.film.lattice.matrix[:2])
+        reduced = _reduce_vector_sets(vector_sets)
+        assert reduced.shape == (len(vector_sets), 2, 3)
+        for vectors, reduced_vectors in zip(vector_sets, reduced, strict=True):
+            assert_array_equal(reduced_vectors, reduce_vectors(*vectors))
+
+    def test_get_equiv_transformations(self):
+        z = ZSLGenerator(max_area_ratio_tol=0.05, max_angle_tol=0.05, max_length_tol=0.05, bidirectional=True)
+        film_vectors = self.film.lattice.matrix[:2]
+        substrate_vectors = self.substrate.lattice.matrix[:2]
+        transformation_sets = list(
+            z.generate_sl_transformation_sets(vec_area(*film_vectors), vec_area(*substrate_vectors))
+        )
+
+        # Compare against checking each pair of super lattices one by one
+        expected = []
+        for film_transformations, substrate_transformations in transformation_sets:
+            for f_trans in film_transformations:
+                for s_trans in substrate_transformations:
+                    film_sl = reduce_vectors(*np.dot(f_trans, film_vectors))
+                    substrate_sl = reduce_vectors(*np.dot(s_trans, substrate_vectors))
+                    if is_same_vectors(
+                        film_sl, substrate_sl, bidirectional=True, max_length_tol=0.05, max_angle_tol=0.05
+                    ):
+                        expected.append((film_sl, substrate_sl, f_trans, s_trans))
+
+        matches = list(z.get_equiv_transformations(transformation_sets, film_vectors, substrate_vectors))
+        assert len(matches) == len(expected) == 60
+        for match, expected_match in zip(matches, expected, strict=True):
+            for value, expected_value in zip(match, expected_match, strict=True):
+                assert_array_equal(value, expected_value)
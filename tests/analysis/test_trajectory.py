@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from pytest import approx
+
+from pymatgen.analysis.trajectory import get_diffusivity, get_msd, get_rdf, get_unwrapped_coords, get_vacf
+from pymatgen.core import Lattice
+from pymatgen.core.trajectory import DiskTrajectory, Trajectory
+from pymatgen.util.testing import VASP_OUT_DIR, MatSciTest
+
+
+class TestTrajectoryAnalysis(MatSciTest):
+    def setup_method(self):
+        self.traj = Trajectory.from_file(f"{VASP_OUT_DIR}/XDATCAR_traj")
+        self.traj.time_step = 2
+        self.unwrapped = get_unwrapped_coords(self.traj)
+
+    def test_unwrapped_coords(self):
+        # Random walk in a small box wraps around many times
+        rng = np.random.default_rng(0)
+        cart_coords = np.cumsum(rng.normal(scale=0.3, size=(50, 4, 3)), axis=0)
+        lattice = Lattice.cubic(3)
+        traj = Trajectory(
+            species=["Li"] * 4,
+            coords=lattice.get_fractional_coords(cart_coords.reshape(-1, 3)).reshape(50, 4, 3) % 1,
+            lattice=lattice.matrix,
+        )
+        unwrapped = get_unwrapped_coords(traj, chunk_size=7)
+        assert_allclose(unwrapped - unwrapped[0], cart_coords - cart_coords[0], atol=1e-10)
+
+        traj.to_displacements()
+        assert_allclose(get_unwrapped_coords(traj), unwrapped, atol=1e-10)
+        assert get_unwrapped_coords(self.traj, "Li").shape == (100, 38, 3)
+
+    def test_msd(self):
+        coords = self.unwrapped
+        n_frames = len(coords)
+        expected = [((coords[lag:] - coords[: n_frames - lag]) ** 2).sum(axis=-1).mean() for lag in range(n_frames)]
+        assert_allclose(get_msd(self.traj), expected, atol=1e-10)
+        assert_allclose(get_msd(self.traj, n_jobs=2), expected, atol=1e-10)
+        assert get_msd(self.traj, "Si", per_site=True).shape == (100, 38)
+
+    def test_diffusivity(self):
+        # Brownian motion with D = 1e-4 cm^2/s = 1e-3 A^2/fs, time step 1 fs
+        rng = np.random.default_rng(0)
+        steps = rng.normal(scale=np.sqrt(2 * 1e-3), size=(2000, 200, 3))
+        traj = Trajectory(species=["Li"] * 200, coords=np.cumsum(steps, axis=0), charge=0, time_step=1)
+        assert get_diffusivity(traj) == approx(1e-4, rel=0.1)
+
+        with pytest.raises(ValueError, match="time_step of the trajectory is needed"):
+            get_diffusivity(Trajectory(species=["Li"], coords=[[[0, 0, 0]], [[1, 0, 0]]], charge=0))
+
+    def test_vacf(self):
+        velocities = np.diff(self.unwrapped, axis=0) / self.traj.time_step
+        n_frames = len(velocities)
+        expected = [(velocities[lag:] * velocities[: n_frames - lag]).sum(axis=-1).mean() for lag in range(n_frames)]
+        assert_allclose(get_vacf(self.traj, normalize=False), expected, atol=1e-12)
+        vacf = get_vacf(self.traj, velocities=velocities, n_jobs=2)
+        assert vacf[0] == approx(1)
+        assert_allclose(vacf, np.array(expected) / expected[0], atol=1e-10)
+
+    def test_rdf(self):
+        # Randomly placed sites have g(r) = 1
+        rng = np.random.default_rng(0)
+        traj = Trajectory(species=["Li"] * 100, coords=rng.random((20, 100, 3)), lattice=Lattice.cubic(10).matrix)
+        r, g_r = get_rdf(traj, r_max=5, n_bins=10, chunk_size=6)
+        assert_allclose(r, np.arange(0.25, 5, 0.5))
+        assert g_r[5:].mean() == approx(1, abs=0.05)
+
+        # Compare with distances from Structure
+        r, g_r = get_rdf(self.traj, r_max=4, n_bins=8, species1="Li", species2="Si", frames=slice(0, 10, 3))
+        hist = np.zeros(8)
+        density = 0
+        for struct in self.traj[0:10:3]:
+            li_idx = [idx for idx, site in enumerate(struct) if site.specie.symbol == "Li"]
+            si_idx = [idx for idx, site in enumerate(struct) if site.specie.symbol == "Si"]
+            hist += np.histogram(struct.distance_matrix[np.ix_(li_idx, si_idx)], bins=8, range=(0, 4))[0]
+            density += len(li_idx) * len(si_idx) / struct.volume
+        shell_volumes = 4 / 3 * np.pi * np.diff(np.linspace(0, 4, 9) ** 3)
+        # Distance matrix has only the nearest images, equivalent below half the shortest cell length
+        assert_allclose(g_r[:4], (hist / (density * shell_volumes))[:4])
+
+        with pytest.raises(ValueError, match="only implemented for Structure-based"):
+            get_rdf(Trajectory(species=["Li"], coords=[[[0, 0, 0]]], charge=0))
+
+    def test_disk_trajectory(self):
+        disk_traj = DiskTrajectory.from_trajectory("traj", self.traj, chunk_size=30)
+        assert_allclose(get_msd(disk_traj), get_msd(self.traj))
+        assert_allclose(get_rdf(disk_traj, r_max=4, n_jobs=2)[1], get_rdf(self.traj, r_max=4)[1])
+
+    def test_species_error(self):
+        with pytest.raises(ValueError, match="No sites of species="):
+            get_msd(self.traj, "Na")
@@ -6,6 +6,10 @@ Created on Nov 10, 2012.
 
 from __future__ import annotations
 
+import pickle
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
@@ -483,6 +487,17 @@ class TestComposition(MatSciTest):
             self.serialize_with_pickle(comp)
             self.serialize_with_pickle(comp.as_data_dict())
 
+        # Cached hashes are not pickled, as hashes of Species differ between processes
+        comp = Composition({Species("Fe", 2): 1, Species("O", -2): 1})
+        assert hash(comp) == hash(Composition(comp))
+        assert comp.reduced_composition == comp
+        code = (
+            "import pickle, sys; from pymatgen.core import Composition; "
+            "comp = pickle.loads(sys.stdin.buffer.read()); print(comp in {Composition(comp)})"
+        )
+        result = subprocess.run([sys.executable, "-c", code], input=pickle.dumps(comp), capture_output=True, check=True)
+        assert result.stdout.decode().strip() == "True"
+
     def test_as_data_dict(self):
         comp = Composition("Fe0.00009Ni0.99991")
         dct = comp.as_data_dict()
@@ -661,6 +676,12 @@ class TestComposition(MatSciTest):
         # missing V4+, but can balance due to additional sites
         assert Composition("V2O4").oxi_state_guesses(oxi_states_override={"V": [2, 3, 5]}) == ({"V": 4, "O": -2},)
 
+        # fractional oxidation states in the override
+        assert Composition("V2O5").oxi_state_guesses(oxi_states_override={"V": [2.5, 5, 0.1]}) == ({"V": 5, "O": -2},)
+        assert Composition("Fe3O4").oxi_state_guesses(oxi_states_override={"Fe": [2.5, 8 / 3, 2, 3]}) == (
+            {"Fe": 8 / 3, "O": -2},
+        )
+
         # multiple solutions - Mn/Fe = 2+/4+ or 3+/3+ or 4+/2+
         MnFeO3 = Composition("MnFeO3")
         MnFeO3_guesses = MnFeO3.oxi_state_guesses(oxi_states_override={"Mn": [2, 3, 4], "Fe": [2, 3, 4]})
@@ -701,6 +722,20 @@ class TestComposition(MatSciTest):
         with pytest.raises(ValueError, match="Composition V2 O3 cannot accommodate max_sites setting"):
             Composition("V2O3").oxi_state_guesses(max_sites=1)
 
+    def test_oxi_state_guesses_many_sites(self):
+        # too many site combinations to enumerate, should timeout if not solved per charge total
+        guesses = Composition("V30Mo20W10O150").oxi_state_guesses()
+        assert len(guesses) == 496
+        assert guesses[0] == approx({"V": 4.933333, "Mo": 6, "W": 3.2, "O": -2})
+
+        _, oxi_combos = Composition("Fe3O4")._get_oxi_state_guesses(False, None, None, 0)
+        assert oxi_combos[0] == {"Fe": (2, 3, 3), "O": (-2, -2, -2, -2)}
+
+        # results are cached, but modifying them must not affect later calls
+        guesses = Composition("Fe3O4").oxi_state_guesses()
+        guesses[0]["Fe"] = 0
+        assert Composition("Fe3O4").oxi_state_guesses() == ({"Fe": 8 / 3, "O": -2},)
+
     def test_oxi_state_decoration(self):
         # Basic test: Get compositions where each element is in a single charge state
         decorated = Composition("H2O").add_charges_from_oxi_state_guesses()
@@ -872,6 +907,31 @@ class TestComposition(MatSciTest):
         }.items():
             assert Composition(formula).formula == expected
 
+    def test_cached_formulas(self):
+        comp = Composition("Li4Fe4P4O16")
+        assert comp.get_reduced_formula_and_factor() is comp.get_reduced_formula_and_factor()
+        assert comp.get_reduced_formula_and_factor(iupac_ordering=True)[1] == 4
+        reduced_comp, factor = comp.get_reduced_composition_and_factor()
+        assert reduced_comp is comp.reduced_composition
+        assert (reduced_comp.formula, factor) == ("Li1 Fe1 P1 O4", 4)
+        assert comp.chemical_system == "Fe-Li-O-P"
+        assert hash(comp) == hash(Composition("LiFePO4"))
+
+        # parsed formulas are cached, but callers get their own dict
+        sym_amt = Composition._parse_formula("Fe2O3")
+        sym_amt["Fe"] = 5
+        assert Composition._parse_formula("Fe2O3") == {"Fe": 2, "O": 3}
+        with pytest.raises(ValueError, match="Invalid formula='12'"):
+            Composition("12")
+
+    def test_arithmetic_mixed_element_species(self):
+        # amounts of Element and Species keys with the same symbol are kept separate
+        comp = Composition({"Fe": 1, "Fe2+": 1, "O": 1})
+        assert (comp * 2).as_dict() == {"Fe": 2, "Fe2+": 2, "O": 2}
+        assert (comp / 2).as_dict() == {"Fe": 0.5, "Fe2+": 0.5, "O": 0.5}
+        assert (comp + comp).as_dict() == (comp * 2).as_dict()
+        assert (comp * 2 - comp).as_dict() == comp.as_dict()
+
 
 def test_reduce_formula():
     assert reduce_formula({"Li": 2, "Mn": 4, "O": 8}) == ("LiMn2O4", 2)
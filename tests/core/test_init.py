@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import pymatgen.core
+from pymatgen.core import Structure
+from pymatgen.core.structure import Structure as _Structure
+
+
+def test_lazy_imports():
+    """Importing pymatgen.core should not import its submodules until needed."""
+    code = (
+        "import sys, pymatgen.core, pymatgen.io.vasp; "
+        "print(sorted(mod for mod in sys.modules if mod.startswith('pymatgen.')))"
+    )
+    modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert modules.strip() == "['pymatgen.core', 'pymatgen.io', 'pymatgen.io.vasp']"
+
+    assert Structure is _Structure
+    assert pymatgen.core.Lattice.cubic(3).volume == pytest.approx(27)
+    assert pymatgen.core.periodic_table.Element.Fe.Z == 26
+    assert {"Composition", "Structure", "SETTINGS"} <= set(dir(pymatgen.core))
+    with pytest.raises(AttributeError, match="module 'pymatgen.core' has no attribute 'foo'"):
+        _ = pymatgen.core.foo
+
+
+def test_star_imports():
+    """Star imports export the lazily imported classes."""
+    for module, names in (("pymatgen.core", {"Structure", "Element", "SETTINGS"}), ("pymatgen.io.vasp", {"Vasprun"})):
+        namespace: dict = {}
+        exec(f"from {module} import *", namespace)  # noqa: S102
+        assert names <= set(namespace)
+    assert namespace["Vasprun"].__module__ == "pymatgen.io.vasp.outputs"
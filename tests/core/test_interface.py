@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 from pytest import approx
 
@@ -264,6 +265,14 @@ class TestGrainBoundaryGenerator(MatSciTest):
         assert sorted(true_111) == sorted(sigma_222)
         assert sorted(true_111) == sorted(sigma_888)
 
+        # sigma tables are cached, the returned ones must be safe to modify
+        sigmas = GrainBoundaryGenerator.enum_sigma_cubic(50, (1, 0, 0))
+        sigmas[5].append(0.0)
+        del sigmas[13]
+        sigmas = GrainBoundaryGenerator.enum_sigma_cubic(50, [1, 0, 0])
+        assert list(sigmas) == [5, 17, 13, 37, 25, 41, 29]
+        assert_allclose(sigmas[5], [53.13010235415597, 36.86989764584402, 126.86989764584402, 143.13010235415598])
+
     def test_enum_sigma_hex(self):
         true_100 = [17, 18, 22, 27, 38, 41]
         true_001 = [7, 13, 19, 31, 37, 43, 49]
@@ -330,6 +339,19 @@ class TestGrainBoundaryGenerator(MatSciTest):
         angle = GrainBoundaryGenerator.get_rotation_angle_from_sigma(6, [1, 0, 0], lat_type="o", ratio=[270, 30, 29])
         assert_allclose(close_angle, angle)
 
+    def test_gb_from_sigmas(self):
+        gbs = self.GB_Cu_conv.gb_from_sigmas([13, 5], [1, 0, 0], expand_times=1, n_jobs=2)
+        assert list(gbs) == [13, 5]
+        assert [len(gbs[sigma]) for sigma in gbs] == [4, 4]
+        for sigma, sigma_gbs in gbs.items():
+            angles = [gb.rotation_angle for gb in sigma_gbs]
+            assert_allclose(angles, GrainBoundaryGenerator.get_rotation_angle_from_sigma(sigma, [1, 0, 0]))
+            assert {gb.sigma for gb in sigma_gbs} == {sigma}
+        assert gbs[13][1] == self.GB_Cu_conv.gb_from_parameters([1, 0, 0], gbs[13][1].rotation_angle, expand_times=1)
+
+        with pytest.raises(ValueError, match=r"\[7\] are not possible sigma values"):
+            self.GB_Cu_conv.gb_from_sigmas([5, 7], [1, 0, 0])
+
 
 class TestInterface(MatSciTest):
     def setup_method(self):
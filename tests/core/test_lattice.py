@@ -7,7 +7,13 @@ import pytest
 from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
-from pymatgen.core.lattice import Lattice, get_points_in_spheres
+from pymatgen.core.lattice import (
+    Lattice,
+    _lll_reduce,
+    _niggli_reduce_metric,
+    find_points_in_spheres_batch,
+    get_points_in_spheres,
+)
 from pymatgen.core.operations import SymmOp
 from pymatgen.util.testing import MatSciTest
 
@@ -225,6 +231,14 @@ class TestLattice(MatSciTest):
             reduced_random_latt = random_latt.get_lll_reduced_lattice()
             assert reduced_random_latt.volume == approx(random_latt.volume)
 
+        # delta is passed through to the reduction and results are cached per delta
+        lattice = Lattice([[1, 0, 0], [0.4, 0.75, 0], [0, 0, 1]])
+        assert_allclose(lattice.get_lll_reduced_lattice(delta=0.25).matrix, lattice.matrix)
+        assert_allclose(
+            lattice.get_lll_reduced_lattice(delta=0.99).matrix, [[0.4, 0.75, 0], [0.6, -0.75, 0], [0, 0, 1]]
+        )
+        assert_allclose(lattice.get_lll_reduced_lattice(delta=0.25).matrix, lattice.matrix)
+
     def test_get_niggli_reduced_lattice(self):
         lattice = Lattice.from_parameters(3, 5.196, 2, 103 + 55 / 60, 109 + 28 / 60, 134 + 53 / 60)
         reduced_cell = lattice.get_niggli_reduced_lattice()
@@ -274,6 +288,28 @@ class TestLattice(MatSciTest):
         ]
         assert_allclose(lattice.get_niggli_reduced_lattice().matrix, expected, atol=1e-5)
 
+        # Repeated calls reuse the cached matrix but return independent lattices
+        reduced_cell = lattice.get_niggli_reduced_lattice()
+        assert reduced_cell is not lattice.get_niggli_reduced_lattice()
+        assert_allclose(reduced_cell.matrix, lattice.get_niggli_reduced_lattice().matrix)
+        assert not np.allclose(lattice.get_niggli_reduced_lattice(tol=0.5).matrix, expected, atol=1e-5)
+
+    def test_compiled_reduction_kernels(self):
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            matrix = rng.normal(size=(3, 3)) * 5
+            for compiled, python in zip(_lll_reduce(matrix, 0.75), _lll_reduce.py_func(matrix, 0.75), strict=True):
+                assert_allclose(compiled, python)
+
+            metric = np.dot(matrix, matrix.T)
+            params = (metric[0, 0], metric[1, 1], metric[2, 2], 2 * metric[1, 2], 2 * metric[0, 2], 2 * metric[0, 1])
+            assert_allclose(_niggli_reduce_metric(params, 1e-5), _niggli_reduce_metric.py_func(params, 1e-5))
+
+        lattice = Lattice.cubic(3)
+        assert_allclose(lattice.get_lll_reduced_lattice().matrix, lattice.matrix)
+        assert_allclose(lattice.get_niggli_reduced_lattice().matrix, lattice.matrix, atol=1e-12)
+
     def test_find_mapping(self):
         matrix = [[0.1, 0.2, 0.3], [-0.1, 0.2, 0.7], [0.6, 0.9, 0.2]]
         lattice = Lattice(matrix)
@@ -487,6 +523,11 @@ class TestLattice(MatSciTest):
         output3 = lattice_pbc.get_all_distances(frac_coords[:-1], frac_coords)
         assert_allclose(output3, expected_pbc, 3)
 
+        # computing blocks of rows gives the same distances
+        for block_size in (1, 2, 5):
+            assert_allclose(lattice.get_all_distances(frac_coords, frac_coords, block_size=block_size), output)
+        assert_allclose(lattice_pbc.get_all_distances(frac_coords[:-1], frac_coords, block_size=3), output3)
+
     def test_monoclinic(self):
         assert self.monoclinic.angles == approx([90, 66, 90])
         assert self.monoclinic.lengths == approx([10, 20, 30])
@@ -618,6 +659,27 @@ class TestLattice(MatSciTest):
         )
         assert len(nns[0]) == 4
 
+    def test_find_points_in_spheres_batch(self):
+        coords = [[[0.0, 0.0, 0.0], [2.0, 2.0, 2.0]], [[0.5, 0.5, 0.5]]]
+        lattices = [Lattice.cubic(3).matrix, Lattice.cubic(4).matrix]
+        centers, points, images, distances, offsets = find_points_in_spheres_batch(coords, lattices, r=4.5)
+        assert_array_equal(offsets, [0, 58, 64])
+        assert images.shape == (64, 3)
+        assert_allclose(distances[58:], 4)
+        assert_array_equal(centers[58:], 0)
+        assert_array_equal(points[58:], 0)
+
+        # packed coordinates, per-system pbc and threads give the same result
+        results = find_points_in_spheres_batch(
+            np.concatenate(coords), lattices, r=4.5, pbc=[[1, 1, 1], [1, 1, 0]], n_points=[2, 1], n_workers=2
+        )
+        assert_array_equal(results[4], [0, 58, 62])
+        for arr1, arr2 in zip(results[:4], (centers, points, images, distances), strict=True):
+            assert_allclose(arr1[:58], arr2[:58])
+
+        with pytest.raises(ValueError, match=r"sum\(n_points\)=4 does not match the 3 packed coordinates"):
+            find_points_in_spheres_batch(np.concatenate(coords), lattices, r=3, n_points=[2, 2])
+
     def test_selling_dist(self):
         # verification process described here
         # https://github.com/materialsproject/pymatgen/pull/1888#issuecomment-818072164
@@ -5,7 +5,7 @@ import pytest
 from numpy.testing import assert_allclose
 from pytest import approx
 
-from pymatgen.core.operations import MagSymmOp, SymmOp
+from pymatgen.core.operations import MagSymmOp, SymmOp, SymmOpSet
 from pymatgen.electronic_structure.core import Magmom
 from pymatgen.util.testing import MatSciTest
 
@@ -239,6 +239,58 @@ class TestSymmOp(MatSciTest):
         assert_allclose(symm_op.translation_vector, [0.5, 0.25, 0.75])
 
 
+class TestSymmOpSet(MatSciTest):
+    def setup_method(self):
+        self.ops = [
+            SymmOp.from_xyz_str("x, y, z"),
+            SymmOp.from_xyz_str("-y, x-y, z"),
+            SymmOp.from_xyz_str("-x, -y, -z+1/2"),
+            SymmOp.from_axis_angle_and_translation([0, 0, 1], 30, translation_vec=[0, 0, 1]),
+        ]
+        self.op_set = SymmOpSet(self.ops)
+
+    def test_sequence(self):
+        assert len(self.op_set) == 4
+        assert self.op_set[1] is self.ops[1]
+        assert list(self.op_set) == self.ops
+        assert self.op_set.rotations.shape == (4, 3, 3)
+        assert_allclose(self.op_set.translations[2], [0, 0, 0.5])
+
+        op_set = SymmOpSet.from_rotations_and_translations(self.op_set.rotations, self.op_set.translations)
+        assert list(op_set) == self.ops
+
+    def test_operate_multi(self):
+        points = np.random.default_rng(0).random((5, 3))
+        new_points = self.op_set.operate_multi(points)
+        assert new_points.shape == (4, 5, 3)
+        for op, op_points in zip(self.ops, new_points, strict=True):
+            assert_allclose(op_points, op.operate_multi(points))
+        assert_allclose(self.op_set.operate_multi(points[0]), [op.operate(points[0]) for op in self.ops])
+        assert_allclose(
+            self.op_set.apply_rotation_only(points[0]), [op.apply_rotation_only(points[0]) for op in self.ops]
+        )
+
+    def test_get_orbits(self):
+        op_set = SymmOpSet(self.op_set[:3])
+        general, special = op_set.get_orbits([[0.1, 0.2, 0.3], [0, 0, 0.25]])
+        assert_allclose(general, [[0.1, 0.2, 0.3], [0.8, 0.9, 0.3], [0.9, 0.8, 0.2]])
+        assert_allclose(special, [[0, 0, 0.25]])
+        assert len(op_set.get_orbits([[0, 0, 0.25]], wrap=False)[0]) == 1
+
+    def test_are_symmetrically_related_vectors(self):
+        from_a, to_a, r_a = np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.1, 0.2]), np.array([0, 1, 0])
+        for from_b, to_b, r_b in [
+            (self.ops[1].operate(from_a), self.ops[1].operate(to_a), self.ops[1].apply_rotation_only(r_a)),
+            (from_a, to_a, r_a),
+            ([0.5, 0.5, 0.5], to_a, r_a),
+        ]:
+            from_b, to_b = np.mod(from_b, 1), np.mod(to_b, 1)
+            related, reversed_ = self.op_set.are_symmetrically_related_vectors(from_a, to_a, r_a, from_b, to_b, r_b)
+            expected = [op.are_symmetrically_related_vectors(from_a, to_a, r_a, from_b, to_b, r_b) for op in self.ops]
+            assert related.tolist() == [exp[0] for exp in expected]
+            assert reversed_.tolist() == [exp[1] for exp in expected]
+
+
 class TestMagSymmOp(MatSciTest):
     def test_xyzt_string(self):
         xyzt_strings = ["x, y, z, +1", "x, y, z, -1", "-y+1/2, x+1/2, x+1/2, +1"]
@@ -27,6 +27,9 @@ from pymatgen.core.structure import (
     PeriodicNeighbor,
     Structure,
     StructureError,
+    _get_translation_supercell_matrix,
+    _relax_idpp,
+    get_neighbor_lists,
 )
 from pymatgen.electronic_structure.core import Magmom
 from pymatgen.io.ase import AseAtomsAdaptor
@@ -376,6 +379,47 @@ class TestIStructure(MatSciTest):
         assert new_struct.properties["another_prop"] == "test"
         assert new_struct.properties["test_property"] == "test"
 
+    def test_columnar_sites(self):
+        si4, mn = Species("Si", 4), Element("Mn")
+        struct = IStructure(
+            self.lattice,
+            ["Li", {si4: 0.5, mn: 0.5}, "Li"],
+            [[0, 0, 0], [0.75, 0.5, 0.75], [1.25, -0.5, 0.5]],
+            site_properties={"magmom": [1, 2, 3]},
+            labels=["a", None, "c"],
+        )
+        # array-backed accessors do not create PeriodicSite objects
+        assert struct._site_columns is not None
+        assert len(struct) == 3
+        assert_allclose(struct.frac_coords[2], [1.25, -0.5, 0.5])
+        assert_allclose(struct.cart_coords, self.lattice.get_cartesian_coords(struct.frac_coords))
+        assert struct.site_properties == {"magmom": [1, 2, 3]}
+        assert struct.labels == ["a", "Mn:0.5, Si4+:0.5", "c"]
+        assert struct.composition == Composition({"Li": 2, si4: 0.5, mn: 0.5})
+        assert not struct.is_ordered
+        assert len(struct._site_columns.species_table) == 2
+        dct = struct.as_dict()
+        assert struct._site_columns is not None
+
+        # sites are materialized on access and match the eager construction
+        site = struct[1]
+        assert struct._site_columns is None
+        assert site.species == Composition({si4: 0.5, mn: 0.5})
+        assert site.magmom == 2
+        assert struct.as_dict() == dct
+        assert IStructure.from_dict(dct) == struct
+
+        # in-place site modifications survive on mutable structures
+        struct = Structure(self.lattice, ["Si"] * 2, [[0, 0, 0], [0.75, 0.5, 0.75]], to_unit_cell=True)
+        struct.lattice = Lattice.cubic(5)
+        assert struct._site_columns is not None
+        struct[0].frac_coords = [0.5, 0.5, 0.5]
+        assert_allclose(struct.frac_coords[0], [0.5, 0.5, 0.5])
+        assert struct[1].lattice == Lattice.cubic(5)
+
+        with pytest.raises(StructureError, match="Site property 'magmom' has 1 values for 2 sites"):
+            IStructure(self.lattice, ["Si"] * 2, [[0, 0, 0]] * 2, site_properties={"magmom": [1]})
+
     def test_interpolate(self):
         coords = [[0, 0, 0], [0.75, 0.5, 0.75]]
         struct = IStructure(self.lattice, ["Si"] * 2, coords)
@@ -550,6 +594,43 @@ class TestIStructure(MatSciTest):
             assert struct2.volume >= int_s[1].volume
             assert int_s[1].volume <= struct1.volume
 
+    def test_interpolate_idpp(self):
+        # Vacancy hop in fcc Al, where the linear path squeezes the moving atom
+        # between its neighbors
+        coords = [[0, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0.5], [0, 0.5, 0.5]]
+        fcc_al = Structure(Lattice.cubic(4.05), ["Al"] * 4, coords) * 2
+        start = fcc_al.copy()
+        start.remove_sites([0])
+        end = start.copy()
+        end[7] = "Al", [0, 0, 0]
+
+        linear = start.interpolate(end, 6)
+        images = start.interpolate(end, 6, idpp=True)
+        assert len(images) == 7
+        assert_allclose(images[0].frac_coords, start.frac_coords)
+        assert_allclose(images[-1].frac_coords, end.frac_coords)
+
+        def min_dist(struct):
+            return np.min(struct.distance_matrix[np.triu_indices(len(struct), 1)])
+
+        assert min_dist(linear[3]) == approx(2.48, abs=1e-2)
+        assert min_dist(images[3]) > min_dist(linear[3]) + 0.1
+        # The path stays symmetric about the middle image
+        assert min_dist(images[1]) == approx(min_dist(images[5]), abs=1e-2)
+
+        with pytest.warns(UserWarning, match="IDPP relaxation did not converge within 2 iterations"):
+            start.interpolate(end, 6, idpp=True, idpp_kwargs={"max_iter": 2})
+
+        # Sites many cells apart (unwrapped coords) relax as their minimum images do
+        frac_coords = np.array([image.frac_coords for image in linear])
+        lattices = np.array([image.lattice.matrix for image in linear])
+        fractions = np.linspace(0, 1, len(linear))
+        relaxed = _relax_idpp(frac_coords, lattices, (True, True, True), fractions, max_iter=50)
+        frac_coords[:, 0] += 200
+        relaxed_shifted = _relax_idpp(frac_coords, lattices, (True, True, True), fractions, max_iter=50)
+        relaxed[:, 0] += 200
+        assert_allclose(relaxed_shifted, relaxed, atol=1e-8)
+
     def test_get_primitive_structure(self):
         coords = [[0, 0, 0], [0.5, 0.5, 0], [0, 0.5, 0.5], [0.5, 0, 0.5]]
         fcc_ag = IStructure(Lattice.cubic(4.09), ["Ag"] * 4, coords)
@@ -587,6 +668,25 @@ class TestIStructure(MatSciTest):
         assert len(fcc_ag_prim) == 1
         assert fcc_ag_prim.volume == approx(17.10448225)
 
+        # Skewed supercell is reduced in one pass, perturbed one is returned unchanged
+        skewed = fcc_ag * [[2, 1, 0], [0, 3, 1], [1, 0, 2]]
+        assert len(skewed) == 13 * 32
+        prim = skewed.get_primitive_structure()
+        assert len(prim) == 1
+        assert prim.volume == approx(17.10448225)
+        fcc_ag.perturb(0.5, min_distance=0.3, seed=0)
+        assert fcc_ag.get_primitive_structure() == fcc_ag
+
+    def test_get_translation_supercell_matrix(self):
+        supercell_matrix = np.array([[2, 1, 0], [0, 1, 0], [0, 0, 3]])
+        basis = np.linalg.inv(supercell_matrix)
+        trans_vecs = np.array([np.dot(idx, basis) for idx in itertools.product(range(6), range(6), range(6))])
+        trans_vecs = np.unique(np.round(trans_vecs % 1, 8) % 1, axis=0)
+        assert len(trans_vecs) == 6
+        assert_array_equal(_get_translation_supercell_matrix(trans_vecs), supercell_matrix)
+        # Not closed under addition
+        assert _get_translation_supercell_matrix(trans_vecs[:4]) is None
+
     def test_primitive_with_constrained_lattice(self):
         struct = Structure.from_file(f"{TEST_FILES_DIR}/core/structure/Fe310.json.gz")
         constraints = {"a": 2.83133, "b": 4.69523, "gamma": 107.54840}
@@ -714,6 +814,53 @@ Direct
             assert_allclose(cy_indices2, py_indices2)
             assert len(cy_offsets) == len(py_offsets)
 
+    def test_get_neighbor_lists(self):
+        structs = [self.struct, self.get_structure("Li2O"), self.get_structure("LiFePO4")]
+        for n_workers in (1, 2):
+            *neighbor_lists, offsets = get_neighbor_lists(structs, 3, n_workers=n_workers)
+            assert len(offsets) == len(structs) + 1
+            for idx, struct in enumerate(structs):
+                rows = slice(offsets[idx], offsets[idx + 1])
+                for arr1, arr2 in zip(neighbor_lists, struct.get_neighbor_list(3), strict=True):
+                    assert_allclose(arr1[rows], arr2)
+
+    def test_neighbor_cache(self):
+        def sorted_neighbor_list(neighbor_list):
+            centers, points, images, distances = neighbor_list
+            order = np.lexsort((distances.round(8), points, centers))
+            return centers[order], points[order], images[order], distances[order]
+
+        struct = Structure.from_sites(self.get_structure("LiFePO4"))
+        expected = {r: sorted_neighbor_list(struct.get_neighbor_list(r)) for r in (4, 2.5, 0.5)}
+        assert struct.enable_neighbor_cache() is struct
+        for r in (4, 2.5, 0.5):
+            for arr1, arr2 in zip(sorted_neighbor_list(struct.get_neighbor_list(r)), expected[r], strict=True):
+                assert_allclose(arr1, arr2)
+        # smaller cutoffs are answered from the cached r=4 list
+        assert list(struct._neighbor_cache) == [1e-8]
+        assert struct._neighbor_cache[1e-8].r == 4
+
+        neighbors = struct.get_neighbors(struct[3], 2.5)
+        assert sorted(nn.index for nn in neighbors) == sorted(expected[2.5][1][expected[2.5][0] == 3])
+
+        struct.translate_sites([0], [0.1, 0, 0])
+        assert struct._neighbor_cache == {}
+        struct.get_neighbor_list(3)
+        struct.apply_strain(0.01)
+        assert struct._neighbor_cache == {}
+        struct.get_neighbor_list(3)
+        struct[0] = "Na"
+        assert struct._neighbor_cache == {}
+        for arr1, arr2 in zip(
+            sorted_neighbor_list(struct.get_neighbor_list(3)),
+            sorted_neighbor_list(struct._get_neighbor_list(3)),
+            strict=True,
+        ):
+            assert_allclose(arr1, arr2)
+
+        struct.enable_neighbor_cache(enable=False)
+        assert struct._neighbor_cache is None
+
     @pytest.mark.xfail(reason="TODO: need someone to fix this")
     @pytest.mark.skipif(not os.getenv("CI"), reason="Only run this in CI tests")
     def test_get_all_neighbors_crosscheck_old(self):
@@ -889,6 +1036,28 @@ Direct
     def test_get_dist_matrix(self):
         assert_allclose(self.struct.distance_matrix, [[0.0, 2.3516318], [2.3516318, 0.0]])
 
+    def test_get_distance_matrix_blocked(self):
+        struct = self.get_structure("LiFePO4") * 2
+        dist_mat = struct.get_distance_matrix(max_memory=None)
+        assert_allclose(struct.get_distance_matrix(max_memory=1e4), dist_mat)
+        assert_allclose(struct.distance_matrix, dist_mat)
+
+    def test_get_sparse_distance_matrix(self):
+        struct = self.get_structure("LiFePO4")
+        dist_mat = struct.distance_matrix
+        sparse = struct.get_sparse_distance_matrix(3.5)
+        assert sparse.shape == dist_mat.shape
+
+        within = (dist_mat <= 3.5) & ~np.eye(len(struct), dtype=bool)
+        assert sparse.nnz == within.sum()
+        dense = sparse.toarray()
+        assert_allclose(dense[within], dist_mat[within])
+        assert not dense[~within].any()
+
+        # Only the shortest image of a pair is kept, even if other images are within the cutoff
+        small = IStructure(Lattice.cubic(2), ["Si", "Si"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        assert_allclose(small.get_sparse_distance_matrix(5).toarray(), [[0, 3**0.5], [3**0.5, 0]])
+
     def test_to_from_file_and_string(self):
         for fmt in ("cif", "json", "poscar", "cssr", "pwmat"):
             struct = self.struct.to(fmt=fmt)
@@ -1573,6 +1742,27 @@ class TestStructure(MatSciTest):
         assert len(self.struct) == orig_len
         assert len(supercell) == 2 * orig_len
 
+    def test_make_supercell_site_order(self):
+        struct = self.struct.copy()
+        struct.add_site_property("magmom", [1, -1])
+        struct[1] = "Ge"  # materialized sites
+        supercell = struct * [[1, 1, 0], [-1, 1, 0], [0, 0, 2]]
+
+        # All images of a site are consecutive and keep its species and properties
+        assert [site.specie.symbol for site in supercell] == ["Si"] * 4 + ["Ge"] * 4
+        assert supercell.site_properties["magmom"] == [1] * 4 + [-1] * 4
+        assert supercell.labels == [label for label in struct.labels for _ in range(4)]
+        assert np.all((supercell.frac_coords >= 0) & (supercell.frac_coords < 1))
+        shifts = struct.lattice.get_fractional_coords(supercell.cart_coords[:4] - struct.cart_coords[0])
+        assert_allclose(shifts, np.round(shifts), atol=1e-8)
+
+        # make_supercell matches __mul__ and keeps the structure columnar
+        struct.make_supercell([[1, 1, 0], [-1, 1, 0], [0, 0, 2]])
+        assert struct._site_columns is not None
+        assert struct.lattice == supercell.lattice
+        assert_allclose(struct.frac_coords, supercell.frac_coords)
+        assert struct.site_properties == supercell.site_properties
+
     def test_make_supercell_labeled(self):
         struct = self.labeled_structure.copy()
         struct.make_supercell([1, 1, 2])
@@ -2193,6 +2383,24 @@ class TestIMolecule(MatSciTest):
     def test_get_covalent_bonds(self):
         assert len(self.mol.get_covalent_bonds()) == 4
 
+    def test_get_covalent_bond_indices(self):
+        # C-H bonds of methane, site 0 is C
+        assert self.mol.get_covalent_bond_indices().tolist() == [[0, 1], [0, 2], [0, 3], [0, 4]]
+        assert len(self.mol.get_covalent_bond_indices(tol=0.5)) == 4
+
+        # Two methanes far apart are not bonded to each other, bonds of the second are offset
+        two_mols = Molecule(
+            self.mol.species * 2, np.concatenate([self.mol.cart_coords, self.mol.cart_coords + [50, 0, 0]])
+        )
+        bond_indices = two_mols.get_covalent_bond_indices()
+        assert bond_indices.tolist() == [[0, idx] for idx in range(1, 5)] + [[5, idx] for idx in range(6, 10)]
+        assert [(two_mols.index(bond.site1), two_mols.index(bond.site2)) for bond in two_mols.get_covalent_bonds()] == [
+            tuple(pair) for pair in bond_indices.tolist()
+        ]
+
+        with pytest.raises(ValueError, match="No bond data for elements Fe - H"):
+            Molecule(["Fe", "H"], [[0, 0, 0], [0, 0, 20]]).get_covalent_bond_indices()
+
     def test_properties(self):
         assert len(self.mol) == 5
         assert self.mol.is_ordered
@@ -2261,6 +2469,13 @@ Site: H (-0.5134, 0.8892, -0.3630)"""
         assert str(no_reorder[0].specie) == "C"
         assert_allclose(no_reorder[2].frac_coords, [0.60267191, 0.5, 0.4637])
 
+        # Randomly rotated images keep min_dist across periodic boundaries
+        s4 = self.mol.get_boxed_structure(4, 4, 4, (2, 2, 2), random_rotation=True, min_dist=1, reorder=False)
+        dist_mat = s4.distance_matrix
+        for idx in range(8):
+            dist_mat[5 * idx : 5 * idx + 5, 5 * idx : 5 * idx + 5] = np.inf
+        assert dist_mat.min() > 1
+
     def test_get_distance(self):
         assert self.mol.get_distance(0, 1) == approx(1.089)
 
@@ -15,6 +15,9 @@ from pymatgen.core.surface import (
     ReconstructionGenerator,
     Slab,
     SlabGenerator,
+    _get_slab_fingerprint,
+    _group_equivalent_slabs,
+    _may_be_equivalent,
     generate_all_slabs,
     get_d,
     get_slab_regions,
@@ -515,6 +518,28 @@ class TestSlabGenerator(MatSciTest):
         for n_a in n_atoms:
             assert n_atoms[0] == n_a
 
+    def test_group_equivalent_slabs(self):
+        # Prefiltered grouping gives the same groups in the same order as the StructureMatcher
+        gen = SlabGenerator(self.get_structure("LiFePO4"), [0, 1, 0], 10, 10)
+        slabs = gen.get_slabs(filter_out_sym_slabs=False)
+        matcher = StructureMatcher(ltol=0.1, stol=0.1, primitive_cell=False, scale=False)
+        expected = [[slabs.index(slab) for slab in group] for group in matcher.group_structures(slabs)]
+        groups = _group_equivalent_slabs(slabs, 0.1)
+        assert [[slabs.index(slab) for slab in group] for group in groups] == expected
+
+        # Layer profiles only rule out matches beyond the matcher tolerances
+        cscl = Structure.from_spacegroup("Pm-3m", Lattice.cubic(4.2), ["Cs", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        slab = SlabGenerator(cscl, [1, 1, 1], 10, 10).get_slab()
+        fingerprint = _get_slab_fingerprint(slab)
+        assert _may_be_equivalent(fingerprint, fingerprint, 0.1, 0.1)
+        for shift, may_match in [(0.01, True), (2, False)]:
+            moved = slab.copy()
+            moved.translate_sites([0], shift * slab.normal, frac_coords=False)
+            assert _may_be_equivalent(fingerprint, _get_slab_fingerprint(moved), 0.1, 0.1) is may_match
+        removed = slab.copy()
+        removed.remove_sites([0])
+        assert not _may_be_equivalent(fingerprint, _get_slab_fingerprint(removed), 0.1, 0.1)
+
     def test_triclinic_TeI(self):
         # Test case for a triclinic structure of TeI. Only these three
         # Miller indices are used because it is easier to identify which
@@ -757,6 +782,8 @@ class TestMillerIndexFinder(MatSciTest):
 
         indices = get_symmetrically_distinct_miller_indices(self.cscl, 1)
         assert len(indices) == 3
+        spg_analyzer = SpacegroupAnalyzer(self.cscl)
+        assert get_symmetrically_distinct_miller_indices(self.cscl, 1, spg_analyzer=spg_analyzer) == indices
         indices = get_symmetrically_distinct_miller_indices(self.cscl, 2)
         assert len(indices) == 6
 
@@ -824,6 +851,14 @@ class TestMillerIndexFinder(MatSciTest):
         slabs = generate_all_slabs(self.cscl, 1, 10, 10, bonds={("Cs", "Cl"): 4}, max_broken_bonds=100)
         assert len(slabs) == 3
 
+        # Distributing the Miller indices over processes gives the same slabs
+        slabs = generate_all_slabs(self.lifepo4, 1, 10, 10)
+        slabs_parallel = generate_all_slabs(self.lifepo4, 1, 10, 10, n_jobs=2)
+        assert [slab.miller_index for slab in slabs_parallel] == [slab.miller_index for slab in slabs]
+        for slab, slab_parallel in zip(slabs, slabs_parallel, strict=True):
+            assert slab_parallel.shift == approx(slab.shift)
+            assert_allclose(slab_parallel.frac_coords, slab.frac_coords)
+
         slabs2 = generate_all_slabs(self.lifepo4, 1, 10, 10, bonds={("P", "O"): 3, ("Fe", "O"): 3})
         assert len(slabs2) == 0
 
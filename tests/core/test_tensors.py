@@ -298,6 +298,19 @@ class TestTensor(MatSciTest):
         empty[tkey] = 1
         assert empty[tkey] == 1
 
+        # Keys added or removed one at a time stay in sync with lookups
+        mapping = TensorMapping(tol=1e-5)
+        keys = [Tensor(np.full((3, 3), idx)) for idx in range(40)]
+        for idx, key in enumerate(keys):
+            mapping[key] = idx
+            assert mapping[key] == idx
+        del mapping[keys[3]]
+        assert keys[3] not in mapping
+        assert mapping[keys[4]] == 4
+        mapping[keys[3] + 0.5] = "new"
+        assert mapping[keys[3] + 0.5] == "new"
+        assert len(mapping) == 40
+
     def test_populate(self):
         test_data = loadfn(f"{TEST_FILES_DIR}/analysis/elasticity/test_toec_data.json")
 
@@ -457,6 +470,36 @@ class TestTensorCollection(MatSciTest):
         for t_input, tensor in zip(tc_input, tc, strict=True):
             assert_allclose(Tensor.from_voigt(t_input), tensor)
 
+    def test_mixed_collections(self):
+        # Tensors of different classes and ranks are processed in groups but keep their order
+        rng = np.random.default_rng(0)
+        tensors = [Tensor(rng.random((3, 3))), SquareTensor(rng.random((3, 3))), Tensor(rng.random((3, 3, 3, 3)))]
+        tensors += [Tensor(rng.random((3, 3, 3))), Tensor(rng.random((3, 3)))]
+        tc = TensorCollection(tensors)
+        a = 3.14 * 42.5 / 180
+        rotation = SquareTensor([[math.cos(a), 0, math.sin(a)], [0, 1, 0], [-math.sin(a), 0, math.cos(a)]])
+        for tc_mod, tensors_mod in [
+            (tc.rotate(rotation), [tensor.rotate(rotation) for tensor in tensors]),
+            (tc.fit_to_structure(self.struct), [tensor.fit_to_structure(self.struct) for tensor in tensors]),
+            (tc.symmetrized, [tensor.symmetrized for tensor in tensors]),
+            (tc.round(2), [tensor.round(2) for tensor in tensors]),
+        ]:
+            assert [type(tensor) for tensor in tc_mod] == [type(tensor) for tensor in tensors_mod]
+            for t_mod, tensor_mod in zip(tc_mod, tensors_mod, strict=True):
+                assert_allclose(t_mod, tensor_mod, atol=1e-12)
+
+        with pytest.raises(ValueError, match="Rotation matrix is not valid"):
+            tc.rotate(2 * np.eye(3))
+
+    def test_to_array(self):
+        array = self.seq_tc.to_array()
+        assert array.shape == (4, 3, 3, 3)
+        assert_allclose(array, np.arange(4 * 3**3).reshape((4, 3, 3, 3)))
+        tc = TensorCollection(np.random.default_rng().random((5, 3, 3)))
+        assert_allclose(TensorCollection(tc.to_array()).rotate(np.eye(3)).to_array(), tc.to_array())
+        with pytest.raises(ValueError, match="different ranks"):
+            self.diff_rank.to_array()
+
     def test_serialization(self):
         # Test base serialize-deserialize
         dct = self.seq_tc.as_dict()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import os
 import re
 
 import numpy as np
@@ -9,7 +10,7 @@ from numpy.testing import assert_allclose
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Molecule, Structure
-from pymatgen.core.trajectory import Trajectory
+from pymatgen.core.trajectory import DiskTrajectory, Trajectory
 from pymatgen.io.qchem.outputs import QCOutput
 from pymatgen.io.vasp.outputs import Xdatcar
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, VASP_OUT_DIR, MatSciTest
@@ -573,3 +574,181 @@ class TestTrajectory(MatSciTest):
                 match="ASE is required to write .traj files. pip install ase",
             ):
                 ase_traj = traj.to_ase()
+
+
+class TestDiskTrajectory(MatSciTest):
+    def setup_method(self):
+        self.traj = Trajectory.from_file(f"{VASP_OUT_DIR}/XDATCAR_traj")
+        species, coords, charge, spin = (["C", "O"], np.random.default_rng(0).random((4, 2, 3)), 0, 1)
+        self.traj_mols = Trajectory(
+            species=species,
+            coords=coords,
+            charge=charge,
+            spin_multiplicity=spin,
+            frame_properties=[{"energy": -float(idx)} for idx in range(4)],
+        )
+
+    def test_from_trajectory(self):
+        DiskTrajectory.from_trajectory("traj", self.traj, chunk_size=7)
+        disk_traj = DiskTrajectory("traj")
+
+        assert len(disk_traj) == len(self.traj)
+        assert isinstance(disk_traj.coords, np.memmap)
+        assert_allclose(disk_traj.coords, self.traj.coords)
+        assert_allclose(disk_traj.lattice, self.traj.lattice)
+        assert disk_traj.frame_properties is None
+        for idx in (0, 17, -1):
+            assert disk_traj[idx] == self.traj[idx]
+
+        sliced = disk_traj[2:99:3]
+        assert type(sliced) is Trajectory
+        assert all(frame1 == frame2 for frame1, frame2 in zip(sliced, self.traj[2:99:3], strict=True))
+        assert all(struct == self.traj[idx] for struct, idx in zip(disk_traj[[10, 30]], [10, 30], strict=True))
+        assert_allclose(disk_traj.to_trajectory().coords, self.traj.coords)
+        assert Trajectory.from_dict(disk_traj.as_dict())[5] == self.traj[5]
+
+        with pytest.raises(IndexError, match="out of range"):
+            disk_traj[len(self.traj)]
+        with pytest.raises(OSError, match="read-only"):
+            disk_traj.append(self.traj[0])
+        with pytest.raises(FileExistsError, match="already exists"):
+            DiskTrajectory.from_trajectory("traj", self.traj)
+
+    def test_to_displacements(self):
+        disk_traj = DiskTrajectory.from_trajectory("traj", self.traj, chunk_size=7)
+        expected = copy.deepcopy(self.traj)
+        expected.to_displacements()
+
+        disk_traj.to_displacements()
+        assert disk_traj.coords_are_displacement
+        assert_allclose(disk_traj.coords, expected.coords)
+        disk_traj.to_positions()
+        assert isinstance(disk_traj.coords, np.memmap)
+        assert_allclose(disk_traj.coords, self.traj.coords)
+
+        # Indexing and appending switch back to positions
+        disk_traj.to_displacements()
+        assert disk_traj[17] == self.traj[17]
+        disk_traj.to_displacements()
+        disk_traj.append(self.traj[0])
+        assert not disk_traj.coords_are_displacement
+        assert_allclose(disk_traj.coords[-1], self.traj.coords[0])
+
+    def test_interrupted_append(self, monkeypatch):
+        structures = list(self.traj[:3])
+        for idx, struct in enumerate(structures):
+            struct.add_site_property("forces", np.full((len(struct), 3), idx, dtype=float))
+        disk_traj = DiskTrajectory.create("traj", self.traj.species, lattice=self.traj.lattice)
+
+        def fail(*_args):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            # Fail after the first frame was written, before the manifest is updated
+            patch.setattr("pymatgen.core.trajectory._write_json_atomic", fail)
+            with pytest.raises(OSError, match="disk full"):
+                disk_traj.append(structures[0])
+
+        # The site property arrays of the first append are not in the manifest and are removed
+        disk_traj = DiskTrajectory("traj", mode="a")
+        assert sorted(os.listdir("traj")) == ["coords.bin", "frames_000000.jsonl", "manifest.json"]
+        for struct in structures[1:]:
+            disk_traj.append(struct)
+        disk_traj = DiskTrajectory("traj")
+        assert len(disk_traj) == 2
+        for idx, struct in enumerate(structures[1:]):
+            assert disk_traj[idx] == struct
+            assert_allclose(disk_traj[idx].site_properties["forces"], idx + 1)
+
+    def test_failed_append(self):
+        structures = [self.traj[0].copy() for _ in range(3)]
+        for idx, struct in enumerate(structures):
+            struct.scale_lattice(struct.volume * (1 + idx / 10))
+            struct.add_site_property("forces", np.full((len(struct), 3), idx, dtype=float))
+        disk_traj = DiskTrajectory.create("traj", self.traj.species, constant_lattice=False)
+        disk_traj.append(structures[0])
+
+        # Frame properties that cannot be serialized fail before anything is written
+        structures[1].properties = {"bad": object()}
+        with pytest.raises(TypeError):
+            disk_traj.append(structures[1])
+        assert len(disk_traj) == 1
+        disk_traj.append(structures[2])
+
+        for traj in (disk_traj, DiskTrajectory("traj")):
+            assert len(traj) == 2
+            assert_allclose(traj.lattice, [structures[0].lattice.matrix, structures[2].lattice.matrix])
+            assert traj[1] == structures[2]
+            assert_allclose(traj[1].site_properties["forces"], 2)
+
+    def test_append(self):
+        structures = list(self.traj[:5])
+        for idx, struct in enumerate(structures):
+            struct.add_site_property("forces", np.full((len(struct), 3), idx, dtype=float))
+            struct.add_site_property("tag", [f"frame-{idx}"] * len(struct))
+            struct.properties = {"energy": -float(idx)}
+
+        disk_traj = DiskTrajectory.create(
+            "traj", self.traj.species, lattice=self.traj.lattice, time_step=self.traj.time_step, chunk_size=2
+        )
+        assert len(disk_traj) == 0
+        for struct in structures[:3]:
+            disk_traj.append(struct)
+        assert len(disk_traj) == 3
+
+        # Data of an interrupted append beyond the manifest is discarded on reopening
+        with open("traj/coords.bin", mode="ab") as file:
+            file.write(b"\0" * 24)
+        disk_traj = DiskTrajectory("traj", mode="a")
+        for struct in structures[3:]:
+            disk_traj.append(struct)
+
+        disk_traj = DiskTrajectory("traj")
+        assert [props["energy"] for props in disk_traj.frame_properties] == [0, -1, -2, -3, -4]
+        assert disk_traj.frame_properties[-1] == {"energy": -4}
+        for idx, struct in enumerate(structures):
+            assert disk_traj[idx] == struct
+            assert disk_traj[idx].properties == struct.properties
+            assert_allclose(disk_traj[idx].site_properties["forces"], idx)
+            assert disk_traj[idx].site_properties["tag"] == struct.site_properties["tag"]
+        assert disk_traj[1:4].site_properties[0]["tag"][0] == "frame-1"
+
+        disk_traj = DiskTrajectory("traj", mode="a")
+        disk_traj.extend(self.traj[5:8])
+        assert len(disk_traj) == 8
+        assert_allclose(disk_traj[7].frac_coords, self.traj[7].frac_coords)
+        assert "tag" not in disk_traj[7].site_properties
+        assert np.isnan(disk_traj[7].site_properties["forces"]).all()
+
+        strained = structures[0].copy()
+        strained.apply_strain(0.1)
+        with pytest.raises(ValueError, match="differs from the constant lattice"):
+            disk_traj.append(strained)
+        with pytest.raises(ValueError, match="different species"):
+            disk_traj.append(structures[0].copy().replace_species({"Si": "Ge"}))
+        assert len(disk_traj) == 8
+
+    def test_molecules(self):
+        disk_traj = DiskTrajectory.from_trajectory("mols", self.traj_mols)
+        assert disk_traj.lattice is None
+        assert_allclose(disk_traj.coords, self.traj_mols.coords)
+        for idx in range(len(self.traj_mols)):
+            assert disk_traj[idx] == self.traj_mols[idx]
+            assert disk_traj[idx].properties == {"energy": -idx}
+        assert list(disk_traj.frame_properties) == self.traj_mols.frame_properties
+
+        with pytest.raises(ValueError, match="Cannot combine Molecule- and Structure-based"):
+            disk_traj.extend(self.traj)
+        disk_traj.to_displacements()
+        assert_allclose(disk_traj.coords[1:], np.diff(self.traj_mols.coords, axis=0))
+
+    def test_variable_lattice(self):
+        structures = [struct.copy() for struct in self.traj[:3]]
+        for idx, struct in enumerate(structures):
+            struct.apply_strain(0.01 * idx)
+        traj = Trajectory.from_structures(structures, constant_lattice=False)
+
+        disk_traj = DiskTrajectory.from_trajectory("traj", traj)
+        assert disk_traj.lattice.shape == (3, 3, 3)
+        assert all(frame1 == frame2 for frame1, frame2 in zip(disk_traj, structures, strict=True))
+        assert_allclose(disk_traj[1:].lattice, traj.lattice[1:])
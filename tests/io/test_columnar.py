@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+from glob import glob
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from pytest import approx
+
+from pymatgen.core import Lattice, Species, Structure
+from pymatgen.entries.computed_entries import (
+    ComputedStructureEntry,
+    ConstantEnergyAdjustment,
+    GibbsComputedStructureEntry,
+)
+from pymatgen.io.columnar import StructureStore
+from pymatgen.util.testing import MatSciTest
+
+
+class TestStructureStore(MatSciTest):
+    def setup_method(self):
+        self.li_fe_po4 = self.get_structure("LiFePO4")
+        self.li_fe_po4.add_site_property("magmom", [float(idx % 3) for idx in range(len(self.li_fe_po4))])
+        self.li_fe_po4.add_site_property("forces", np.arange(3 * len(self.li_fe_po4)).reshape(-1, 3).tolist())
+        self.li_fe_po4.properties = {"source": "test"}
+
+        self.disordered = Structure(
+            Lattice.cubic(4.2),
+            [{"Fe2+": 0.5, "Mn2+": 0.5}, Species("O", -2)],
+            [[0, 0, 0], [0.5, 0.5, 0.5]],
+            site_properties={"tag": ["a", "b"]},
+            labels=["M1", None],
+        )
+        self.molecule_box = Structure(
+            Lattice(np.eye(3) * 10, pbc=(True, True, False)), ["H", "H"], [[0, 0, 0], [0, 0, 0.074]], charge=1
+        )
+        self.structures = [self.li_fe_po4, self.disordered, self.molecule_box]
+
+    def assert_same_structure(self, struct: Structure, expected: Structure):
+        assert struct == expected
+        assert_allclose(struct.lattice.matrix, expected.lattice.matrix)
+        assert_allclose(struct.frac_coords, expected.frac_coords)
+        assert struct.lattice.pbc == expected.lattice.pbc
+        assert struct.charge == expected.charge
+        assert struct.labels == expected.labels
+        assert struct.properties == expected.properties
+        assert struct.site_properties == expected.site_properties
+
+    def test_round_trip(self):
+        StructureStore.from_structures("store", self.structures)
+
+        store = StructureStore("store")
+        assert len(store) == 3
+        assert store.entry_type == "Structure"
+        for struct, expected in zip(store, self.structures, strict=True):
+            self.assert_same_structure(struct, expected)
+        self.assert_same_structure(store[-1], self.molecule_box)
+        assert [len(struct) for struct in store[1:]] == [2, 2]
+
+        with pytest.raises(IndexError, match="out of range"):
+            store[3]
+        with pytest.raises(OSError, match="read-only"):
+            store.append(self.molecule_box)
+        with pytest.raises(FileExistsError, match="already exists"):
+            StructureStore.from_structures("store", self.structures)
+
+    def test_columns(self):
+        store = StructureStore.from_structures("store", self.structures)
+        n_sites = sum(len(struct) for struct in self.structures)
+
+        assert store.lattices.shape == (3, 3, 3)
+        assert store.frac_coords.shape == (n_sites, 3)
+        assert_allclose(store.offsets, np.cumsum([0, *map(len, self.structures)]))
+        assert_allclose(store.frac_coords[store.offsets[2] : store.offsets[3]], self.molecule_box.frac_coords)
+        assert np.isnan(store.energies).all()
+
+        magmoms = store.get_site_property("magmom")
+        assert_allclose(magmoms[: len(self.li_fe_po4)], self.li_fe_po4.site_properties["magmom"])
+        assert np.isnan(magmoms[len(self.li_fe_po4) :]).all()
+        assert store.get_site_property("forces").shape == (n_sites, 3)
+        with pytest.raises(KeyError, match="not stored as a site property column"):
+            store.get_site_property("tag")  # strings go to the JSON metadata
+
+        # Each distinct site species is stored once
+        species = store.species
+        assert len(species) == len({comp for struct in self.structures for comp in struct.species_and_occu})
+        assert [species[idx] for idx in store.species_indices[:4]] == self.li_fe_po4.species_and_occu[:4]
+
+    def test_append(self):
+        store = StructureStore("store", mode="a")
+        assert len(store) == 0
+        assert store.lattices.shape == (0, 3, 3)
+
+        store.append(self.molecule_box)
+        store.extend(self.structures, chunk_size=2)
+        assert len(store) == 4
+        assert store.offsets[-1] == 2 + sum(map(len, self.structures))
+
+        # Site property first seen after structures without it is backfilled
+        magmoms = StructureStore("store").get_site_property("magmom")
+        assert np.isnan(magmoms[:2]).all()
+        assert_allclose(magmoms[2 : 2 + len(self.li_fe_po4)], self.li_fe_po4.site_properties["magmom"])
+
+        # Data of an interrupted append beyond the manifest is discarded on reopening
+        with open("store/frac_coords.bin", mode="ab") as file:
+            file.write(b"\0" * 24)
+        store = StructureStore("store", mode="a")
+        store.append(self.disordered)
+        reopened = StructureStore("store")
+        for struct, expected in zip(reopened, [self.molecule_box, *self.structures, self.disordered], strict=True):
+            self.assert_same_structure(struct, expected)
+
+        with pytest.raises(TypeError, match="Cannot append a ComputedStructureEntry"):
+            store.append(ComputedStructureEntry(self.molecule_box, -1))
+
+    def test_interrupted_append(self, monkeypatch):
+        store = StructureStore.from_structures("store", [self.molecule_box])
+
+        def fail(_self):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            # Fail after the columns and metadata were written, before the manifest is updated
+            patch.setattr(StructureStore, "_write_manifest", fail)
+            with pytest.raises(OSError, match="disk full"):
+                store.extend([self.li_fe_po4, self.disordered])
+        # The failed chunk is neither in the manifest in memory nor in the files
+        assert len(store) == 1
+        assert store._manifest["site_properties"] == {}
+        assert len(store.species) == 1
+
+        store = StructureStore("store", mode="a")
+        assert len(store) == 1
+        assert os.path.getsize("store/meta.jsonl") == store._manifest["meta_bytes"]
+        assert not glob("store/site_property_*.bin")
+
+        store.extend([self.disordered, self.li_fe_po4])
+        reopened = StructureStore("store")
+        for struct, expected in zip(reopened, [self.molecule_box, self.disordered, self.li_fe_po4], strict=True):
+            self.assert_same_structure(struct, expected)
+        assert_allclose(
+            reopened.get_site_property("magmom")[-len(self.li_fe_po4) :], self.li_fe_po4.site_properties["magmom"]
+        )
+
+    def test_entries(self, monkeypatch):
+        entries = [
+            ComputedStructureEntry(
+                self.li_fe_po4,
+                -191.3,
+                energy_adjustments=[ConstantEnergyAdjustment(-1.5, name="Fe correction")],
+                parameters={"run_type": "GGA+U"},
+                data={"band_gap": 3.7},
+                entry_id="mp-19017",
+            ),
+            ComputedStructureEntry(self.molecule_box, -6.7, entry_id="h2"),
+        ]
+        with monkeypatch.context() as patch:
+            # The structures go to the columns, they are never turned into dicts
+            patch.setattr(Structure, "as_dict", lambda *_args, **_kwargs: pytest.fail("Structure.as_dict called"))
+            StructureStore.from_structures("entries", entries)
+
+        store = StructureStore("entries")
+        assert store.entry_type == "ComputedStructureEntry"
+        assert_allclose(store.energies, [-191.3, -6.7])
+        for entry, expected in zip(store, entries, strict=True):
+            assert isinstance(entry, ComputedStructureEntry)
+            assert entry.energy == approx(expected.energy)
+            assert entry.uncorrected_energy == approx(expected.uncorrected_energy)
+            assert entry.correction == approx(expected.correction)
+            assert [(type(adj), adj.name, adj.value) for adj in entry.energy_adjustments] == [
+                (type(adj), adj.name, adj.value) for adj in expected.energy_adjustments
+            ]
+            assert entry.entry_id == expected.entry_id
+            assert entry.parameters == expected.parameters
+            assert entry.data == expected.data
+            self.assert_same_structure(entry.structure, expected.structure)
+        assert store[0].correction == -1.5
+
+        with open("entries/manifest.json", encoding="utf-8") as file:
+            assert json.load(file)["n_structures"] == 2
+
+        # Subclasses are rebuilt from their @module and @class
+        gibbs_entry = GibbsComputedStructureEntry(self.li_fe_po4, -2.4, temp=600, entry_id="gibbs")
+        store = StructureStore.from_structures("gibbs", [gibbs_entry])
+        assert store.entry_type == "GibbsComputedStructureEntry"
+        entry = StructureStore("gibbs")[0]
+        assert type(entry) is GibbsComputedStructureEntry
+        assert entry.temp == 600
+        assert entry.energy == approx(gibbs_entry.energy)
+        assert entry.entry_id == "gibbs"
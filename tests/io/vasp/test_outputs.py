@@ -103,6 +103,82 @@ class TestVasprun(MatSciTest):
         assert vasp_run.parameters["EDIFFG"] == 0
         assert vasp_run.parameters["EDIFF"] == approx(1e-5)
 
+    def test_vasprun_fields(self):
+        filepath = f"{VASP_OUT_DIR}/vasprun.xml.gz"
+        vasp_run = Vasprun(filepath, parse_potcar_file=False)
+        lite = Vasprun(filepath, parse_potcar_file=False, fields={"final_structure", "final_energy", "parameters"})
+        assert lite.final_structure == vasp_run.final_structure
+        assert lite.final_energy == approx(vasp_run.final_energy)
+        assert lite.parameters == vasp_run.parameters
+        assert lite.ionic_steps[-1]["e_0_energy"] == vasp_run.ionic_steps[-1]["e_0_energy"]
+        assert len(lite.ionic_steps) == 1
+        assert lite.nionic_steps == vasp_run.nionic_steps == len(vasp_run.ionic_steps)
+        assert lite.converged_ionic == vasp_run.converged_ionic
+        assert lite.eigenvalues is None
+        assert not hasattr(lite, "tdos")
+
+        lite = Vasprun(filepath, parse_potcar_file=False, fields={"ionic_steps", "dos"})
+        assert len(lite.ionic_steps) == len(vasp_run.ionic_steps)
+        assert lite.tdos.densities[Spin.up] == approx(vasp_run.tdos.densities[Spin.up])
+        assert lite.eigenvalues is None
+
+        header = Vasprun(filepath, parse_potcar_file=False, fields=())
+        assert header.initial_structure == vasp_run.initial_structure
+        assert header.incar == vasp_run.incar
+        assert header.atomic_symbols == vasp_run.atomic_symbols
+        assert header.ionic_steps == []
+        assert header.nionic_steps is None
+        for prop in ("converged_electronic", "converged_ionic", "final_energy", "md_n_steps"):
+            with pytest.raises(ValueError, match=f"Vasprun.{prop} needs the ionic steps"):
+                getattr(header, prop)
+        with pytest.raises(ValueError, match="needs the ionic steps"):
+            _ = header.converged
+        with pytest.raises(ValueError, match="needs the ionic steps"):
+            header.as_dict()
+
+        # MD steps of on-the-fly ML runs are counted across all ionic steps
+        vasp_run = Vasprun(f"{VASP_OUT_DIR}/vasprun.ml_md.xml.gz", fields={"final_energy"})
+        assert vasp_run.md_n_steps == 100
+        assert vasp_run.converged_ionic
+
+        with pytest.raises(ValueError, match="Unknown Vasprun fields \\['energy'\\]"):
+            Vasprun(filepath, fields={"energy"})
+        with pytest.raises(ValueError, match="fields cannot be combined with ionic_step_skip"):
+            Vasprun(filepath, fields={"final_energy"}, ionic_step_skip=2)
+
+    @pytest.mark.parametrize(
+        "filepath",
+        [
+            f"{VASP_OUT_DIR}/vasprun.{name}.xml.gz"
+            for name in ("lvel.Si2H", "r2scan", "pbesol", "scan_rvv10", "pbesol_vdw", "Al")
+        ]
+        + [f"{TEST_DIR}/fixtures/kpoints_opt/vasprun.xml.gz"],
+    )
+    def test_vasprun_fields_eigenvalues(self, filepath):
+        # Only the calculation-level <eigenvalues> count, not e.g. those of <electronvelocities>
+        vasp_run = Vasprun(filepath, parse_potcar_file=False)
+        lite = Vasprun(filepath, parse_potcar_file=False, fields={"eigenvalues"})
+        assert lite.eigenvalues.keys() == vasp_run.eigenvalues.keys()
+        for spin, eigenvalues in vasp_run.eigenvalues.items():
+            assert_allclose(lite.eigenvalues[spin], eigenvalues)
+        if vasp_run.kpoints_opt_props is not None:
+            for spin, eigenvalues in vasp_run.kpoints_opt_props.eigenvalues.items():
+                assert_allclose(lite.kpoints_opt_props.eigenvalues[spin], eigenvalues)
+
+    def test_from_cache(self):
+        filepath = f"{VASP_OUT_DIR}/vasprun.xml.gz"
+        vasp_run = Vasprun(filepath, parse_potcar_file=False)
+        for _ in range(2):
+            cached = Vasprun.from_cache(filepath, cache="cache", parse_potcar_file=False)
+            assert cached.final_structure == vasp_run.final_structure
+            assert cached.final_energy == approx(vasp_run.final_energy)
+            assert_allclose(cached.eigenvalues[Spin.up], vasp_run.eigenvalues[Spin.up])
+        assert len(list(Path("cache").glob("*.json"))) == 1
+
+        bs_vasp_run = BSVasprun.from_cache(filepath, cache="cache")
+        assert isinstance(bs_vasp_run, BSVasprun)
+        assert len(list(Path("cache").glob("*.json"))) == 2
+
     def test_bad_random_seed(self):
         vasp_run = Vasprun(f"{VASP_OUT_DIR}/vasprun.bad_random_seed.xml.gz")
         assert vasp_run.incar["ISMEAR"] == 0
@@ -618,6 +694,13 @@ class TestVasprun(MatSciTest):
         assert vasp_run.projected_magnetisation.shape == (76, 240, 4, 9, 3)
         assert vasp_run.projected_magnetisation[0, 0, 0, 0, 0] == approx(-0.0712)
 
+        vasp_run_32 = Vasprun(filepath, parse_projected_eigen=True, projected_eigen_dtype=np.float32)
+        assert vasp_run_32.projected_magnetisation.dtype == np.float32
+        assert vasp_run_32.projected_eigenvalues[Spin.up].dtype == np.float32
+        assert_allclose(vasp_run_32.projected_magnetisation, vasp_run.projected_magnetisation, atol=1e-7)
+        assert_allclose(vasp_run_32.projected_eigenvalues[Spin.up], vasp_run.projected_eigenvalues[Spin.up], atol=1e-7)
+        assert vasp_run_32.eigenvalues[Spin.up].dtype == np.float64
+
     def test_smart_efermi(self):
         # branch 1 - E_fermi does not cross a band
         vrun = Vasprun(f"{VASP_OUT_DIR}/vasprun.LiF.xml.gz")
@@ -911,6 +994,41 @@ class TestOutcar:
             toten += outcar.final_energy_contribs[k]
         assert toten == approx(outcar.final_energy, abs=1e-6)
 
+    def test_from_cache(self, tmp_path):
+        outcar = Outcar(f"{VASP_OUT_DIR}/OUTCAR.gz")
+        for _ in range(2):
+            cached = Outcar.from_cache(f"{VASP_OUT_DIR}/OUTCAR.gz", cache=tmp_path)
+            assert cached.as_dict() == outcar.as_dict()
+
+    def test_batch_read(self):
+        filepath = f"{VASP_OUT_DIR}/OUTCAR.lepsilon.gz"
+        toten = {"energy": r"free energy\s+TOTEN\s+=\s+(\S+)"}
+        outcar = Outcar(filepath)
+        assert outcar._text is None
+        with outcar.batch_read():
+            assert outcar._text is not None
+            outcar.read_lepsilon()
+            outcar.read_lepsilon_ionic()
+            outcar.read_piezo_tensor()
+            with outcar.batch_read():
+                outcar.read_pattern(toten, reverse=True)
+            core_potentials = outcar.read_avg_core_poten()
+        assert outcar._text is None
+        assert core_potentials == outcar.read_avg_core_poten()
+        assert core_potentials[-1][1] == approx(-90.0487)
+
+        reference = Outcar(filepath)
+        reference.read_lepsilon()
+        reference.read_lepsilon_ionic()
+        reference.read_piezo_tensor()
+        assert_allclose(outcar.dielectric_tensor, reference.dielectric_tensor)
+        assert_allclose(outcar.born, reference.born)
+        assert_allclose(outcar.dielectric_ionic_tensor, reference.dielectric_ionic_tensor)
+        assert_allclose(outcar.data["piezo_tensor"], reference.data["piezo_tensor"])
+        reference.read_pattern(toten, reverse=True)
+        assert outcar.data["energy"] == reference.data["energy"]
+        assert outcar.data["energy"][0] == ["-0.40318411"]
+
     def test_stopped_old(self):
         filepath = f"{VASP_OUT_DIR}/OUTCAR.stopped.gz"
         outcar = Outcar(filepath)
@@ -1637,6 +1755,31 @@ class TestChgcar(MatSciTest):
                 if idx in (22130, 44255):
                     assert line == "augmentation occupancies   1  15\n"
 
+        # The grid and augmentation blocks are written as VASP does
+        with zopen(f"{VASP_OUT_DIR}/CHGCAR.spin.gz", mode="rt", encoding="utf-8") as file:
+            expected = file.readlines()[10:]
+        with open(out_path, encoding="utf-8") as file:
+            assert file.readlines()[10:] == expected
+
+    def test_write_irregular_values(self):
+        values = np.array([0, 1.5, -2.25e-5, 1e-99, 1e-101, -9.99999999999e98, 3e120])
+        chgcar = Chgcar(self.chgcar_spin.poscar, {"total": values.reshape(7, 1, 1)})
+        chgcar.write_file(out_path := f"{self.tmp_path}/CHGCAR_irregular")
+        with open(out_path, encoding="utf-8") as file:
+            lines = file.readlines()
+        assert lines[-2:] == [
+            " 0.00000000000E+01 0.15000000000E+01 -.22500000000E-04 0.10000000000E-98 0.10000000000E-100\n",
+            " -.10000000000E+100 0.30000000000E+121  \n",
+        ]
+        assert_allclose(Chgcar.from_file(out_path).data["total"].ravel(), values)
+
+    def test_total_only(self):
+        chgcar = Chgcar.from_file(f"{VASP_OUT_DIR}/CHGCAR.spin.gz", total_only=True)
+        assert not chgcar.is_spin_polarized
+        assert set(chgcar.data) == {"total"}
+        assert_allclose(chgcar.data["total"], self.chgcar_spin.data["total"])
+        assert chgcar.data_aug["total"] == self.chgcar_spin.data_aug["total"]
+
     def test_soc_chgcar(self):
         assert set(self.chgcar_NiO_soc.data) == {
             "total",
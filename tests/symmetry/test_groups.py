@@ -9,7 +9,7 @@ from pytest import approx
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.operations import SymmOp
-from pymatgen.symmetry.groups import SYMM_DATA, PointGroup, SpaceGroup
+from pymatgen.symmetry.groups import SYMM_DATA, PointGroup, SpaceGroup, get_first_unique_mask, in_array_list
 
 __author__ = "Shyue Ping Ong"
 __copyright__ = "Copyright 2012, The Materials Virtual Lab"
@@ -165,6 +165,22 @@ class TestSpaceGroup:
         assert rand_percent[1] == approx(pp[1])
         assert rand_percent[2] == approx(pp[2])
 
+    def test_get_orbits(self):
+        sg = SpaceGroup("Fm-3m")
+        points = [[0, 0, 0], [0.25, 0.25, 0.25], [0.11, 0.23, 0.37]]
+        orbits = sg.get_orbits(points)
+        assert [len(orbit) for orbit in orbits] == [4, 8, 192]
+        for point, orbit in zip(points, orbits, strict=True):
+            np.testing.assert_allclose(orbit, sg.get_orbit(point))
+
+    def test_symmetry_op_set(self):
+        sg = SpaceGroup("Pm-3m")
+        op_set = sg.symmetry_op_set
+        assert len(op_set) == len(sg) == 48
+        # Same operations in the same order as iterating over the set
+        assert [op.affine_matrix.tolist() for op in op_set] == [op.affine_matrix.tolist() for op in sg.symmetry_ops]
+        assert sg[1] is op_set[1]
+
     def test_is_compatible(self):
         cubic = Lattice.cubic(1)
         hexagonal = Lattice.hexagonal(1, 2)
@@ -292,3 +308,16 @@ class TestSpaceGroup:
     def test_import(self):
         # Ensure no circular import
         subprocess.run([sys.executable, "-c", "from pymatgen.symmetry.groups import SpaceGroup"], check=True)
+
+
+def test_get_first_unique_mask():
+    rng = np.random.default_rng(0)
+    for tol in (0, 1e-5, 2e-5):
+        arrays = rng.integers(0, 3, size=(50, 3)) / 2 + rng.choice([0, 3e-6, 1e-5], size=(50, 1))
+        kept = []
+        expected = []
+        for arr in arrays:
+            expected.append(not in_array_list(kept, arr, tol=tol))
+            if expected[-1]:
+                kept.append(arr)
+        assert get_first_unique_mask(arrays, tol=tol).tolist() == expected
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from pymatgen.util.io_utils import micro_pyawk
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymatgen.util.io_utils import ParseCache, micro_pyawk
 from pymatgen.util.testing import VASP_OUT_DIR, MatSciTest
 
 
@@ -16,3 +23,93 @@ class TestFunc(MatSciTest):
 
         micro_pyawk(f"{VASP_OUT_DIR}/OUTCAR.gz", [["POTCAR:(.*)", f2, f]])
         assert len(data) == 6
+
+
+class CountingParser:
+    """Parser stand-in that counts how often it actually parses."""
+
+    n_parses = 0
+
+    def __init__(self, filename, scale: float = 1.0) -> None:
+        type(self).n_parses += 1
+        with open(filename, encoding="utf-8") as file:
+            self.values = scale * np.array(file.read().split(), dtype=float)
+        self.scale = scale
+
+
+class TestParseCache(MatSciTest):
+    @staticmethod
+    def write_data(text: str = "1 2 3") -> None:
+        CountingParser.n_parses = 0
+        with open("data.txt", mode="w", encoding="utf-8") as file:
+            file.write(text)
+
+    def test_load(self):
+        self.write_data()
+        cache = ParseCache("cache")
+        parsed = cache.load(CountingParser, "data.txt")
+        assert_allclose(parsed.values, [1, 2, 3])
+        cached = cache.load(CountingParser, "data.txt")
+        assert CountingParser.n_parses == 1
+        assert_allclose(cached.values, [1, 2, 3])
+        # Arrays of cached objects can be modified in place
+        cached.values *= 2
+        assert_allclose(cache.load(CountingParser, "data.txt").values, [1, 2, 3])
+        assert len(list(Path("cache").glob("*.json"))) == 1
+
+        # Different options and modified files are parsed again
+        assert_allclose(cache.load(CountingParser, "data.txt", scale=2).values, [2, 4, 6])
+        assert CountingParser.n_parses == 2
+        self.write_data("4 5 6")
+        assert_allclose(cache.load(CountingParser, "data.txt").values, [4, 5, 6])
+        assert CountingParser.n_parses == 1
+
+        cache.clear()
+        assert not list(Path("cache").iterdir())
+
+    def test_other_files_kept(self):
+        # Files that are not cache entries survive clearing and eviction
+        self.write_data()
+        Path("cache").mkdir()
+        other_files = ["settings.json", f"{'0' * 32}.json", "notes.bin"]
+        for filename in other_files:
+            Path(f"cache/{filename}").write_text("{}")
+        cache = ParseCache("cache", max_size=0)
+        cache.load(CountingParser, "data.txt")
+        assert sorted(path.name for path in Path("cache").iterdir()) == sorted(other_files)
+        cache.max_size = 2**30
+        cache.load(CountingParser, "data.txt")
+        cache.clear()
+        assert sorted(path.name for path in Path("cache").iterdir()) == sorted(other_files)
+
+    def test_eviction(self):
+        self.write_data()
+        cache = ParseCache("cache", max_size=0)
+        cache.load(CountingParser, "data.txt")
+        cache.load(CountingParser, "data.txt")
+        assert CountingParser.n_parses == 2
+        assert not list(Path("cache").iterdir())
+
+    def test_unreadable_entry(self):
+        self.write_data()
+        cache = ParseCache("cache")
+        cache.load(CountingParser, "data.txt")
+        for path in Path("cache").glob("*.bin"):
+            path.write_bytes(b"garbage")
+        with pytest.warns(UserWarning, match="Removing unreadable parse cache entry"):
+            parsed = cache.load(CountingParser, "data.txt")
+        assert_allclose(parsed.values, [1, 2, 3])
+        assert CountingParser.n_parses == 2
+
+    def test_truncated_entry(self):
+        # A .bin cut off after the pickle would otherwise load with zeroed arrays
+        self.write_data()
+        cache = ParseCache("cache")
+        cache.load(CountingParser, "data.txt")
+        (json_path,) = Path("cache").glob("*.json")
+        bin_path = json_path.with_suffix(".bin")
+        bin_path.write_bytes(bin_path.read_bytes()[: json.loads(json_path.read_text())["pickle_size"]])
+        with pytest.warns(UserWarning, match="read .* of .* bytes"):
+            parsed = cache.load(CountingParser, "data.txt")
+        assert_allclose(parsed.values, [1, 2, 3])
+        assert CountingParser.n_parses == 2